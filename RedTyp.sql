@@ -45,7 +45,7 @@ INSERT INTO `2-way FST` (`2-way FST ID`, `example data`, `description`, `FST dia
 ('Echo - Initial C* is replaced + dissimilation in case of homophony', '| Input | Output    |\r\n|-------|-----------|\r\n| C-X   | C-X-v-X   |\r\n| v-X   | v-X-s-X   |\r\n| C-CX  | C-CX-v-CX |', 'Three allomorphs\r\na) Input=#CX% where X is a string of segments and C is a consonant but not [v]\r\nOutput=#CX\\~vX%\r\nb) Input=#VX% where X is a string of segments and V is a vowel\r\nOutput=#VX\\~vVX%\r\nc) Input=#vX% where X is a string of segments \r\nOutput=#vX\\~sX\r\nThe entire string is reduplicated except that the word-initial C\\* is overwritten by a morphologically-specified string [v]. But if C\\* is [v], then use [s] instead \r\n', '\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-2 outputs the base \r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n%states q2-5 go back to #, ignore the first C*, checks if starts with m, outputs m if no m, otherwise n, output rest of reduplicant, and end\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [below of=q1] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state,accepting] (q5) [right of=q4] {$q_5$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge [loop above] node {($\\Sigma$,$\\Sigma$,+1)} (q1)\r\n(q1) edge  node {(\\%,$\\epsilon$,-1)} (q2)\r\n(q2) edge [loop above] node {($\\Sigma$,$\\epsilon$,-1)} (q2)\r\n(q2) edge node {(\\#,$\\epsilon$,+1)} (q3)\r\n(q3) edge node {(\\{C-v\\},v,+1)} (q4)\r\n\r\n(q3) edge[bend right=45] node[below] {(v,\\textipa{S},+1)} (q4)\r\n\r\n(q4) edge[loop below] node {($\\Sigma$,$\\Sigma$,+1)} (q4)\r\n(q4) edge node {(\\%,$\\epsilon$,+1)} (q5)\r\n\r\n;\r\n\\end{tikzpicture}', 0, '#Echo reduplication -- default Turkic behavior\r\n#The word-initial onset is replaced by [m]. An onsetless word now starts with [m]\r\n#e.g. para --> para~mara, stara --> stara~mara, ara --> ara~mara\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first copy\',\'go back to start\',\'start second copy with replacements\',\'output second copy\',\'end\'] \r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first copy\', \'\', 1)\r\n(\'output first copy\', \\alphabet) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \'%\') = (\'go back to start\', \'\',-1)\r\n(\'go back to start\', \\alphabet) = (\'go back to start\', \'\',-1)\r\n(\'go back to start\', \'#\') = ( \'start second copy with replacements\', \'~\',1)\r\n(\'start second copy with replacements\', {\\consonants-\'v\'} ) = ( \'output second copy\', \'v\', 1)\r\n(\'start second copy with replacements\', \'v\' ) = ( \'output second copy\', \'k\', 1)\r\n(\'start second copy with replacements\', \\vowels) =  (\'output second copy\', [\'v\'  \\ID ] , 1)\r\n(\'output second copy\', \\alphabet) =  (\'output second copy\' , \\ID , 1)\r\n(\'output second copy\', \'%\' ) = (\'end\', \'\', 1)\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Echo reduplication -- default Turkic behavior\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first copy\r\n3	go back to start\r\n4	start second copy with replacements\r\n5	output second copy\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,%,3,,-1\r\n2,+,2,+,1\r\n2,.,2,.,1\r\n2,`a,2,`a,1\r\n2,`a:,2,`a:,1\r\n2,`e,2,`e,1\r\n2,`e:,2,`e:,1\r\n2,`i,2,`i,1\r\n2,`i:,2,`i:,1\r\n2,`o,2,`o,1\r\n2,`o:,2,`o:,1\r\n2,`u,2,`u,1\r\n2,`u:,2,`u:,1\r\n2,`y,2,`y,1\r\n2,`y:,2,`y:,1\r\n2,a,2,a,1\r\n2,a:,2,a:,1\r\n2,b,2,b,1\r\n2,c,2,c,1\r\n2,d,2,d,1\r\n2,e,2,e,1\r\n2,e:,2,e:,1\r\n2,f,2,f,1\r\n2,g,2,g,1\r\n2,h,2,h,1\r\n2,i,2,i,1\r\n2,i:,2,i:,1\r\n2,j,2,j,1\r\n2,k,2,k,1\r\n2,l,2,l,1\r\n2,m,2,m,1\r\n2,n,2,n,1\r\n2,o,2,o,1\r\n2,o:,2,o:,1\r\n2,p,2,p,1\r\n2,q,2,q,1\r\n2,r,2,r,1\r\n2,s,2,s,1\r\n2,t,2,t,1\r\n2,u,2,u,1\r\n2,u:,2,u:,1\r\n2,v,2,v,1\r\n2,w,2,w,1\r\n2,x,2,x,1\r\n2,y,2,y,1\r\n2,y:,2,y:,1\r\n2,z,2,z,1\r\n3,#,4,~,1\r\n3,+,3,,-1\r\n3,.,3,,-1\r\n3,`a,3,,-1\r\n3,`a:,3,,-1\r\n3,`e,3,,-1\r\n3,`e:,3,,-1\r\n3,`i,3,,-1\r\n3,`i:,3,,-1\r\n3,`o,3,,-1\r\n3,`o:,3,,-1\r\n3,`u,3,,-1\r\n3,`u:,3,,-1\r\n3,`y,3,,-1\r\n3,`y:,3,,-1\r\n3,a,3,,-1\r\n3,a:,3,,-1\r\n3,b,3,,-1\r\n3,c,3,,-1\r\n3,d,3,,-1\r\n3,e,3,,-1\r\n3,e:,3,,-1\r\n3,f,3,,-1\r\n3,g,3,,-1\r\n3,h,3,,-1\r\n3,i,3,,-1\r\n3,i:,3,,-1\r\n3,j,3,,-1\r\n3,k,3,,-1\r\n3,l,3,,-1\r\n3,m,3,,-1\r\n3,n,3,,-1\r\n3,o,3,,-1\r\n3,o:,3,,-1\r\n3,p,3,,-1\r\n3,q,3,,-1\r\n3,r,3,,-1\r\n3,s,3,,-1\r\n3,t,3,,-1\r\n3,u,3,,-1\r\n3,u:,3,,-1\r\n3,v,3,,-1\r\n3,w,3,,-1\r\n3,x,3,,-1\r\n3,y,3,,-1\r\n3,y:,3,,-1\r\n3,z,3,,-1\r\n4,`a,5,v`a,1\r\n4,`a:,5,v`a:,1\r\n4,`e,5,v`e,1\r\n4,`e:,5,v`e:,1\r\n4,`i,5,v`i,1\r\n4,`i:,5,v`i:,1\r\n4,`o,5,v`o,1\r\n4,`o:,5,v`o:,1\r\n4,`u,5,v`u,1\r\n4,`u:,5,v`u:,1\r\n4,`y,5,v`y,1\r\n4,`y:,5,v`y:,1\r\n4,a,5,va,1\r\n4,a:,5,va:,1\r\n4,b,5,v,1\r\n4,c,5,v,1\r\n4,d,5,v,1\r\n4,e,5,ve,1\r\n4,e:,5,ve:,1\r\n4,f,5,v,1\r\n4,g,5,v,1\r\n4,h,5,v,1\r\n4,i,5,vi,1\r\n4,i:,5,vi:,1\r\n4,j,5,v,1\r\n4,k,5,v,1\r\n4,l,5,v,1\r\n4,m,5,v,1\r\n4,n,5,v,1\r\n4,o,5,vo,1\r\n4,o:,5,vo:,1\r\n4,p,5,v,1\r\n4,q,5,v,1\r\n4,r,5,v,1\r\n4,s,5,v,1\r\n4,t,5,v,1\r\n4,u,5,vu,1\r\n4,u:,5,vu:,1\r\n4,v,5,k,1\r\n4,w,5,v,1\r\n4,x,5,v,1\r\n4,y,5,vy,1\r\n4,y:,5,vy:,1\r\n4,z,5,v,1\r\n5,%,1,,1\r\n5,+,5,+,1\r\n5,.,5,.,1\r\n5,`a,5,`a,1\r\n5,`a:,5,`a:,1\r\n5,`e,5,`e,1\r\n5,`e:,5,`e:,1\r\n5,`i,5,`i,1\r\n5,`i:,5,`i:,1\r\n5,`o,5,`o,1\r\n5,`o:,5,`o:,1\r\n5,`u,5,`u,1\r\n5,`u:,5,`u:,1\r\n5,`y,5,`y,1\r\n5,`y:,5,`y:,1\r\n5,a,5,a,1\r\n5,a:,5,a:,1\r\n5,b,5,b,1\r\n5,c,5,c,1\r\n5,d,5,d,1\r\n5,e,5,e,1\r\n5,e:,5,e:,1\r\n5,f,5,f,1\r\n5,g,5,g,1\r\n5,h,5,h,1\r\n5,i,5,i,1\r\n5,i:,5,i:,1\r\n5,j,5,j,1\r\n5,k,5,k,1\r\n5,l,5,l,1\r\n5,m,5,m,1\r\n5,n,5,n,1\r\n5,o,5,o,1\r\n5,o:,5,o:,1\r\n5,p,5,p,1\r\n5,q,5,q,1\r\n5,r,5,r,1\r\n5,s,5,s,1\r\n5,t,5,t,1\r\n5,u,5,u,1\r\n5,u:,5,u:,1\r\n5,v,5,v,1\r\n5,w,5,w,1\r\n5,x,5,x,1\r\n5,y,5,y,1\r\n5,y:,5,y:,1\r\n5,z,5,z,1\r\n'),
 ('Echo - Initial C*V is replaced + length is maintained', '| Input   | Output          |\r\n|---------|-----------------|\r\n| CV-X    | CV-X-gi-X       |\r\n| V-X     | V-X-gi-X        |\r\n| CV:-X   | CV:-X-gi:-X     |', 'Input=#C\\*V-X% where X is a string of segments\r\nOutput\\=#C\\*V-X~gi-X%\r\nThe entire string is reduplicated except that the word-initial C\\*V is overwritten by a morphologically-specified string [gi]. \r\nLength of the base\'s V is maintained in [gi]', '\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-2 outputs the base \r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n%states q2-6 go back to #, ignore the first CV, output gi, output rest of reduplicant, and end\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [below of=q1] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n\\node[state,accepting] (q6) [right of=q5] {$q_6$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge [loop above] node {($\\Sigma$,$\\Sigma$,+1)} (q1)\r\n(q1) edge  node {(\\%,$\\epsilon$,-1)} (q2)\r\n(q2) edge [loop above] node {($\\Sigma$,$\\epsilon$,-1)} (q2)\r\n(q2) edge node {(\\#,$\\epsilon$,+1)} (q3)\r\n(q3) edge node {(C,$\\epsilon$,+1)} (q4)\r\n(q3) edge[bend right] node {(V,$\\epsilon$,+1)} (q4)\r\n(q4) edge node {(\\v{V},gi,+1)} (q5)\r\n(q4) edge[bend right] node {(V:,gi:,+1)} (q5)\r\n(q5) edge[loop right]  node {($\\Sigma$,$\\Sigma$,+1)} (q5)\r\n(q5) edge node {(\\%,$\\epsilon$,+1)} (q6)\r\n\r\n;\r\n\\end{tikzpicture}\r\n\r\n', 0, '#Echo reduplication with vowel length maintenance-- default Indic behavior\r\n#The word-initial syllable is replaced with [gi] and its old coda\r\n#If the word-initial syllable had a long vowel, vowel length is transmitted to the reduplicant\r\n#This file requires that the input be broken into a string of symbols separated by space because length is represented as a multicharacter symbol\r\n#e.g. \"p a r a\" --> para~gira, \"s t a r a\" --> stara~gira, \"a r a\" --> ara~gira\r\n#e.g. \"p a: r a\" --> pa:ra~gi:ra, \"s t a: r a\" --> sta:ra~gi:ra, \"a: r a\" --> a:ra~gi:ra\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first copy\',\'go back to start\',\'start second copy with replacements\',\'output second copy\',\'end\'] \r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\' ) = (\'output first copy\', \'\', 1 )\r\n(\'output first copy\', \\alphabet ) = ( \'output first copy\', \\ID, 1 )\r\n(\'output first copy\', \'%\' ) = ( \'go back to start\', \'\', -1 )\r\n(\'go back to start\', \\alphabet ) = ( \'go back to start\', \'\', -1 )\r\n(\'go back to start\', \'#\' ) = ( \'start second copy with replacements\', \'~\', 1 )\r\n(\'start second copy with replacements\', \\consonants ) = ( \'start second copy with replacements\', \'\', 1 )\r\n(\'start second copy with replacements\', \\short_vowels) = ( \'output second copy\', \'gi\', 1 )\r\n(\'start second copy with replacements\', \\long_vowels) = ( \'output second copy\', \'gi:\', 1 )\r\n(\'output second copy\', \\alphabet) =  (\'output second copy\' , \\ID , 1)\r\n(\'output second copy\', \'%\' ) = (\'end\', \'\', 1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Echo reduplication with vowel length maintenance-- default Indic behavior\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first copy\r\n3	go back to start\r\n4	start second copy with replacements\r\n5	output second copy\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,%,3,,-1\r\n2,+,2,+,1\r\n2,.,2,.,1\r\n2,`a,2,`a,1\r\n2,`a:,2,`a:,1\r\n2,`e,2,`e,1\r\n2,`e:,2,`e:,1\r\n2,`i,2,`i,1\r\n2,`i:,2,`i:,1\r\n2,`o,2,`o,1\r\n2,`o:,2,`o:,1\r\n2,`u,2,`u,1\r\n2,`u:,2,`u:,1\r\n2,`y,2,`y,1\r\n2,`y:,2,`y:,1\r\n2,a,2,a,1\r\n2,a:,2,a:,1\r\n2,b,2,b,1\r\n2,c,2,c,1\r\n2,d,2,d,1\r\n2,e,2,e,1\r\n2,e:,2,e:,1\r\n2,f,2,f,1\r\n2,g,2,g,1\r\n2,h,2,h,1\r\n2,i,2,i,1\r\n2,i:,2,i:,1\r\n2,j,2,j,1\r\n2,k,2,k,1\r\n2,l,2,l,1\r\n2,m,2,m,1\r\n2,n,2,n,1\r\n2,o,2,o,1\r\n2,o:,2,o:,1\r\n2,p,2,p,1\r\n2,q,2,q,1\r\n2,r,2,r,1\r\n2,s,2,s,1\r\n2,t,2,t,1\r\n2,u,2,u,1\r\n2,u:,2,u:,1\r\n2,v,2,v,1\r\n2,w,2,w,1\r\n2,x,2,x,1\r\n2,y,2,y,1\r\n2,y:,2,y:,1\r\n2,z,2,z,1\r\n3,#,4,~,1\r\n3,+,3,,-1\r\n3,.,3,,-1\r\n3,`a,3,,-1\r\n3,`a:,3,,-1\r\n3,`e,3,,-1\r\n3,`e:,3,,-1\r\n3,`i,3,,-1\r\n3,`i:,3,,-1\r\n3,`o,3,,-1\r\n3,`o:,3,,-1\r\n3,`u,3,,-1\r\n3,`u:,3,,-1\r\n3,`y,3,,-1\r\n3,`y:,3,,-1\r\n3,a,3,,-1\r\n3,a:,3,,-1\r\n3,b,3,,-1\r\n3,c,3,,-1\r\n3,d,3,,-1\r\n3,e,3,,-1\r\n3,e:,3,,-1\r\n3,f,3,,-1\r\n3,g,3,,-1\r\n3,h,3,,-1\r\n3,i,3,,-1\r\n3,i:,3,,-1\r\n3,j,3,,-1\r\n3,k,3,,-1\r\n3,l,3,,-1\r\n3,m,3,,-1\r\n3,n,3,,-1\r\n3,o,3,,-1\r\n3,o:,3,,-1\r\n3,p,3,,-1\r\n3,q,3,,-1\r\n3,r,3,,-1\r\n3,s,3,,-1\r\n3,t,3,,-1\r\n3,u,3,,-1\r\n3,u:,3,,-1\r\n3,v,3,,-1\r\n3,w,3,,-1\r\n3,x,3,,-1\r\n3,y,3,,-1\r\n3,y:,3,,-1\r\n3,z,3,,-1\r\n4,`a,5,gi,1\r\n4,`a:,5,gi:,1\r\n4,`e,5,gi,1\r\n4,`e:,5,gi:,1\r\n4,`i,5,gi,1\r\n4,`i:,5,gi:,1\r\n4,`o,5,gi,1\r\n4,`o:,5,gi:,1\r\n4,`u,5,gi,1\r\n4,`u:,5,gi:,1\r\n4,`y,5,gi,1\r\n4,`y:,5,gi:,1\r\n4,a,5,gi,1\r\n4,a:,5,gi:,1\r\n4,b,4,,1\r\n4,c,4,,1\r\n4,d,4,,1\r\n4,e,5,gi,1\r\n4,e:,5,gi:,1\r\n4,f,4,,1\r\n4,g,4,,1\r\n4,h,4,,1\r\n4,i,5,gi,1\r\n4,i:,5,gi:,1\r\n4,j,4,,1\r\n4,k,4,,1\r\n4,l,4,,1\r\n4,m,4,,1\r\n4,n,4,,1\r\n4,o,5,gi,1\r\n4,o:,5,gi:,1\r\n4,p,4,,1\r\n4,q,4,,1\r\n4,r,4,,1\r\n4,s,4,,1\r\n4,t,4,,1\r\n4,u,5,gi,1\r\n4,u:,5,gi:,1\r\n4,v,4,,1\r\n4,w,4,,1\r\n4,x,4,,1\r\n4,y,5,gi,1\r\n4,y:,5,gi:,1\r\n4,z,4,,1\r\n5,%,1,,1\r\n5,+,5,+,1\r\n5,.,5,.,1\r\n5,`a,5,`a,1\r\n5,`a:,5,`a:,1\r\n5,`e,5,`e,1\r\n5,`e:,5,`e:,1\r\n5,`i,5,`i,1\r\n5,`i:,5,`i:,1\r\n5,`o,5,`o,1\r\n5,`o:,5,`o:,1\r\n5,`u,5,`u,1\r\n5,`u:,5,`u:,1\r\n5,`y,5,`y,1\r\n5,`y:,5,`y:,1\r\n5,a,5,a,1\r\n5,a:,5,a:,1\r\n5,b,5,b,1\r\n5,c,5,c,1\r\n5,d,5,d,1\r\n5,e,5,e,1\r\n5,e:,5,e:,1\r\n5,f,5,f,1\r\n5,g,5,g,1\r\n5,h,5,h,1\r\n5,i,5,i,1\r\n5,i:,5,i:,1\r\n5,j,5,j,1\r\n5,k,5,k,1\r\n5,l,5,l,1\r\n5,m,5,m,1\r\n5,n,5,n,1\r\n5,o,5,o,1\r\n5,o:,5,o:,1\r\n5,p,5,p,1\r\n5,q,5,q,1\r\n5,r,5,r,1\r\n5,s,5,s,1\r\n5,t,5,t,1\r\n5,u,5,u,1\r\n5,u:,5,u:,1\r\n5,v,5,v,1\r\n5,w,5,w,1\r\n5,x,5,x,1\r\n5,y,5,y,1\r\n5,y:,5,y:,1\r\n5,z,5,z,1\r\n'),
 ('Final C - General ', '| Input | Output       |\r\n|-------|--------------|\r\n| X-C   | X-C\\~C   |\r\n| XYZ-C | XYZ-C$\\~C |', 'Input=#X-C$ where X is any string of symbols\r\nOutput=#X-C\\~C%\r\nThe word-final C string is repeated. I assume there are reasons why this isn\'t just called gemination. \r\n', '\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1 outputs the base once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n%states q2-7 goes back to the last C, ouputs it as a reduplicant, and then ends.\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [below of=q1] {$q_3$};\r\n\\node[state,accepting] (q4) [right of =q3] {$q_4$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge[loop above]  node {($\\Sigma$,$\\Sigma$,+1)} (q1)\r\n(q1) edge node {(\\%,$\\sim$,-1)} (q2)\r\n(q2) edge node {(C,C,+1)} (q3)\r\n(q3) edge[loop left]  node {($\\Sigma$,$\\Sigma$,+1)} (q3)\r\n(q3) edge node[below] {(\\%,$\\epsilon$,+1)} (q4)\r\n\r\n;\r\n\\end{tikzpicture}\r\n\r\n\r\n', 0, '#Final consonant reduplication\r\n#The final consonant in the input is reduplicated\r\n#The function is not defined for any input which ends with anything other than C\r\n#e.g. par --> par~r, para --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first copy\',\'return\',\'start second copy with replacements\',\'output second copy\',\'end\'] \r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first copy\', \'\', 1)\r\n(\'output first copy\', \\alphabet) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \'%\') = (\'return\', \'~\',-1)\r\n(\'return\', \\consonants) = (\'output second copy\', \\ID, 1)\r\n(\'output second copy\', \\alphabet) = (\'output second copy\', \\ID, 1)\r\n(\'output second copy\', \'%\') = (\'end\', \'\', 1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Final consonant reduplication\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first copy\r\n3	return\r\n4	start second copy with replacements\r\n5	output second copy\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,%,3,~,-1\r\n2,+,2,+,1\r\n2,.,2,.,1\r\n2,`a,2,`a,1\r\n2,`a:,2,`a:,1\r\n2,`e,2,`e,1\r\n2,`e:,2,`e:,1\r\n2,`i,2,`i,1\r\n2,`i:,2,`i:,1\r\n2,`o,2,`o,1\r\n2,`o:,2,`o:,1\r\n2,`u,2,`u,1\r\n2,`u:,2,`u:,1\r\n2,`y,2,`y,1\r\n2,`y:,2,`y:,1\r\n2,a,2,a,1\r\n2,a:,2,a:,1\r\n2,b,2,b,1\r\n2,c,2,c,1\r\n2,d,2,d,1\r\n2,e,2,e,1\r\n2,e:,2,e:,1\r\n2,f,2,f,1\r\n2,g,2,g,1\r\n2,h,2,h,1\r\n2,i,2,i,1\r\n2,i:,2,i:,1\r\n2,j,2,j,1\r\n2,k,2,k,1\r\n2,l,2,l,1\r\n2,m,2,m,1\r\n2,n,2,n,1\r\n2,o,2,o,1\r\n2,o:,2,o:,1\r\n2,p,2,p,1\r\n2,q,2,q,1\r\n2,r,2,r,1\r\n2,s,2,s,1\r\n2,t,2,t,1\r\n2,u,2,u,1\r\n2,u:,2,u:,1\r\n2,v,2,v,1\r\n2,w,2,w,1\r\n2,x,2,x,1\r\n2,y,2,y,1\r\n2,y:,2,y:,1\r\n2,z,2,z,1\r\n3,b,5,b,1\r\n3,c,5,c,1\r\n3,d,5,d,1\r\n3,f,5,f,1\r\n3,g,5,g,1\r\n3,h,5,h,1\r\n3,j,5,j,1\r\n3,k,5,k,1\r\n3,l,5,l,1\r\n3,m,5,m,1\r\n3,n,5,n,1\r\n3,p,5,p,1\r\n3,q,5,q,1\r\n3,r,5,r,1\r\n3,s,5,s,1\r\n3,t,5,t,1\r\n3,v,5,v,1\r\n3,w,5,w,1\r\n3,x,5,x,1\r\n3,z,5,z,1\r\n5,%,1,,1\r\n5,+,5,+,1\r\n5,.,5,.,1\r\n5,`a,5,`a,1\r\n5,`a:,5,`a:,1\r\n5,`e,5,`e,1\r\n5,`e:,5,`e:,1\r\n5,`i,5,`i,1\r\n5,`i:,5,`i:,1\r\n5,`o,5,`o,1\r\n5,`o:,5,`o:,1\r\n5,`u,5,`u,1\r\n5,`u:,5,`u:,1\r\n5,`y,5,`y,1\r\n5,`y:,5,`y:,1\r\n5,a,5,a,1\r\n5,a:,5,a:,1\r\n5,b,5,b,1\r\n5,c,5,c,1\r\n5,d,5,d,1\r\n5,e,5,e,1\r\n5,e:,5,e:,1\r\n5,f,5,f,1\r\n5,g,5,g,1\r\n5,h,5,h,1\r\n5,i,5,i,1\r\n5,i:,5,i:,1\r\n5,j,5,j,1\r\n5,k,5,k,1\r\n5,l,5,l,1\r\n5,m,5,m,1\r\n5,n,5,n,1\r\n5,o,5,o,1\r\n5,o:,5,o:,1\r\n5,p,5,p,1\r\n5,q,5,q,1\r\n5,r,5,r,1\r\n5,s,5,s,1\r\n5,t,5,t,1\r\n5,u,5,u,1\r\n5,u:,5,u:,1\r\n5,v,5,v,1\r\n5,w,5,w,1\r\n5,x,5,x,1\r\n5,y,5,y,1\r\n5,y:,5,y:,1\r\n5,z,5,z,1\r\n'),
-('Final CV - final coda skiped + RED inside base', '| Input   | Output     |\r\n|---------|------------|\r\n| X-CV    | X-CV-CV    |\r\n| X-CVC   | X-CV-CVC   |\r\n| XYZ-CV  | XYZ-CV-CV  |\r\n| XYZ-CVC | XYZ-CV-CVC |', 'Two allomorphs\r\nInput=#X-CV-(C~f~)$ where X is any string of symbols\r\nOutput=#X-CV\\~CV-(C~f~)%\r\nIf the word ends in CV, the final string is repeated. Else if the word ends in CVC~f~,then the CV is repeated and placed before the final C\r\n', '\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1 outputs the base once until the last CV\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n%states q2-3 make sure that C isnt outputed unless nonfinal\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%states q4 and up handle the last CV(C) both in base and red\r\n\\node[state] (q4) [below of=q0] {$q_4$};\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n\\node[state] (q6) [right of=q5] {$q_6$};\r\n\\node[state] (q7) [right of=q6] {$q_7$};\r\n\\node[state] (q8) [below of=q6] {$q_8$};\r\n\\node[state] (q9) [right of=q8] {$q_9$};\r\n\\node[state] (q10) [right of=q9] {$q_{10}$};\r\n\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge[loop above] node {(V,V,+1)} (q1)\r\n(q1) edge node {(C,$\\epsilon$,+1)} (q2)\r\n(q2) edge node {($\\Sigma$,$\\epsilon$,-1)} (q3)\r\n(q3) edge[bend right=45] node[above] {(C,C,+1)} (q1)\r\n\r\n\r\n\r\n(q1) edge node[left] {(\\%,$\\epsilon$,-1)} (q4)\r\n(q2) edge node {(\\%,$\\epsilon$,-1)} (q4)\r\n(q4) edge node {(C,$\\epsilon$,-1)} (q5)\r\n(q4) edge[bend right] node {(V,$\\epsilon$,-1)} (q6)\r\n(q5) edge node {(V,$\\epsilon$,-1)} (q6)\r\n(q6) edge node {(C,$\\sim$C,+1)} (q7)\r\n(q7) edge node {(V,V,+1)} (q8)\r\n(q8) edge node {(C,C,+1)} (q9)\r\n(q8) edge[bend right] node[below] {(\\%,\\%,+1)} (q10)\r\n(q9) edge node {(\\%,$\\epsilon$,+1)} (q10)\r\n\r\n\r\n\r\n\r\n\r\n\r\n;\r\n\\end{tikzpicture}\r\nQ', 1, '#Final CV reduplication without coda and within the syllable\r\n#The final CV syllable is reduplicated. If it has a (simplex) coda, then the simplex coda is placed after both copies\r\n#The function is not defined for words which end in anything other than CV or CVC\r\n#e.g. kipar --> kipa~par, kipa --> kipa~pa, kipart --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first copy\',\'check if reached final C\',\'wasnt final C\',\'return\',\'skipping final C in reduplicant\',\'skipping final V in reduplicant\',\'output second copys C\',\'output second copys CV\',\'output second copys CVC\',\'end\'] \r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first copy\', \'\', 1)\r\n(\'output first copy\', \\vowels) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \\consonants) = (\'check if reached final C\', \'\', 1)\r\n(\'check if reached final C\', \\alphabet ) = (\'wasnt final C\',  \'\',-1)\r\n(\'wasnt final C\', \\consonants) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \'%\') = (\'return\', \'\',-1)\r\n(\'check if reached final C\',\'%\') = (\'return\', \'\',-1) \r\n(\'return\', \\consonants) =  (\'skipping final C in reduplicant\', \'\',-1)\r\n(\'return\', \\vowels) = (\'skipping final V in reduplicant\',\'\', -1)\r\n(\'skipping final C in reduplicant\', \\vowels )=( \'skipping final V in reduplicant\', \'\',-1)\r\n(\'skipping final V in reduplicant\', \\consonants) = (\'output second copys C\', [\'~\'+\\ID], 1)\r\n(\'output second copys C\' , \\vowels) =  (\'output second copys CV\' ,\\ID, 1))\r\n(\'output second copys CV\' , \\consonants) =  (\'output second copys CVC\',\\ID,1)\r\n(\'output second copys CV\', \'%\') = (\'end\', \'\', 1)\r\n(\'output second copys CVC\', \'%\') =  (\'end\', \'\', 1) ', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Final CV reduplication without coda and within the syllable\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first copy\r\n3	check if reached final C\r\n4	wasnt final C\r\n5	return\r\n6	skipping final C in reduplicant\r\n7	skipping final V in reduplicant\r\n8	output second copys C\r\n9	output second copys CV\r\n10	output second copys CVC\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n10,%,1,,1\r\n2,%,5,,-1\r\n2,`a,2,`a,1\r\n2,`a:,2,`a:,1\r\n2,`e,2,`e,1\r\n2,`e:,2,`e:,1\r\n2,`i,2,`i,1\r\n2,`i:,2,`i:,1\r\n2,`o,2,`o,1\r\n2,`o:,2,`o:,1\r\n2,`u,2,`u,1\r\n2,`u:,2,`u:,1\r\n2,`y,2,`y,1\r\n2,`y:,2,`y:,1\r\n2,a,2,a,1\r\n2,a:,2,a:,1\r\n2,b,3,,1\r\n2,c,3,,1\r\n2,d,3,,1\r\n2,e,2,e,1\r\n2,e:,2,e:,1\r\n2,f,3,,1\r\n2,g,3,,1\r\n2,h,3,,1\r\n2,i,2,i,1\r\n2,i:,2,i:,1\r\n2,j,3,,1\r\n2,k,3,,1\r\n2,l,3,,1\r\n2,m,3,,1\r\n2,n,3,,1\r\n2,o,2,o,1\r\n2,o:,2,o:,1\r\n2,p,3,,1\r\n2,q,3,,1\r\n2,r,3,,1\r\n2,s,3,,1\r\n2,t,3,,1\r\n2,u,2,u,1\r\n2,u:,2,u:,1\r\n2,v,3,,1\r\n2,w,3,,1\r\n2,x,3,,1\r\n2,y,2,y,1\r\n2,y:,2,y:,1\r\n2,z,3,,1\r\n3,%,5,,-1\r\n3,+,4,,-1\r\n3,.,4,,-1\r\n3,`a,4,,-1\r\n3,`a:,4,,-1\r\n3,`e,4,,-1\r\n3,`e:,4,,-1\r\n3,`i,4,,-1\r\n3,`i:,4,,-1\r\n3,`o,4,,-1\r\n3,`o:,4,,-1\r\n3,`u,4,,-1\r\n3,`u:,4,,-1\r\n3,`y,4,,-1\r\n3,`y:,4,,-1\r\n3,a,4,,-1\r\n3,a:,4,,-1\r\n3,b,4,,-1\r\n3,c,4,,-1\r\n3,d,4,,-1\r\n3,e,4,,-1\r\n3,e:,4,,-1\r\n3,f,4,,-1\r\n3,g,4,,-1\r\n3,h,4,,-1\r\n3,i,4,,-1\r\n3,i:,4,,-1\r\n3,j,4,,-1\r\n3,k,4,,-1\r\n3,l,4,,-1\r\n3,m,4,,-1\r\n3,n,4,,-1\r\n3,o,4,,-1\r\n3,o:,4,,-1\r\n3,p,4,,-1\r\n3,q,4,,-1\r\n3,r,4,,-1\r\n3,s,4,,-1\r\n3,t,4,,-1\r\n3,u,4,,-1\r\n3,u:,4,,-1\r\n3,v,4,,-1\r\n3,w,4,,-1\r\n3,x,4,,-1\r\n3,y,4,,-1\r\n3,y:,4,,-1\r\n3,z,4,,-1\r\n4,b,2,b,1\r\n4,c,2,c,1\r\n4,d,2,d,1\r\n4,f,2,f,1\r\n4,g,2,g,1\r\n4,h,2,h,1\r\n4,j,2,j,1\r\n4,k,2,k,1\r\n4,l,2,l,1\r\n4,m,2,m,1\r\n4,n,2,n,1\r\n4,p,2,p,1\r\n4,q,2,q,1\r\n4,r,2,r,1\r\n4,s,2,s,1\r\n4,t,2,t,1\r\n4,v,2,v,1\r\n4,w,2,w,1\r\n4,x,2,x,1\r\n4,z,2,z,1\r\n5,`a,7,,-1\r\n5,`a:,7,,-1\r\n5,`e,7,,-1\r\n5,`e:,7,,-1\r\n5,`i,7,,-1\r\n5,`i:,7,,-1\r\n5,`o,7,,-1\r\n5,`o:,7,,-1\r\n5,`u,7,,-1\r\n5,`u:,7,,-1\r\n5,`y,7,,-1\r\n5,`y:,7,,-1\r\n5,a,7,,-1\r\n5,a:,7,,-1\r\n5,b,6,,-1\r\n5,c,6,,-1\r\n5,d,6,,-1\r\n5,e,7,,-1\r\n5,e:,7,,-1\r\n5,f,6,,-1\r\n5,g,6,,-1\r\n5,h,6,,-1\r\n5,i,7,,-1\r\n5,i:,7,,-1\r\n5,j,6,,-1\r\n5,k,6,,-1\r\n5,l,6,,-1\r\n5,m,6,,-1\r\n5,n,6,,-1\r\n5,o,7,,-1\r\n5,o:,7,,-1\r\n5,p,6,,-1\r\n5,q,6,,-1\r\n5,r,6,,-1\r\n5,s,6,,-1\r\n5,t,6,,-1\r\n5,u,7,,-1\r\n5,u:,7,,-1\r\n5,v,6,,-1\r\n5,w,6,,-1\r\n5,x,6,,-1\r\n5,y,7,,-1\r\n5,y:,7,,-1\r\n5,z,6,,-1\r\n6,`a,7,,-1\r\n6,`a:,7,,-1\r\n6,`e,7,,-1\r\n6,`e:,7,,-1\r\n6,`i,7,,-1\r\n6,`i:,7,,-1\r\n6,`o,7,,-1\r\n6,`o:,7,,-1\r\n6,`u,7,,-1\r\n6,`u:,7,,-1\r\n6,`y,7,,-1\r\n6,`y:,7,,-1\r\n6,a,7,,-1\r\n6,a:,7,,-1\r\n6,e,7,,-1\r\n6,e:,7,,-1\r\n6,i,7,,-1\r\n6,i:,7,,-1\r\n6,o,7,,-1\r\n6,o:,7,,-1\r\n6,u,7,,-1\r\n6,u:,7,,-1\r\n6,y,7,,-1\r\n6,y:,7,,-1\r\n7,b,8,~\'+\\I,1\r\n7,c,8,~\'+\\I,1\r\n7,d,8,~\'+\\I,1\r\n7,f,8,~\'+\\I,1\r\n7,g,8,~\'+\\I,1\r\n7,h,8,~\'+\\I,1\r\n7,j,8,~\'+\\I,1\r\n7,k,8,~\'+\\I,1\r\n7,l,8,~\'+\\I,1\r\n7,m,8,~\'+\\I,1\r\n7,n,8,~\'+\\I,1\r\n7,p,8,~\'+\\I,1\r\n7,q,8,~\'+\\I,1\r\n7,r,8,~\'+\\I,1\r\n7,s,8,~\'+\\I,1\r\n7,t,8,~\'+\\I,1\r\n7,v,8,~\'+\\I,1\r\n7,w,8,~\'+\\I,1\r\n7,x,8,~\'+\\I,1\r\n7,z,8,~\'+\\I,1\r\n8,`a,9,`a,1\r\n8,`a:,9,`a:,1\r\n8,`e,9,`e,1\r\n8,`e:,9,`e:,1\r\n8,`i,9,`i,1\r\n8,`i:,9,`i:,1\r\n8,`o,9,`o,1\r\n8,`o:,9,`o:,1\r\n8,`u,9,`u,1\r\n8,`u:,9,`u:,1\r\n8,`y,9,`y,1\r\n8,`y:,9,`y:,1\r\n8,a,9,a,1\r\n8,a:,9,a:,1\r\n8,e,9,e,1\r\n8,e:,9,e:,1\r\n8,i,9,i,1\r\n8,i:,9,i:,1\r\n8,o,9,o,1\r\n8,o:,9,o:,1\r\n8,u,9,u,1\r\n8,u:,9,u:,1\r\n8,y,9,y,1\r\n8,y:,9,y:,1\r\n9,%,1,,1\r\n9,b,10,b,1\r\n9,c,10,c,1\r\n9,d,10,d,1\r\n9,f,10,f,1\r\n9,g,10,g,1\r\n9,h,10,h,1\r\n9,j,10,j,1\r\n9,k,10,k,1\r\n9,l,10,l,1\r\n9,m,10,m,1\r\n9,n,10,n,1\r\n9,p,10,p,1\r\n9,q,10,q,1\r\n9,r,10,r,1\r\n9,s,10,s,1\r\n9,t,10,t,1\r\n9,v,10,v,1\r\n9,w,10,w,1\r\n9,x,10,x,1\r\n9,z,10,z,1\r\n'),
+('Final CV - final coda skiped + RED inside base', '| Input   | Output     |\r\n|---------|------------|\r\n| X-CV    | X-CV-CV    |\r\n| X-CVC   | X-CV-CVC   |\r\n| XYZ-CV  | XYZ-CV-CV  |\r\n| XYZ-CVC | XYZ-CV-CVC |', 'Two allomorphs\r\nInput=#X-CV-(C~f~)$ where X is any string of symbols\r\nOutput=#X-CV\\~CV-(C~f~)%\r\nIf the word ends in CV, the final string is repeated. Else if the word ends in CVC~f~,then the CV is repeated and placed before the final C\r\n', '\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1 outputs the base once until the last CV\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n%states q2-3 make sure that C isnt outputed unless nonfinal\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%states q4 and up handle the last CV(C) both in base and red\r\n\\node[state] (q4) [below of=q0] {$q_4$};\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n\\node[state] (q6) [right of=q5] {$q_6$};\r\n\\node[state] (q7) [right of=q6] {$q_7$};\r\n\\node[state] (q8) [below of=q6] {$q_8$};\r\n\\node[state] (q9) [right of=q8] {$q_9$};\r\n\\node[state] (q10) [right of=q9] {$q_{10}$};\r\n\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge[loop above] node {(V,V,+1)} (q1)\r\n(q1) edge node {(C,$\\epsilon$,+1)} (q2)\r\n(q2) edge node {($\\Sigma$,$\\epsilon$,-1)} (q3)\r\n(q3) edge[bend right=45] node[above] {(C,C,+1)} (q1)\r\n\r\n\r\n\r\n(q1) edge node[left] {(\\%,$\\epsilon$,-1)} (q4)\r\n(q2) edge node {(\\%,$\\epsilon$,-1)} (q4)\r\n(q4) edge node {(C,$\\epsilon$,-1)} (q5)\r\n(q4) edge[bend right] node {(V,$\\epsilon$,-1)} (q6)\r\n(q5) edge node {(V,$\\epsilon$,-1)} (q6)\r\n(q6) edge node {(C,$\\sim$C,+1)} (q7)\r\n(q7) edge node {(V,V,+1)} (q8)\r\n(q8) edge node {(C,C,+1)} (q9)\r\n(q8) edge[bend right] node[below] {(\\%,\\%,+1)} (q10)\r\n(q9) edge node {(\\%,$\\epsilon$,+1)} (q10)\r\n\r\n\r\n\r\n\r\n\r\n\r\n;\r\n\\end{tikzpicture}\r\nQ', 1, '#Final CV reduplication without coda and within the syllable\r\n#The final CV syllable is reduplicated. If it has a (simplex) coda, then the simplex coda is placed after both copies\r\n#The function is not defined for words which end in anything other than CV or CVC\r\n#e.g. kipar --> kipa~par, kipa --> kipa~pa, kipart --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first copy\',\'check if reached final C\',\'wasnt final C\',\'return\',\'skipping final C in reduplicant\',\'skipping final V in reduplicant\',\'output second copys C\',\'output second copys CV\',\'output second copys CVC\',\'end\'] \r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first copy\', \'\', 1)\r\n(\'output first copy\', \\vowels) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \\consonants) = (\'check if reached final C\', \'\', 1)\r\n(\'check if reached final C\', \\alphabet ) = (\'wasnt final C\',  \'\',-1)\r\n(\'wasnt final C\', \\consonants) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \'%\') = (\'return\', \'\',-1)\r\n(\'check if reached final C\',\'%\') = (\'return\', \'\',-1) \r\n(\'return\', \\consonants) =  (\'skipping final C in reduplicant\', \'\',-1)\r\n(\'return\', \\vowels) = (\'skipping final V in reduplicant\',\'\', -1)\r\n(\'skipping final C in reduplicant\', \\vowels )=( \'skipping final V in reduplicant\', \'\',-1)\r\n(\'skipping final V in reduplicant\', \\consonants) = (\'output second copys C\', [\'~\' \\ID], 1)\r\n(\'output second copys C\' , \\vowels) =  (\'output second copys CV\' ,\\ID, 1)\r\n(\'output second copys CV\' , \\consonants) =  (\'output second copys CVC\',\\ID,1)\r\n(\'output second copys CV\', \'%\') = (\'end\', \'\', 1)\r\n(\'output second copys CVC\', \'%\') =  (\'end\', \'\', 1) ', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Final CV reduplication without coda and within the syllable\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first copy\r\n3	check if reached final C\r\n4	wasnt final C\r\n5	return\r\n6	skipping final C in reduplicant\r\n7	skipping final V in reduplicant\r\n8	output second copys C\r\n9	output second copys CV\r\n10	output second copys CVC\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n10,%,1,,1\r\n2,%,5,,-1\r\n2,`a,2,`a,1\r\n2,`a:,2,`a:,1\r\n2,`e,2,`e,1\r\n2,`e:,2,`e:,1\r\n2,`i,2,`i,1\r\n2,`i:,2,`i:,1\r\n2,`o,2,`o,1\r\n2,`o:,2,`o:,1\r\n2,`u,2,`u,1\r\n2,`u:,2,`u:,1\r\n2,`y,2,`y,1\r\n2,`y:,2,`y:,1\r\n2,a,2,a,1\r\n2,a:,2,a:,1\r\n2,b,3,,1\r\n2,c,3,,1\r\n2,d,3,,1\r\n2,e,2,e,1\r\n2,e:,2,e:,1\r\n2,f,3,,1\r\n2,g,3,,1\r\n2,h,3,,1\r\n2,i,2,i,1\r\n2,i:,2,i:,1\r\n2,j,3,,1\r\n2,k,3,,1\r\n2,l,3,,1\r\n2,m,3,,1\r\n2,n,3,,1\r\n2,o,2,o,1\r\n2,o:,2,o:,1\r\n2,p,3,,1\r\n2,q,3,,1\r\n2,r,3,,1\r\n2,s,3,,1\r\n2,t,3,,1\r\n2,u,2,u,1\r\n2,u:,2,u:,1\r\n2,v,3,,1\r\n2,w,3,,1\r\n2,x,3,,1\r\n2,y,2,y,1\r\n2,y:,2,y:,1\r\n2,z,3,,1\r\n3,%,5,,-1\r\n3,+,4,,-1\r\n3,.,4,,-1\r\n3,`a,4,,-1\r\n3,`a:,4,,-1\r\n3,`e,4,,-1\r\n3,`e:,4,,-1\r\n3,`i,4,,-1\r\n3,`i:,4,,-1\r\n3,`o,4,,-1\r\n3,`o:,4,,-1\r\n3,`u,4,,-1\r\n3,`u:,4,,-1\r\n3,`y,4,,-1\r\n3,`y:,4,,-1\r\n3,a,4,,-1\r\n3,a:,4,,-1\r\n3,b,4,,-1\r\n3,c,4,,-1\r\n3,d,4,,-1\r\n3,e,4,,-1\r\n3,e:,4,,-1\r\n3,f,4,,-1\r\n3,g,4,,-1\r\n3,h,4,,-1\r\n3,i,4,,-1\r\n3,i:,4,,-1\r\n3,j,4,,-1\r\n3,k,4,,-1\r\n3,l,4,,-1\r\n3,m,4,,-1\r\n3,n,4,,-1\r\n3,o,4,,-1\r\n3,o:,4,,-1\r\n3,p,4,,-1\r\n3,q,4,,-1\r\n3,r,4,,-1\r\n3,s,4,,-1\r\n3,t,4,,-1\r\n3,u,4,,-1\r\n3,u:,4,,-1\r\n3,v,4,,-1\r\n3,w,4,,-1\r\n3,x,4,,-1\r\n3,y,4,,-1\r\n3,y:,4,,-1\r\n3,z,4,,-1\r\n4,b,2,b,1\r\n4,c,2,c,1\r\n4,d,2,d,1\r\n4,f,2,f,1\r\n4,g,2,g,1\r\n4,h,2,h,1\r\n4,j,2,j,1\r\n4,k,2,k,1\r\n4,l,2,l,1\r\n4,m,2,m,1\r\n4,n,2,n,1\r\n4,p,2,p,1\r\n4,q,2,q,1\r\n4,r,2,r,1\r\n4,s,2,s,1\r\n4,t,2,t,1\r\n4,v,2,v,1\r\n4,w,2,w,1\r\n4,x,2,x,1\r\n4,z,2,z,1\r\n5,`a,7,,-1\r\n5,`a:,7,,-1\r\n5,`e,7,,-1\r\n5,`e:,7,,-1\r\n5,`i,7,,-1\r\n5,`i:,7,,-1\r\n5,`o,7,,-1\r\n5,`o:,7,,-1\r\n5,`u,7,,-1\r\n5,`u:,7,,-1\r\n5,`y,7,,-1\r\n5,`y:,7,,-1\r\n5,a,7,,-1\r\n5,a:,7,,-1\r\n5,b,6,,-1\r\n5,c,6,,-1\r\n5,d,6,,-1\r\n5,e,7,,-1\r\n5,e:,7,,-1\r\n5,f,6,,-1\r\n5,g,6,,-1\r\n5,h,6,,-1\r\n5,i,7,,-1\r\n5,i:,7,,-1\r\n5,j,6,,-1\r\n5,k,6,,-1\r\n5,l,6,,-1\r\n5,m,6,,-1\r\n5,n,6,,-1\r\n5,o,7,,-1\r\n5,o:,7,,-1\r\n5,p,6,,-1\r\n5,q,6,,-1\r\n5,r,6,,-1\r\n5,s,6,,-1\r\n5,t,6,,-1\r\n5,u,7,,-1\r\n5,u:,7,,-1\r\n5,v,6,,-1\r\n5,w,6,,-1\r\n5,x,6,,-1\r\n5,y,7,,-1\r\n5,y:,7,,-1\r\n5,z,6,,-1\r\n6,`a,7,,-1\r\n6,`a:,7,,-1\r\n6,`e,7,,-1\r\n6,`e:,7,,-1\r\n6,`i,7,,-1\r\n6,`i:,7,,-1\r\n6,`o,7,,-1\r\n6,`o:,7,,-1\r\n6,`u,7,,-1\r\n6,`u:,7,,-1\r\n6,`y,7,,-1\r\n6,`y:,7,,-1\r\n6,a,7,,-1\r\n6,a:,7,,-1\r\n6,e,7,,-1\r\n6,e:,7,,-1\r\n6,i,7,,-1\r\n6,i:,7,,-1\r\n6,o,7,,-1\r\n6,o:,7,,-1\r\n6,u,7,,-1\r\n6,u:,7,,-1\r\n6,y,7,,-1\r\n6,y:,7,,-1\r\n7,b,8,~\'+\\I,1\r\n7,c,8,~\'+\\I,1\r\n7,d,8,~\'+\\I,1\r\n7,f,8,~\'+\\I,1\r\n7,g,8,~\'+\\I,1\r\n7,h,8,~\'+\\I,1\r\n7,j,8,~\'+\\I,1\r\n7,k,8,~\'+\\I,1\r\n7,l,8,~\'+\\I,1\r\n7,m,8,~\'+\\I,1\r\n7,n,8,~\'+\\I,1\r\n7,p,8,~\'+\\I,1\r\n7,q,8,~\'+\\I,1\r\n7,r,8,~\'+\\I,1\r\n7,s,8,~\'+\\I,1\r\n7,t,8,~\'+\\I,1\r\n7,v,8,~\'+\\I,1\r\n7,w,8,~\'+\\I,1\r\n7,x,8,~\'+\\I,1\r\n7,z,8,~\'+\\I,1\r\n8,`a,9,`a,1\r\n8,`a:,9,`a:,1\r\n8,`e,9,`e,1\r\n8,`e:,9,`e:,1\r\n8,`i,9,`i,1\r\n8,`i:,9,`i:,1\r\n8,`o,9,`o,1\r\n8,`o:,9,`o:,1\r\n8,`u,9,`u,1\r\n8,`u:,9,`u:,1\r\n8,`y,9,`y,1\r\n8,`y:,9,`y:,1\r\n8,a,9,a,1\r\n8,a:,9,a:,1\r\n8,e,9,e,1\r\n8,e:,9,e:,1\r\n8,i,9,i,1\r\n8,i:,9,i:,1\r\n8,o,9,o,1\r\n8,o:,9,o:,1\r\n8,u,9,u,1\r\n8,u:,9,u:,1\r\n8,y,9,y,1\r\n8,y:,9,y:,1\r\n9,%,1,,1\r\n9,b,10,b,1\r\n9,c,10,c,1\r\n9,d,10,d,1\r\n9,f,10,f,1\r\n9,g,10,g,1\r\n9,h,10,h,1\r\n9,j,10,j,1\r\n9,k,10,k,1\r\n9,l,10,l,1\r\n9,m,10,m,1\r\n9,n,10,n,1\r\n9,p,10,p,1\r\n9,q,10,q,1\r\n9,r,10,r,1\r\n9,s,10,s,1\r\n9,t,10,t,1\r\n9,v,10,v,1\r\n9,w,10,w,1\r\n9,x,10,x,1\r\n9,z,10,z,1\r\n'),
 ('Final CV - General reduplication', '| Input  | Output    |\r\n|--------|-----------|\r\n| X-CV   | X-CV-CV   |', 'Input=#X-CV$ where X is any string of symbols\r\nOutput=#X-CV\\~CV%\r\nThe word-final CV string is repeated. I assume that inputs ends with CV and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the base once\r\n\\node[state] (q2) [right of=q0] {$q_2$};\r\n%states q4-9 goes back to the last CV, ouputs it as a reduplicant, and then ends.\r\n\\node[state] (q4) [below of=q2] {$q_4$};\r\n\\node[state] (q5) [left of=q4] {$q_5$};\r\n\\node[state] (q6) [below of=q5] {$q_6$};\r\n\\node[state] (q7) [right of=q6] {$q_7$};\r\n\\node[state,accepting] (q8) [right of=q7] {$q_8$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q2)\r\n(q2) edge[loop above]  node {($\\Sigma$,$\\Simga$,+1)} (q2)\r\n(q2) edge node {(\\%,$\\epsilon$,-1)} (q4)\r\n(q4) edge node {(V,$\\epsilon$,-1)} (q5)\r\n(q5) edge node {(C,$\\sim$C,+1)} (q6)\r\n(q6) edge node {(V,V,+1)} (q7)\r\n(q7) edge node[below] {(\\%,$\\epsilon$,1)} (q8)\r\n\r\n;\r\n\\end{tikzpicture}', 0, '#Final CV reduplication without coda and within the syllable\r\n#The final CV syllable is reduplicated.\r\n#This will work for any word ending in CV. \r\n#The function is undefined for any word that ends in any  substring which isnt CV\r\n#e.g. kipa --> kipa~pa, kipar --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first copy\',\'return\',\'skipping final V in reduplicant\',\'output second copys C\',\'output second copys V\',\'end\'] \r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first copy\', \'\',1)\r\n(\'output first copy\', \\alphabet ) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \'%\') =  (\'return\', \'\', -1)\r\n(\'return\', \\vowels) = (\'skipping final V in reduplicant\',\'\',-1)\r\n(\'skipping final V in reduplicant\', \\consonants) = (\'output second copys C\', [\'~\' \\ID], 1)\r\n(\'output second copys C\', \\vowels) = (\'output second copys V\', \\ID, 1)\r\n(\'output second copys V\', \'%\') =  (\'end\', \'\', 1) ', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Final CV reduplication without coda and within the syllable\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first copy\r\n3	return\r\n4	skipping final V in reduplicant\r\n5	output second copys C\r\n6	output second copys V\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,%,3,,-1\r\n2,+,2,+,1\r\n2,.,2,.,1\r\n2,`a,2,`a,1\r\n2,`a:,2,`a:,1\r\n2,`e,2,`e,1\r\n2,`e:,2,`e:,1\r\n2,`i,2,`i,1\r\n2,`i:,2,`i:,1\r\n2,`o,2,`o,1\r\n2,`o:,2,`o:,1\r\n2,`u,2,`u,1\r\n2,`u:,2,`u:,1\r\n2,`y,2,`y,1\r\n2,`y:,2,`y:,1\r\n2,a,2,a,1\r\n2,a:,2,a:,1\r\n2,b,2,b,1\r\n2,c,2,c,1\r\n2,d,2,d,1\r\n2,e,2,e,1\r\n2,e:,2,e:,1\r\n2,f,2,f,1\r\n2,g,2,g,1\r\n2,h,2,h,1\r\n2,i,2,i,1\r\n2,i:,2,i:,1\r\n2,j,2,j,1\r\n2,k,2,k,1\r\n2,l,2,l,1\r\n2,m,2,m,1\r\n2,n,2,n,1\r\n2,o,2,o,1\r\n2,o:,2,o:,1\r\n2,p,2,p,1\r\n2,q,2,q,1\r\n2,r,2,r,1\r\n2,s,2,s,1\r\n2,t,2,t,1\r\n2,u,2,u,1\r\n2,u:,2,u:,1\r\n2,v,2,v,1\r\n2,w,2,w,1\r\n2,x,2,x,1\r\n2,y,2,y,1\r\n2,y:,2,y:,1\r\n2,z,2,z,1\r\n3,`a,4,,-1\r\n3,`a:,4,,-1\r\n3,`e,4,,-1\r\n3,`e:,4,,-1\r\n3,`i,4,,-1\r\n3,`i:,4,,-1\r\n3,`o,4,,-1\r\n3,`o:,4,,-1\r\n3,`u,4,,-1\r\n3,`u:,4,,-1\r\n3,`y,4,,-1\r\n3,`y:,4,,-1\r\n3,a,4,,-1\r\n3,a:,4,,-1\r\n3,e,4,,-1\r\n3,e:,4,,-1\r\n3,i,4,,-1\r\n3,i:,4,,-1\r\n3,o,4,,-1\r\n3,o:,4,,-1\r\n3,u,4,,-1\r\n3,u:,4,,-1\r\n3,y,4,,-1\r\n3,y:,4,,-1\r\n4,b,5,~b,1\r\n4,c,5,~c,1\r\n4,d,5,~d,1\r\n4,f,5,~f,1\r\n4,g,5,~g,1\r\n4,h,5,~h,1\r\n4,j,5,~j,1\r\n4,k,5,~k,1\r\n4,l,5,~l,1\r\n4,m,5,~m,1\r\n4,n,5,~n,1\r\n4,p,5,~p,1\r\n4,q,5,~q,1\r\n4,r,5,~r,1\r\n4,s,5,~s,1\r\n4,t,5,~t,1\r\n4,v,5,~v,1\r\n4,w,5,~w,1\r\n4,x,5,~x,1\r\n4,z,5,~z,1\r\n5,`a,6,`a,1\r\n5,`a:,6,`a:,1\r\n5,`e,6,`e,1\r\n5,`e:,6,`e:,1\r\n5,`i,6,`i,1\r\n5,`i:,6,`i:,1\r\n5,`o,6,`o,1\r\n5,`o:,6,`o:,1\r\n5,`u,6,`u,1\r\n5,`u:,6,`u:,1\r\n5,`y,6,`y,1\r\n5,`y:,6,`y:,1\r\n5,a,6,a,1\r\n5,a:,6,a:,1\r\n5,e,6,e,1\r\n5,e:,6,e:,1\r\n5,i,6,i,1\r\n5,i:,6,i:,1\r\n5,o,6,o,1\r\n5,o:,6,o:,1\r\n5,u,6,u,1\r\n5,u:,6,u:,1\r\n5,y,6,y,1\r\n5,y:,6,y:,1\r\n6,%,1,,1\r\n'),
 ('Final CVC - complex onsets & codaless vowels are okay', '| Input  | Output      |\r\n|--------|-------------|\r\n| X-CVC  | X-CVC-CVC   |\r\n| X-CV   | X-CV-CV     |\r\n| X-CCVC | X-CCVC-CCVC |\r\n| X-CCV  | X-CCV-CCV   |', 'Two allomorphs\r\nInput=#X-B$ where X is any string of symbols and B is ( C ) CV ( C )\r\nOutput=#X-B~B%\r\n\r\nThe word-final ( C ) CV ( C ) is repeated. Complex onsets are copied. Codaless vowels are okay', '\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1 outputs the base once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n%states q2-7 goes back to the last CVC, ouputs it as a reduplicant, and then ends.\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n\\node[state] (q6) [below of=q1] {$q_6$};\r\n\\node[state,accepting] (q7) [right of=q6] {$q_7$};\r\n\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge[loop above]  node {($\\Sigma$,$\\Sigma$,+1)} (q1)\r\n(q1) edge node {(\\%,$\\sim$,-1)} (q2)\r\n(q2) edge node {(C,$\\epsilon$,-1)} (q3)\r\n(q2) edge[bend left] node {(V,$\\epsilon$,-1)} (q4)\r\n(q3) edge node {(V,$\\epsilon$,-1)} (q4)\r\n(q4) edge node {(C,$\\epsilon$,-1)} (q5)\r\n(q5) edge[bend left] node {(C,C,+1)} (q6)\r\n(q5) edge node {(\\{\\#,V\\},$\\epsilon$,+1)} (q6)\r\n(q6) edge[loop left] node {($\\Sigma$,$\\Sigma$,+1)} (q6)\r\n(q6) edge node[below] {(\\%,$\\epsilon$,+1)} (q7)\r\n\r\n;\r\n\\end{tikzpicture}', 1, '#Final CVC reduplication, complex onsets and codaless syllables are allowed\r\n#The final CVC syllable is reduplicated.\r\n#If the final syllable doesnt have a coda, it is still copied\r\n#If the final vowel follows two consonants, they are both copied\r\n#The bibliography so far was ambiguous on syllabification. \r\n#If it\'s really about syllable boundaries, then they can be added later\r\n#The function is not defined for an onsetless final syllable\r\n#e.g. kipa --> kipa~pa, kipar --> kipar --> kipar~par, kispar --> kispar~spar, ar--> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first copy\',\'return\',\'skipping final C\', \'skipping final V\', \'skipping final onset\',\'output second copy\',\'end\'] \r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first copy\', \'\', 1)\r\n(\'output first copy\', \\alphabet ) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \'%\') = (\'return\', \'~\', -1)\r\n(\'return\', \\consonants) = (\'skipping final C\', \'\',-1)\r\n(\'return\', \\vowels) = (\'skipping final V\', \'\', -1)\r\n(\'skipping final C\', \\vowels ) = (\'skipping final V\', \'\',-1)\r\n(\'skipping final V\', \\consonants) =(\'skipping final onset\', \'\', -1)\r\n(\'skipping final onset\', \\consonants) = (\'output second copy\', \\ID, 1)\r\n(\'skipping final onset\', \'#\') =  (\'output second copy\', \'\',1)\r\n(\'skipping final onset\', \\vowels) = (\'output second copy\', \'\',1)\r\n(\'output second copy\', \\alphabet) =  (\'output second copy\', \\ID, 1)\r\n(\'output second copy\', \'%\') =  (\'end\', \'\', 1)\r\n\r\n\r\n\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Final CVC reduplication, complex onsets and codaless syllables are allowed\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first copy\r\n3	return\r\n4	skipping final C\r\n5	skipping final V\r\n6	skipping final onset\r\n7	output second copy\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,%,3,~,-1\r\n2,+,2,+,1\r\n2,.,2,.,1\r\n2,`a,2,`a,1\r\n2,`a:,2,`a:,1\r\n2,`e,2,`e,1\r\n2,`e:,2,`e:,1\r\n2,`i,2,`i,1\r\n2,`i:,2,`i:,1\r\n2,`o,2,`o,1\r\n2,`o:,2,`o:,1\r\n2,`u,2,`u,1\r\n2,`u:,2,`u:,1\r\n2,`y,2,`y,1\r\n2,`y:,2,`y:,1\r\n2,a,2,a,1\r\n2,a:,2,a:,1\r\n2,b,2,b,1\r\n2,c,2,c,1\r\n2,d,2,d,1\r\n2,e,2,e,1\r\n2,e:,2,e:,1\r\n2,f,2,f,1\r\n2,g,2,g,1\r\n2,h,2,h,1\r\n2,i,2,i,1\r\n2,i:,2,i:,1\r\n2,j,2,j,1\r\n2,k,2,k,1\r\n2,l,2,l,1\r\n2,m,2,m,1\r\n2,n,2,n,1\r\n2,o,2,o,1\r\n2,o:,2,o:,1\r\n2,p,2,p,1\r\n2,q,2,q,1\r\n2,r,2,r,1\r\n2,s,2,s,1\r\n2,t,2,t,1\r\n2,u,2,u,1\r\n2,u:,2,u:,1\r\n2,v,2,v,1\r\n2,w,2,w,1\r\n2,x,2,x,1\r\n2,y,2,y,1\r\n2,y:,2,y:,1\r\n2,z,2,z,1\r\n3,`a,5,,-1\r\n3,`a:,5,,-1\r\n3,`e,5,,-1\r\n3,`e:,5,,-1\r\n3,`i,5,,-1\r\n3,`i:,5,,-1\r\n3,`o,5,,-1\r\n3,`o:,5,,-1\r\n3,`u,5,,-1\r\n3,`u:,5,,-1\r\n3,`y,5,,-1\r\n3,`y:,5,,-1\r\n3,a,5,,-1\r\n3,a:,5,,-1\r\n3,b,4,,-1\r\n3,c,4,,-1\r\n3,d,4,,-1\r\n3,e,5,,-1\r\n3,e:,5,,-1\r\n3,f,4,,-1\r\n3,g,4,,-1\r\n3,h,4,,-1\r\n3,i,5,,-1\r\n3,i:,5,,-1\r\n3,j,4,,-1\r\n3,k,4,,-1\r\n3,l,4,,-1\r\n3,m,4,,-1\r\n3,n,4,,-1\r\n3,o,5,,-1\r\n3,o:,5,,-1\r\n3,p,4,,-1\r\n3,q,4,,-1\r\n3,r,4,,-1\r\n3,s,4,,-1\r\n3,t,4,,-1\r\n3,u,5,,-1\r\n3,u:,5,,-1\r\n3,v,4,,-1\r\n3,w,4,,-1\r\n3,x,4,,-1\r\n3,y,5,,-1\r\n3,y:,5,,-1\r\n3,z,4,,-1\r\n4,`a,5,,-1\r\n4,`a:,5,,-1\r\n4,`e,5,,-1\r\n4,`e:,5,,-1\r\n4,`i,5,,-1\r\n4,`i:,5,,-1\r\n4,`o,5,,-1\r\n4,`o:,5,,-1\r\n4,`u,5,,-1\r\n4,`u:,5,,-1\r\n4,`y,5,,-1\r\n4,`y:,5,,-1\r\n4,a,5,,-1\r\n4,a:,5,,-1\r\n4,e,5,,-1\r\n4,e:,5,,-1\r\n4,i,5,,-1\r\n4,i:,5,,-1\r\n4,o,5,,-1\r\n4,o:,5,,-1\r\n4,u,5,,-1\r\n4,u:,5,,-1\r\n4,y,5,,-1\r\n4,y:,5,,-1\r\n5,b,6,,-1\r\n5,c,6,,-1\r\n5,d,6,,-1\r\n5,f,6,,-1\r\n5,g,6,,-1\r\n5,h,6,,-1\r\n5,j,6,,-1\r\n5,k,6,,-1\r\n5,l,6,,-1\r\n5,m,6,,-1\r\n5,n,6,,-1\r\n5,p,6,,-1\r\n5,q,6,,-1\r\n5,r,6,,-1\r\n5,s,6,,-1\r\n5,t,6,,-1\r\n5,v,6,,-1\r\n5,w,6,,-1\r\n5,x,6,,-1\r\n5,z,6,,-1\r\n6,#,7,,1\r\n6,`a,7,,1\r\n6,`a:,7,,1\r\n6,`e,7,,1\r\n6,`e:,7,,1\r\n6,`i,7,,1\r\n6,`i:,7,,1\r\n6,`o,7,,1\r\n6,`o:,7,,1\r\n6,`u,7,,1\r\n6,`u:,7,,1\r\n6,`y,7,,1\r\n6,`y:,7,,1\r\n6,a,7,,1\r\n6,a:,7,,1\r\n6,b,7,b,1\r\n6,c,7,c,1\r\n6,d,7,d,1\r\n6,e,7,,1\r\n6,e:,7,,1\r\n6,f,7,f,1\r\n6,g,7,g,1\r\n6,h,7,h,1\r\n6,i,7,,1\r\n6,i:,7,,1\r\n6,j,7,j,1\r\n6,k,7,k,1\r\n6,l,7,l,1\r\n6,m,7,m,1\r\n6,n,7,n,1\r\n6,o,7,,1\r\n6,o:,7,,1\r\n6,p,7,p,1\r\n6,q,7,q,1\r\n6,r,7,r,1\r\n6,s,7,s,1\r\n6,t,7,t,1\r\n6,u,7,,1\r\n6,u:,7,,1\r\n6,v,7,v,1\r\n6,w,7,w,1\r\n6,x,7,x,1\r\n6,y,7,,1\r\n6,y:,7,,1\r\n6,z,7,z,1\r\n7,%,1,,1\r\n7,+,7,+,1\r\n7,.,7,.,1\r\n7,`a,7,`a,1\r\n7,`a:,7,`a:,1\r\n7,`e,7,`e,1\r\n7,`e:,7,`e:,1\r\n7,`i,7,`i,1\r\n7,`i:,7,`i:,1\r\n7,`o,7,`o,1\r\n7,`o:,7,`o:,1\r\n7,`u,7,`u,1\r\n7,`u:,7,`u:,1\r\n7,`y,7,`y,1\r\n7,`y:,7,`y:,1\r\n7,a,7,a,1\r\n7,a:,7,a:,1\r\n7,b,7,b,1\r\n7,c,7,c,1\r\n7,d,7,d,1\r\n7,e,7,e,1\r\n7,e:,7,e:,1\r\n7,f,7,f,1\r\n7,g,7,g,1\r\n7,h,7,h,1\r\n7,i,7,i,1\r\n7,i:,7,i:,1\r\n7,j,7,j,1\r\n7,k,7,k,1\r\n7,l,7,l,1\r\n7,m,7,m,1\r\n7,n,7,n,1\r\n7,o,7,o,1\r\n7,o:,7,o:,1\r\n7,p,7,p,1\r\n7,q,7,q,1\r\n7,r,7,r,1\r\n7,s,7,s,1\r\n7,t,7,t,1\r\n7,u,7,u,1\r\n7,u:,7,u:,1\r\n7,v,7,v,1\r\n7,w,7,w,1\r\n7,x,7,x,1\r\n7,y,7,y,1\r\n7,y:,7,y:,1\r\n7,z,7,z,1\r\n'),
 ('Final CVC - General reduplication ', '| Input   | Output      |\r\n|---------|-------------|\r\n| X-CVC   | X-CVC-CVC   |', 'Input=#X-CVC$ where X is any string of symbols\r\nOutput=#X-CVC\\~CVC%\r\nThe word-final CVC string is repeated. I assume that inputs ends with CVC and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-4 outputs the base once\r\n\\node[state] (q2) [right of=q0] {$q_2$};\r\n\\node[state] (q4) [below of=q2] {$q_4$};\r\n%states q5-9 goes back to the last CVC, ouputs it as a reduplicant, and then ends.\r\n\\node[state] (q5) [left of=q4] {$q_5$};\r\n\\node[state] (q6) [left of=q5] {$q_6$};\r\n\\node[state] (q7) [below of=q6] {$q_7$};\r\n\\node[state,accepting] (q8) [right of=q7] {$q_8$};\r\n \r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q2)\r\n\r\n(q2) edge[loop above]  node {($\\Sigma$,$\\Sigma$,+1)} (q2)\r\n(q2) edge node {(\\%,$\\epsilon$,-1)} (q4)\r\n\r\n(q4) edge node {(C,$\\epsilon$,-1)} (q5)\r\n(q5) edge node {(V,$\\epsilon$,-1)} (q6)\r\n(q6) edge node {(C,C,+1)} (q7)\r\n(q7) edge[loop left]  node {($\\Sigma$,$\\Sigma$,+1)} (q7)\r\n(q7) edge node[below] {(\\%,$\\epsilon$,+1)} (q8)\r\n\r\n;\r\n\\end{tikzpicture}\r\n\r\n', 0, '#Final CVC reduplication\r\n#The final CVC syllable is reduplicated.\r\n#The function is undefined for any word which ends in anything other than CVC\r\n#e.g. kipar --> kipar~par, kipa --> kipa~undefined, ar--> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first copy\',\'return\',\'skipping final C\', \'skipping final VC\', \'output second copy\',\'end\'] \r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first copy\', \'\', 1)\r\n(\'output first copy\', \\alphabet ) = (\'output first copy\', \\ID, 1)\r\n(\'output first copy\', \'%\') = (\'return\', \'~\', -1)\r\n(\'return\', \\consonants) = (\'skipping final C\', \'\',-1)\r\n(\'skipping final C\', \\vowels ) = (\'skipping final VC\', \'\',-1)\r\n(\'skipping final VC\', \\consonants) =(\'output second copy\', \\ID,1)\r\n(\'output second copy\', \\alphabet) =  (\'output second copy\', \\ID, 1)\r\n(\'output second copy\', \'%\') =  (\'end\', \'\', 1)\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Final CVC reduplication\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first copy\r\n3	return\r\n4	skipping final C\r\n5	skipping final VC\r\n6	output second copy\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,%,3,~,-1\r\n2,+,2,+,1\r\n2,.,2,.,1\r\n2,`a,2,`a,1\r\n2,`a:,2,`a:,1\r\n2,`e,2,`e,1\r\n2,`e:,2,`e:,1\r\n2,`i,2,`i,1\r\n2,`i:,2,`i:,1\r\n2,`o,2,`o,1\r\n2,`o:,2,`o:,1\r\n2,`u,2,`u,1\r\n2,`u:,2,`u:,1\r\n2,`y,2,`y,1\r\n2,`y:,2,`y:,1\r\n2,a,2,a,1\r\n2,a:,2,a:,1\r\n2,b,2,b,1\r\n2,c,2,c,1\r\n2,d,2,d,1\r\n2,e,2,e,1\r\n2,e:,2,e:,1\r\n2,f,2,f,1\r\n2,g,2,g,1\r\n2,h,2,h,1\r\n2,i,2,i,1\r\n2,i:,2,i:,1\r\n2,j,2,j,1\r\n2,k,2,k,1\r\n2,l,2,l,1\r\n2,m,2,m,1\r\n2,n,2,n,1\r\n2,o,2,o,1\r\n2,o:,2,o:,1\r\n2,p,2,p,1\r\n2,q,2,q,1\r\n2,r,2,r,1\r\n2,s,2,s,1\r\n2,t,2,t,1\r\n2,u,2,u,1\r\n2,u:,2,u:,1\r\n2,v,2,v,1\r\n2,w,2,w,1\r\n2,x,2,x,1\r\n2,y,2,y,1\r\n2,y:,2,y:,1\r\n2,z,2,z,1\r\n3,b,4,,-1\r\n3,c,4,,-1\r\n3,d,4,,-1\r\n3,f,4,,-1\r\n3,g,4,,-1\r\n3,h,4,,-1\r\n3,j,4,,-1\r\n3,k,4,,-1\r\n3,l,4,,-1\r\n3,m,4,,-1\r\n3,n,4,,-1\r\n3,p,4,,-1\r\n3,q,4,,-1\r\n3,r,4,,-1\r\n3,s,4,,-1\r\n3,t,4,,-1\r\n3,v,4,,-1\r\n3,w,4,,-1\r\n3,x,4,,-1\r\n3,z,4,,-1\r\n4,`a,5,,-1\r\n4,`a:,5,,-1\r\n4,`e,5,,-1\r\n4,`e:,5,,-1\r\n4,`i,5,,-1\r\n4,`i:,5,,-1\r\n4,`o,5,,-1\r\n4,`o:,5,,-1\r\n4,`u,5,,-1\r\n4,`u:,5,,-1\r\n4,`y,5,,-1\r\n4,`y:,5,,-1\r\n4,a,5,,-1\r\n4,a:,5,,-1\r\n4,e,5,,-1\r\n4,e:,5,,-1\r\n4,i,5,,-1\r\n4,i:,5,,-1\r\n4,o,5,,-1\r\n4,o:,5,,-1\r\n4,u,5,,-1\r\n4,u:,5,,-1\r\n4,y,5,,-1\r\n4,y:,5,,-1\r\n5,b,6,b,1\r\n5,c,6,c,1\r\n5,d,6,d,1\r\n5,f,6,f,1\r\n5,g,6,g,1\r\n5,h,6,h,1\r\n5,j,6,j,1\r\n5,k,6,k,1\r\n5,l,6,l,1\r\n5,m,6,m,1\r\n5,n,6,n,1\r\n5,p,6,p,1\r\n5,q,6,q,1\r\n5,r,6,r,1\r\n5,s,6,s,1\r\n5,t,6,t,1\r\n5,v,6,v,1\r\n5,w,6,w,1\r\n5,x,6,x,1\r\n5,z,6,z,1\r\n6,%,1,,1\r\n6,+,6,+,1\r\n6,.,6,.,1\r\n6,`a,6,`a,1\r\n6,`a:,6,`a:,1\r\n6,`e,6,`e,1\r\n6,`e:,6,`e:,1\r\n6,`i,6,`i,1\r\n6,`i:,6,`i:,1\r\n6,`o,6,`o,1\r\n6,`o:,6,`o:,1\r\n6,`u,6,`u,1\r\n6,`u:,6,`u:,1\r\n6,`y,6,`y,1\r\n6,`y:,6,`y:,1\r\n6,a,6,a,1\r\n6,a:,6,a:,1\r\n6,b,6,b,1\r\n6,c,6,c,1\r\n6,d,6,d,1\r\n6,e,6,e,1\r\n6,e:,6,e:,1\r\n6,f,6,f,1\r\n6,g,6,g,1\r\n6,h,6,h,1\r\n6,i,6,i,1\r\n6,i:,6,i:,1\r\n6,j,6,j,1\r\n6,k,6,k,1\r\n6,l,6,l,1\r\n6,m,6,m,1\r\n6,n,6,n,1\r\n6,o,6,o,1\r\n6,o:,6,o:,1\r\n6,p,6,p,1\r\n6,q,6,q,1\r\n6,r,6,r,1\r\n6,s,6,s,1\r\n6,t,6,t,1\r\n6,u,6,u,1\r\n6,u:,6,u:,1\r\n6,v,6,v,1\r\n6,w,6,w,1\r\n6,x,6,x,1\r\n6,y,6,y,1\r\n6,y:,6,y:,1\r\n6,z,6,z,1\r\n');
@@ -59,7 +59,7 @@ INSERT INTO `2-way FST` (`2-way FST ID`, `example data`, `description`, `FST dia
 ('First C after First V - Quileute', '| Input   | Output    |\r\n|---------|-----------|\r\n| C~1~V-X | CV-C~1~-X |', 'Input=#C~1~VX% \r\nOutput=#C~1~V-C~1~\\~X%\r\nInitial C is copied at placed after first V', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the first CV once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%states q3-q5 return to the beginning of input, output the base CVX, and end\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state] (q5) [below of=q0] {$q_5$};\r\n\\node[state,accepting] (q6) [right of=q5] {$q_6$};\r\n\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge  node {(V,V,-1)} (q3)\r\n(q3) edge  node {(C,C,+1)} (q4)\r\n(q4) edge  node {(V,$\\sim$,+1)} (q5)\r\n(q5) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q5)\r\n(q5) edge node[below] {(\\%,$\\epsilon$,+1)} (q6)\r\n\r\n;\r\n\\end{tikzpicture}\r\n', 1, '#Copying first C after word-initial CV in Quileute\r\n#If the input starts with CV, the consonant is copied and placed after the vowel\r\n#The function is not defined for an input which starts with anything other than CV\r\n#e.g. patak --> pap~tak, ata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first C\',\'output first CV\',\'output first C again\',\'return to old position\',\'continue output\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') =  (\'output first C\', \'\', 1)\r\n(\'output first C\', \\consonants) = (\'output first CV\', \\ID, 1)\r\n(\'output first CV\', \\vowels) =  (\'output first C again\', \\ID, -1)\r\n(\'output first C again\', \\consonants) =  (\'return to old position\', \\ID, 1)\r\n(\'return to old position\', \\vowels) =  (\'continue output\', \'~\', 1)\r\n(\'continue output\', \\alphabet) =  (\'continue output\', \\ID, 1)\r\n(\'continue output\', \'%\') =  (\'end\', \'\', 1)\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Copying first C after word-initial CV in Quileute\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	output first CV\r\n4	output first C again\r\n5	return to old position\r\n6	continue output\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,`a,4,`a,-1\r\n3,`a:,4,`a:,-1\r\n3,`e,4,`e,-1\r\n3,`e:,4,`e:,-1\r\n3,`i,4,`i,-1\r\n3,`i:,4,`i:,-1\r\n3,`o,4,`o,-1\r\n3,`o:,4,`o:,-1\r\n3,`u,4,`u,-1\r\n3,`u:,4,`u:,-1\r\n3,`y,4,`y,-1\r\n3,`y:,4,`y:,-1\r\n3,a,4,a,-1\r\n3,a:,4,a:,-1\r\n3,e,4,e,-1\r\n3,e:,4,e:,-1\r\n3,i,4,i,-1\r\n3,i:,4,i:,-1\r\n3,o,4,o,-1\r\n3,o:,4,o:,-1\r\n3,u,4,u,-1\r\n3,u:,4,u:,-1\r\n3,y,4,y,-1\r\n3,y:,4,y:,-1\r\n4,b,5,b,1\r\n4,c,5,c,1\r\n4,d,5,d,1\r\n4,f,5,f,1\r\n4,g,5,g,1\r\n4,h,5,h,1\r\n4,j,5,j,1\r\n4,k,5,k,1\r\n4,l,5,l,1\r\n4,m,5,m,1\r\n4,n,5,n,1\r\n4,p,5,p,1\r\n4,q,5,q,1\r\n4,r,5,r,1\r\n4,s,5,s,1\r\n4,t,5,t,1\r\n4,v,5,v,1\r\n4,w,5,w,1\r\n4,x,5,x,1\r\n4,z,5,z,1\r\n5,`a,6,~,1\r\n5,`a:,6,~,1\r\n5,`e,6,~,1\r\n5,`e:,6,~,1\r\n5,`i,6,~,1\r\n5,`i:,6,~,1\r\n5,`o,6,~,1\r\n5,`o:,6,~,1\r\n5,`u,6,~,1\r\n5,`u:,6,~,1\r\n5,`y,6,~,1\r\n5,`y:,6,~,1\r\n5,a,6,~,1\r\n5,a:,6,~,1\r\n5,e,6,~,1\r\n5,e:,6,~,1\r\n5,i,6,~,1\r\n5,i:,6,~,1\r\n5,o,6,~,1\r\n5,o:,6,~,1\r\n5,u,6,~,1\r\n5,u:,6,~,1\r\n5,y,6,~,1\r\n5,y:,6,~,1\r\n6,%,1,,1\r\n6,+,6,+,1\r\n6,.,6,.,1\r\n6,`a,6,`a,1\r\n6,`a:,6,`a:,1\r\n6,`e,6,`e,1\r\n6,`e:,6,`e:,1\r\n6,`i,6,`i,1\r\n6,`i:,6,`i:,1\r\n6,`o,6,`o,1\r\n6,`o:,6,`o:,1\r\n6,`u,6,`u,1\r\n6,`u:,6,`u:,1\r\n6,`y,6,`y,1\r\n6,`y:,6,`y:,1\r\n6,a,6,a,1\r\n6,a:,6,a:,1\r\n6,b,6,b,1\r\n6,c,6,c,1\r\n6,d,6,d,1\r\n6,e,6,e,1\r\n6,e:,6,e:,1\r\n6,f,6,f,1\r\n6,g,6,g,1\r\n6,h,6,h,1\r\n6,i,6,i,1\r\n6,i:,6,i:,1\r\n6,j,6,j,1\r\n6,k,6,k,1\r\n6,l,6,l,1\r\n6,m,6,m,1\r\n6,n,6,n,1\r\n6,o,6,o,1\r\n6,o:,6,o:,1\r\n6,p,6,p,1\r\n6,q,6,q,1\r\n6,r,6,r,1\r\n6,s,6,s,1\r\n6,t,6,t,1\r\n6,u,6,u,1\r\n6,u:,6,u:,1\r\n6,v,6,v,1\r\n6,w,6,w,1\r\n6,x,6,x,1\r\n6,y,6,y,1\r\n6,y:,6,y:,1\r\n6,z,6,z,1\r\n');
 INSERT INTO `2-way FST` (`2-way FST ID`, `example data`, `description`, `FST diagram`, `language specific`, `FST recipe`, `FST code`) VALUES
 ('First C after Second C - Levantine Arabic & Zuni', '| Input        | Output             |\r\n|--------------|--------------------|\r\n| C~1~V-X-C~f~ | C~1~V-X-C~1~V-C~f~ |', 'Input=#C~1~VC~2~X% \r\nOutput=#C~1~VC~2~\\~C~1~-X%\r\nThe sources argue that the output is derived not directly from the roots but after a V template has already been inserted\r\nNote that bi-consonantly superficially look different from tri-consonantal because form like [lafaf] alternate with [laff]', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\n                    semithick]\r\n  \\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n  \\node[initial,state] (q0)	{$q_0$};\r\n  \\node[state] (q1) [right of=q0] {$q_1$};\r\n  \\node[state] (q2) [right of=q1] {$q_2$};\r\n  \\node[state] (q3) [right of=q2] {$q_3$};\r\n  \\node[state] (q4) [below of=q0] {$q_4$};\r\n  \\node[state] (q5) [right of=q4] {$q_5$};\r\n  \\node[state] (q6) [right of=q5] {$q_6$};\r\n  \\node[state] (q7) [right of=q6] {$q_7$};\r\n  \\node[state] (q8) [right of=q7] {$q_8$};\r\n  \\node[state,accepting] (q9) [right of=q8] {$q_9$};\r\n   \r\n  \r\n\r\n  \\path\r\n (q0) edge node {(\\#, $\\epsilon$,+1)} (q1)\r\n (q1) edge node {(C,C,+1)} (q2)\r\n (q2) edge node {(V,V,+1)} (q3)\r\n (q3) edge node {(C,C,-1)} (q4)\r\n (q4) edge [loop left] node {($\\Sigma$,$\\epsilon$,-1)} (q4)\r\n (q4) edge node[below] {(\\#,$\\sim$,+1)} (q5)\r\n (q5) edge node[below] {(C,C,+1)} (q6)\r\n (q6) edge node {(V,$\\epsilon$,+1)} (q7)\r\n (q7) edge node {(C,$\\epsilon$,+1)} (q8)\r\n (q8) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q8)\r\n (q8) edge node {(\\%,$\\epsilon$,+1)} (q9)\r\n \r\n ;\r\n\\end{tikzpicture}\r\n', 1, '#Copying first C after word-initial CVC\r\n#If the input starts with CVC, the first consonant is copied and placed after the CVC\r\n#The function is not defined for an input which starts with anything other than CVC\r\n#e.g. patak --> pat~pak, ata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first C\',\'output first CV\',\'output first CVC\',\'return\',\'output C again\',\'skip V\',\'skip VC\',\'continue output\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') =  (\'output first C\', \'\', 1)\r\n(\'output first C\', \\consonants) =  (\'output first CV\', \\ID, 1)\r\n(\'output first CV\', \\vowels) = (\'output first CVC\', \\ID, 1)\r\n(\'output first CVC\', \\consonants) = (\'return\', \\ID, -1)\r\n(\'return\', \\alphabet) =  (\'return\', \'\', -1)\r\n(\'return\', \'#\')  = (\'output C again\', \'~\',1)\r\n(\'output C again\',\\consonants) =  (\'skip V\', \\ID, 1)\r\n(\'skip V\', \\vowels)  = (\'skip VC\' , \'\', 1)\r\n(\'skip VC\', \\consonants) =  (\'continue output\', \'\',1)\r\n(\'continue output\', \\alphabet) =  (\'continue output\', \\ID, 1)\r\n(\'continue output\', \'%\') =  (\'end\', \'\', 1)\r\n\r\n\r\n\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Copying first C after word-initial CVC\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	output first CV\r\n4	output first CVC\r\n5	return\r\n6	output C again\r\n7	skip V\r\n8	skip VC\r\n9	continue output\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,`a,4,`a,1\r\n3,`a:,4,`a:,1\r\n3,`e,4,`e,1\r\n3,`e:,4,`e:,1\r\n3,`i,4,`i,1\r\n3,`i:,4,`i:,1\r\n3,`o,4,`o,1\r\n3,`o:,4,`o:,1\r\n3,`u,4,`u,1\r\n3,`u:,4,`u:,1\r\n3,`y,4,`y,1\r\n3,`y:,4,`y:,1\r\n3,a,4,a,1\r\n3,a:,4,a:,1\r\n3,e,4,e,1\r\n3,e:,4,e:,1\r\n3,i,4,i,1\r\n3,i:,4,i:,1\r\n3,o,4,o,1\r\n3,o:,4,o:,1\r\n3,u,4,u,1\r\n3,u:,4,u:,1\r\n3,y,4,y,1\r\n3,y:,4,y:,1\r\n4,b,5,b,-1\r\n4,c,5,c,-1\r\n4,d,5,d,-1\r\n4,f,5,f,-1\r\n4,g,5,g,-1\r\n4,h,5,h,-1\r\n4,j,5,j,-1\r\n4,k,5,k,-1\r\n4,l,5,l,-1\r\n4,m,5,m,-1\r\n4,n,5,n,-1\r\n4,p,5,p,-1\r\n4,q,5,q,-1\r\n4,r,5,r,-1\r\n4,s,5,s,-1\r\n4,t,5,t,-1\r\n4,v,5,v,-1\r\n4,w,5,w,-1\r\n4,x,5,x,-1\r\n4,z,5,z,-1\r\n5,#,6,~,1\r\n5,+,5,,-1\r\n5,.,5,,-1\r\n5,`a,5,,-1\r\n5,`a:,5,,-1\r\n5,`e,5,,-1\r\n5,`e:,5,,-1\r\n5,`i,5,,-1\r\n5,`i:,5,,-1\r\n5,`o,5,,-1\r\n5,`o:,5,,-1\r\n5,`u,5,,-1\r\n5,`u:,5,,-1\r\n5,`y,5,,-1\r\n5,`y:,5,,-1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,c,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,j,5,,-1\r\n5,k,5,,-1\r\n5,l,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,q,5,,-1\r\n5,r,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,w,5,,-1\r\n5,x,5,,-1\r\n5,y,5,,-1\r\n5,y:,5,,-1\r\n5,z,5,,-1\r\n6,b,7,b,1\r\n6,c,7,c,1\r\n6,d,7,d,1\r\n6,f,7,f,1\r\n6,g,7,g,1\r\n6,h,7,h,1\r\n6,j,7,j,1\r\n6,k,7,k,1\r\n6,l,7,l,1\r\n6,m,7,m,1\r\n6,n,7,n,1\r\n6,p,7,p,1\r\n6,q,7,q,1\r\n6,r,7,r,1\r\n6,s,7,s,1\r\n6,t,7,t,1\r\n6,v,7,v,1\r\n6,w,7,w,1\r\n6,x,7,x,1\r\n6,z,7,z,1\r\n7,`a,8,,1\r\n7,`a:,8,,1\r\n7,`e,8,,1\r\n7,`e:,8,,1\r\n7,`i,8,,1\r\n7,`i:,8,,1\r\n7,`o,8,,1\r\n7,`o:,8,,1\r\n7,`u,8,,1\r\n7,`u:,8,,1\r\n7,`y,8,,1\r\n7,`y:,8,,1\r\n7,a,8,,1\r\n7,a:,8,,1\r\n7,e,8,,1\r\n7,e:,8,,1\r\n7,i,8,,1\r\n7,i:,8,,1\r\n7,o,8,,1\r\n7,o:,8,,1\r\n7,u,8,,1\r\n7,u:,8,,1\r\n7,y,8,,1\r\n7,y:,8,,1\r\n8,b,9,,1\r\n8,c,9,,1\r\n8,d,9,,1\r\n8,f,9,,1\r\n8,g,9,,1\r\n8,h,9,,1\r\n8,j,9,,1\r\n8,k,9,,1\r\n8,l,9,,1\r\n8,m,9,,1\r\n8,n,9,,1\r\n8,p,9,,1\r\n8,q,9,,1\r\n8,r,9,,1\r\n8,s,9,,1\r\n8,t,9,,1\r\n8,v,9,,1\r\n8,w,9,,1\r\n8,x,9,,1\r\n8,z,9,,1\r\n9,%,1,,1\r\n9,+,9,+,1\r\n9,.,9,.,1\r\n9,`a,9,`a,1\r\n9,`a:,9,`a:,1\r\n9,`e,9,`e,1\r\n9,`e:,9,`e:,1\r\n9,`i,9,`i,1\r\n9,`i:,9,`i:,1\r\n9,`o,9,`o,1\r\n9,`o:,9,`o:,1\r\n9,`u,9,`u,1\r\n9,`u:,9,`u:,1\r\n9,`y,9,`y,1\r\n9,`y:,9,`y:,1\r\n9,a,9,a,1\r\n9,a:,9,a:,1\r\n9,b,9,b,1\r\n9,c,9,c,1\r\n9,d,9,d,1\r\n9,e,9,e,1\r\n9,e:,9,e:,1\r\n9,f,9,f,1\r\n9,g,9,g,1\r\n9,h,9,h,1\r\n9,i,9,i,1\r\n9,i:,9,i:,1\r\n9,j,9,j,1\r\n9,k,9,k,1\r\n9,l,9,l,1\r\n9,m,9,m,1\r\n9,n,9,n,1\r\n9,o,9,o,1\r\n9,o:,9,o:,1\r\n9,p,9,p,1\r\n9,q,9,q,1\r\n9,r,9,r,1\r\n9,s,9,s,1\r\n9,t,9,t,1\r\n9,u,9,u,1\r\n9,u:,9,u:,1\r\n9,v,9,v,1\r\n9,w,9,w,1\r\n9,x,9,x,1\r\n9,y,9,y,1\r\n9,y:,9,y:,1\r\n9,z,9,z,1\r\n'),
-('First-Last C - General', '| Input             | Output                     |\r\n|-------------------|----------------------------|\r\n| C~1~C~2~VC~f~     | C~1~C~f~-C~1~C~2~VC~f~     |\r\n| C~1~C~2~C~3~VC~f~ | C~1~C~f~-C~1~C~2~C~3~VC~f~ |', 'Input=#C~1~-X-C~f~% where X is a string of segments\r\nOutput=#C~1~C~f~\\~C~1~-X-C~f~%\r\nThe first and last consonants are copied and placed before the base', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs C1 and Cf\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n%state q3 and up output the base\r\n\\node[state] (q5) [below of=q1] {$q_5$};\r\n\\node[state,accepting] (q6) [right of=q5] {$q_6$};\r\n\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge [loop above] node[] {($\\Sigma$,$\\epsilon$,+1)} (q2)\r\n(q2) edge node {(\\%,$\\epsilon$,-1)} (q3)\r\n(q3) edge node {(C,C,-1)} (q4)\r\n(q4) edge [loop above] node[] {($\\Sigma$,$\\epsilon$,-1)} (q4)\r\n(q4) edge node[] {(\\#,$\\sim$,+1)} (q5)\r\n(q5) edge [loop above] node[] {($\\Sigma$,$\\Sigma$,+1)} (q5)\r\n(q5) edge node[below] {(\\%,$\\epsilon$,+1)} (q6)\r\n\r\n\r\n;\r\n\\end{tikzpicture}\r\n\r\n', 1, '#First C + Last C copying\r\n#If the word starts and ends with a consonant: C...C, then the two consonants are copied \r\n#and placed at the beginning of the word  \r\n#The function is not defined for an input which starts with anything other than C \r\n#or which ends with anything other than C\r\n#e.g. patak --> pk~patak, pata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\', \'output first C\',\'skip to the end\',\'output final C\',\'return\',\'continue output\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first C\', \'\', 1)\r\n(\'output first C\', \\consonants) =  (\'skip to the end\', \\ID, 1)\r\n(\'skip to the end\', \\alphabet) = (\'skip to the end\', \'\', 1)\r\n(\'skip to the end\', \'%\') =  (\'output final C\', \'\',-1)\r\n(\'output final C\', \\consonants) = (\'return\', \\ID, -1)\r\n(\'return\', \\alphabet)  = (\'return\', \'\', -1)\r\n(\'return\', \'#\') = (\'continue output\', \'~\',1)\r\n(\'continue output\', \\alphabet) = (\'continue output\', \\ID, 1)\r\n(\'continue output\', \'%\') = (\'end\', \'\', 1) 1', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	First C + Last C copying\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	skip to the end\r\n4	output final C\r\n5	return\r\n6	continue output\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,%,4,,-1\r\n3,+,3,,1\r\n3,.,3,,1\r\n3,`a,3,,1\r\n3,`a:,3,,1\r\n3,`e,3,,1\r\n3,`e:,3,,1\r\n3,`i,3,,1\r\n3,`i:,3,,1\r\n3,`o,3,,1\r\n3,`o:,3,,1\r\n3,`u,3,,1\r\n3,`u:,3,,1\r\n3,`y,3,,1\r\n3,`y:,3,,1\r\n3,a,3,,1\r\n3,a:,3,,1\r\n3,b,3,,1\r\n3,c,3,,1\r\n3,d,3,,1\r\n3,e,3,,1\r\n3,e:,3,,1\r\n3,f,3,,1\r\n3,g,3,,1\r\n3,h,3,,1\r\n3,i,3,,1\r\n3,i:,3,,1\r\n3,j,3,,1\r\n3,k,3,,1\r\n3,l,3,,1\r\n3,m,3,,1\r\n3,n,3,,1\r\n3,o,3,,1\r\n3,o:,3,,1\r\n3,p,3,,1\r\n3,q,3,,1\r\n3,r,3,,1\r\n3,s,3,,1\r\n3,t,3,,1\r\n3,u,3,,1\r\n3,u:,3,,1\r\n3,v,3,,1\r\n3,w,3,,1\r\n3,x,3,,1\r\n3,y,3,,1\r\n3,y:,3,,1\r\n3,z,3,,1\r\n4,b,5,b,-1\r\n4,c,5,c,-1\r\n4,d,5,d,-1\r\n4,f,5,f,-1\r\n4,g,5,g,-1\r\n4,h,5,h,-1\r\n4,j,5,j,-1\r\n4,k,5,k,-1\r\n4,l,5,l,-1\r\n4,m,5,m,-1\r\n4,n,5,n,-1\r\n4,p,5,p,-1\r\n4,q,5,q,-1\r\n4,r,5,r,-1\r\n4,s,5,s,-1\r\n4,t,5,t,-1\r\n4,v,5,v,-1\r\n4,w,5,w,-1\r\n4,x,5,x,-1\r\n4,z,5,z,-1\r\n5,#,6,~,1\r\n5,+,5,,-1\r\n5,.,5,,-1\r\n5,`a,5,,-1\r\n5,`a:,5,,-1\r\n5,`e,5,,-1\r\n5,`e:,5,,-1\r\n5,`i,5,,-1\r\n5,`i:,5,,-1\r\n5,`o,5,,-1\r\n5,`o:,5,,-1\r\n5,`u,5,,-1\r\n5,`u:,5,,-1\r\n5,`y,5,,-1\r\n5,`y:,5,,-1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,c,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,j,5,,-1\r\n5,k,5,,-1\r\n5,l,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,q,5,,-1\r\n5,r,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,w,5,,-1\r\n5,x,5,,-1\r\n5,y,5,,-1\r\n5,y:,5,,-1\r\n5,z,5,,-1\r\n6,%,1,,1\r\n6,+,6,+,1\r\n6,.,6,.,1\r\n6,`a,6,`a,1\r\n6,`a:,6,`a:,1\r\n6,`e,6,`e,1\r\n6,`e:,6,`e:,1\r\n6,`i,6,`i,1\r\n6,`i:,6,`i:,1\r\n6,`o,6,`o,1\r\n6,`o:,6,`o:,1\r\n6,`u,6,`u,1\r\n6,`u:,6,`u:,1\r\n6,`y,6,`y,1\r\n6,`y:,6,`y:,1\r\n6,a,6,a,1\r\n6,a:,6,a:,1\r\n6,b,6,b,1\r\n6,c,6,c,1\r\n6,d,6,d,1\r\n6,e,6,e,1\r\n6,e:,6,e:,1\r\n6,f,6,f,1\r\n6,g,6,g,1\r\n6,h,6,h,1\r\n6,i,6,i,1\r\n6,i:,6,i:,1\r\n6,j,6,j,1\r\n6,k,6,k,1\r\n6,l,6,l,1\r\n6,m,6,m,1\r\n6,n,6,n,1\r\n6,o,6,o,1\r\n6,o:,6,o:,1\r\n6,p,6,p,1\r\n6,q,6,q,1\r\n6,r,6,r,1\r\n6,s,6,s,1\r\n6,t,6,t,1\r\n6,u,6,u,1\r\n6,u:,6,u:,1\r\n6,v,6,v,1\r\n6,w,6,w,1\r\n6,x,6,x,1\r\n6,y,6,y,1\r\n6,y:,6,y:,1\r\n6,z,6,z,1\r\n'),
+('First-Last C - General', '| Input             | Output                     |\r\n|-------------------|----------------------------|\r\n| C~1~C~2~VC~f~     | C~1~C~f~-C~1~C~2~VC~f~     |\r\n| C~1~C~2~C~3~VC~f~ | C~1~C~f~-C~1~C~2~C~3~VC~f~ |', 'Input=#C~1~-X-C~f~% where X is a string of segments\r\nOutput=#C~1~C~f~\\~C~1~-X-C~f~%\r\nThe first and last consonants are copied and placed before the base', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs C1 and Cf\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n%state q3 and up output the base\r\n\\node[state] (q5) [below of=q1] {$q_5$};\r\n\\node[state,accepting] (q6) [right of=q5] {$q_6$};\r\n\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge [loop above] node[] {($\\Sigma$,$\\epsilon$,+1)} (q2)\r\n(q2) edge node {(\\%,$\\epsilon$,-1)} (q3)\r\n(q3) edge node {(C,C,-1)} (q4)\r\n(q4) edge [loop above] node[] {($\\Sigma$,$\\epsilon$,-1)} (q4)\r\n(q4) edge node[] {(\\#,$\\sim$,+1)} (q5)\r\n(q5) edge [loop above] node[] {($\\Sigma$,$\\Sigma$,+1)} (q5)\r\n(q5) edge node[below] {(\\%,$\\epsilon$,+1)} (q6)\r\n\r\n\r\n;\r\n\\end{tikzpicture}\r\n\r\n', 1, '#First C + Last C copying\r\n#If the word starts and ends with a consonant: C...C, then the two consonants are copied \r\n#and placed at the beginning of the word  \r\n#The function is not defined for an input which starts with anything other than C \r\n#or which ends with anything other than C\r\n#e.g. patak --> pk~patak, pata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\', \'output first C\',\'skip to the end\',\'output final C\',\'return\',\'continue output\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first C\', \'\', 1)\r\n(\'output first C\', \\consonants) =  (\'skip to the end\', \\ID, 1)\r\n(\'skip to the end\', \\alphabet) = (\'skip to the end\', \'\', 1)\r\n(\'skip to the end\', \'%\') =  (\'output final C\', \'\',-1)\r\n(\'output final C\', \\consonants) = (\'return\', \\ID, -1)\r\n(\'return\', \\alphabet)  = (\'return\', \'\', -1)\r\n(\'return\', \'#\') = (\'continue output\', \'~\',1)\r\n(\'continue output\', \\alphabet) = (\'continue output\', \\ID, 1)\r\n(\'continue output\', \'%\') = (\'end\', \'\', 1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	First C + Last C copying\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	skip to the end\r\n4	output final C\r\n5	return\r\n6	continue output\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,%,4,,-1\r\n3,+,3,,1\r\n3,.,3,,1\r\n3,`a,3,,1\r\n3,`a:,3,,1\r\n3,`e,3,,1\r\n3,`e:,3,,1\r\n3,`i,3,,1\r\n3,`i:,3,,1\r\n3,`o,3,,1\r\n3,`o:,3,,1\r\n3,`u,3,,1\r\n3,`u:,3,,1\r\n3,`y,3,,1\r\n3,`y:,3,,1\r\n3,a,3,,1\r\n3,a:,3,,1\r\n3,b,3,,1\r\n3,c,3,,1\r\n3,d,3,,1\r\n3,e,3,,1\r\n3,e:,3,,1\r\n3,f,3,,1\r\n3,g,3,,1\r\n3,h,3,,1\r\n3,i,3,,1\r\n3,i:,3,,1\r\n3,j,3,,1\r\n3,k,3,,1\r\n3,l,3,,1\r\n3,m,3,,1\r\n3,n,3,,1\r\n3,o,3,,1\r\n3,o:,3,,1\r\n3,p,3,,1\r\n3,q,3,,1\r\n3,r,3,,1\r\n3,s,3,,1\r\n3,t,3,,1\r\n3,u,3,,1\r\n3,u:,3,,1\r\n3,v,3,,1\r\n3,w,3,,1\r\n3,x,3,,1\r\n3,y,3,,1\r\n3,y:,3,,1\r\n3,z,3,,1\r\n4,b,5,b,-1\r\n4,c,5,c,-1\r\n4,d,5,d,-1\r\n4,f,5,f,-1\r\n4,g,5,g,-1\r\n4,h,5,h,-1\r\n4,j,5,j,-1\r\n4,k,5,k,-1\r\n4,l,5,l,-1\r\n4,m,5,m,-1\r\n4,n,5,n,-1\r\n4,p,5,p,-1\r\n4,q,5,q,-1\r\n4,r,5,r,-1\r\n4,s,5,s,-1\r\n4,t,5,t,-1\r\n4,v,5,v,-1\r\n4,w,5,w,-1\r\n4,x,5,x,-1\r\n4,z,5,z,-1\r\n5,#,6,~,1\r\n5,+,5,,-1\r\n5,.,5,,-1\r\n5,`a,5,,-1\r\n5,`a:,5,,-1\r\n5,`e,5,,-1\r\n5,`e:,5,,-1\r\n5,`i,5,,-1\r\n5,`i:,5,,-1\r\n5,`o,5,,-1\r\n5,`o:,5,,-1\r\n5,`u,5,,-1\r\n5,`u:,5,,-1\r\n5,`y,5,,-1\r\n5,`y:,5,,-1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,c,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,j,5,,-1\r\n5,k,5,,-1\r\n5,l,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,q,5,,-1\r\n5,r,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,w,5,,-1\r\n5,x,5,,-1\r\n5,y,5,,-1\r\n5,y:,5,,-1\r\n5,z,5,,-1\r\n6,%,1,,1\r\n6,+,6,+,1\r\n6,.,6,.,1\r\n6,`a,6,`a,1\r\n6,`a:,6,`a:,1\r\n6,`e,6,`e,1\r\n6,`e:,6,`e:,1\r\n6,`i,6,`i,1\r\n6,`i:,6,`i:,1\r\n6,`o,6,`o,1\r\n6,`o:,6,`o:,1\r\n6,`u,6,`u,1\r\n6,`u:,6,`u:,1\r\n6,`y,6,`y,1\r\n6,`y:,6,`y:,1\r\n6,a,6,a,1\r\n6,a:,6,a:,1\r\n6,b,6,b,1\r\n6,c,6,c,1\r\n6,d,6,d,1\r\n6,e,6,e,1\r\n6,e:,6,e:,1\r\n6,f,6,f,1\r\n6,g,6,g,1\r\n6,h,6,h,1\r\n6,i,6,i,1\r\n6,i:,6,i:,1\r\n6,j,6,j,1\r\n6,k,6,k,1\r\n6,l,6,l,1\r\n6,m,6,m,1\r\n6,n,6,n,1\r\n6,o,6,o,1\r\n6,o:,6,o:,1\r\n6,p,6,p,1\r\n6,q,6,q,1\r\n6,r,6,r,1\r\n6,s,6,s,1\r\n6,t,6,t,1\r\n6,u,6,u,1\r\n6,u:,6,u:,1\r\n6,v,6,v,1\r\n6,w,6,w,1\r\n6,x,6,x,1\r\n6,y,6,y,1\r\n6,y:,6,y:,1\r\n6,z,6,z,1\r\n'),
 ('First-Last C - Temiar cluster repair', '| Input         | Output              |\r\n|---------------|---------------------|\r\n| C~1~C~2~VC~f~ | C~1~-C~f~-C~2~VC~f~ |\r\n| C~1~VC~f~     | C~1~C~f~-C~1~VC~f~  |', 'a)\r\nInput=#C~1~-VX-C~f~% where X is a string of segments\r\nOutput=#C~1~C~f~\\~C~1~-X-C~f~%\r\nb)\r\nInput=#C~1~C~2~-VX-C~f~% where X is a string of segments\r\nOutput=#C~1~C~f~\\~C~2~-X-C~f~%\r\nIf there is no initial cluster, the first and last consonants are copied and placed before the base. Else if there is, the final consonant is copied and placed inside the cluster', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs C1 and Cf\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n%state q3 and up output the base but without the first consonant i if its a cluster\r\n\\node[state] (q5) [below of=q0] {$q_5$};\r\n\\node[state] (q6) [right of=q5] {$q_6$};\r\n\\node[state] (q7) [right of=q6] {$q_7$};\r\n\\node[state,accepting] (q8) [right of=q7] {$q_8$};\r\n\\node[state] (q9) [below of=q6] {$q_9$};\r\n\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge [loop above] node[] {($\\Sigma$,$\\epsilon$,+1)} (q2)\r\n(q2) edge node {(\\%,$\\epsilon$,-1)} (q3)\r\n(q3) edge node {(C,C,-1)} (q4)\r\n(q4) edge [loop above] node[] {($\\Sigma$,$\\epsilon$,-1)} (q4)\r\n\r\n(q4) edge[bend left=10] node[] {(\\#,$\\sim$,+1)} (q5)\r\n(q5) edge node[below] {(C,$\\epsilon$,+1)} (q6)\r\n(q6) edge node[below] {(C,C,+1)} (q7)\r\n(q7) edge [loop above] node[] {($\\Sigma$,$\\Sigma$,+1)} (q7)\r\n(q7) edge node[below] {(\\%,$\\epsilon$,+1)} (q8)\r\n(q6) edge node[left] {(V,$\\epsilon$,-1)} (q9)\r\n(q9) edge node[right] {(C,C,+1)} (q7)\r\n\r\n\r\n;\r\n\\end{tikzpicture}', 1, '#First C + Last C copying with initial cluster repair\r\n#If the word starts with CV and ends with a consonant: CV...C, then the two consonants are copied \r\n#and placed at the beginning of the word  \r\n#If the word starts with two or more consonants C_1C_2C* and ends with C, the final C is copied and placed after C_1\r\n#The function is not defined for an input which starts with anything other than C \r\n#or which ends with anything other than C\r\n#e.g. patak --> pk~patak, pfatak --> pk~fatak, pata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first C\',\'skip to the end\',\'output final C\',\'return\',\'skip first C\',\'check if word starts with C cluster\',\'continue output\',\'end\',\'word does not start with cluster\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\' ) = (\'output first C\', \'\', 1)\r\n(\'output first C\', \\consonants) =  (\'skip to the end\', \\ID, 1)\r\n(\'skip to the end\', \\alphabet) =  (\'skip to the end\', \'\', 1)\r\n(\'skip to the end\', \'%\') = (\'output final C\', \'\', -1)\r\n(\'output final C\', \\consonants) =  (\'return\', \\ID, -1)\r\n(\'return\', \\alphabet)  = (\'return\', \'\', -1)\r\n(\'return\', \'#\')  = (\'skip first C\', \'~\',1)\r\n(\'skip first C\', \\consonants) =  (\'check if word starts with C cluster\', \'\', 1)\r\n(\'check if word starts with C cluster\', \\consonants) =  (\'continue output\',\\ID, 1)\r\n(\'continue output\', \\alphabet) = (\'continue output\', \\ID, 1)\r\n(\'continue output\', \'%\') =  (\'end\', \'\', 1)\r\n(\'check if word starts with C cluster\', \\vowels) =  (\'word does not start with cluster\', \'\', -1)\r\n(\'word does not start with cluster\', \\consonants)  = (\'continue output\', \\ID, 1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	First C + Last C copying with initial cluster repair\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	skip to the end\r\n4	output final C\r\n5	return\r\n6	skip first C\r\n7	check if word starts with C cluster\r\n8	continue output\r\n9	word does not start with cluster\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,%,4,,-1\r\n3,+,3,,1\r\n3,.,3,,1\r\n3,`a,3,,1\r\n3,`a:,3,,1\r\n3,`e,3,,1\r\n3,`e:,3,,1\r\n3,`i,3,,1\r\n3,`i:,3,,1\r\n3,`o,3,,1\r\n3,`o:,3,,1\r\n3,`u,3,,1\r\n3,`u:,3,,1\r\n3,`y,3,,1\r\n3,`y:,3,,1\r\n3,a,3,,1\r\n3,a:,3,,1\r\n3,b,3,,1\r\n3,c,3,,1\r\n3,d,3,,1\r\n3,e,3,,1\r\n3,e:,3,,1\r\n3,f,3,,1\r\n3,g,3,,1\r\n3,h,3,,1\r\n3,i,3,,1\r\n3,i:,3,,1\r\n3,j,3,,1\r\n3,k,3,,1\r\n3,l,3,,1\r\n3,m,3,,1\r\n3,n,3,,1\r\n3,o,3,,1\r\n3,o:,3,,1\r\n3,p,3,,1\r\n3,q,3,,1\r\n3,r,3,,1\r\n3,s,3,,1\r\n3,t,3,,1\r\n3,u,3,,1\r\n3,u:,3,,1\r\n3,v,3,,1\r\n3,w,3,,1\r\n3,x,3,,1\r\n3,y,3,,1\r\n3,y:,3,,1\r\n3,z,3,,1\r\n4,b,5,b,-1\r\n4,c,5,c,-1\r\n4,d,5,d,-1\r\n4,f,5,f,-1\r\n4,g,5,g,-1\r\n4,h,5,h,-1\r\n4,j,5,j,-1\r\n4,k,5,k,-1\r\n4,l,5,l,-1\r\n4,m,5,m,-1\r\n4,n,5,n,-1\r\n4,p,5,p,-1\r\n4,q,5,q,-1\r\n4,r,5,r,-1\r\n4,s,5,s,-1\r\n4,t,5,t,-1\r\n4,v,5,v,-1\r\n4,w,5,w,-1\r\n4,x,5,x,-1\r\n4,z,5,z,-1\r\n5,#,6,~,1\r\n5,+,5,,-1\r\n5,.,5,,-1\r\n5,`a,5,,-1\r\n5,`a:,5,,-1\r\n5,`e,5,,-1\r\n5,`e:,5,,-1\r\n5,`i,5,,-1\r\n5,`i:,5,,-1\r\n5,`o,5,,-1\r\n5,`o:,5,,-1\r\n5,`u,5,,-1\r\n5,`u:,5,,-1\r\n5,`y,5,,-1\r\n5,`y:,5,,-1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,c,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,j,5,,-1\r\n5,k,5,,-1\r\n5,l,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,q,5,,-1\r\n5,r,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,w,5,,-1\r\n5,x,5,,-1\r\n5,y,5,,-1\r\n5,y:,5,,-1\r\n5,z,5,,-1\r\n6,b,7,,1\r\n6,c,7,,1\r\n6,d,7,,1\r\n6,f,7,,1\r\n6,g,7,,1\r\n6,h,7,,1\r\n6,j,7,,1\r\n6,k,7,,1\r\n6,l,7,,1\r\n6,m,7,,1\r\n6,n,7,,1\r\n6,p,7,,1\r\n6,q,7,,1\r\n6,r,7,,1\r\n6,s,7,,1\r\n6,t,7,,1\r\n6,v,7,,1\r\n6,w,7,,1\r\n6,x,7,,1\r\n6,z,7,,1\r\n7,`a,9,,-1\r\n7,`a:,9,,-1\r\n7,`e,9,,-1\r\n7,`e:,9,,-1\r\n7,`i,9,,-1\r\n7,`i:,9,,-1\r\n7,`o,9,,-1\r\n7,`o:,9,,-1\r\n7,`u,9,,-1\r\n7,`u:,9,,-1\r\n7,`y,9,,-1\r\n7,`y:,9,,-1\r\n7,a,9,,-1\r\n7,a:,9,,-1\r\n7,b,8,b,1\r\n7,c,8,c,1\r\n7,d,8,d,1\r\n7,e,9,,-1\r\n7,e:,9,,-1\r\n7,f,8,f,1\r\n7,g,8,g,1\r\n7,h,8,h,1\r\n7,i,9,,-1\r\n7,i:,9,,-1\r\n7,j,8,j,1\r\n7,k,8,k,1\r\n7,l,8,l,1\r\n7,m,8,m,1\r\n7,n,8,n,1\r\n7,o,9,,-1\r\n7,o:,9,,-1\r\n7,p,8,p,1\r\n7,q,8,q,1\r\n7,r,8,r,1\r\n7,s,8,s,1\r\n7,t,8,t,1\r\n7,u,9,,-1\r\n7,u:,9,,-1\r\n7,v,8,v,1\r\n7,w,8,w,1\r\n7,x,8,x,1\r\n7,y,9,,-1\r\n7,y:,9,,-1\r\n7,z,8,z,1\r\n8,%,1,,1\r\n8,+,8,+,1\r\n8,.,8,.,1\r\n8,`a,8,`a,1\r\n8,`a:,8,`a:,1\r\n8,`e,8,`e,1\r\n8,`e:,8,`e:,1\r\n8,`i,8,`i,1\r\n8,`i:,8,`i:,1\r\n8,`o,8,`o,1\r\n8,`o:,8,`o:,1\r\n8,`u,8,`u,1\r\n8,`u:,8,`u:,1\r\n8,`y,8,`y,1\r\n8,`y:,8,`y:,1\r\n8,a,8,a,1\r\n8,a:,8,a:,1\r\n8,b,8,b,1\r\n8,c,8,c,1\r\n8,d,8,d,1\r\n8,e,8,e,1\r\n8,e:,8,e:,1\r\n8,f,8,f,1\r\n8,g,8,g,1\r\n8,h,8,h,1\r\n8,i,8,i,1\r\n8,i:,8,i:,1\r\n8,j,8,j,1\r\n8,k,8,k,1\r\n8,l,8,l,1\r\n8,m,8,m,1\r\n8,n,8,n,1\r\n8,o,8,o,1\r\n8,o:,8,o:,1\r\n8,p,8,p,1\r\n8,q,8,q,1\r\n8,r,8,r,1\r\n8,s,8,s,1\r\n8,t,8,t,1\r\n8,u,8,u,1\r\n8,u:,8,u:,1\r\n8,v,8,v,1\r\n8,w,8,w,1\r\n8,x,8,x,1\r\n8,y,8,y,1\r\n8,y:,8,y:,1\r\n8,z,8,z,1\r\n9,b,8,b,1\r\n9,c,8,c,1\r\n9,d,8,d,1\r\n9,f,8,f,1\r\n9,g,8,g,1\r\n9,h,8,h,1\r\n9,j,8,j,1\r\n9,k,8,k,1\r\n9,l,8,l,1\r\n9,m,8,m,1\r\n9,n,8,n,1\r\n9,p,8,p,1\r\n9,q,8,q,1\r\n9,r,8,r,1\r\n9,s,8,s,1\r\n9,t,8,t,1\r\n9,v,8,v,1\r\n9,w,8,w,1\r\n9,x,8,x,1\r\n9,z,8,z,1\r\n'),
 ('Initial C - General with an affix', '| Input | Output    |\r\n|-------|-----------|\r\n| C-X   | C-a-C-X   | ', 'Input=#C-X$ where X is any string of symbols\r\nOutput=#C\\~C-X%\r\nThe word-initial C string is repeated. I assume that inputs start with C and there is no modification done on the reduplicant. I assume there are reasons why this isn\'t just called gemination. \r\n\r\nIn most cases a morphologically-specified string (infix) is added between the two copies. I model this string as [a].', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0) {$q_0$};\r\n%state q1-3 outputs the first C once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n%states q2-q4 return to the beginning of input, output the base CVX, and end\r\n\\node[state] (q3) [below of=q1] {$q_3$};\r\n\\node[state,accepting] (q4) [right of=q3] {$q_4$};\r\n\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge node {(C,C,-1)} (q2)\r\n(q2) edge [loop right] node {($\\Sigma$,$\\epsilon$,-1)} (q2)\r\n(q2) edge node {(\\#,a$\\sim$,+1)} (q3)\r\n(q3) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q3)\r\n(q3) edge node[below] {(\\%,$\\epsilon$,+1)} (q4)\r\n\r\n;\r\n\\end{tikzpicture}\r\n', 0, '#First C copying with epenthesis\r\n#If the word starts with C, then that C is reduplicated \r\n#A morphologically or phonologically specified string is cross-linguistically often placed between the two consonants\r\n#I model this epenthetic string as [a]\r\n#The function is not defined for an input which starts with anything other than C \r\n#e.g. patak --> pa~patak, ata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\', \'output first C\', \'return\', \'continue output\', \'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') =  (\'output first C\', \'\', 1)\r\n(\'output first C\', \\consonants) =  (\'return\', \\ID, 1)\r\n(\'return\', \\alphabet)  = (\'return\', \'\', -1)\r\n(\'return\',\'#\') =  (\'continue output\', \'a~\',1)\r\n(\'continue output\', \\alphabet) =  (\'continue output\', \\ID, 1)\r\n(\'continue output\', \'%\') =  (\'end\', \'\', 1)\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	First C copying with epenthesis\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	return\r\n4	continue output\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,#,4,a~,1\r\n3,+,3,,-1\r\n3,.,3,,-1\r\n3,`a,3,,-1\r\n3,`a:,3,,-1\r\n3,`e,3,,-1\r\n3,`e:,3,,-1\r\n3,`i,3,,-1\r\n3,`i:,3,,-1\r\n3,`o,3,,-1\r\n3,`o:,3,,-1\r\n3,`u,3,,-1\r\n3,`u:,3,,-1\r\n3,`y,3,,-1\r\n3,`y:,3,,-1\r\n3,a,3,,-1\r\n3,a:,3,,-1\r\n3,b,3,,-1\r\n3,c,3,,-1\r\n3,d,3,,-1\r\n3,e,3,,-1\r\n3,e:,3,,-1\r\n3,f,3,,-1\r\n3,g,3,,-1\r\n3,h,3,,-1\r\n3,i,3,,-1\r\n3,i:,3,,-1\r\n3,j,3,,-1\r\n3,k,3,,-1\r\n3,l,3,,-1\r\n3,m,3,,-1\r\n3,n,3,,-1\r\n3,o,3,,-1\r\n3,o:,3,,-1\r\n3,p,3,,-1\r\n3,q,3,,-1\r\n3,r,3,,-1\r\n3,s,3,,-1\r\n3,t,3,,-1\r\n3,u,3,,-1\r\n3,u:,3,,-1\r\n3,v,3,,-1\r\n3,w,3,,-1\r\n3,x,3,,-1\r\n3,y,3,,-1\r\n3,y:,3,,-1\r\n3,z,3,,-1\r\n4,%,1,,1\r\n4,+,4,+,1\r\n4,.,4,.,1\r\n4,`a,4,`a,1\r\n4,`a:,4,`a:,1\r\n4,`e,4,`e,1\r\n4,`e:,4,`e:,1\r\n4,`i,4,`i,1\r\n4,`i:,4,`i:,1\r\n4,`o,4,`o,1\r\n4,`o:,4,`o:,1\r\n4,`u,4,`u,1\r\n4,`u:,4,`u:,1\r\n4,`y,4,`y,1\r\n4,`y:,4,`y:,1\r\n4,a,4,a,1\r\n4,a:,4,a:,1\r\n4,b,4,b,1\r\n4,c,4,c,1\r\n4,d,4,d,1\r\n4,e,4,e,1\r\n4,e:,4,e:,1\r\n4,f,4,f,1\r\n4,g,4,g,1\r\n4,h,4,h,1\r\n4,i,4,i,1\r\n4,i:,4,i:,1\r\n4,j,4,j,1\r\n4,k,4,k,1\r\n4,l,4,l,1\r\n4,m,4,m,1\r\n4,n,4,n,1\r\n4,o,4,o,1\r\n4,o:,4,o:,1\r\n4,p,4,p,1\r\n4,q,4,q,1\r\n4,r,4,r,1\r\n4,s,4,s,1\r\n4,t,4,t,1\r\n4,u,4,u,1\r\n4,u:,4,u:,1\r\n4,v,4,v,1\r\n4,w,4,w,1\r\n4,x,4,x,1\r\n4,y,4,y,1\r\n4,y:,4,y:,1\r\n4,z,4,z,1\r\n'),
 ('Initial CV - Akan palatalization', '| Input | Output (without reduplication | Input | Output (with reduplication |\r\n|-------|-------------------------------|-------|----------------------------|\r\n| kɛ    | tɕe                           | kaʔ   | kɪkaʔ                      |\r\n| ge    | dʝe                           | hawʔ  | hɪ-hawʔ                    |\r\n| wi    | ɥi                            | ge    | dʝɪ-dʝe                    |\r\n| hi    | çi                            | kwe   | tçɥɪ-tçɥe                  |\r\n| ŋwĩn  | ɲɥĩn                          |       |                            |', 'Input=#CV-X$ where X is any string of symbols\r\nOutput=#CI\\~CV-X% where I is an epenthetic vowel\r\nThe word-initial C is repeated. An epenthetic vowel I string is inserted.  It is prespecified as [+high] but it receives its [front] and [round] features through harmony with the root.\r\n\r\nProcess: Outside of reduplication, dorsal segments /{k, g, w, ŋ^w^/ palatalize when followed by a non-front vowel. When the word involves reduplication, the reduplicant\'s C will not palatalize from the reduplicant\'s [i] (underapply) unless the base\'s C is also followed by a non-front vowel. When the base\'s C fits the context for palatalization, the reduplicant\'s C will be allowed to palatalize. It is not clear if the initial C is actually a consonant cluster or a complex segment', 'FST: Symbols use: V for vowel, I for non-low front vowel, K for dorsal segments, P for palatalized segments. The FST assumes that the word starts with CV, e.g. \\#CVΣ*\\%. This FST assumes that the reduplicant vowel is [i]\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 handles case where C is not dorsal, and outputs reduplicant and base with [i] \r\n\\node[state] (q1) [right of=q0]	{$q_1$};\r\n\\node[state] (q2) [right of=q1]	{$q_2$};\r\n\\node[state,accepting] (q3) [right of =q2]	{$q_3$};\r\n%state q4 is for if word doesnt have nasal that precedes % without blocker\r\n\\node[state] (q4) [below of=q1]	{$q_4$};\r\n\\node[state] (q5) [right of=q4]	{$q_5$};\r\n\\node[state] (q6) [below of=q5]	{$q_6$};\r\n\\path\r\n%check if first C is succeeded by low front V\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n%if the C is nonvelar, then just output *i*, continue the base, and end\r\n(q1) edge node {(\\{C-K\\},*i$\\sim$*,+1)} (q2)\r\n(q2) edge[loop above] node {($\\Sigma$,*,+1)} (q2)\r\n(q2) edge node {(\\%,$\\epsilon$,+1)} (q3)\r\n%if C is velar, then check if followed by non-low front I\r\n(q1) edge node[left] {(K,$\\epsilon$,+1)} (q4)\r\n%if it is followed by I then go back and produce palatalized versions\r\n(q4) edge node {(I,$\\epsilon$,-1)} (q5)\r\n(q5) edge node {(K,Pi$\\sim$P,+1)} (q2)\r\n%if it is not followed by I then go back and produce palatalized versions\r\n(q4) edge node[left] {(\\{V-I\\},$\\epsilon$,-1)} (q6)\r\n(q6) edge[bend right=45] node[right] {(K,Ki$\\sim$K,+1)} (q2)\r\n\r\n\r\n;\r\n\r\n\r\n\\end{tikzpicture}', 1, '#Initial CV reduplication in Akan with underapplication of palatalization\r\n#In Akan, dorsals palatalize before non-low front vowels\r\n#There is an initiail-CV reduplication process that copies the first C and makes the reduplicant\'s V be /ɪ/\r\n#Palatalization will not apply in the reduplicant unless both copies of the C are before non-low front vowels\r\n#e.g. pata--> pɪ~pata, kata --> ka~kata, kita --> tɕi~tɕita\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet = [ \'p\', \'t\', \'b\', \'d\',\'m\',\'n\',\'r\',\'l\',\'f\',\'v\',\'s\',\'z\',\'j\', \'tɕ\', \'dʝ\', \'ɥ\', \'ç\', \'ɲ\', \'ʔ\', \'k\',\'g\',\'w\',\'h\',\'ŋ\', \'ŋw\',\'kw\',\'tçɥ\',\'a\',\'e\',\'ɛ\',\'i\', \'ɪ\',\'o\',\'u\']\r\nsubalphabets = 4\r\nconsonants = [ \'p\', \'t\', \'b\', \'d\',\'m\',\'n\',\'r\',\'l\',\'f\',\'v\',\'s\',\'z\',\'j\', \'tɕ\', \'dʝ\', \'ɥ\', \'ç\', \'ɲ\', \'ʔ\', \'k\',\'g\',\'w\',\'h\',\'ŋ\', \'ŋw\', \'kw\', \'tçɥ\']\r\ndorsals = [  \'k\',\'g\',\'w\',\'h\',\'ŋ\', \'ŋw\',\'kw\' ]\r\nvowels = [\'a\',\'e\',\'ɛ\',\'i\', \'ɪ\',\'o\',\'u\']\r\nnonlow_front_vowels = [\'e\',\'ɛ\',\'i\', \'ɪ\']\r\n\r\nfunctions  = 1\r\npalatalize = { (\'k\', \'tɕ\'),(\'g\',\'dʝ\'), (\'w\',\'ɥ\'), (\'h\',\'ç\'), (\'ŋ\', \'ɲ\'), (\'ŋw\',\'ɲɥ\'), (\'kw\',\'tçɥ\') }\r\n\r\n#states type = string\r\nstates = [\'start\',\'check if first C is dorsal or not\',\'continue base\',\'end\',\'first C was dorsal so check first V\',\'first V is non-low front\',\'first V is not non-low front\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'check if first C is dorsal or not\',\'\',1)\r\n(\'check if first C is dorsal or not\',{\\consonants - \\dorsals}) = (\'continue base\',[\\ID \'ɪ~\' \\ID], 1)\r\n(\'continue base\',\\alphabet) = (\'continue base\',\\ID,1)\r\n(\'continue base\',\'%\') = (\'end\',\'\',1)\r\n(\'check if first C is dorsal or not\',\\dorsals) = (\'first C was dorsal so check first V\',\'\',1)\r\n(\'first C was dorsal so check first V\',\\nonlow_front_vowels) = (\'first V is non-low front\',\'\',-1)\r\n(\'first V is non-low front\',\\dorsals) = (\'continue base\',[\\palatalize \'ɪ~\' \\palatalize], 1)\r\n(\'first C was dorsal so check first V\',{\\vowels - \\nonlow_front_vowels} ) = (\'first V is not non-low front\',\'\',-1)\r\n(\'first V is not non-low front\',\\dorsals) = (\'continue base\',[\\ID \'ɪ~\' \\ID], 1)\r\n\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Initial CV reduplication in Akan with underapplication of palatalization\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	check if first C is dorsal or not\r\n3	continue base\r\n4	first C was dorsal so check first V\r\n5	first V is non-low front\r\n6	first V is not non-low front\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,bɪ~b,1\r\n2,d,3,dɪ~d,1\r\n2,dʝ,3,dʝɪ~dʝ,1\r\n2,f,3,fɪ~f,1\r\n2,g,4,,1\r\n2,h,4,,1\r\n2,j,3,jɪ~j,1\r\n2,k,4,,1\r\n2,kw,4,,1\r\n2,l,3,lɪ~l,1\r\n2,m,3,mɪ~m,1\r\n2,n,3,nɪ~n,1\r\n2,p,3,pɪ~p,1\r\n2,r,3,rɪ~r,1\r\n2,s,3,sɪ~s,1\r\n2,t,3,tɪ~t,1\r\n2,tçɥ,3,tçɥɪ~tçɥ,1\r\n2,tɕ,3,tɕɪ~tɕ,1\r\n2,v,3,vɪ~v,1\r\n2,w,4,,1\r\n2,z,3,zɪ~z,1\r\n2,ç,3,çɪ~ç,1\r\n2,ŋ,4,,1\r\n2,ŋw,4,,1\r\n2,ɥ,3,ɥɪ~ɥ,1\r\n2,ɲ,3,ɲɪ~ɲ,1\r\n2,ʔ,3,ʔɪ~ʔ,1\r\n3,%,1,,1\r\n3,a,3,a,1\r\n3,b,3,b,1\r\n3,d,3,d,1\r\n3,dʝ,3,dʝ,1\r\n3,e,3,e,1\r\n3,f,3,f,1\r\n3,g,3,g,1\r\n3,h,3,h,1\r\n3,i,3,i,1\r\n3,j,3,j,1\r\n3,k,3,k,1\r\n3,kw,3,kw,1\r\n3,l,3,l,1\r\n3,m,3,m,1\r\n3,n,3,n,1\r\n3,o,3,o,1\r\n3,p,3,p,1\r\n3,r,3,r,1\r\n3,s,3,s,1\r\n3,t,3,t,1\r\n3,tçɥ,3,tçɥ,1\r\n3,tɕ,3,tɕ,1\r\n3,u,3,u,1\r\n3,v,3,v,1\r\n3,w,3,w,1\r\n3,z,3,z,1\r\n3,ç,3,ç,1\r\n3,ŋ,3,ŋ,1\r\n3,ŋw,3,ŋw,1\r\n3,ɛ,3,ɛ,1\r\n3,ɥ,3,ɥ,1\r\n3,ɪ,3,ɪ,1\r\n3,ɲ,3,ɲ,1\r\n3,ʔ,3,ʔ,1\r\n4,a,6,,-1\r\n4,e,5,,-1\r\n4,i,5,,-1\r\n4,o,6,,-1\r\n4,u,6,,-1\r\n4,ɛ,5,,-1\r\n4,ɪ,5,,-1\r\n5,g,3,dʝɪ~dʝ,1\r\n5,h,3,çɪ~ç,1\r\n5,k,3,tɕɪ~tɕ,1\r\n5,kw,3,tçɥɪ~tçɥ,1\r\n5,w,3,ɥɪ~ɥ,1\r\n5,ŋ,3,ɲɪ~ɲ,1\r\n5,ŋw,3,ɲɥɪ~ɲɥ,1\r\n6,g,3,gɪ~g,1\r\n6,h,3,hɪ~h,1\r\n6,k,3,kɪ~k,1\r\n6,kw,3,kwɪ~kw,1\r\n6,w,3,wɪ~w,1\r\n6,ŋ,3,ŋɪ~ŋ,1\r\n6,ŋw,3,ŋwɪ~ŋw,1\r\n'),
@@ -78,13 +78,13 @@ INSERT INTO `2-way FST` (`2-way FST ID`, `example data`, `description`, `FST dia
 ('Initial CVC - codaless V is okay', '| Input          | Output                      |\r\n|----------------|-----------------------------|\r\n| C~1~V~2~C~3~-X | C~1~V~2~C~3~-C~1~V~2~C~3~-X |\r\n| C~1~V~2~-V~3~X | C~1~V~2~-C~1~V~2~-V~3~X     |', 'Two allomorphs\r\nInput=#B-X$ where X is any string of symbols and B is either CVC or CV\r\nOutput=#B\\~B-X%\r\nThe word-initial CVC or CV string is repeated. Codaless vowels are thus okay. I assume that inputs start with CVC and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the first (C+0)VC once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%states q3-q5 return to the beginning of input, output the base CVCX, and end\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state] (q5) [below of=q1] {$q_5$};\r\n\\node[state,accepting] (q6) [right of=q5] {$q_6$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge node {(V,V,+1)} (q3)\r\n(q3) edge[bend left=45] node {(V,$\\epsilon$,-1)} (q4)\r\n(q3) edge node {(C,C,-1)} (q4)\r\n(q4) edge [loop right] node {($\\Sigma$,$\\epsilon$,-1)} (q4)\r\n(q4) edge node {(\\#,$\\sim$,+1)} (q5)\r\n(q5) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q5)\r\n(q5) edge node[below] {(\\%,$\\epsilon$,+1)} (q6)\r\n\r\n;\r\n\\end{tikzpicture}', 0, '#Inital CVC reduplication -- codaless vowels allowed\r\n#The word initial CVC sequence is copied\r\n#If there is no C after the V, then only CV is copied\r\n#function is not defined for any input which doesnt start with CV(C)\r\n#e.g. pata --> pat~pata, patka --> pat~patka, pai --> pa~pai, ata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first C\',\'output first CV\',\'output first CVC or CV\',\'return\',\'output base\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'output first C\',\'\',1)\r\n(\'output first C\',\\consonants) =  (\'output first CV\',\\ID,1)\r\n(\'output first CV\',\\vowels) =  (\'output first CVC or CV\',\\ID,1)\r\n(\'output first CVC or CV\',\\vowels) = (\'return\',\'\',-1)\r\n(\'output first CVC or CV\',\\consonants) =  (\'return\',\\ID,-1)\r\n(\'return\',\\alphabet) = (\'return\',\'\',-1)\r\n(\'return\',\'#\') =  (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\',\'%\') = (\'end\',\'\',1)\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Inital CVC reduplication -- codaless vowels allowed\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	output first CV\r\n4	output first CVC or CV\r\n5	return\r\n6	output base\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,`a,4,`a,1\r\n3,`a:,4,`a:,1\r\n3,`e,4,`e,1\r\n3,`e:,4,`e:,1\r\n3,`i,4,`i,1\r\n3,`i:,4,`i:,1\r\n3,`o,4,`o,1\r\n3,`o:,4,`o:,1\r\n3,`u,4,`u,1\r\n3,`u:,4,`u:,1\r\n3,`y,4,`y,1\r\n3,`y:,4,`y:,1\r\n3,a,4,a,1\r\n3,a:,4,a:,1\r\n3,e,4,e,1\r\n3,e:,4,e:,1\r\n3,i,4,i,1\r\n3,i:,4,i:,1\r\n3,o,4,o,1\r\n3,o:,4,o:,1\r\n3,u,4,u,1\r\n3,u:,4,u:,1\r\n3,y,4,y,1\r\n3,y:,4,y:,1\r\n4,`a,5,,-1\r\n4,`a:,5,,-1\r\n4,`e,5,,-1\r\n4,`e:,5,,-1\r\n4,`i,5,,-1\r\n4,`i:,5,,-1\r\n4,`o,5,,-1\r\n4,`o:,5,,-1\r\n4,`u,5,,-1\r\n4,`u:,5,,-1\r\n4,`y,5,,-1\r\n4,`y:,5,,-1\r\n4,a,5,,-1\r\n4,a:,5,,-1\r\n4,b,5,b,-1\r\n4,c,5,c,-1\r\n4,d,5,d,-1\r\n4,e,5,,-1\r\n4,e:,5,,-1\r\n4,f,5,f,-1\r\n4,g,5,g,-1\r\n4,h,5,h,-1\r\n4,i,5,,-1\r\n4,i:,5,,-1\r\n4,j,5,j,-1\r\n4,k,5,k,-1\r\n4,l,5,l,-1\r\n4,m,5,m,-1\r\n4,n,5,n,-1\r\n4,o,5,,-1\r\n4,o:,5,,-1\r\n4,p,5,p,-1\r\n4,q,5,q,-1\r\n4,r,5,r,-1\r\n4,s,5,s,-1\r\n4,t,5,t,-1\r\n4,u,5,,-1\r\n4,u:,5,,-1\r\n4,v,5,v,-1\r\n4,w,5,w,-1\r\n4,x,5,x,-1\r\n4,y,5,,-1\r\n4,y:,5,,-1\r\n4,z,5,z,-1\r\n5,#,6,~,1\r\n5,+,5,,-1\r\n5,.,5,,-1\r\n5,`a,5,,-1\r\n5,`a:,5,,-1\r\n5,`e,5,,-1\r\n5,`e:,5,,-1\r\n5,`i,5,,-1\r\n5,`i:,5,,-1\r\n5,`o,5,,-1\r\n5,`o:,5,,-1\r\n5,`u,5,,-1\r\n5,`u:,5,,-1\r\n5,`y,5,,-1\r\n5,`y:,5,,-1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,c,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,j,5,,-1\r\n5,k,5,,-1\r\n5,l,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,q,5,,-1\r\n5,r,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,w,5,,-1\r\n5,x,5,,-1\r\n5,y,5,,-1\r\n5,y:,5,,-1\r\n5,z,5,,-1\r\n6,%,1,,1\r\n6,+,6,+,1\r\n6,.,6,.,1\r\n6,`a,6,`a,1\r\n6,`a:,6,`a:,1\r\n6,`e,6,`e,1\r\n6,`e:,6,`e:,1\r\n6,`i,6,`i,1\r\n6,`i:,6,`i:,1\r\n6,`o,6,`o,1\r\n6,`o:,6,`o:,1\r\n6,`u,6,`u,1\r\n6,`u:,6,`u:,1\r\n6,`y,6,`y,1\r\n6,`y:,6,`y:,1\r\n6,a,6,a,1\r\n6,a:,6,a:,1\r\n6,b,6,b,1\r\n6,c,6,c,1\r\n6,d,6,d,1\r\n6,e,6,e,1\r\n6,e:,6,e:,1\r\n6,f,6,f,1\r\n6,g,6,g,1\r\n6,h,6,h,1\r\n6,i,6,i,1\r\n6,i:,6,i:,1\r\n6,j,6,j,1\r\n6,k,6,k,1\r\n6,l,6,l,1\r\n6,m,6,m,1\r\n6,n,6,n,1\r\n6,o,6,o,1\r\n6,o:,6,o:,1\r\n6,p,6,p,1\r\n6,q,6,q,1\r\n6,r,6,r,1\r\n6,s,6,s,1\r\n6,t,6,t,1\r\n6,u,6,u,1\r\n6,u:,6,u:,1\r\n6,v,6,v,1\r\n6,w,6,w,1\r\n6,x,6,x,1\r\n6,y,6,y,1\r\n6,y:,6,y:,1\r\n6,z,6,z,1\r\n'),
 ('Initial CVC - complex codas & onsetless vowels are okay + syllable boundaries are ignored', '| Input  | Output      |\r\n|--------|-------------|\r\n| CVC-X  | CVC-CVC-X   |\r\n| VC-X   | VC-VC-X     |\r\n| CVCC-X | CVCC-CVCC-X |\r\n| VCC-X  | VCC-VCC-X   |', 'Two allomorphs\r\nInput=#B-X$ where X is any string of symbols and B is CVCC\\* or VCC\\*\r\nOutput=#B\\~B-X%\r\n\r\nThe word-initial CVCC\\* or VCC\\* is repeated. Complex codas and the following syllable\'s onsets are copied. Onsetless vowels are okay I assume that inputs start with CVCC\\* and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the first (C+0)VCC* once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n%states q4 and upreturn to the beginning of input, output the base, and end\r\n\\node[state] (q5) [below of=q1] {$q_5$};\r\n\\node[state] (q6) [right of=q5] {$q_6$};\r\n\\node[state,accepting] (q7) [right of=q6] {$q_7$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge node {(V,V,+1)} (q3)\r\n(q1) edge[bend left=45] node {(V,V,+1)} (q3)\r\n(q3) edge node {(C,C,+1)} (q4)\r\n(q4) edge[loop above] node {(C,C,+1)} (q4)\r\n\r\n(q4) edge node {(\\{V,\\%\\},$\\epsilon$,-1)} (q5)\r\n(q5) edge [loop left] node {($\\Sigma$,$\\epsilon$,-1)} (q5)\r\n(q5) edge node[below] {(\\#,$\\sim$,+1)} (q6)\r\n(q6) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q6)\r\n(q6) edge node[below] {(\\%,$\\epsilon$,+1)} (q7)\r\n\r\n;\r\n\\end{tikzpicture}', 1, '#Inital CVC reduplication -- onsetless syllables and complex codas allowed\r\n#The word initial syllable (C)VCC* sequence is copied\r\n#The function is not defined for any input which doesnt start with CVC, VC, CVCC*,VCC*\r\n#e.g. pata --> pat~pata, patka --> patk~patka, ata --> at~ata, aata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first C or V\',\'output first CV\',\'output first CVC or VC\',\'output first CVCC* or VCC*\',\'return\',\'output base\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'output first C or V\',\'\',1)\r\n(\'output first C or V\', \\consonants) =  (\'output first CV\',\\ID,1)\r\n(\'output first CV\', \\vowels) =  (\'output first CVC or VC\',\\ID,1)\r\n(\'output first C or V\', \\vowels) =  (\'output first CVC or VC\',\\ID,1)\r\n(\'output first CVC or VC\', \\consonants)  = (\'output first CVCC* or VCC*\',\\ID,1)\r\n(\'output first CVCC* or VCC*\',\\consonants) = (\'output first CVCC* or VCC*\',\\ID,1)\r\n(\'output first CVCC* or VCC*\',\\vowels) = (\'return\',\'\',-1)\r\n(\'output first CVCC* or VCC*\', \'%\') = (\'return\',\'\',-1)\r\n(\'return\',\\alphabet)  =  (\'return\',\'\',-1)\r\n(\'return\',\'#\') =  (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\', \'%\') = (\'end\',\'\',1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Inital CVC reduplication -- onsetless syllables and complex codas allowed\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C or V\r\n3	output first CV\r\n4	output first CVC or VC\r\n5	output first CVCC* or VCC*\r\n6	return\r\n7	output base\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,`a,4,`a,1\r\n2,`a:,4,`a:,1\r\n2,`e,4,`e,1\r\n2,`e:,4,`e:,1\r\n2,`i,4,`i,1\r\n2,`i:,4,`i:,1\r\n2,`o,4,`o,1\r\n2,`o:,4,`o:,1\r\n2,`u,4,`u,1\r\n2,`u:,4,`u:,1\r\n2,`y,4,`y,1\r\n2,`y:,4,`y:,1\r\n2,a,4,a,1\r\n2,a:,4,a:,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,e,4,e,1\r\n2,e:,4,e:,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,i,4,i,1\r\n2,i:,4,i:,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,o,4,o,1\r\n2,o:,4,o:,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,u,4,u,1\r\n2,u:,4,u:,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,y,4,y,1\r\n2,y:,4,y:,1\r\n2,z,3,z,1\r\n3,`a,4,`a,1\r\n3,`a:,4,`a:,1\r\n3,`e,4,`e,1\r\n3,`e:,4,`e:,1\r\n3,`i,4,`i,1\r\n3,`i:,4,`i:,1\r\n3,`o,4,`o,1\r\n3,`o:,4,`o:,1\r\n3,`u,4,`u,1\r\n3,`u:,4,`u:,1\r\n3,`y,4,`y,1\r\n3,`y:,4,`y:,1\r\n3,a,4,a,1\r\n3,a:,4,a:,1\r\n3,e,4,e,1\r\n3,e:,4,e:,1\r\n3,i,4,i,1\r\n3,i:,4,i:,1\r\n3,o,4,o,1\r\n3,o:,4,o:,1\r\n3,u,4,u,1\r\n3,u:,4,u:,1\r\n3,y,4,y,1\r\n3,y:,4,y:,1\r\n4,b,5,b,1\r\n4,c,5,c,1\r\n4,d,5,d,1\r\n4,f,5,f,1\r\n4,g,5,g,1\r\n4,h,5,h,1\r\n4,j,5,j,1\r\n4,k,5,k,1\r\n4,l,5,l,1\r\n4,m,5,m,1\r\n4,n,5,n,1\r\n4,p,5,p,1\r\n4,q,5,q,1\r\n4,r,5,r,1\r\n4,s,5,s,1\r\n4,t,5,t,1\r\n4,v,5,v,1\r\n4,w,5,w,1\r\n4,x,5,x,1\r\n4,z,5,z,1\r\n5,%,6,,-1\r\n5,`a,6,,-1\r\n5,`a:,6,,-1\r\n5,`e,6,,-1\r\n5,`e:,6,,-1\r\n5,`i,6,,-1\r\n5,`i:,6,,-1\r\n5,`o,6,,-1\r\n5,`o:,6,,-1\r\n5,`u,6,,-1\r\n5,`u:,6,,-1\r\n5,`y,6,,-1\r\n5,`y:,6,,-1\r\n5,a,6,,-1\r\n5,a:,6,,-1\r\n5,b,5,b,1\r\n5,c,5,c,1\r\n5,d,5,d,1\r\n5,e,6,,-1\r\n5,e:,6,,-1\r\n5,f,5,f,1\r\n5,g,5,g,1\r\n5,h,5,h,1\r\n5,i,6,,-1\r\n5,i:,6,,-1\r\n5,j,5,j,1\r\n5,k,5,k,1\r\n5,l,5,l,1\r\n5,m,5,m,1\r\n5,n,5,n,1\r\n5,o,6,,-1\r\n5,o:,6,,-1\r\n5,p,5,p,1\r\n5,q,5,q,1\r\n5,r,5,r,1\r\n5,s,5,s,1\r\n5,t,5,t,1\r\n5,u,6,,-1\r\n5,u:,6,,-1\r\n5,v,5,v,1\r\n5,w,5,w,1\r\n5,x,5,x,1\r\n5,y,6,,-1\r\n5,y:,6,,-1\r\n5,z,5,z,1\r\n6,#,7,~,1\r\n6,+,6,,-1\r\n6,.,6,,-1\r\n6,`a,6,,-1\r\n6,`a:,6,,-1\r\n6,`e,6,,-1\r\n6,`e:,6,,-1\r\n6,`i,6,,-1\r\n6,`i:,6,,-1\r\n6,`o,6,,-1\r\n6,`o:,6,,-1\r\n6,`u,6,,-1\r\n6,`u:,6,,-1\r\n6,`y,6,,-1\r\n6,`y:,6,,-1\r\n6,a,6,,-1\r\n6,a:,6,,-1\r\n6,b,6,,-1\r\n6,c,6,,-1\r\n6,d,6,,-1\r\n6,e,6,,-1\r\n6,e:,6,,-1\r\n6,f,6,,-1\r\n6,g,6,,-1\r\n6,h,6,,-1\r\n6,i,6,,-1\r\n6,i:,6,,-1\r\n6,j,6,,-1\r\n6,k,6,,-1\r\n6,l,6,,-1\r\n6,m,6,,-1\r\n6,n,6,,-1\r\n6,o,6,,-1\r\n6,o:,6,,-1\r\n6,p,6,,-1\r\n6,q,6,,-1\r\n6,r,6,,-1\r\n6,s,6,,-1\r\n6,t,6,,-1\r\n6,u,6,,-1\r\n6,u:,6,,-1\r\n6,v,6,,-1\r\n6,w,6,,-1\r\n6,x,6,,-1\r\n6,y,6,,-1\r\n6,y:,6,,-1\r\n6,z,6,,-1\r\n7,%,1,,1\r\n7,+,7,+,1\r\n7,.,7,.,1\r\n7,`a,7,`a,1\r\n7,`a:,7,`a:,1\r\n7,`e,7,`e,1\r\n7,`e:,7,`e:,1\r\n7,`i,7,`i,1\r\n7,`i:,7,`i:,1\r\n7,`o,7,`o,1\r\n7,`o:,7,`o:,1\r\n7,`u,7,`u,1\r\n7,`u:,7,`u:,1\r\n7,`y,7,`y,1\r\n7,`y:,7,`y:,1\r\n7,a,7,a,1\r\n7,a:,7,a:,1\r\n7,b,7,b,1\r\n7,c,7,c,1\r\n7,d,7,d,1\r\n7,e,7,e,1\r\n7,e:,7,e:,1\r\n7,f,7,f,1\r\n7,g,7,g,1\r\n7,h,7,h,1\r\n7,i,7,i,1\r\n7,i:,7,i:,1\r\n7,j,7,j,1\r\n7,k,7,k,1\r\n7,l,7,l,1\r\n7,m,7,m,1\r\n7,n,7,n,1\r\n7,o,7,o,1\r\n7,o:,7,o:,1\r\n7,p,7,p,1\r\n7,q,7,q,1\r\n7,r,7,r,1\r\n7,s,7,s,1\r\n7,t,7,t,1\r\n7,u,7,u,1\r\n7,u:,7,u:,1\r\n7,v,7,v,1\r\n7,w,7,w,1\r\n7,x,7,x,1\r\n7,y,7,y,1\r\n7,y:,7,y:,1\r\n7,z,7,z,1\r\n'),
 ('Initial CVC - General', '| Input   | Output      |\r\n|---------|-------------|\r\n| CVC-X   | CVC-CVC-X   |', 'Input=#CVC-X$ where X is any string of symbols\r\nOutput=#CVC\\~CVC-X%\r\nThe word-initial CVC string is repeated. I assume that inputs start with CVC and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the first CVC once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%states q3-q5 return to the beginning of input, output the base CVCX, and end\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state] (q5) [below of=q1] {$q_5$};\r\n\\node[state,accepting] (q6) [right of=q5] {$q_6$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge node {(V,V,+1)} (q3)\r\n(q3) edge node {(C,C,-1)} (q4)\r\n(q4) edge [loop right] node {($\\Sigma$,$\\epsilon$,-1)} (q4)\r\n(q4) edge node[right] {(\\#,$\\sim$,+1)} (q5)\r\n(q5) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q5)\r\n(q5) edge node[below] {(\\%,$\\epsilon$,+1)} (q6)\r\n\r\n;\r\n\\end{tikzpicture}', 0, '#Inital CVC\r\n#If the word starts with CVC, the CVC is reduplicated\r\n#The function is not defined for any input which doesnt start with CVC\r\n#e.g. patka --> pat~patka, ata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\', \'output first C\',\'output first CV\',\'output first CVC\',\'return\',\'output base\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\', \'#\') = (\'output first C\',\'\',1)\r\n(\'output first C\', \\consonants) = (\'output first CV\',\\ID,1)\r\n(\'output first CV\',\\vowels)  = (\'output first CVC\',\\ID,1)\r\n(\'output first CVC\',\\consonants) = (\'return\',\\ID,-1)\r\n(\'return\',\\alphabet) = (\'return\',\'\',-1)\r\n(\'return\', \'#\') =  (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\', \'%\') =  (\'end\',\'\',1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Inital CVC\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	output first CV\r\n4	output first CVC\r\n5	return\r\n6	output base\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,`a,4,`a,1\r\n3,`a:,4,`a:,1\r\n3,`e,4,`e,1\r\n3,`e:,4,`e:,1\r\n3,`i,4,`i,1\r\n3,`i:,4,`i:,1\r\n3,`o,4,`o,1\r\n3,`o:,4,`o:,1\r\n3,`u,4,`u,1\r\n3,`u:,4,`u:,1\r\n3,`y,4,`y,1\r\n3,`y:,4,`y:,1\r\n3,a,4,a,1\r\n3,a:,4,a:,1\r\n3,e,4,e,1\r\n3,e:,4,e:,1\r\n3,i,4,i,1\r\n3,i:,4,i:,1\r\n3,o,4,o,1\r\n3,o:,4,o:,1\r\n3,u,4,u,1\r\n3,u:,4,u:,1\r\n3,y,4,y,1\r\n3,y:,4,y:,1\r\n4,b,5,b,-1\r\n4,c,5,c,-1\r\n4,d,5,d,-1\r\n4,f,5,f,-1\r\n4,g,5,g,-1\r\n4,h,5,h,-1\r\n4,j,5,j,-1\r\n4,k,5,k,-1\r\n4,l,5,l,-1\r\n4,m,5,m,-1\r\n4,n,5,n,-1\r\n4,p,5,p,-1\r\n4,q,5,q,-1\r\n4,r,5,r,-1\r\n4,s,5,s,-1\r\n4,t,5,t,-1\r\n4,v,5,v,-1\r\n4,w,5,w,-1\r\n4,x,5,x,-1\r\n4,z,5,z,-1\r\n5,#,6,~,1\r\n5,+,5,,-1\r\n5,.,5,,-1\r\n5,`a,5,,-1\r\n5,`a:,5,,-1\r\n5,`e,5,,-1\r\n5,`e:,5,,-1\r\n5,`i,5,,-1\r\n5,`i:,5,,-1\r\n5,`o,5,,-1\r\n5,`o:,5,,-1\r\n5,`u,5,,-1\r\n5,`u:,5,,-1\r\n5,`y,5,,-1\r\n5,`y:,5,,-1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,c,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,j,5,,-1\r\n5,k,5,,-1\r\n5,l,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,q,5,,-1\r\n5,r,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,w,5,,-1\r\n5,x,5,,-1\r\n5,y,5,,-1\r\n5,y:,5,,-1\r\n5,z,5,,-1\r\n6,%,1,,1\r\n6,+,6,+,1\r\n6,.,6,.,1\r\n6,`a,6,`a,1\r\n6,`a:,6,`a:,1\r\n6,`e,6,`e,1\r\n6,`e:,6,`e:,1\r\n6,`i,6,`i,1\r\n6,`i:,6,`i:,1\r\n6,`o,6,`o,1\r\n6,`o:,6,`o:,1\r\n6,`u,6,`u,1\r\n6,`u:,6,`u:,1\r\n6,`y,6,`y,1\r\n6,`y:,6,`y:,1\r\n6,a,6,a,1\r\n6,a:,6,a:,1\r\n6,b,6,b,1\r\n6,c,6,c,1\r\n6,d,6,d,1\r\n6,e,6,e,1\r\n6,e:,6,e:,1\r\n6,f,6,f,1\r\n6,g,6,g,1\r\n6,h,6,h,1\r\n6,i,6,i,1\r\n6,i:,6,i:,1\r\n6,j,6,j,1\r\n6,k,6,k,1\r\n6,l,6,l,1\r\n6,m,6,m,1\r\n6,n,6,n,1\r\n6,o,6,o,1\r\n6,o:,6,o:,1\r\n6,p,6,p,1\r\n6,q,6,q,1\r\n6,r,6,r,1\r\n6,s,6,s,1\r\n6,t,6,t,1\r\n6,u,6,u,1\r\n6,u:,6,u:,1\r\n6,v,6,v,1\r\n6,w,6,w,1\r\n6,x,6,x,1\r\n6,y,6,y,1\r\n6,y:,6,y:,1\r\n6,z,6,z,1\r\n'),
-('Initial CVC - Ilocano monosyllable + glottal stop repairs', 'Data is complicated. Refer to the description.', 'a) \r\nInput=#C~1~\\*VC~2~-X% where X is a string of symbols containing at least one vowel\r\nOutput=#C~1~\\*VC~2~\\~C~1~\\*VC~2~-X%\r\nb)\r\nInput=#C~1~\\*VP-X% where X is a string of segments containing at least one vowel, and P is a glottal stop\r\nOutput=#C~1~\\*VV~C~1~\\*VP-X%\r\nc)\r\nInput=#C~1~\\*VC_2%\r\nOutput=#C~1~\\*VV\\~C~1~\\*V%\r\n\r\nIf the initial CVC ends in a glottal stop, the reduplicant is CVV. Else if the the input is monosyllable, the output is CVV. Otherwise the reduplicant is just CVC', 'FST: I assume the input has syllable boundaries (.) between syllables. This FST only handdles the Ilokano case because its data is more complete\r\n\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-4 outputs checks if input is monosyllabic or has glottal stop\r\n\r\n\\node[state] (q2) [above of=q0] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n% doltong till 7 output CVV for monosyllable or for glottal stop word\r\n\\node[state] (qDOTlong) [right of=q0] {$q_{long}$};\r\n\r\n\\node[state] (q6) [below of=qDOTlong] {$q_6$};\r\n\\node[state] (q7) [below of=q6] {$q_7$};\r\n%dotsecond outputs second copy\r\n\\node[state] (qDOTsecond) [below right of=q4] {$q_{2nd}$};\r\n\\node[state] (q9) [right of=qDOTsecond] {$q_9$};\r\n\\node[state,accepting] (q10) [right of=q9] {$q_{10}$};\r\n\r\n%dotok and up output CVC for polsyllabic and non-glottal stop word\r\n\\node[state] (qDOTok) [above of = q4] {$q_{ok}$};\r\n\r\n\r\n\\node[state] (q14) [right of=qDOTok] {$q_{14}$};\r\n\\node[state] (q15) [right of=q14] {$q_{15}$};\r\n\\node[state] (q16) [right of=q15] {$q_{16}$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q2)\r\n(q2) edge[loop above] node {(C,$\\epsilon$,+1)} (q2)\r\n(q2) edge node {(V,$\\epsilon$,+1)} (q3)\r\n(q3) edge[loop above]  node {(V,$\\epsilon$,+1)} (q3)\r\n(q3) edge node[left] {(\\textipa{P},$\\epsilon$,-1)} (qDOTlong)\r\n(q3) edge node {(\\{C-\\textipa{P}\\},$\\epsilon$,+1)} (q4)\r\n(q3) edge node {(.,$\\epsilon$,-1)} (qDOTok)\r\n(q4) edge node {(\\%,$\\epsilon$,-1)} (qDOTlong)\r\n(q4) edge node[right] {(.,$\\epsilon$,-1)} (qDOTok)\r\n\r\n(qDOTlong) edge[loop right] node {(\\{$\\Sigma$\\},$\\epsilon$,-1)} (qDOTlong)\r\n(qDOTlong) edge node {(\\#,$\\epsilon$,+1)} (q6)\r\n(q6) edge node[left] {(C,C,+1)} (q7)\r\n(q7) edge[loop below] node {(C,C,+1)} (q7)\r\n(q7) edge node[right] {(V,V:,-1)} (qDOTsecond)\r\n\r\n(qDOTsecond) edge[loop below] node[right] {($\\Sigma$,.\\},$\\epsilon$,-1)} (qDOTsecond)\r\n(qDOTsecond) edge node {(\\#,$\\sim$,+1)} (q9)\r\n(q9) edge[loop below] node [right]{(\\{$\\Sigma,.$\\},\\{$\\Sigma,\\epsilon$\\},+1)} (q9)\r\n(q9) edge node {(\\%,$\\epsilon$,+1)} (q10)\r\n\r\n\r\n(qDOTok) edge[loop above] node {(\\{$\\Sigma$\\},$\\epsilon$,-1)} (qDOTok)\r\n(qDOTok) edge node {(\\#,$\\epsilon$,+1)} (q14)\r\n(q14) edge node {(C,C,+1)} (q15)\r\n(q15) edge[loop above] node {(C,C,+1)} (q15)\r\n(q15) edge node {(V,V,+1)} (q16)\r\n(q16)  edge node {(.,$\\epsilon$,+1)} (q16)\r\n(q16)  edge node {(C,C,-1)} (qDOTsecond)\r\n;\r\n\\end{tikzpicture}\r\n', 1, '#Ilocano initial CVC reduplication with vowel CVV used instead for monosyllables and glottal stop codas\r\n#In Ilocano, if the word is monosyllabic starts CC*V then CC*V is repeated with vowel lengthening\r\n#If the word is polysyllabic but initial CC*VC\'s final C is a glottal stop, then CC*V is repeated with vowel lengthening\r\n#If the word is polysyllabica nd the initial CC*VC\'s final C is not a glottal stop, then CC*VC is repeated\r\n#I use \'.\' to mark the boundary between syllables\r\n#The function is not defined for an input which starts with anything other than CC*V(C)% or CC*V(C). \r\n#e.g. pa.ta--> pat~pata, spa.ta --> spat~spata, pat --> pa:~pat, paʔ --> pa:~paʔ, ata --> məŋ+ata~ata, ata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\',\'ʔ\',\'a\',\'e\',\'i\',\'o\',\'u\',\'a:\',\'e:\',\'i:\',\'o:\',\'u:\',\'.\']\r\nsubalphabets = 3\r\nsegments = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\',\'ʔ\',\'a\',\'e\',\'i\',\'o\',\'u\',\'a:\',\'e:\',\'i:\',\'o:\',\'u:\']\r\nconsonants = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\',\'ʔ\']\r\nvowels = [\'a\',\'e\',\'i\',\'o\',\'u\']\r\n\r\nfunctions  = 1\r\nlengthen = { (\'a\',\'a:\'),(\'e\',\'e:\'),(\'i\',\'i:\'),(\'o\',\'o:\'),(\'u\',\'u:\') }\r\n\r\n#states type = string\r\nstates = [\'start\',\'skip the onset\',\'check the first syllable for coda\',\'check the first syllable for monosyllabicity\',\'first syllable needs to reduplicate as CVV\',\'output first C of CVV\',\'output first CVV of CVV\',\'return to output base\',q9,\'output base\',\'first syllabe doesnt need to reduplicate as CVV\',\'end\',\'output first C of CVC\',\'output first CV of CVC\',\'output first CVC of CVC\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'skip the onset\',\'\',1)\r\n(\'skip the onset\',\\consonants) = (\'skip the onset\',\'\',1)\r\n(\'skip the onset\',\\vowels) = (\'check the first syllable for coda\',\'\',1)\r\n(\'check the first syllable for coda\',\\vowels) = (\'check the first syllable for coda\',\'\',1)\r\n(\'check the first syllable for coda\', \'ʔ\') = (\'first syllable needs to reduplicate as CVV\',\'\',-1)\r\n(\'check the first syllable for coda\', {\\consonants - \'ʔ\'} ) = (\'check the first syllable for monosyllabicity\',\'\',1)\r\n(\'check the first syllable for coda\', \'.\' ) = (\'first syllabe doesnt need to reduplicate as CVV\',\'\',1)\r\n(\'check the first syllable for monosyllabicity\', \'%\') = (\'first syllable needs to reduplicate as CVV\',\'\',-1)\r\n(\'check the first syllable for monosyllabicity\',\'.\') =  (\'first syllabe doesnt need to reduplicate as CVV\',\'\',-1)\r\n(\'first syllable needs to reduplicate as CVV\', \\segments) =  (\'first syllable needs to reduplicate as CVV\',\'\',-1)\r\n(\'first syllable needs to reduplicate as CVV\', \'#\') = (\'output first C of CVV\',\'\',1)\r\n(\'output first C of CVV\',\\consonants) = (\'output first CVV of CVV\',\\ID,1)\r\n(\'output first CVV of CVV\',\\consonants) = (\'output first CVV of CVV\',\\ID,1)\r\n(\'output first CVV of CVV\',\\vowels) =  (\'return to output base\',\\lengthen,-1)\r\n(\'return to output base\', \\alphabet) = (\'return to output base\',\'\',-1)\r\n(\'return to output base\',\'#\') = (\'output base\',\'~\',1)\r\n(\'output base\', \\segments) = (\'output base\',\\ID,1)\r\n(\'output base\',\'.\') =  (\'output base\',\'\',1)\r\n(\'output base\', \'%\') = (\'end\',\'\',1)\r\n(\'first syllabe doesnt need to reduplicate as CVV\', \\alphabet) = (\'first syllabe doesnt need to reduplicate as CVV\',\'\',-1)\r\n(\'first syllabe doesnt need to reduplicate as CVV\', \'#\') = (\'output first C of CVC\',\'\',1)\r\n(\'output first C of CVC\', \\consonants) = (\'output first CV of CVC\',\\ID,1)\r\n(\'output first CV of CVC\',\\consonants) = (\'output first CV of CVC\',\\ID,1)\r\n(\'output first CV of CVC\', \\vowels) = (\'output first CVC of CVC\',\\ID,1)\r\n(\'output first CVC of CVC\', \'.\')  = (\'output first CVC of CVC\',\'\',+1)\r\n(\'output first CVC of CVC\', \\consonants)  = (\'return to output base\',\\ID,-1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Ilocano initial CVC reduplication with vowel CVV used instead for monosyllables and glottal stop codas\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	skip the onset\r\n3	check the first syllable for coda\r\n4	check the first syllable for monosyllabicity\r\n5	first syllable needs to reduplicate as CVV\r\n6	output first C of CVV\r\n7	output first CVV of CVV\r\n8	return to output base\r\n9	output base\r\n10	first syllabe doesnt need to reduplicate as CVV\r\n11	output first C of CVC\r\n12	output first CV of CVC\r\n13	output first CVC of CVC\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n10,#,11,,1\r\n10,.,10,,-1\r\n10,a,10,,-1\r\n10,a:,10,,-1\r\n10,b,10,,-1\r\n10,d,10,,-1\r\n10,e,10,,-1\r\n10,e:,10,,-1\r\n10,f,10,,-1\r\n10,g,10,,-1\r\n10,h,10,,-1\r\n10,i,10,,-1\r\n10,i:,10,,-1\r\n10,k,10,,-1\r\n10,m,10,,-1\r\n10,n,10,,-1\r\n10,o,10,,-1\r\n10,o:,10,,-1\r\n10,p,10,,-1\r\n10,s,10,,-1\r\n10,t,10,,-1\r\n10,u,10,,-1\r\n10,u:,10,,-1\r\n10,v,10,,-1\r\n10,z,10,,-1\r\n10,ʔ,10,,-1\r\n11,b,12,b,1\r\n11,d,12,d,1\r\n11,f,12,f,1\r\n11,g,12,g,1\r\n11,h,12,h,1\r\n11,k,12,k,1\r\n11,m,12,m,1\r\n11,n,12,n,1\r\n11,p,12,p,1\r\n11,s,12,s,1\r\n11,t,12,t,1\r\n11,v,12,v,1\r\n11,z,12,z,1\r\n11,ʔ,12,ʔ,1\r\n12,a,13,a,1\r\n12,b,12,b,1\r\n12,d,12,d,1\r\n12,e,13,e,1\r\n12,f,12,f,1\r\n12,g,12,g,1\r\n12,h,12,h,1\r\n12,i,13,i,1\r\n12,k,12,k,1\r\n12,m,12,m,1\r\n12,n,12,n,1\r\n12,o,13,o,1\r\n12,p,12,p,1\r\n12,s,12,s,1\r\n12,t,12,t,1\r\n12,u,13,u,1\r\n12,v,12,v,1\r\n12,z,12,z,1\r\n12,ʔ,12,ʔ,1\r\n13,.,13,,1\r\n13,b,8,b,-1\r\n13,d,8,d,-1\r\n13,f,8,f,-1\r\n13,g,8,g,-1\r\n13,h,8,h,-1\r\n13,k,8,k,-1\r\n13,m,8,m,-1\r\n13,n,8,n,-1\r\n13,p,8,p,-1\r\n13,s,8,s,-1\r\n13,t,8,t,-1\r\n13,v,8,v,-1\r\n13,z,8,z,-1\r\n13,ʔ,8,ʔ,-1\r\n2,a,3,,1\r\n2,b,2,,1\r\n2,d,2,,1\r\n2,e,3,,1\r\n2,f,2,,1\r\n2,g,2,,1\r\n2,h,2,,1\r\n2,i,3,,1\r\n2,k,2,,1\r\n2,m,2,,1\r\n2,n,2,,1\r\n2,o,3,,1\r\n2,p,2,,1\r\n2,s,2,,1\r\n2,t,2,,1\r\n2,u,3,,1\r\n2,v,2,,1\r\n2,z,2,,1\r\n2,ʔ,2,,1\r\n3,.,10,,1\r\n3,a,3,,1\r\n3,b,4,,1\r\n3,d,4,,1\r\n3,e,3,,1\r\n3,f,4,,1\r\n3,g,4,,1\r\n3,h,4,,1\r\n3,i,3,,1\r\n3,k,4,,1\r\n3,m,4,,1\r\n3,n,4,,1\r\n3,o,3,,1\r\n3,p,4,,1\r\n3,s,4,,1\r\n3,t,4,,1\r\n3,u,3,,1\r\n3,v,4,,1\r\n3,z,4,,1\r\n3,ʔ,5,,-1\r\n4,%,5,,-1\r\n4,.,10,,-1\r\n5,#,6,,1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,k,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,z,5,,-1\r\n5,ʔ,5,,-1\r\n6,b,7,b,1\r\n6,d,7,d,1\r\n6,f,7,f,1\r\n6,g,7,g,1\r\n6,h,7,h,1\r\n6,k,7,k,1\r\n6,m,7,m,1\r\n6,n,7,n,1\r\n6,p,7,p,1\r\n6,s,7,s,1\r\n6,t,7,t,1\r\n6,v,7,v,1\r\n6,z,7,z,1\r\n6,ʔ,7,ʔ,1\r\n7,a,8,a:,-1\r\n7,b,7,b,1\r\n7,d,7,d,1\r\n7,e,8,e:,-1\r\n7,f,7,f,1\r\n7,g,7,g,1\r\n7,h,7,h,1\r\n7,i,8,i:,-1\r\n7,k,7,k,1\r\n7,m,7,m,1\r\n7,n,7,n,1\r\n7,o,8,o:,-1\r\n7,p,7,p,1\r\n7,s,7,s,1\r\n7,t,7,t,1\r\n7,u,8,u:,-1\r\n7,v,7,v,1\r\n7,z,7,z,1\r\n7,ʔ,7,ʔ,1\r\n8,#,9,~,1\r\n8,.,8,,-1\r\n8,a,8,,-1\r\n8,a:,8,,-1\r\n8,b,8,,-1\r\n8,d,8,,-1\r\n8,e,8,,-1\r\n8,e:,8,,-1\r\n8,f,8,,-1\r\n8,g,8,,-1\r\n8,h,8,,-1\r\n8,i,8,,-1\r\n8,i:,8,,-1\r\n8,k,8,,-1\r\n8,m,8,,-1\r\n8,n,8,,-1\r\n8,o,8,,-1\r\n8,o:,8,,-1\r\n8,p,8,,-1\r\n8,s,8,,-1\r\n8,t,8,,-1\r\n8,u,8,,-1\r\n8,u:,8,,-1\r\n8,v,8,,-1\r\n8,z,8,,-1\r\n8,ʔ,8,,-1\r\n9,%,1,,1\r\n9,.,9,,1\r\n9,a,9,a,1\r\n9,a:,9,a:,1\r\n9,b,9,b,1\r\n9,d,9,d,1\r\n9,e,9,e,1\r\n9,e:,9,e:,1\r\n9,f,9,f,1\r\n9,g,9,g,1\r\n9,h,9,h,1\r\n9,i,9,i,1\r\n9,i:,9,i:,1\r\n9,k,9,k,1\r\n9,m,9,m,1\r\n9,n,9,n,1\r\n9,o,9,o,1\r\n9,o:,9,o:,1\r\n9,p,9,p,1\r\n9,s,9,s,1\r\n9,t,9,t,1\r\n9,u,9,u,1\r\n9,u:,9,u:,1\r\n9,v,9,v,1\r\n9,z,9,z,1\r\n9,ʔ,9,ʔ,1\r\n');
+('Initial CVC - Ilocano monosyllable + glottal stop repairs', 'Data is complicated. Refer to the description.', 'a) \r\nInput=#C~1~\\*VC~2~-X% where X is a string of symbols containing at least one vowel\r\nOutput=#C~1~\\*VC~2~\\~C~1~\\*VC~2~-X%\r\nb)\r\nInput=#C~1~\\*VP-X% where X is a string of segments containing at least one vowel, and P is a glottal stop\r\nOutput=#C~1~\\*VV~C~1~\\*VP-X%\r\nc)\r\nInput=#C~1~\\*VC_2%\r\nOutput=#C~1~\\*VV\\~C~1~\\*V%\r\n\r\nIf the initial CVC ends in a glottal stop, the reduplicant is CVV. Else if the the input is monosyllable, the output is CVV. Otherwise the reduplicant is just CVC', 'FST: I assume the input has syllable boundaries (.) between syllables. This FST only handdles the Ilokano case because its data is more complete\r\n\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-4 outputs checks if input is monosyllabic or has glottal stop\r\n\r\n\\node[state] (q2) [above of=q0] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n% doltong till 7 output CVV for monosyllable or for glottal stop word\r\n\\node[state] (qDOTlong) [right of=q0] {$q_{long}$};\r\n\r\n\\node[state] (q6) [below of=qDOTlong] {$q_6$};\r\n\\node[state] (q7) [below of=q6] {$q_7$};\r\n%dotsecond outputs second copy\r\n\\node[state] (qDOTsecond) [below right of=q4] {$q_{2nd}$};\r\n\\node[state] (q9) [right of=qDOTsecond] {$q_9$};\r\n\\node[state,accepting] (q10) [right of=q9] {$q_{10}$};\r\n\r\n%dotok and up output CVC for polsyllabic and non-glottal stop word\r\n\\node[state] (qDOTok) [above of = q4] {$q_{ok}$};\r\n\r\n\r\n\\node[state] (q14) [right of=qDOTok] {$q_{14}$};\r\n\\node[state] (q15) [right of=q14] {$q_{15}$};\r\n\\node[state] (q16) [right of=q15] {$q_{16}$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q2)\r\n(q2) edge[loop above] node {(C,$\\epsilon$,+1)} (q2)\r\n(q2) edge node {(V,$\\epsilon$,+1)} (q3)\r\n(q3) edge[loop above]  node {(V,$\\epsilon$,+1)} (q3)\r\n(q3) edge node[left] {(\\textipa{P},$\\epsilon$,-1)} (qDOTlong)\r\n(q3) edge node {(\\{C-\\textipa{P}\\},$\\epsilon$,+1)} (q4)\r\n(q3) edge node {(.,$\\epsilon$,-1)} (qDOTok)\r\n(q4) edge node {(\\%,$\\epsilon$,-1)} (qDOTlong)\r\n(q4) edge node[right] {(.,$\\epsilon$,-1)} (qDOTok)\r\n\r\n(qDOTlong) edge[loop right] node {(\\{$\\Sigma$\\},$\\epsilon$,-1)} (qDOTlong)\r\n(qDOTlong) edge node {(\\#,$\\epsilon$,+1)} (q6)\r\n(q6) edge node[left] {(C,C,+1)} (q7)\r\n(q7) edge[loop below] node {(C,C,+1)} (q7)\r\n(q7) edge node[right] {(V,V:,-1)} (qDOTsecond)\r\n\r\n(qDOTsecond) edge[loop below] node[right] {($\\Sigma$,.\\},$\\epsilon$,-1)} (qDOTsecond)\r\n(qDOTsecond) edge node {(\\#,$\\sim$,+1)} (q9)\r\n(q9) edge[loop below] node [right]{(\\{$\\Sigma,.$\\},\\{$\\Sigma,\\epsilon$\\},+1)} (q9)\r\n(q9) edge node {(\\%,$\\epsilon$,+1)} (q10)\r\n\r\n\r\n(qDOTok) edge[loop above] node {(\\{$\\Sigma$\\},$\\epsilon$,-1)} (qDOTok)\r\n(qDOTok) edge node {(\\#,$\\epsilon$,+1)} (q14)\r\n(q14) edge node {(C,C,+1)} (q15)\r\n(q15) edge[loop above] node {(C,C,+1)} (q15)\r\n(q15) edge node {(V,V,+1)} (q16)\r\n(q16)  edge node {(.,$\\epsilon$,+1)} (q16)\r\n(q16)  edge node {(C,C,-1)} (qDOTsecond)\r\n;\r\n\\end{tikzpicture}\r\n', 1, '#Ilocano initial CVC reduplication with vowel CVV used instead for monosyllables and glottal stop codas\r\n#In Ilocano, if the word is monosyllabic starts CC*V then CC*V is repeated with vowel lengthening\r\n#If the word is polysyllabic but initial CC*VC\'s final C is a glottal stop, then CC*V is repeated with vowel lengthening\r\n#If the word is polysyllabica nd the initial CC*VC\'s final C is not a glottal stop, then CC*VC is repeated\r\n#I use \'.\' to mark the boundary between syllables\r\n#The function is not defined for an input which starts with anything other than CC*V(C)% or CC*V(C). \r\n#e.g. pa.ta--> pat~pata, spa.ta --> spat~spata, pat --> pa:~pat, paʔ --> pa:~paʔ, ata --> məŋ+ata~ata, ata --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\',\'ʔ\',\'a\',\'e\',\'i\',\'o\',\'u\',\'a:\',\'e:\',\'i:\',\'o:\',\'u:\',\'.\']\r\nsubalphabets = 3\r\nsegments = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\',\'ʔ\',\'a\',\'e\',\'i\',\'o\',\'u\',\'a:\',\'e:\',\'i:\',\'o:\',\'u:\']\r\nconsonants = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\',\'ʔ\']\r\nvowels = [\'a\',\'e\',\'i\',\'o\',\'u\']\r\n\r\nfunctions  = 1\r\nlengthen = { (\'a\',\'a:\'),(\'e\',\'e:\'),(\'i\',\'i:\'),(\'o\',\'o:\'),(\'u\',\'u:\') }\r\n\r\n#states type = string\r\nstates = [\'start\',\'skip the onset\',\'check the first syllable for coda\',\'check the first syllable for monosyllabicity\',\'first syllable needs to reduplicate as CVV\',\'output first C of CVV\',\'output first CVV of CVV\',\'return to output base\',\'q9\',\'output base\',\'first syllabe doesnt need to reduplicate as CVV\',\'end\',\'output first C of CVC\',\'output first CV of CVC\',\'output first CVC of CVC\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'skip the onset\',\'\',1)\r\n(\'skip the onset\',\\consonants) = (\'skip the onset\',\'\',1)\r\n(\'skip the onset\',\\vowels) = (\'check the first syllable for coda\',\'\',1)\r\n(\'check the first syllable for coda\',\\vowels) = (\'check the first syllable for coda\',\'\',1)\r\n(\'check the first syllable for coda\', \'ʔ\') = (\'first syllable needs to reduplicate as CVV\',\'\',-1)\r\n(\'check the first syllable for coda\', {\\consonants - \'ʔ\'} ) = (\'check the first syllable for monosyllabicity\',\'\',1)\r\n(\'check the first syllable for coda\', \'.\' ) = (\'first syllabe doesnt need to reduplicate as CVV\',\'\',1)\r\n(\'check the first syllable for monosyllabicity\', \'%\') = (\'first syllable needs to reduplicate as CVV\',\'\',-1)\r\n(\'check the first syllable for monosyllabicity\',\'.\') =  (\'first syllabe doesnt need to reduplicate as CVV\',\'\',-1)\r\n(\'first syllable needs to reduplicate as CVV\', \\segments) =  (\'first syllable needs to reduplicate as CVV\',\'\',-1)\r\n(\'first syllable needs to reduplicate as CVV\', \'#\') = (\'output first C of CVV\',\'\',1)\r\n(\'output first C of CVV\',\\consonants) = (\'output first CVV of CVV\',\\ID,1)\r\n(\'output first CVV of CVV\',\\consonants) = (\'output first CVV of CVV\',\\ID,1)\r\n(\'output first CVV of CVV\',\\vowels) =  (\'return to output base\',\\lengthen,-1)\r\n(\'return to output base\', \\alphabet) = (\'return to output base\',\'\',-1)\r\n(\'return to output base\',\'#\') = (\'output base\',\'~\',1)\r\n(\'output base\', \\segments) = (\'output base\',\\ID,1)\r\n(\'output base\',\'.\') =  (\'output base\',\'\',1)\r\n(\'output base\', \'%\') = (\'end\',\'\',1)\r\n(\'first syllabe doesnt need to reduplicate as CVV\', \\alphabet) = (\'first syllabe doesnt need to reduplicate as CVV\',\'\',-1)\r\n(\'first syllabe doesnt need to reduplicate as CVV\', \'#\') = (\'output first C of CVC\',\'\',1)\r\n(\'output first C of CVC\', \\consonants) = (\'output first CV of CVC\',\\ID,1)\r\n(\'output first CV of CVC\',\\consonants) = (\'output first CV of CVC\',\\ID,1)\r\n(\'output first CV of CVC\', \\vowels) = (\'output first CVC of CVC\',\\ID,1)\r\n(\'output first CVC of CVC\', \'.\')  = (\'output first CVC of CVC\',\'\',+1)\r\n(\'output first CVC of CVC\', \\consonants)  = (\'return to output base\',\\ID,-1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Ilocano initial CVC reduplication with vowel CVV used instead for monosyllables and glottal stop codas\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	skip the onset\r\n3	check the first syllable for coda\r\n4	check the first syllable for monosyllabicity\r\n5	first syllable needs to reduplicate as CVV\r\n6	output first C of CVV\r\n7	output first CVV of CVV\r\n8	return to output base\r\n9	output base\r\n10	first syllabe doesnt need to reduplicate as CVV\r\n11	output first C of CVC\r\n12	output first CV of CVC\r\n13	output first CVC of CVC\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n10,#,11,,1\r\n10,.,10,,-1\r\n10,a,10,,-1\r\n10,a:,10,,-1\r\n10,b,10,,-1\r\n10,d,10,,-1\r\n10,e,10,,-1\r\n10,e:,10,,-1\r\n10,f,10,,-1\r\n10,g,10,,-1\r\n10,h,10,,-1\r\n10,i,10,,-1\r\n10,i:,10,,-1\r\n10,k,10,,-1\r\n10,m,10,,-1\r\n10,n,10,,-1\r\n10,o,10,,-1\r\n10,o:,10,,-1\r\n10,p,10,,-1\r\n10,s,10,,-1\r\n10,t,10,,-1\r\n10,u,10,,-1\r\n10,u:,10,,-1\r\n10,v,10,,-1\r\n10,z,10,,-1\r\n10,ʔ,10,,-1\r\n11,b,12,b,1\r\n11,d,12,d,1\r\n11,f,12,f,1\r\n11,g,12,g,1\r\n11,h,12,h,1\r\n11,k,12,k,1\r\n11,m,12,m,1\r\n11,n,12,n,1\r\n11,p,12,p,1\r\n11,s,12,s,1\r\n11,t,12,t,1\r\n11,v,12,v,1\r\n11,z,12,z,1\r\n11,ʔ,12,ʔ,1\r\n12,a,13,a,1\r\n12,b,12,b,1\r\n12,d,12,d,1\r\n12,e,13,e,1\r\n12,f,12,f,1\r\n12,g,12,g,1\r\n12,h,12,h,1\r\n12,i,13,i,1\r\n12,k,12,k,1\r\n12,m,12,m,1\r\n12,n,12,n,1\r\n12,o,13,o,1\r\n12,p,12,p,1\r\n12,s,12,s,1\r\n12,t,12,t,1\r\n12,u,13,u,1\r\n12,v,12,v,1\r\n12,z,12,z,1\r\n12,ʔ,12,ʔ,1\r\n13,.,13,,1\r\n13,b,8,b,-1\r\n13,d,8,d,-1\r\n13,f,8,f,-1\r\n13,g,8,g,-1\r\n13,h,8,h,-1\r\n13,k,8,k,-1\r\n13,m,8,m,-1\r\n13,n,8,n,-1\r\n13,p,8,p,-1\r\n13,s,8,s,-1\r\n13,t,8,t,-1\r\n13,v,8,v,-1\r\n13,z,8,z,-1\r\n13,ʔ,8,ʔ,-1\r\n2,a,3,,1\r\n2,b,2,,1\r\n2,d,2,,1\r\n2,e,3,,1\r\n2,f,2,,1\r\n2,g,2,,1\r\n2,h,2,,1\r\n2,i,3,,1\r\n2,k,2,,1\r\n2,m,2,,1\r\n2,n,2,,1\r\n2,o,3,,1\r\n2,p,2,,1\r\n2,s,2,,1\r\n2,t,2,,1\r\n2,u,3,,1\r\n2,v,2,,1\r\n2,z,2,,1\r\n2,ʔ,2,,1\r\n3,.,10,,1\r\n3,a,3,,1\r\n3,b,4,,1\r\n3,d,4,,1\r\n3,e,3,,1\r\n3,f,4,,1\r\n3,g,4,,1\r\n3,h,4,,1\r\n3,i,3,,1\r\n3,k,4,,1\r\n3,m,4,,1\r\n3,n,4,,1\r\n3,o,3,,1\r\n3,p,4,,1\r\n3,s,4,,1\r\n3,t,4,,1\r\n3,u,3,,1\r\n3,v,4,,1\r\n3,z,4,,1\r\n3,ʔ,5,,-1\r\n4,%,5,,-1\r\n4,.,10,,-1\r\n5,#,6,,1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,k,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,z,5,,-1\r\n5,ʔ,5,,-1\r\n6,b,7,b,1\r\n6,d,7,d,1\r\n6,f,7,f,1\r\n6,g,7,g,1\r\n6,h,7,h,1\r\n6,k,7,k,1\r\n6,m,7,m,1\r\n6,n,7,n,1\r\n6,p,7,p,1\r\n6,s,7,s,1\r\n6,t,7,t,1\r\n6,v,7,v,1\r\n6,z,7,z,1\r\n6,ʔ,7,ʔ,1\r\n7,a,8,a:,-1\r\n7,b,7,b,1\r\n7,d,7,d,1\r\n7,e,8,e:,-1\r\n7,f,7,f,1\r\n7,g,7,g,1\r\n7,h,7,h,1\r\n7,i,8,i:,-1\r\n7,k,7,k,1\r\n7,m,7,m,1\r\n7,n,7,n,1\r\n7,o,8,o:,-1\r\n7,p,7,p,1\r\n7,s,7,s,1\r\n7,t,7,t,1\r\n7,u,8,u:,-1\r\n7,v,7,v,1\r\n7,z,7,z,1\r\n7,ʔ,7,ʔ,1\r\n8,#,9,~,1\r\n8,.,8,,-1\r\n8,a,8,,-1\r\n8,a:,8,,-1\r\n8,b,8,,-1\r\n8,d,8,,-1\r\n8,e,8,,-1\r\n8,e:,8,,-1\r\n8,f,8,,-1\r\n8,g,8,,-1\r\n8,h,8,,-1\r\n8,i,8,,-1\r\n8,i:,8,,-1\r\n8,k,8,,-1\r\n8,m,8,,-1\r\n8,n,8,,-1\r\n8,o,8,,-1\r\n8,o:,8,,-1\r\n8,p,8,,-1\r\n8,s,8,,-1\r\n8,t,8,,-1\r\n8,u,8,,-1\r\n8,u:,8,,-1\r\n8,v,8,,-1\r\n8,z,8,,-1\r\n8,ʔ,8,,-1\r\n9,%,1,,1\r\n9,.,9,,1\r\n9,a,9,a,1\r\n9,a:,9,a:,1\r\n9,b,9,b,1\r\n9,d,9,d,1\r\n9,e,9,e,1\r\n9,e:,9,e:,1\r\n9,f,9,f,1\r\n9,g,9,g,1\r\n9,h,9,h,1\r\n9,i,9,i,1\r\n9,i:,9,i:,1\r\n9,k,9,k,1\r\n9,m,9,m,1\r\n9,n,9,n,1\r\n9,o,9,o,1\r\n9,o:,9,o:,1\r\n9,p,9,p,1\r\n9,s,9,s,1\r\n9,t,9,t,1\r\n9,u,9,u,1\r\n9,u:,9,u:,1\r\n9,v,9,v,1\r\n9,z,9,z,1\r\n9,ʔ,9,ʔ,1\r\n');
 INSERT INTO `2-way FST` (`2-way FST ID`, `example data`, `description`, `FST diagram`, `language specific`, `FST recipe`, `FST code`) VALUES
-('Initial CVC - Mokilese mora minimality + gemination/lengthening', 'Data is complicated. Refer to description', 'There are multiple subpatterns. The general pattern is initial CVC reduplication. However there different strategies depending on whether stem starts with a vowel vs. consonant, whether the first vowel is long, and whether the first vowel is succeeded by a consonant. The different strategies involve simple copying, vowel lengthenening, or consonant gemination. I assume the consonant clusters are actually complex segments, though the orthography+syllabification+description are inconsistent. Likewise an additional source (Halle 2008) who cites (Blevins 1996) argues that monosyllables undergo triplicaton: /caak}/-->[caa-caa-caak]  \"bending\" which contradicts the monosyllables from my first source.\r\n\r\n\r\n1) Pattern 1: If the input is of the form \\#CVC-Σ\\*\\%, then redup(X)=CVC-X\r\n\r\n| Input | Gloss                | Output    | Gloss                     |\r\n|-------|----------------------|-----------|---------------------------|\r\n| pɔdok | \"to plant\"           | pɔd-pɔdok | \"to plant (prog)\"         |\r\n| pilɔd | \"to pick breadfruit\" | pil-pilɔd | \" pick breadfruit (prog)\" |\r\n\r\n2) Pattern 2: If the input is of the form \\#CV:-Σ\\*\\%, then redup(X)=CV:-X\r\n\r\n| Input  | Gloss     | Output     | Gloss            |\r\n|--------|-----------|------------|------------------|\r\n| sɔ:rak | \"to tear\" | sɔ:-sɔ:rak | \"to tear (prog)\" |\r\n\r\n3) Pattern 3: If the input is of the form \\#CV-(VΣ\\*)\\%, then redup(X)=CV:-X\r\n\r\n| Input | Gloss      | Output  | Gloss             |\r\n|-------|------------|---------|-------------------|\r\n| pa    | \"to weave\" | pa:-pa  | \"to weave (prog)\" |\r\n| wia   | \"to do\"    | wi:-wia | \"to do (prog)\"    |\r\n\r\n4) Pattern 4: If the input is of the form \\#VC-Σ\\%, then redup(X)=VC:-X\r\n\r\n| Input | Gloss        | Output    | Gloss               |\r\n|-------|--------------|-----------|---------------------|\r\n| alu   | \"to walk\"    | all-lu    | \"to walk (prog)\"    |\r\n| andip | \"to split\"   | and-andip | \"to split (prog)\"   |\r\n| onop  | \"to prepare\" | onn-onop  | \"to prepare (prog)\" |\r\n', 'FST: I represent long and short vowels as V: and V with the circumflex\r\n\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-4 outputs checks if input is monosyllabic or has glottal stop\r\n\\node[state] (q1) [above of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%qstartV is for when the input starts with V so the output must be VC:\r\n\\node[state] (qStartsV) [above of=q3] {$q_V$};\r\n\r\n% doltong till 7 output CVV for monosyllable or for long vowel or for vowel hiatus\r\n\\node[state] (qDOTlong) [right of=q0] {$q_{long}$};\r\n\r\n\\node[state] (q6) [below of=qDOTlong] {$q_6$};\r\n\\node[state] (q7) [below of=q6] {$q_7$};\r\n%dotsecond outputs second copy\r\n\\node[state] (qDOTsecond) [below right of=qStartsV] {$q_{2nd}$};\r\n\\node[state] (q9) [right of=qDOTsecond] {$q_9$};\r\n\\node[state,accepting] (q10) [right of=q9] {$q_{10}$};\r\n\r\n%dotok and up output CVC for polsyllabic and with initial C\r\n\\node[state] (qDOTok) [above of = qStartsV] {$q_{ok}$};\r\n\r\n\r\n\\node[state] (q14) [right of=qDOTok] {$q_{14}$};\r\n\\node[state] (q15) [right of=q14] {$q_{15}$};\r\n\\node[state] (q16) [right of=q15] {$q_{16}$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge node {(C,$\\epsilon$,+1)} (q2)\r\n(q2) edge node[left] {(V:,$\\epsilon$,+1)} (qDOTlong)\r\n(q2) edge node {(\\v{V},$\\epsilon$,+1)} (q3)\r\n(q3) edge node[right] {\\{\\%,V\\},$\\epsilon$,-1)} (qDOTlong)\r\n(q3) edge[bend left] node[left] {C,$\\epsilon$,-1)} (qDOTok)\r\n(q1) edge node {(V,V,+1)} (qStartsV)\r\n(qStartsV) edge node {(C,C:,-1)} (qDOTsecond)\r\n\r\n(qDOTlong) edge[loop right] node {($\\Sigma$,$\\epsilon$,-1)} (qDOTlong)\r\n(qDOTlong) edge node {(\\#,$\\epsilon$,+1)} (q6)\r\n(q6) edge node[left] {(C,C,+1)} (q7)\r\n(q7) edge node[right] {(V,V:,-1)} (qDOTsecond)\r\n\r\n(qDOTsecond) edge[loop below] node[right] {($\\Sigma$\\},$\\epsilon$,-1)} (qDOTsecond)\r\n(qDOTsecond) edge node {(\\#,$\\sim$,+1)} (q9)\r\n(q9) edge[loop below] node [right]{($\\Sigma$,$\\Sigma$,+1)} (q9)\r\n(q9) edge node {(\\%,$\\epsilon$,+1)} (q10)\r\n\r\n\r\n(qDOTok) edge[loop above] node {($\\Sigma$,$\\epsilon$,-1)} (qDOTok)\r\n(qDOTok) edge node {(\\#,$\\epsilon$,+1)} (q14)\r\n(q14) edge node {(C,C,+1)} (q15)\r\n(q15) edge node {(V,V,+1)} (q16)\r\n(q16)  edge node {(C,C,-1)} (qDOTsecond)\r\n;\r\n\\end{tikzpicture}\r\n\r\n', 1, '#Mokilese initial CVC reduplication with vowel CVV used instead for some cases\r\n#In Ilocano, if the word starts with VC then the VC is repeated and the C is repeated: VC-->VCC~VC\r\n#If the word starts with CVV where the two Vs are not a single long vowel, then CV is repeated with vowel lengthening: CVV-->CV:~V\r\n#If the word starts and ends with CV then the CV is repeated with vowel lengthening: CV-->CV:~CV\r\n#If the word starts with CV: then the CV: is repeated: CV:-->CV:~CV:\r\n#If the word starts with CVC then the CVC is repeated: CVC-->CVC~CVC\r\n#Length on the input is represented with a multicharacter symbol so white space is needed between input symbols\r\n#e.g. \"p a t a\"--> pat~pata, \"a p a t\" --> app~apat, \"p a: t a\" --> pa:~pata, \"p a\" --> pa:~pa\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\',\'a\',\'e\',\'i\',\'o\',\'u\', \'a:\',\'e:\',\'i:\',\'o:\',\'u:\']\r\nsubalphabets = 4\r\nconsonants = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\']\r\nvowels = [\'a\',\'e\',\'i\',\'o\',\'u\', \'a:\',\'e:\',\'i:\',\'o:\',\'u:\']\r\nshort_vowels = [\'a\',\'e\',\'i\',\'o\',\'u\']\r\nlong_vowels = [\'a:\',\'e:\',\'i:\',\'o:\',\'u:\']\r\n\r\nfunctions  = 1\r\nlengthen = { (\'a\',\'a:\'),(\'e\',\'e:\'),(\'i\',\'i:\'),(\'o\',\'o:\'),(\'u\',\'u:\'),(\'a:\',\'a:\'),(\'e:\',\'e:\'),(\'i:\',\'i:\'),(\'o:\',\'o:\'),(\'u:\',\'u:\') }\r\n\r\n#states type = string\r\nstates = [\'start\',\'check if needs CV: or CVC or VC:\',\'starts with C\',\'starts with C and has short vowel\',\'output C of CV:\',\'output CV: of CV:\',\'output CV: of CV:\',\'output base\',\'check if needs CV: or CVC or VC:\'0,\'check if needs CV: or CVC or VC:\'1,\'check if needs CV: or CVC or VC:\'2,\'check if needs CV: or CVC or VC:\'3,\'check if needs CV: or CVC or VC:\'4,\'check if needs CV: or CVC or VC:\'5,\'check if needs CV: or CVC or VC:\'6,\'needs to reduplicate as CV:\',\'needs to reduplicate as CVC\',\'reduplicate as VC:\',\'return to output base\' ,\'end\', \'output C of CVC\', \'output CV of CVC\', \'output CVC of CVC\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'check if needs CV: or CVC or VC:\',\'\',1)\r\n(\'check if needs CV: or CVC or VC:\',\\consonants) = (\'starts with C\',\'\',1)\r\n(\'starts with C\',\\long_vowels) = (\'needs to reduplicate as CV:\',\'\',1)\r\n(\'starts with C\', \\short_vowels) = (\'starts with C and has short vowel\',\'\',1)\r\n(\'starts with C and has short vowel\', \'%\') =(\'needs to reduplicate as CV:\',\'\',-1)\r\n(\'starts with C and has short vowel\', \\vowels) = (\'needs to reduplicate as CV:\',\'\',-1)\r\n(\'starts with C and has short vowel\',\\consonants) = (\'needs to reduplicate as CVC\',\'\',-1)\r\n(\'check if needs CV: or CVC or VC:\',\\vowels) = (\'reduplicate as VC:\',\\ID,1)\r\n(\'reduplicate as VC:\', \\consonants) = (\'return to output base\',[\\ID \\ID],-1)\r\n(\'needs to reduplicate as CV:\',\\alphabet) = (\'needs to reduplicate as CV:\',\'\',-1)\r\n(\'needs to reduplicate as CV:\',\'#\') = (\'output C of CV:\',\'\',1)\r\n(\'output C of CV:\',\\consonants) = (\'output CV: of CV:\',\\ID,1)\r\n(\'output CV: of CV:\',\\vowels) = (\'return to output base\',\\lengthen,-1)\r\n(\'return to output base\',\\alphabet) = (\'return to output base\',\'\',-1)\r\n(\'return to output base\',\'#\') = (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\',\'%\') = (\'end\',\'\',1)\r\n(\'needs to reduplicate as CVC\',\\alphabet) = (\'needs to reduplicate as CVC\',\'\',-1)\r\n(\'needs to reduplicate as CVC\',\'#\') = (\'output C of CVC\',\'\',1)\r\n(\'output C of CVC\',\\consonants) = (\'output CV of CVC\',\\ID,1)\r\n(\'output CV of CVC\',\\vowels) = (\'output CVC of CVC\',\\ID,1)\r\n(\'output CVC of CVC\',\\consonants)  = (\'return to output base\',\\ID,-1)\r\n\r\n\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Mokilese initial CVC reduplication with vowel CVV used instead for some cases\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	check if needs CV: or CVC or VC:\r\n3	starts with C\r\n4	starts with C and has short vowel\r\n5	output C of CV:\r\n7	output CV: of CV:\r\n8	output base\r\n15	check if needs CV: or CVC or VC:\'\r\n16	needs to reduplicate as CV:\r\n17	needs to reduplicate as CVC\r\n18	reduplicate as VC:\r\n19	return to output base\r\n20	output C of CVC\r\n21	output CV of CVC\r\n22	output CVC of CVC\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n16,#,5,,1\r\n16,a,16,,-1\r\n16,a:,16,,-1\r\n16,b,16,,-1\r\n16,d,16,,-1\r\n16,e,16,,-1\r\n16,e:,16,,-1\r\n16,f,16,,-1\r\n16,g,16,,-1\r\n16,h,16,,-1\r\n16,i,16,,-1\r\n16,i:,16,,-1\r\n16,k,16,,-1\r\n16,m,16,,-1\r\n16,n,16,,-1\r\n16,o,16,,-1\r\n16,o:,16,,-1\r\n16,p,16,,-1\r\n16,s,16,,-1\r\n16,t,16,,-1\r\n16,u,16,,-1\r\n16,u:,16,,-1\r\n16,v,16,,-1\r\n16,z,16,,-1\r\n17,#,20,,1\r\n17,a,17,,-1\r\n17,a:,17,,-1\r\n17,b,17,,-1\r\n17,d,17,,-1\r\n17,e,17,,-1\r\n17,e:,17,,-1\r\n17,f,17,,-1\r\n17,g,17,,-1\r\n17,h,17,,-1\r\n17,i,17,,-1\r\n17,i:,17,,-1\r\n17,k,17,,-1\r\n17,m,17,,-1\r\n17,n,17,,-1\r\n17,o,17,,-1\r\n17,o:,17,,-1\r\n17,p,17,,-1\r\n17,s,17,,-1\r\n17,t,17,,-1\r\n17,u,17,,-1\r\n17,u:,17,,-1\r\n17,v,17,,-1\r\n17,z,17,,-1\r\n18,b,19,bb,-1\r\n18,d,19,dd,-1\r\n18,f,19,ff,-1\r\n18,g,19,gg,-1\r\n18,h,19,hh,-1\r\n18,k,19,kk,-1\r\n18,m,19,mm,-1\r\n18,n,19,nn,-1\r\n18,p,19,pp,-1\r\n18,s,19,ss,-1\r\n18,t,19,tt,-1\r\n18,v,19,vv,-1\r\n18,z,19,zz,-1\r\n19,#,8,~,1\r\n19,a,19,,-1\r\n19,a:,19,,-1\r\n19,b,19,,-1\r\n19,d,19,,-1\r\n19,e,19,,-1\r\n19,e:,19,,-1\r\n19,f,19,,-1\r\n19,g,19,,-1\r\n19,h,19,,-1\r\n19,i,19,,-1\r\n19,i:,19,,-1\r\n19,k,19,,-1\r\n19,m,19,,-1\r\n19,n,19,,-1\r\n19,o,19,,-1\r\n19,o:,19,,-1\r\n19,p,19,,-1\r\n19,s,19,,-1\r\n19,t,19,,-1\r\n19,u,19,,-1\r\n19,u:,19,,-1\r\n19,v,19,,-1\r\n19,z,19,,-1\r\n2,a,18,a,1\r\n2,a:,18,a:,1\r\n2,b,3,,1\r\n2,d,3,,1\r\n2,e,18,e,1\r\n2,e:,18,e:,1\r\n2,f,3,,1\r\n2,g,3,,1\r\n2,h,3,,1\r\n2,i,18,i,1\r\n2,i:,18,i:,1\r\n2,k,3,,1\r\n2,m,3,,1\r\n2,n,3,,1\r\n2,o,18,o,1\r\n2,o:,18,o:,1\r\n2,p,3,,1\r\n2,s,3,,1\r\n2,t,3,,1\r\n2,u,18,u,1\r\n2,u:,18,u:,1\r\n2,v,3,,1\r\n2,z,3,,1\r\n20,b,21,b,1\r\n20,d,21,d,1\r\n20,f,21,f,1\r\n20,g,21,g,1\r\n20,h,21,h,1\r\n20,k,21,k,1\r\n20,m,21,m,1\r\n20,n,21,n,1\r\n20,p,21,p,1\r\n20,s,21,s,1\r\n20,t,21,t,1\r\n20,v,21,v,1\r\n20,z,21,z,1\r\n21,a,22,a,1\r\n21,a:,22,a:,1\r\n21,e,22,e,1\r\n21,e:,22,e:,1\r\n21,i,22,i,1\r\n21,i:,22,i:,1\r\n21,o,22,o,1\r\n21,o:,22,o:,1\r\n21,u,22,u,1\r\n21,u:,22,u:,1\r\n22,b,19,b,-1\r\n22,d,19,d,-1\r\n22,f,19,f,-1\r\n22,g,19,g,-1\r\n22,h,19,h,-1\r\n22,k,19,k,-1\r\n22,m,19,m,-1\r\n22,n,19,n,-1\r\n22,p,19,p,-1\r\n22,s,19,s,-1\r\n22,t,19,t,-1\r\n22,v,19,v,-1\r\n22,z,19,z,-1\r\n3,a,4,,1\r\n3,a:,16,,1\r\n3,e,4,,1\r\n3,e:,16,,1\r\n3,i,4,,1\r\n3,i:,16,,1\r\n3,o,4,,1\r\n3,o:,16,,1\r\n3,u,4,,1\r\n3,u:,16,,1\r\n4,%,16,,-1\r\n4,a,16,,-1\r\n4,a:,16,,-1\r\n4,b,17,,-1\r\n4,d,17,,-1\r\n4,e,16,,-1\r\n4,e:,16,,-1\r\n4,f,17,,-1\r\n4,g,17,,-1\r\n4,h,17,,-1\r\n4,i,16,,-1\r\n4,i:,16,,-1\r\n4,k,17,,-1\r\n4,m,17,,-1\r\n4,n,17,,-1\r\n4,o,16,,-1\r\n4,o:,16,,-1\r\n4,p,17,,-1\r\n4,s,17,,-1\r\n4,t,17,,-1\r\n4,u,16,,-1\r\n4,u:,16,,-1\r\n4,v,17,,-1\r\n4,z,17,,-1\r\n5,b,7,b,1\r\n5,d,7,d,1\r\n5,f,7,f,1\r\n5,g,7,g,1\r\n5,h,7,h,1\r\n5,k,7,k,1\r\n5,m,7,m,1\r\n5,n,7,n,1\r\n5,p,7,p,1\r\n5,s,7,s,1\r\n5,t,7,t,1\r\n5,v,7,v,1\r\n5,z,7,z,1\r\n7,a,19,a:,-1\r\n7,a:,19,a:,-1\r\n7,e,19,e:,-1\r\n7,e:,19,e:,-1\r\n7,i,19,i:,-1\r\n7,i:,19,i:,-1\r\n7,o,19,o:,-1\r\n7,o:,19,o:,-1\r\n7,u,19,u:,-1\r\n7,u:,19,u:,-1\r\n8,%,1,,1\r\n8,a,8,a,1\r\n8,a:,8,a:,1\r\n8,b,8,b,1\r\n8,d,8,d,1\r\n8,e,8,e,1\r\n8,e:,8,e:,1\r\n8,f,8,f,1\r\n8,g,8,g,1\r\n8,h,8,h,1\r\n8,i,8,i,1\r\n8,i:,8,i:,1\r\n8,k,8,k,1\r\n8,m,8,m,1\r\n8,n,8,n,1\r\n8,o,8,o,1\r\n8,o:,8,o:,1\r\n8,p,8,p,1\r\n8,s,8,s,1\r\n8,t,8,t,1\r\n8,u,8,u,1\r\n8,u:,8,u:,1\r\n8,v,8,v,1\r\n8,z,8,z,1\r\n'),
+('Initial CVC - Mokilese mora minimality + gemination/lengthening', 'Data is complicated. Refer to description', 'There are multiple subpatterns. The general pattern is initial CVC reduplication. However there different strategies depending on whether stem starts with a vowel vs. consonant, whether the first vowel is long, and whether the first vowel is succeeded by a consonant. The different strategies involve simple copying, vowel lengthenening, or consonant gemination. I assume the consonant clusters are actually complex segments, though the orthography+syllabification+description are inconsistent. Likewise an additional source (Halle 2008) who cites (Blevins 1996) argues that monosyllables undergo triplicaton: /caak}/-->[caa-caa-caak]  \"bending\" which contradicts the monosyllables from my first source.\r\n\r\n\r\n1) Pattern 1: If the input is of the form \\#CVC-Σ\\*\\%, then redup(X)=CVC-X\r\n\r\n| Input | Gloss                | Output    | Gloss                     |\r\n|-------|----------------------|-----------|---------------------------|\r\n| pɔdok | \"to plant\"           | pɔd-pɔdok | \"to plant (prog)\"         |\r\n| pilɔd | \"to pick breadfruit\" | pil-pilɔd | \" pick breadfruit (prog)\" |\r\n\r\n2) Pattern 2: If the input is of the form \\#CV:-Σ\\*\\%, then redup(X)=CV:-X\r\n\r\n| Input  | Gloss     | Output     | Gloss            |\r\n|--------|-----------|------------|------------------|\r\n| sɔ:rak | \"to tear\" | sɔ:-sɔ:rak | \"to tear (prog)\" |\r\n\r\n3) Pattern 3: If the input is of the form \\#CV-(VΣ\\*)\\%, then redup(X)=CV:-X\r\n\r\n| Input | Gloss      | Output  | Gloss             |\r\n|-------|------------|---------|-------------------|\r\n| pa    | \"to weave\" | pa:-pa  | \"to weave (prog)\" |\r\n| wia   | \"to do\"    | wi:-wia | \"to do (prog)\"    |\r\n\r\n4) Pattern 4: If the input is of the form \\#VC-Σ\\%, then redup(X)=VC:-X\r\n\r\n| Input | Gloss        | Output    | Gloss               |\r\n|-------|--------------|-----------|---------------------|\r\n| alu   | \"to walk\"    | all-lu    | \"to walk (prog)\"    |\r\n| andip | \"to split\"   | and-andip | \"to split (prog)\"   |\r\n| onop  | \"to prepare\" | onn-onop  | \"to prepare (prog)\" |\r\n', 'FST: I represent long and short vowels as V: and V with the circumflex\r\n\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-4 outputs checks if input is monosyllabic or has glottal stop\r\n\\node[state] (q1) [above of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%qstartV is for when the input starts with V so the output must be VC:\r\n\\node[state] (qStartsV) [above of=q3] {$q_V$};\r\n\r\n% doltong till 7 output CVV for monosyllable or for long vowel or for vowel hiatus\r\n\\node[state] (qDOTlong) [right of=q0] {$q_{long}$};\r\n\r\n\\node[state] (q6) [below of=qDOTlong] {$q_6$};\r\n\\node[state] (q7) [below of=q6] {$q_7$};\r\n%dotsecond outputs second copy\r\n\\node[state] (qDOTsecond) [below right of=qStartsV] {$q_{2nd}$};\r\n\\node[state] (q9) [right of=qDOTsecond] {$q_9$};\r\n\\node[state,accepting] (q10) [right of=q9] {$q_{10}$};\r\n\r\n%dotok and up output CVC for polsyllabic and with initial C\r\n\\node[state] (qDOTok) [above of = qStartsV] {$q_{ok}$};\r\n\r\n\r\n\\node[state] (q14) [right of=qDOTok] {$q_{14}$};\r\n\\node[state] (q15) [right of=q14] {$q_{15}$};\r\n\\node[state] (q16) [right of=q15] {$q_{16}$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge node {(C,$\\epsilon$,+1)} (q2)\r\n(q2) edge node[left] {(V:,$\\epsilon$,+1)} (qDOTlong)\r\n(q2) edge node {(\\v{V},$\\epsilon$,+1)} (q3)\r\n(q3) edge node[right] {\\{\\%,V\\},$\\epsilon$,-1)} (qDOTlong)\r\n(q3) edge[bend left] node[left] {C,$\\epsilon$,-1)} (qDOTok)\r\n(q1) edge node {(V,V,+1)} (qStartsV)\r\n(qStartsV) edge node {(C,C:,-1)} (qDOTsecond)\r\n\r\n(qDOTlong) edge[loop right] node {($\\Sigma$,$\\epsilon$,-1)} (qDOTlong)\r\n(qDOTlong) edge node {(\\#,$\\epsilon$,+1)} (q6)\r\n(q6) edge node[left] {(C,C,+1)} (q7)\r\n(q7) edge node[right] {(V,V:,-1)} (qDOTsecond)\r\n\r\n(qDOTsecond) edge[loop below] node[right] {($\\Sigma$\\},$\\epsilon$,-1)} (qDOTsecond)\r\n(qDOTsecond) edge node {(\\#,$\\sim$,+1)} (q9)\r\n(q9) edge[loop below] node [right]{($\\Sigma$,$\\Sigma$,+1)} (q9)\r\n(q9) edge node {(\\%,$\\epsilon$,+1)} (q10)\r\n\r\n\r\n(qDOTok) edge[loop above] node {($\\Sigma$,$\\epsilon$,-1)} (qDOTok)\r\n(qDOTok) edge node {(\\#,$\\epsilon$,+1)} (q14)\r\n(q14) edge node {(C,C,+1)} (q15)\r\n(q15) edge node {(V,V,+1)} (q16)\r\n(q16)  edge node {(C,C,-1)} (qDOTsecond)\r\n;\r\n\\end{tikzpicture}\r\n\r\n', 1, '#Mokilese initial CVC reduplication with vowel CVV used instead for some cases\r\n#In Ilocano, if the word starts with VC then the VC is repeated and the C is repeated: VC-->VCC~VC\r\n#If the word starts with CVV where the two Vs are not a single long vowel, then CV is repeated with vowel lengthening: CVV-->CV:~V\r\n#If the word starts and ends with CV then the CV is repeated with vowel lengthening: CV-->CV:~CV\r\n#If the word starts with CV: then the CV: is repeated: CV:-->CV:~CV:\r\n#If the word starts with CVC then the CVC is repeated: CVC-->CVC~CVC\r\n#Length on the input is represented with a multicharacter symbol so white space is needed between input symbols\r\n#e.g. \"p a t a\"--> pat~pata, \"a p a t\" --> app~apat, \"p a: t a\" --> pa:~pata, \"p a\" --> pa:~pa\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\',\'a\',\'e\',\'i\',\'o\',\'u\', \'a:\',\'e:\',\'i:\',\'o:\',\'u:\']\r\nsubalphabets = 4\r\nconsonants = [\'p\',\'b\',\'m\', \'t\',\'d\',\'n\', \'k\',\'g\',\'h\',\'f\',\'v\',\'s\',\'z\']\r\nvowels = [\'a\',\'e\',\'i\',\'o\',\'u\', \'a:\',\'e:\',\'i:\',\'o:\',\'u:\']\r\nshort_vowels = [\'a\',\'e\',\'i\',\'o\',\'u\']\r\nlong_vowels = [\'a:\',\'e:\',\'i:\',\'o:\',\'u:\']\r\n\r\nfunctions  = 1\r\nlengthen = { (\'a\',\'a:\'),(\'e\',\'e:\'),(\'i\',\'i:\'),(\'o\',\'o:\'),(\'u\',\'u:\'),(\'a:\',\'a:\'),(\'e:\',\'e:\'),(\'i:\',\'i:\'),(\'o:\',\'o:\'),(\'u:\',\'u:\') }\r\n\r\n#states type = string\r\nstates = [\'start\',\'check if needs CV: or CVC or VC:\',\'starts with C\',\'starts with C and has short vowel\',\'output C of CV:\',\'output CV: of CV:\',\'output CV: of CV:\',\'output base\',\'check if needs CV: or CVC or VC:0\',\'check if needs CV: or CVC or VC:1\',\'check if needs CV: or CVC or VC:2\',\'check if needs CV: or CVC or VC:3\',\'check if needs CV: or CVC or VC:4\',\'check if needs CV: or CVC or VC:5\',\'check if needs CV: or CVC or VC:6\',\'needs to reduplicate as CV:\',\'needs to reduplicate as CVC\',\'reduplicate as VC:\',\'return to output base\' ,\'end\', \'output C of CVC\', \'output CV of CVC\', \'output CVC of CVC\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'check if needs CV: or CVC or VC:\',\'\',1)\r\n(\'check if needs CV: or CVC or VC:\',\\consonants) = (\'starts with C\',\'\',1)\r\n(\'starts with C\',\\long_vowels) = (\'needs to reduplicate as CV:\',\'\',1)\r\n(\'starts with C\', \\short_vowels) = (\'starts with C and has short vowel\',\'\',1)\r\n(\'starts with C and has short vowel\', \'%\') =(\'needs to reduplicate as CV:\',\'\',-1)\r\n(\'starts with C and has short vowel\', \\vowels) = (\'needs to reduplicate as CV:\',\'\',-1)\r\n(\'starts with C and has short vowel\',\\consonants) = (\'needs to reduplicate as CVC\',\'\',-1)\r\n(\'check if needs CV: or CVC or VC:\',\\vowels) = (\'reduplicate as VC:\',\\ID,1)\r\n(\'reduplicate as VC:\', \\consonants) = (\'return to output base\',[\\ID \\ID],-1)\r\n(\'needs to reduplicate as CV:\',\\alphabet) = (\'needs to reduplicate as CV:\',\'\',-1)\r\n(\'needs to reduplicate as CV:\',\'#\') = (\'output C of CV:\',\'\',1)\r\n(\'output C of CV:\',\\consonants) = (\'output CV: of CV:\',\\ID,1)\r\n(\'output CV: of CV:\',\\vowels) = (\'return to output base\',\\lengthen,-1)\r\n(\'return to output base\',\\alphabet) = (\'return to output base\',\'\',-1)\r\n(\'return to output base\',\'#\') = (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\',\'%\') = (\'end\',\'\',1)\r\n(\'needs to reduplicate as CVC\',\\alphabet) = (\'needs to reduplicate as CVC\',\'\',-1)\r\n(\'needs to reduplicate as CVC\',\'#\') = (\'output C of CVC\',\'\',1)\r\n(\'output C of CVC\',\\consonants) = (\'output CV of CVC\',\\ID,1)\r\n(\'output CV of CVC\',\\vowels) = (\'output CVC of CVC\',\\ID,1)\r\n(\'output CVC of CVC\',\\consonants)  = (\'return to output base\',\\ID,-1)\r\n\r\n\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Mokilese initial CVC reduplication with vowel CVV used instead for some cases\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	check if needs CV: or CVC or VC:\r\n3	starts with C\r\n4	starts with C and has short vowel\r\n5	output C of CV:\r\n7	output CV: of CV:\r\n8	output base\r\n15	check if needs CV: or CVC or VC:\'\r\n16	needs to reduplicate as CV:\r\n17	needs to reduplicate as CVC\r\n18	reduplicate as VC:\r\n19	return to output base\r\n20	output C of CVC\r\n21	output CV of CVC\r\n22	output CVC of CVC\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n16,#,5,,1\r\n16,a,16,,-1\r\n16,a:,16,,-1\r\n16,b,16,,-1\r\n16,d,16,,-1\r\n16,e,16,,-1\r\n16,e:,16,,-1\r\n16,f,16,,-1\r\n16,g,16,,-1\r\n16,h,16,,-1\r\n16,i,16,,-1\r\n16,i:,16,,-1\r\n16,k,16,,-1\r\n16,m,16,,-1\r\n16,n,16,,-1\r\n16,o,16,,-1\r\n16,o:,16,,-1\r\n16,p,16,,-1\r\n16,s,16,,-1\r\n16,t,16,,-1\r\n16,u,16,,-1\r\n16,u:,16,,-1\r\n16,v,16,,-1\r\n16,z,16,,-1\r\n17,#,20,,1\r\n17,a,17,,-1\r\n17,a:,17,,-1\r\n17,b,17,,-1\r\n17,d,17,,-1\r\n17,e,17,,-1\r\n17,e:,17,,-1\r\n17,f,17,,-1\r\n17,g,17,,-1\r\n17,h,17,,-1\r\n17,i,17,,-1\r\n17,i:,17,,-1\r\n17,k,17,,-1\r\n17,m,17,,-1\r\n17,n,17,,-1\r\n17,o,17,,-1\r\n17,o:,17,,-1\r\n17,p,17,,-1\r\n17,s,17,,-1\r\n17,t,17,,-1\r\n17,u,17,,-1\r\n17,u:,17,,-1\r\n17,v,17,,-1\r\n17,z,17,,-1\r\n18,b,19,bb,-1\r\n18,d,19,dd,-1\r\n18,f,19,ff,-1\r\n18,g,19,gg,-1\r\n18,h,19,hh,-1\r\n18,k,19,kk,-1\r\n18,m,19,mm,-1\r\n18,n,19,nn,-1\r\n18,p,19,pp,-1\r\n18,s,19,ss,-1\r\n18,t,19,tt,-1\r\n18,v,19,vv,-1\r\n18,z,19,zz,-1\r\n19,#,8,~,1\r\n19,a,19,,-1\r\n19,a:,19,,-1\r\n19,b,19,,-1\r\n19,d,19,,-1\r\n19,e,19,,-1\r\n19,e:,19,,-1\r\n19,f,19,,-1\r\n19,g,19,,-1\r\n19,h,19,,-1\r\n19,i,19,,-1\r\n19,i:,19,,-1\r\n19,k,19,,-1\r\n19,m,19,,-1\r\n19,n,19,,-1\r\n19,o,19,,-1\r\n19,o:,19,,-1\r\n19,p,19,,-1\r\n19,s,19,,-1\r\n19,t,19,,-1\r\n19,u,19,,-1\r\n19,u:,19,,-1\r\n19,v,19,,-1\r\n19,z,19,,-1\r\n2,a,18,a,1\r\n2,a:,18,a:,1\r\n2,b,3,,1\r\n2,d,3,,1\r\n2,e,18,e,1\r\n2,e:,18,e:,1\r\n2,f,3,,1\r\n2,g,3,,1\r\n2,h,3,,1\r\n2,i,18,i,1\r\n2,i:,18,i:,1\r\n2,k,3,,1\r\n2,m,3,,1\r\n2,n,3,,1\r\n2,o,18,o,1\r\n2,o:,18,o:,1\r\n2,p,3,,1\r\n2,s,3,,1\r\n2,t,3,,1\r\n2,u,18,u,1\r\n2,u:,18,u:,1\r\n2,v,3,,1\r\n2,z,3,,1\r\n20,b,21,b,1\r\n20,d,21,d,1\r\n20,f,21,f,1\r\n20,g,21,g,1\r\n20,h,21,h,1\r\n20,k,21,k,1\r\n20,m,21,m,1\r\n20,n,21,n,1\r\n20,p,21,p,1\r\n20,s,21,s,1\r\n20,t,21,t,1\r\n20,v,21,v,1\r\n20,z,21,z,1\r\n21,a,22,a,1\r\n21,a:,22,a:,1\r\n21,e,22,e,1\r\n21,e:,22,e:,1\r\n21,i,22,i,1\r\n21,i:,22,i:,1\r\n21,o,22,o,1\r\n21,o:,22,o:,1\r\n21,u,22,u,1\r\n21,u:,22,u:,1\r\n22,b,19,b,-1\r\n22,d,19,d,-1\r\n22,f,19,f,-1\r\n22,g,19,g,-1\r\n22,h,19,h,-1\r\n22,k,19,k,-1\r\n22,m,19,m,-1\r\n22,n,19,n,-1\r\n22,p,19,p,-1\r\n22,s,19,s,-1\r\n22,t,19,t,-1\r\n22,v,19,v,-1\r\n22,z,19,z,-1\r\n3,a,4,,1\r\n3,a:,16,,1\r\n3,e,4,,1\r\n3,e:,16,,1\r\n3,i,4,,1\r\n3,i:,16,,1\r\n3,o,4,,1\r\n3,o:,16,,1\r\n3,u,4,,1\r\n3,u:,16,,1\r\n4,%,16,,-1\r\n4,a,16,,-1\r\n4,a:,16,,-1\r\n4,b,17,,-1\r\n4,d,17,,-1\r\n4,e,16,,-1\r\n4,e:,16,,-1\r\n4,f,17,,-1\r\n4,g,17,,-1\r\n4,h,17,,-1\r\n4,i,16,,-1\r\n4,i:,16,,-1\r\n4,k,17,,-1\r\n4,m,17,,-1\r\n4,n,17,,-1\r\n4,o,16,,-1\r\n4,o:,16,,-1\r\n4,p,17,,-1\r\n4,s,17,,-1\r\n4,t,17,,-1\r\n4,u,16,,-1\r\n4,u:,16,,-1\r\n4,v,17,,-1\r\n4,z,17,,-1\r\n5,b,7,b,1\r\n5,d,7,d,1\r\n5,f,7,f,1\r\n5,g,7,g,1\r\n5,h,7,h,1\r\n5,k,7,k,1\r\n5,m,7,m,1\r\n5,n,7,n,1\r\n5,p,7,p,1\r\n5,s,7,s,1\r\n5,t,7,t,1\r\n5,v,7,v,1\r\n5,z,7,z,1\r\n7,a,19,a:,-1\r\n7,a:,19,a:,-1\r\n7,e,19,e:,-1\r\n7,e:,19,e:,-1\r\n7,i,19,i:,-1\r\n7,i:,19,i:,-1\r\n7,o,19,o:,-1\r\n7,o:,19,o:,-1\r\n7,u,19,u:,-1\r\n7,u:,19,u:,-1\r\n8,%,1,,1\r\n8,a,8,a,1\r\n8,a:,8,a:,1\r\n8,b,8,b,1\r\n8,d,8,d,1\r\n8,e,8,e,1\r\n8,e:,8,e:,1\r\n8,f,8,f,1\r\n8,g,8,g,1\r\n8,h,8,h,1\r\n8,i,8,i,1\r\n8,i:,8,i:,1\r\n8,k,8,k,1\r\n8,m,8,m,1\r\n8,n,8,n,1\r\n8,o,8,o,1\r\n8,o:,8,o:,1\r\n8,p,8,p,1\r\n8,s,8,s,1\r\n8,t,8,t,1\r\n8,u,8,u,1\r\n8,u:,8,u:,1\r\n8,v,8,v,1\r\n8,z,8,z,1\r\n'),
 ('Initial CVC - only copy coda if it\'s a nasal', '| Input          | Output                  |\r\n|----------------|-------------------------|\r\n| C~1~V~2~N-X    | C~1~V~2~N-C~1~V~2~N-X   |\r\n| C~1~V~2~-V~3~X | C~1~V~2~-C~1~V~2~-V~3~X |', 'Two allomorphs\r\nInput=#CV-X$ where X is any string of symbols and B is either CV or CVN where N is a nasal\r\nOutput=#B\\~B-X%\r\nThe word-initial CVN or CV string is repeated. The reduplicant thus only has a coda when the base\'s post-V C is a nasal. I assume that inputs start with CVC and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the first CV(N) once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%states q3-q5 return to the beginning of input, output the base CVCX, and end\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state] (q5) [below of=q1] {$q_5$};\r\n\\node[state,accepting] (q6) [right of=q5] {$q_6$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge node {(V,V,+1)} (q3)\r\n(q3) edge[bend left=45] node {(\\{\\Sigma-N\\},$\\epsilon$,-1)} (q4)\r\n(q3) edge node {(N,N,-1)} (q4)\r\n(q4) edge [loop right] node {($\\Sigma$,$\\epsilon$,-1)} (q4)\r\n(q4) edge node {(\\#,$\\sim$,+1)} (q5)\r\n(q5) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q5)\r\n(q5) edge node[below] {(\\%,$\\epsilon$,+1)} (q6)\r\n\r\n;\r\n\\end{tikzpicture}', 1, '#Initial CVC but copy only nasal codas\r\n#If the word starts with CVN then the CVN is repeated\r\n#If the word starts with CV but not CVN, then only the CV is copied\r\n#The function is not defined for an input whichs starts with anything other than CV or CVN\r\n#e.g. pataka --> pat~pataka, pantaka --> pan~pantaka, anta --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet = [\'p\',\'t\',\'k\',\'b\',\'d\',\'g\',\'m\',\'n\',\'ŋ\',\'f\',\'v\',\'s\',\'z\',\'x\',\'h\',\'r\',\'l\',\'w\',\'j\',\'c\',\'q\', \'a\',\'e\',\'i\',\'o\',\'u\',\'y\']\r\nsubalphabets = 3\r\nconsonants = [\'p\',\'t\',\'k\',\'b\',\'d\',\'g\',\'m\',\'n\',\'ŋ\',\'f\',\'v\',\'s\',\'z\',\'x\',\'h\',\'r\',\'l\',\'w\',\'j\',\'c\',\'q\']\r\nnasals = [\'m\',\'n\',\'ŋ\']\r\nvowels = [\'a\',\'e\',\'i\',\'o\',\'u\',\'y\']\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output C\',\'output CV\',\'output CV or CVN\',\'return\',\'output base\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'output C\',\'\',1)\r\n(\'output C\',\\consonants) = (\'output CV\',\\ID,1)\r\n(\'output CV\', \\vowels) = (\'output CV or CVN\',\\ID,1)\r\n(\'output CV or CVN\', {\\alphabet - \\nasals} ) =  (\'return\',\'\',-1)\r\n(\'output CV or CVN\',\\nasals) = (\'return\',\\ID,-1)\r\n(\'return\',\\alphabet)  = (\'return\',\'\',-1)\r\n(\'return\',\'#\') = (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\',\'%\') = (\'end\',\'\',1)\r\n\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Initial CVC but copy only nasal codas\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output C\r\n3	output CV\r\n4	output CV or CVN\r\n5	return\r\n6	output base\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n2,ŋ,3,ŋ,1\r\n3,a,4,a,1\r\n3,e,4,e,1\r\n3,i,4,i,1\r\n3,o,4,o,1\r\n3,u,4,u,1\r\n3,y,4,y,1\r\n4,a,5,,-1\r\n4,b,5,,-1\r\n4,c,5,,-1\r\n4,d,5,,-1\r\n4,e,5,,-1\r\n4,f,5,,-1\r\n4,g,5,,-1\r\n4,h,5,,-1\r\n4,i,5,,-1\r\n4,j,5,,-1\r\n4,k,5,,-1\r\n4,l,5,,-1\r\n4,m,5,m,-1\r\n4,n,5,n,-1\r\n4,o,5,,-1\r\n4,p,5,,-1\r\n4,q,5,,-1\r\n4,r,5,,-1\r\n4,s,5,,-1\r\n4,t,5,,-1\r\n4,u,5,,-1\r\n4,v,5,,-1\r\n4,w,5,,-1\r\n4,x,5,,-1\r\n4,y,5,,-1\r\n4,z,5,,-1\r\n4,ŋ,5,ŋ,-1\r\n5,#,6,~,1\r\n5,a,5,,-1\r\n5,b,5,,-1\r\n5,c,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,j,5,,-1\r\n5,k,5,,-1\r\n5,l,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,p,5,,-1\r\n5,q,5,,-1\r\n5,r,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,v,5,,-1\r\n5,w,5,,-1\r\n5,x,5,,-1\r\n5,y,5,,-1\r\n5,z,5,,-1\r\n5,ŋ,5,,-1\r\n6,%,1,,1\r\n6,a,6,a,1\r\n6,b,6,b,1\r\n6,c,6,c,1\r\n6,d,6,d,1\r\n6,e,6,e,1\r\n6,f,6,f,1\r\n6,g,6,g,1\r\n6,h,6,h,1\r\n6,i,6,i,1\r\n6,j,6,j,1\r\n6,k,6,k,1\r\n6,l,6,l,1\r\n6,m,6,m,1\r\n6,n,6,n,1\r\n6,o,6,o,1\r\n6,p,6,p,1\r\n6,q,6,q,1\r\n6,r,6,r,1\r\n6,s,6,s,1\r\n6,t,6,t,1\r\n6,u,6,u,1\r\n6,v,6,v,1\r\n6,w,6,w,1\r\n6,x,6,x,1\r\n6,y,6,y,1\r\n6,z,6,z,1\r\n6,ŋ,6,ŋ,1\r\n'),
 ('Initial CVC - Onsetless vowels are okay', '| Input | Output    |\r\n|-------|-----------|\r\n| CVC-X | CVC-CVC-X |\r\n| VC-X  | VC-VC-X   |', 'Two allomorphs\r\nInput=#B-X$ where X is any string of symbols and B is either CVC or VC\r\nOutput=#B\\~B-X%\r\nThe word-initial CVC or VC string is repeated. Onsetless vowels are thus okay. I assume that inputs start with CVC and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the first (C+0)VC once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n%states q3-q5 return to the beginning of input, output the base CVCX, and end\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state] (q5) [below of=q1] {$q_5$};\r\n\\node[state,accepting] (q6) [right of=q5] {$q_6$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q1) edge[bend left=45] node {(V,V,+1)} (q3)\r\n(q2) edge node {(V,V,+1)} (q3)\r\n(q3) edge node {(C,C,-1)} (q4)\r\n(q4) edge [loop right] node {($\\Sigma$,$\\epsilon$,-1)} (q4)\r\n(q4) edge node {(\\#,$\\sim$,+1)} (q5)\r\n(q5) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q5)\r\n(q5) edge node[below] {(\\%,$\\epsilon$,+1)} (q6)\r\n\r\n;\r\n\\end{tikzpicture}\r\n', 0, '#Initial CVC reduplication with optional onset\r\n#If the word starts with CVC, then the CVC is repeated\r\n#If the word starts with VC, then the VC is repeated\r\n#function is not defined for any input which doesnt start with CVCC* or VCC*\r\n#e.g. pata --> pat~ata, pafta --> paft~afta, ata --> at~ata, spata--> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first C\',\'output first CV\',\'output first CVC\',\'return\',\'output base\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'output first C\',\'\',1)\r\n(\'output first C\',\\consonants) = (\'output first CV\',\\ID,1)\r\n(\'output first C\',\\vowels) = (\'output first CVC\',\\ID,1)\r\n(\'output first CV\',\\vowels) = (\'output first CVC\',\\ID,1)\r\n(\'output first CVC\',\\consonants) = (\'return\',\\ID,-1)\r\n(\'return\',\\alphabet) = (\'return\',\'\',-1)\r\n(\'return\',\'#\') =  (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\',\'%\') = (\'end\',\'\',1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Initial CVC reduplication with optional onset\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	output first CV\r\n4	output first CVC\r\n5	return\r\n6	output base\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,`a,4,`a,1\r\n2,`a:,4,`a:,1\r\n2,`e,4,`e,1\r\n2,`e:,4,`e:,1\r\n2,`i,4,`i,1\r\n2,`i:,4,`i:,1\r\n2,`o,4,`o,1\r\n2,`o:,4,`o:,1\r\n2,`u,4,`u,1\r\n2,`u:,4,`u:,1\r\n2,`y,4,`y,1\r\n2,`y:,4,`y:,1\r\n2,a,4,a,1\r\n2,a:,4,a:,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,e,4,e,1\r\n2,e:,4,e:,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,i,4,i,1\r\n2,i:,4,i:,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,o,4,o,1\r\n2,o:,4,o:,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,u,4,u,1\r\n2,u:,4,u:,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,y,4,y,1\r\n2,y:,4,y:,1\r\n2,z,3,z,1\r\n3,`a,4,`a,1\r\n3,`a:,4,`a:,1\r\n3,`e,4,`e,1\r\n3,`e:,4,`e:,1\r\n3,`i,4,`i,1\r\n3,`i:,4,`i:,1\r\n3,`o,4,`o,1\r\n3,`o:,4,`o:,1\r\n3,`u,4,`u,1\r\n3,`u:,4,`u:,1\r\n3,`y,4,`y,1\r\n3,`y:,4,`y:,1\r\n3,a,4,a,1\r\n3,a:,4,a:,1\r\n3,e,4,e,1\r\n3,e:,4,e:,1\r\n3,i,4,i,1\r\n3,i:,4,i:,1\r\n3,o,4,o,1\r\n3,o:,4,o:,1\r\n3,u,4,u,1\r\n3,u:,4,u:,1\r\n3,y,4,y,1\r\n3,y:,4,y:,1\r\n4,b,5,b,-1\r\n4,c,5,c,-1\r\n4,d,5,d,-1\r\n4,f,5,f,-1\r\n4,g,5,g,-1\r\n4,h,5,h,-1\r\n4,j,5,j,-1\r\n4,k,5,k,-1\r\n4,l,5,l,-1\r\n4,m,5,m,-1\r\n4,n,5,n,-1\r\n4,p,5,p,-1\r\n4,q,5,q,-1\r\n4,r,5,r,-1\r\n4,s,5,s,-1\r\n4,t,5,t,-1\r\n4,v,5,v,-1\r\n4,w,5,w,-1\r\n4,x,5,x,-1\r\n4,z,5,z,-1\r\n5,#,6,~,1\r\n5,+,5,,-1\r\n5,.,5,,-1\r\n5,`a,5,,-1\r\n5,`a:,5,,-1\r\n5,`e,5,,-1\r\n5,`e:,5,,-1\r\n5,`i,5,,-1\r\n5,`i:,5,,-1\r\n5,`o,5,,-1\r\n5,`o:,5,,-1\r\n5,`u,5,,-1\r\n5,`u:,5,,-1\r\n5,`y,5,,-1\r\n5,`y:,5,,-1\r\n5,a,5,,-1\r\n5,a:,5,,-1\r\n5,b,5,,-1\r\n5,c,5,,-1\r\n5,d,5,,-1\r\n5,e,5,,-1\r\n5,e:,5,,-1\r\n5,f,5,,-1\r\n5,g,5,,-1\r\n5,h,5,,-1\r\n5,i,5,,-1\r\n5,i:,5,,-1\r\n5,j,5,,-1\r\n5,k,5,,-1\r\n5,l,5,,-1\r\n5,m,5,,-1\r\n5,n,5,,-1\r\n5,o,5,,-1\r\n5,o:,5,,-1\r\n5,p,5,,-1\r\n5,q,5,,-1\r\n5,r,5,,-1\r\n5,s,5,,-1\r\n5,t,5,,-1\r\n5,u,5,,-1\r\n5,u:,5,,-1\r\n5,v,5,,-1\r\n5,w,5,,-1\r\n5,x,5,,-1\r\n5,y,5,,-1\r\n5,y:,5,,-1\r\n5,z,5,,-1\r\n6,%,1,,1\r\n6,+,6,+,1\r\n6,.,6,.,1\r\n6,`a,6,`a,1\r\n6,`a:,6,`a:,1\r\n6,`e,6,`e,1\r\n6,`e:,6,`e:,1\r\n6,`i,6,`i,1\r\n6,`i:,6,`i:,1\r\n6,`o,6,`o,1\r\n6,`o:,6,`o:,1\r\n6,`u,6,`u,1\r\n6,`u:,6,`u:,1\r\n6,`y,6,`y,1\r\n6,`y:,6,`y:,1\r\n6,a,6,a,1\r\n6,a:,6,a:,1\r\n6,b,6,b,1\r\n6,c,6,c,1\r\n6,d,6,d,1\r\n6,e,6,e,1\r\n6,e:,6,e:,1\r\n6,f,6,f,1\r\n6,g,6,g,1\r\n6,h,6,h,1\r\n6,i,6,i,1\r\n6,i:,6,i:,1\r\n6,j,6,j,1\r\n6,k,6,k,1\r\n6,l,6,l,1\r\n6,m,6,m,1\r\n6,n,6,n,1\r\n6,o,6,o,1\r\n6,o:,6,o:,1\r\n6,p,6,p,1\r\n6,q,6,q,1\r\n6,r,6,r,1\r\n6,s,6,s,1\r\n6,t,6,t,1\r\n6,u,6,u,1\r\n6,u:,6,u:,1\r\n6,v,6,v,1\r\n6,w,6,w,1\r\n6,x,6,x,1\r\n6,y,6,y,1\r\n6,y:,6,y:,1\r\n6,z,6,z,1\r\n'),
 ('Initial CVCV - General', '| Input    | Output        |\r\n|----------|---------------|\r\n| CVCV-X   | CVCV-CVCV-X   |', 'Input=#CVCV-X$ where X is any string of symbols\r\nOutput=#CVCV\\~CVCV-X%\r\nThe word-initial CVCV string is repeated. I assume that inputs start with CVCV and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the first CVC once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n%states q3-q5 return to the beginning of input, output the base CVCX, and end\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n\\node[state] (q6) [below of=q1] {$q_6$};\r\n\\node[state,accepting] (q7) [right of=q6] {$q_7$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge node {(V,V,+1)} (q3)\r\n(q3) edge node {(C,C,+1)} (q4)\r\n(q4) edge node {(V,V,-1)} (q5)\r\n(q5) edge [loop left] node {($\\Sigma$,$\\epsilon$,-1)} (q5)\r\n(q5) edge node[below] {(\\#,$\\sim$,+1)} (q6)\r\n(q6) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q6)\r\n(q6) edge node[below] {(\\%,$\\epsilon$,+1)} (q7)\r\n\r\n;\r\n\\end{tikzpicture}', 0, '#Initial CVCV reduplication \r\n#If the word starts with CVCV, then the CVCV is repeated\r\n#function is not defined for any input which doesnt start with CVCV\r\n#e.g. pataka --> pata~pataka, pafta --> undefined, ata --> undefined, spata--> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'read first C\',\'read first CV\',\'read first CVC\',\'read first CVCV\',\'return\',\'output base\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'read first C\',\'\',1)\r\n(\'read first C\',\\consonants) = (\'read first CV\',\\ID,1)\r\n(\'read first CV\',\\vowels) = (\'read first CVC\',\\ID,1)\r\n(\'read first CVC\',\\consonants) = (\'read first CVCV\',\\ID,1)\r\n(\'read first CVCV\',\\vowels) = (\'return\',\\ID,-1)\r\n(\'return\',\\alphabet) = (\'return\',\'\',-1)\r\n(\'return\',\'#\') = (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\',\'%\') = (\'end\',\'\',1)\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Initial CVCV reduplication\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	read first C\r\n3	read first CV\r\n4	read first CVC\r\n5	read first CVCV\r\n6	return\r\n7	output base\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,`a,4,`a,1\r\n3,`a:,4,`a:,1\r\n3,`e,4,`e,1\r\n3,`e:,4,`e:,1\r\n3,`i,4,`i,1\r\n3,`i:,4,`i:,1\r\n3,`o,4,`o,1\r\n3,`o:,4,`o:,1\r\n3,`u,4,`u,1\r\n3,`u:,4,`u:,1\r\n3,`y,4,`y,1\r\n3,`y:,4,`y:,1\r\n3,a,4,a,1\r\n3,a:,4,a:,1\r\n3,e,4,e,1\r\n3,e:,4,e:,1\r\n3,i,4,i,1\r\n3,i:,4,i:,1\r\n3,o,4,o,1\r\n3,o:,4,o:,1\r\n3,u,4,u,1\r\n3,u:,4,u:,1\r\n3,y,4,y,1\r\n3,y:,4,y:,1\r\n4,b,5,b,1\r\n4,c,5,c,1\r\n4,d,5,d,1\r\n4,f,5,f,1\r\n4,g,5,g,1\r\n4,h,5,h,1\r\n4,j,5,j,1\r\n4,k,5,k,1\r\n4,l,5,l,1\r\n4,m,5,m,1\r\n4,n,5,n,1\r\n4,p,5,p,1\r\n4,q,5,q,1\r\n4,r,5,r,1\r\n4,s,5,s,1\r\n4,t,5,t,1\r\n4,v,5,v,1\r\n4,w,5,w,1\r\n4,x,5,x,1\r\n4,z,5,z,1\r\n5,`a,6,`a,-1\r\n5,`a:,6,`a:,-1\r\n5,`e,6,`e,-1\r\n5,`e:,6,`e:,-1\r\n5,`i,6,`i,-1\r\n5,`i:,6,`i:,-1\r\n5,`o,6,`o,-1\r\n5,`o:,6,`o:,-1\r\n5,`u,6,`u,-1\r\n5,`u:,6,`u:,-1\r\n5,`y,6,`y,-1\r\n5,`y:,6,`y:,-1\r\n5,a,6,a,-1\r\n5,a:,6,a:,-1\r\n5,e,6,e,-1\r\n5,e:,6,e:,-1\r\n5,i,6,i,-1\r\n5,i:,6,i:,-1\r\n5,o,6,o,-1\r\n5,o:,6,o:,-1\r\n5,u,6,u,-1\r\n5,u:,6,u:,-1\r\n5,y,6,y,-1\r\n5,y:,6,y:,-1\r\n6,#,7,~,1\r\n6,+,6,,-1\r\n6,.,6,,-1\r\n6,`a,6,,-1\r\n6,`a:,6,,-1\r\n6,`e,6,,-1\r\n6,`e:,6,,-1\r\n6,`i,6,,-1\r\n6,`i:,6,,-1\r\n6,`o,6,,-1\r\n6,`o:,6,,-1\r\n6,`u,6,,-1\r\n6,`u:,6,,-1\r\n6,`y,6,,-1\r\n6,`y:,6,,-1\r\n6,a,6,,-1\r\n6,a:,6,,-1\r\n6,b,6,,-1\r\n6,c,6,,-1\r\n6,d,6,,-1\r\n6,e,6,,-1\r\n6,e:,6,,-1\r\n6,f,6,,-1\r\n6,g,6,,-1\r\n6,h,6,,-1\r\n6,i,6,,-1\r\n6,i:,6,,-1\r\n6,j,6,,-1\r\n6,k,6,,-1\r\n6,l,6,,-1\r\n6,m,6,,-1\r\n6,n,6,,-1\r\n6,o,6,,-1\r\n6,o:,6,,-1\r\n6,p,6,,-1\r\n6,q,6,,-1\r\n6,r,6,,-1\r\n6,s,6,,-1\r\n6,t,6,,-1\r\n6,u,6,,-1\r\n6,u:,6,,-1\r\n6,v,6,,-1\r\n6,w,6,,-1\r\n6,x,6,,-1\r\n6,y,6,,-1\r\n6,y:,6,,-1\r\n6,z,6,,-1\r\n7,%,1,,1\r\n7,+,7,+,1\r\n7,.,7,.,1\r\n7,`a,7,`a,1\r\n7,`a:,7,`a:,1\r\n7,`e,7,`e,1\r\n7,`e:,7,`e:,1\r\n7,`i,7,`i,1\r\n7,`i:,7,`i:,1\r\n7,`o,7,`o,1\r\n7,`o:,7,`o:,1\r\n7,`u,7,`u,1\r\n7,`u:,7,`u:,1\r\n7,`y,7,`y,1\r\n7,`y:,7,`y:,1\r\n7,a,7,a,1\r\n7,a:,7,a:,1\r\n7,b,7,b,1\r\n7,c,7,c,1\r\n7,d,7,d,1\r\n7,e,7,e,1\r\n7,e:,7,e:,1\r\n7,f,7,f,1\r\n7,g,7,g,1\r\n7,h,7,h,1\r\n7,i,7,i,1\r\n7,i:,7,i:,1\r\n7,j,7,j,1\r\n7,k,7,k,1\r\n7,l,7,l,1\r\n7,m,7,m,1\r\n7,n,7,n,1\r\n7,o,7,o,1\r\n7,o:,7,o:,1\r\n7,p,7,p,1\r\n7,q,7,q,1\r\n7,r,7,r,1\r\n7,s,7,s,1\r\n7,t,7,t,1\r\n7,u,7,u,1\r\n7,u:,7,u:,1\r\n7,v,7,v,1\r\n7,w,7,w,1\r\n7,x,7,x,1\r\n7,y,7,y,1\r\n7,y:,7,y:,1\r\n7,z,7,z,1\r\n'),
-('Initial CVCV - Kinande', 'Data too complicated. Refer to the description.', 'The reduplicative patterns differ based on the structure of the input/base. It involves overcopying, different outputs for vowel vs consonant initial stems, foot minimality, and reference to multiple morhpological and prosodic constituents. I have refrained from using prosodic constituents (P-stems) in the FST and discussion because those prosodic constituents are derived from the morphological constituents\r\n\r\nThe general template for the input is: Pre-verbal prefixes + root + derivational suffixes or \"extensions\" + inflectional final suffix IFS. \r\n\r\n\r\nOnly the root and inflectional final suffix are obligatory. \r\nThe  root + extensions + IFS look like they are always a sequence of alternating  vowels and consonants that ends in a vowel: VC(VC)\\*V or (CV)\\*CV.\r\n\r\nI assume that what look like consonant clusters in the orthography are actually complex segments\r\n\r\nThe reduplication patterns ignore the prefixes\r\n\r\n1) Pattern 1: redup(prefixes\\* - CVC root - V I(FS )= prefixes\\* - CVC root - V IFS - CVC root - V IFS\r\n\r\nCVC root (hum, tum) + IFS (a or e)\r\n\r\n| Input     | Gloss | Output          | Gloss        |\r\n|-----------|-------|-----------------|--------------|\r\n| eri-hum-a | ?     | eri-hum-a\\~hum-a | \"to beat\"    |\r\n| eri-hum-e | ?     | eri-hum-e\\~hum-e | \"let\'s beat\" |\r\n| eri-tum-a | ?     | eri-tum-a\\~tum-a | \"to send\"    |\r\n| eri-tum-e | ?     | eri-tum-e\\~tum-e | \"let\'s send\" |\r\n\r\n2) Pattern 2: redup(prefixes\\* - CVC root - (VC)\\* extensions - V IFS)= prefixes\\* - CVC root - a - CVC root - (VC)\\* extensions - IFS\r\n\r\nCVC root (hum, tum) + VC extensions (ir, an) + IFS (a or e)\r\n\r\n| Input          | Gloss | Output               | Gloss                    |\r\n|----------------|-------|----------------------|--------------------------|\r\n| eri-hum-ir-a   | ?     | eri-hum-a\\~hum-ir-a   | \"to beat for\"            |\r\n| eri-hum-iran-a | ?     | eri-hum-a\\~hum-iran-a | \"to beat for each other\" |\r\n| eri-tum-ir-a   | ?     | eri-tum-a\\~tum-ir-a   | \"to send to\"             |\r\n| eri-tum-an-a   | ?     | eri-tum-a\\~tum-an-a   | \"to send each other\"     |\r\n| eri-tum-iran-a | ?     | eri-tum-a\\~tum-iran-a | \"to send to each other\"  |\r\n\r\n3) Pattern 3: redup(prefixes\\* - C root -  V IFS)= prefixes\\* - C root - V IFS - C root - V IFS - C root - V IFS\r\n\r\nC root (sw, tm ly, hw) + IFS (a)\r\n\r\n| Input    | Gloss | Output             | Gloss       |\r\n|----------|-------|--------------------|-------------|\r\n| eri-sw-a | ?     | eri-sw-a-sw-a\\~sw-a | \"to grind\"  |\r\n| eri-t-a  | ?     | eri-t-a-t-a\\~t-a    | \"to bury\"   |\r\n| eri-ly-a | ?     | eri-ly-a-ly-a\\~ly-a | \"to eat\"    |\r\n| eri-hw-a | ?     | eri-hw-a-hw-a\\~hw-a | \"to finish\" |\r\n\r\nC root (s) + VC extension (er) + IFS (e)\r\n\r\n| Input       | Gloss | Output              | Gloss      |\r\n|-------------|-------|---------------------|------------|\r\n| eri-sw-er-e | ?     | eri-sw-er-e\\~w-er-a | \"to grind\" |\r\n\r\n4) Pattern 4: redup(prefixes\\* - VC root -  V IFS)= prefixes\\* - VC root - VC root - VC root - V IFS \r\n\r\nVC root (es, oh, ot, um, ib) + IFS (a)\r\n\r\n| Input    | Gloss | Output          | Gloss      |\r\n|----------|-------|-----------------|------------|\r\n| ery-es-a | ?     | ery-es-es\\~es-a | \"to play\"  |\r\n| ery-oh-a | ?     | ery-oh-oh\\~oh-a | \"to pick\"  |\r\n| ery-ot-a | ?     | ery-ot-ot\\~ot-a | \"to light\" |\r\n| ery-um-a | ?     | ery-um-um\\~um-a | \"to dry\"   |\r\n| er-ib-a  | ?     | er-ib-ib\\~ib-a  | \"to steal\" |\r\n\r\n5) Pattern 5: redup(prefixes\\* - VC root - VC extension  - V IFS)= prefixes\\* - VC root - VC extension - V IFS - C root - VC extension - V IFS \r\n\r\nVC root (es, oh) + VC extensions (er) + IFS (a)\r\n\r\n| Input        | Gloss | Output                 | Gloss          |\r\n|--------------|-------|------------------------|----------------|\r\n| ery-es-er-a  | ?     | ery-e-s-er-a\\~s-er-a   | \"to play for\"  |\r\n| ery-oh-er-a  | ?     | ery-o-h-er-a\\~h-er-a   | \"to pick for\"  |\r\n| ery-ot-er-a  | ?     | ery-o-t-er-a+t-er-a    | \"to light for\" |\r\n| ery-amb-al-a | ?     | ery-a-mb-al-a\\~mb-al-a | \"to clothe\"    |\r\n| ery-us-al-a  | ?     | ery-u-s-al-a\\~s-al-a   | \"to fill\"      |', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-2 go over the prefixes\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\r\n%state q2-7 handle if the root is CVC. if the IFS is next to the root, it is copied; otherwise /a/ is outputed.\r\n\\node[state] (q3) [above =4cm of q0] {$q_3$};\r\n\\node[state] (q4) [right of = q3] {$q_4$};\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n%\\node[state] (q6) [right of=q5] {$q_6$};\r\n\\node[state] (q7) [right of=q5] {$q_7$};\r\n%q8-up go back to begining of root and output base+suffixes\r\n\\node[state] (q8) [right of=q2] {$q_8$};\r\n\\node[state] (q9) [right of=q8] {$q_9$};\r\n\\node[state,accepting] (q10) [right of=q9] {$q_{10}$};\r\n\r\n%11-16 handle case where root is VC and theres no D suffixes, it repeats VC twice  to get 3 copies \r\n\\node[state] (q11) [below =4cm of q0] {$q_{11}$};\r\n\\node[state] (q12) [right of=q11] {$q_{12}$};\r\n%\\node[state] (q13) [right of=q12] {$q_{13}$};\r\n\\node[state] (q14) [right of=q12] {$q_{14}$};\r\n\\node[state] (q15) [right of=q14] {$q_{15}$};\r\n\\node[state] (q16) [right of=q15] {$q_{16}$};\r\n\r\n\r\n%17-23 handle case where root is VC and has 1 Der VC suffix. it outputs V-C-suffix VC IFS\'s V, then goes back to root, skips first vowel, and outputs base. \r\n\\node[state] (q17) [below of=q11] {$q_{17}$};\r\n\\node[state] (q18) [right of=q17] {$q_{18}$};\r\n\\node[state] (q19) [right of=q18] {$q_{19}$};\r\n%\\node[state] (q20) [right of=q19] {$q_{20}$};\r\n\\node[state] (q21) [right of=q19] {$q_{21}$};\r\n\\node[state] (q22) [right of=q21] {$q_{22}$};\r\n\\node[state] (q23) [right of=q22] {$q_{23}$};\r\n\r\n%q24-27 handle case where root is C and there are no Der suffixes. teh output is pre-C-IFS-C-IFS - C-IFS\r\n\\node[state] (q24) [above right =4cm of q3] {$q_{24}$};\r\n\\node[state] (q25) [right of=q24] {$q_{25}$};\r\n\\node[state] (q26) [right of=q25] {$q_{26}$};\r\n\\node[state] (q27) [right of=q26] {$q_{27}$};\r\n%q28-32 handle case where root is C and there is 1  Der suffix. teh output is pre-C-VC der-V IFS +base\r\n\\node[state] (q28) [above of =q24] {$q_{28}$};\r\n\\node[state] (q29) [right of=q28] {$q_{29}$};\r\n\\node[state] (q30) [right of=q29] {$q_{30}$};\r\n\\node[state] (q31) [right of=q30] {$q_{31}$};\r\n\\node[state] (q32) [right of=q31] {$q_{32}$};\r\n\r\n\\path\r\n\r\n\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge[loop above] node[left] {(\\{-,$\\Sigma$\\},*,+1)} (q1)\r\n(q1) edge node {(+,*,+1)} (q2)\r\n(q2) edge node[right] {(C,C,+1)} (q3)\r\n(q3) edge node {(V,V,+1)} (q4)\r\n(q4) edge node {(C,C,+1)} (q5)\r\n%----(q5) edge node {(]_R,*,+1)} (q6)\r\n\r\n\r\n(q5) edge node {(=,*,+1)} (q7)\r\n(q7) edge node {(V,V,-1)} (q8)\r\n(q8) edge[loop below] node {(\\{$\\Sigma$,-,=\\},$\\epsilon$,-1)} (q8)\r\n(q8) edge node[below] {(+,$\\sim$,+1)} (q9)\r\n(q9) edge[loop below] node[right] {(\\{$\\Sigma,-,=$\\},*,+1)} (q9)\r\n(q9) edge node {(\\%,$\\epsilon$,+1)} (q10)\r\n\r\n%for case without DER suffixes\r\n(q5) edge node[left] {(-,=a,-1)} (q8)\r\n\r\n\r\n% for VC roots without DER\r\n(q2) edge node {(V,V,+1)} (q11)\r\n(q11) edge node {(C,C,+1)} (q12)\r\n%---(q12) edge node {(_R],*,+1)} (q13)\r\n(q12) edge node {(=,$\\epsilon$,-1)} (q14)\r\n(q14) edge[loop below] node {($\\Sigma$,$\\epsilon$,-1)} (q14)\r\n(q14) edge node {(+,$\\epsilon$,+1)} (q15)\r\n(q15) edge node {(V,V,+1)} (q16)\r\n(q16) edge node {(C,C,+1)} (q8)\r\n\r\n\r\n% for VC roots with DER\r\n(q12) edge node[left] {(-,*,+1)} (q17)\r\n(q17) edge node {(V,V,+1)} (q18)\r\n(q18) edge node {(C,C,+1)} (q19)\r\n%--(q19) edge node {(_D],*,+1)} (q20)\r\n(q19) edge node {(=,*,+1)} (q21)\r\n(q21) edge node {(V,V,-1)} (q22)\r\n(q22) edge[loop below] node {(\\{$\\Sigma$,-,=\\},$\\epsilon$,-1)} (q22)\r\n(q22) edge node[below] {(+,*,+1)} (q23)\r\n(q23) edge node[right] {(V,$\\epsilon$,+1)} (q9)\r\n\r\n%C root no DER suffixes\r\n(q3) edge node {(=,$\\epsilon$,+1)} (q24)\r\n--(q24) edge node {(_I[,$\\epsilon$,+1)} (q25)\r\n(q25) edge node {(V,V,-1)} (q26)\r\n(q26) edge[loop below] node {(\\{$\\Sigma$,=\\},$\\epsilon$,-1)} (q26)\r\n(q26) edge node[below] {(+,*,+1)} (q27)\r\n(q27) edge[loop above] node {(\\{$\\Sigma$,=\\},*,+1)} (q27)\r\n(q27) edge[bend left=45] node {(\\%,$\\epsilon$,-1)} (q8)\r\n\r\n% C root, der suffixes\r\n(q24) edge node {(-,*,+1)} (q28)\r\n(q28) edge node {(V,V,+1)} (q29)\r\n(q29) edge node {(C,C,+1)} (q31)\r\n%--(q30) edge node {(]_D,*,+1)} (q31)\r\n(q31) edge node {(=,*,+1)} (q32)\r\n(q32) edge[bend left=60] node {(V,V,-1)} (q8)\r\n\r\n\r\n;\r\n\\end{tikzpicture}\r\n', 1, '#Initial CVCV reduplication in Kinande\r\n#In Kinande, the first CVCV of the derivational stem is repeated\r\n#The reduplicant is different depending on the morphological and phonological makeup of the stem\r\n#If the stem consists of a CVC root + V inflectional suffix --> CVC-V~CVC-V\r\n#If the stem consists of a CVC root + VC derivational suffixes + V inflectional suffix --> CVC-a~CVC+VC-V\r\n#If the stem consists of a C root + V inflectional suffix --> C-V~C-V~C-V\r\n#If the stem consists of a C root + VC derivational suffix + V inflectional suffix --> C+VC-V~C+VC-V\r\n#If the stem consists of a VC root + V inflectional suffix --> VC~VC~VC-V\r\n#If the stem consists of a VC root + VC derivational suffixes + V inflectional suffix --> VC+VC-V~C+VC-V\r\n#Every input starts with zero or more prefixes, a \'<\' boundary to signify the start of the root, \'+\' to signify start of derivational suffixes, and \'-\' to signify start of the inflectional suffix, e.g CV-CV<CVC+VC-V\r\n#Explanating the variation is easier with the examples in the SQL file\r\n#e.g. pa<tak-a --> pata<tak-a~tak-a, pa<tak+as-i --> pa<tak-a~tak+as-i, pa<t-a --> pa<t-a~t-a~t-a, pa<t+as-a --> pa<t+as-a~t+as-a, p<at-a --> p<at~at~at-a, p<it-as-a --> p<it-as-a~t-as-a \r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet =  [\'p\',\'b\',\'m\',\'t\',\'d\',\'n\',\'k\',\'g\',\'s\',\'z\',\'f\',\'v\',\'h\', \'a\',\'e\',\'i\',\'o\',\'u\', \'<\',\'+\',\'-\']\r\nsubalphabets =3\r\nsegments =  [\'p\',\'b\',\'m\',\'t\',\'d\',\'n\',\'k\',\'g\',\'s\',\'z\',\'f\',\'v\',\'h\', \'a\',\'e\',\'i\',\'o\',\'u\']\r\nconsonants = [\'p\',\'b\',\'m\',\'t\',\'d\',\'n\',\'k\',\'g\',\'s\',\'z\',\'f\',\'v\',\'h\']\r\nvowels = [\'a\',\'e\',\'i\',\'o\',\'u\']\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output prefixes\',\'enter root\',\'output root C\',\'output root CV\',\'output root CVC\',\'output root CVC-\',\'return to root\', \'continue output\', \'end\',\'output root V\',\'output root VC\',\'return to root to repeat VC\',\'output root V again\',\'output root VC again\',\'output root VC+\',\'output root VC+V\',\'output root VC+VC\',\'output root VC+VC-\',\'return to root for last time\',\'output root again without first V\',\'output root C-\',\'output root C-V\',\'return to root again to repeat CV\',\'output root again for C-V\',\'output root C+\',\'output root C+V\',\'output root C+VC\',\'output root C+VC-\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'output prefixes\',\'\',1)\r\n(\'output prefixes\',\'-\') = (\'output prefixes\',\\ID,1)\r\n(\'output prefixes\',\\segments) = (\'output prefixes\',\\ID,1)\r\n(\'output prefixes\',\'<\') = (\'enter root\',\\ID,1)\r\n(\'enter root\',\\consonants) = (\'output root C\',\\ID,1(\r\n(\'output root C\',\\vowels) = (\'output root CV\',\\ID,1)\r\n(\'output root CV\',\\consonants) = (\'output root CVC\',\\ID,1)\r\n(\'output root CVC\',\'-\') = (\'output root CVC-\',\\ID,1)\r\n(\'output root CVC-\',\\vowels) = (\'return to root\',\\ID,-1)\r\n(\'return to root\',\\segments) = (\'return to root\',\'\',-1)\r\n(\'return to root\',\'-\') = (\'return to root\',\'\',-1)\r\n(\'return to root\',\'+\') = (\'return to root\',\'\',-1)\r\n(\'return to root\',\'<\') = (\'continue output\',\'~\',1)\r\n(\'continue output\',\\segments) = (\'continue output\',\\ID,1)\r\n(\'continue output\',\'-\') = (\'continue output\',\\ID,1)\r\n(\'continue output\',\'+\') = (\'continue output\',\\ID,1)\r\n(\'continue output\',\'%\') = (\'end\',\'\',1)\r\n(\'output root CVC\',\'+\') = (\'return to root\',\'-a\',-1)\r\n(\'enter root\',\\vowels) =  (\'output root V\',\\ID,1)\r\n(\'output root V\',\\consonants) = (\'output root VC\',\\ID,1)\r\n(\'output root VC\',\'-\') = (\'return to root to repeat VC\',\'\',-1)\r\n(\'return to root to repeat VC\',\\segments) = (\'return to root to repeat VC\',\'\',-1)\r\n(\'return to root to repeat VC\',\'<\') = (\'output root V again\',\'~\',1)\r\n(\'output root V again\',\\vowels) = (\'output root VC again\',\\ID,1)\r\n(\'output root VC again\',\\consonants) = (\'return to root\',\\ID,1)\r\n(\'output root VC\',\'+\') = (\'output root VC+\',\\ID,1)\r\n(\'output root VC+\',\\vowels) = (\'output root VC+V\',\\ID,1)\r\n(\'output root VC+V\',\\consonants) = (\'output root VC+VC\',\\ID,1)\r\n(\'output root VC+VC\',\'-\') = (\'output root VC+VC-\',\\ID,1)\r\n(\'output root VC+VC-\',\\vowels)= (\'return to root for last time\',\\ID,-1)\r\n(\'return to root for last time\',\\segments) = (\'return to root for last time\',\'\',-1)\r\n(\'return to root for last time\',\'-\') = (\'return to root for last time\',\'\',-1)\r\n(\'return to root for last time\',\'+\') = (\'return to root for last time\',\'\',-1)\r\n(\'return to root for last time\',\'<\') = (\'output root again without first V\',\\ID,1)\r\n(\'output root again without first V\',\\vowels) = (\'continue output\',\'\',1)\r\n(\'output root C\', \'-\') = (\'output root C-\',\'-\',1)\r\n(\'output root C-\', \\vowels) = (\'return to root again to repeat CV\',\\ID,-1)\r\n(\'return to root again to repeat CV\',\'-\') = (\'return to root again to repeat CV\',\'\',-1)\r\n(\'return to root again to repeat CV\',\\segments) = (\'return to root again to repeat CV\',\'\',-1)\r\n(\'return to root again to repeat CV\',\'<\') = (\'output root again for C-V\',\'~\',1)\r\n(\'output root again for C-V\', \\segments) = (\'output root again for C-V\',\\ID,1)\r\n(\'output root again for C-V\',\'-\') = (\'output root again for C-V\',\\ID,1)\r\n(\'output root again for C-V\',\'%\') = (\'return to root\',\'\',-1)\r\n(\'output root C\',\'+\') = (\'output root C+\',\\ID,1)\r\n(\'output root C+\',\\vowels) = (\'output root C+V\',\\ID,1)\r\n(\'output root C+V\',\\consonants) = (\'output root C+VC\',\\ID,1)\r\n(\'output root C+VC\',\'-\') = (\'output root C+VC-\',\\ID,1)\r\n(\'output root C+VC-\',\\vowels) = (\'return to root\',\\ID,-1)\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Initial CVCV reduplication in Kinande\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output prefixes\r\n3	enter root\r\n4	output root C\r\n5	output root CV\r\n6	output root CVC\r\n7	output root CVC-\r\n8	return to root\r\n9	continue output\r\n10	output root V\r\n11	output root VC\r\n12	return to root to repeat VC\r\n13	output root V again\r\n14	output root VC again\r\n15	output root VC+\r\n16	output root VC+V\r\n17	output root VC+VC\r\n18	output root VC+VC-\r\n19	return to root for last time\r\n20	output root again without first V\r\n21	output root C-\r\n22	output root C-V\r\n23	return to root again to repeat CV\r\n24	output root again for C-V\r\n25	output root C+\r\n26	output root C+V\r\n27	output root C+VC\r\n28	output root C+VC-\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n10,b,11,b,1\r\n10,d,11,d,1\r\n10,f,11,f,1\r\n10,g,11,g,1\r\n10,h,11,h,1\r\n10,k,11,k,1\r\n10,m,11,m,1\r\n10,n,11,n,1\r\n10,p,11,p,1\r\n10,s,11,s,1\r\n10,t,11,t,1\r\n10,v,11,v,1\r\n10,z,11,z,1\r\n11,+,15,+,1\r\n11,-,12,,-1\r\n12,<,13,~,1\r\n12,a,12,,-1\r\n12,b,12,,-1\r\n12,d,12,,-1\r\n12,e,12,,-1\r\n12,f,12,,-1\r\n12,g,12,,-1\r\n12,h,12,,-1\r\n12,i,12,,-1\r\n12,k,12,,-1\r\n12,m,12,,-1\r\n12,n,12,,-1\r\n12,o,12,,-1\r\n12,p,12,,-1\r\n12,s,12,,-1\r\n12,t,12,,-1\r\n12,u,12,,-1\r\n12,v,12,,-1\r\n12,z,12,,-1\r\n13,a,14,a,1\r\n13,e,14,e,1\r\n13,i,14,i,1\r\n13,o,14,o,1\r\n13,u,14,u,1\r\n14,b,8,b,1\r\n14,d,8,d,1\r\n14,f,8,f,1\r\n14,g,8,g,1\r\n14,h,8,h,1\r\n14,k,8,k,1\r\n14,m,8,m,1\r\n14,n,8,n,1\r\n14,p,8,p,1\r\n14,s,8,s,1\r\n14,t,8,t,1\r\n14,v,8,v,1\r\n14,z,8,z,1\r\n15,a,16,a,1\r\n15,e,16,e,1\r\n15,i,16,i,1\r\n15,o,16,o,1\r\n15,u,16,u,1\r\n16,b,17,b,1\r\n16,d,17,d,1\r\n16,f,17,f,1\r\n16,g,17,g,1\r\n16,h,17,h,1\r\n16,k,17,k,1\r\n16,m,17,m,1\r\n16,n,17,n,1\r\n16,p,17,p,1\r\n16,s,17,s,1\r\n16,t,17,t,1\r\n16,v,17,v,1\r\n16,z,17,z,1\r\n17,-,18,-,1\r\n18,a,19,a,-1\r\n18,e,19,e,-1\r\n18,i,19,i,-1\r\n18,o,19,o,-1\r\n18,u,19,u,-1\r\n19,+,19,,-1\r\n19,-,19,,-1\r\n19,<,20,<,1\r\n19,a,19,,-1\r\n19,b,19,,-1\r\n19,d,19,,-1\r\n19,e,19,,-1\r\n19,f,19,,-1\r\n19,g,19,,-1\r\n19,h,19,,-1\r\n19,i,19,,-1\r\n19,k,19,,-1\r\n19,m,19,,-1\r\n19,n,19,,-1\r\n19,o,19,,-1\r\n19,p,19,,-1\r\n19,s,19,,-1\r\n19,t,19,,-1\r\n19,u,19,,-1\r\n19,v,19,,-1\r\n19,z,19,,-1\r\n2,-,2,-,1\r\n2,<,3,<,1\r\n2,a,2,a,1\r\n2,b,2,b,1\r\n2,d,2,d,1\r\n2,e,2,e,1\r\n2,f,2,f,1\r\n2,g,2,g,1\r\n2,h,2,h,1\r\n2,i,2,i,1\r\n2,k,2,k,1\r\n2,m,2,m,1\r\n2,n,2,n,1\r\n2,o,2,o,1\r\n2,p,2,p,1\r\n2,s,2,s,1\r\n2,t,2,t,1\r\n2,u,2,u,1\r\n2,v,2,v,1\r\n2,z,2,z,1\r\n20,a,9,,1\r\n20,e,9,,1\r\n20,i,9,,1\r\n20,o,9,,1\r\n20,u,9,,1\r\n21,a,23,a,-1\r\n21,e,23,e,-1\r\n21,i,23,i,-1\r\n21,o,23,o,-1\r\n21,u,23,u,-1\r\n23,-,23,,-1\r\n23,<,24,~,1\r\n23,a,23,,-1\r\n23,b,23,,-1\r\n23,d,23,,-1\r\n23,e,23,,-1\r\n23,f,23,,-1\r\n23,g,23,,-1\r\n23,h,23,,-1\r\n23,i,23,,-1\r\n23,k,23,,-1\r\n23,m,23,,-1\r\n23,n,23,,-1\r\n23,o,23,,-1\r\n23,p,23,,-1\r\n23,s,23,,-1\r\n23,t,23,,-1\r\n23,u,23,,-1\r\n23,v,23,,-1\r\n23,z,23,,-1\r\n24,%,8,,-1\r\n24,-,24,-,1\r\n24,a,24,a,1\r\n24,b,24,b,1\r\n24,d,24,d,1\r\n24,e,24,e,1\r\n24,f,24,f,1\r\n24,g,24,g,1\r\n24,h,24,h,1\r\n24,i,24,i,1\r\n24,k,24,k,1\r\n24,m,24,m,1\r\n24,n,24,n,1\r\n24,o,24,o,1\r\n24,p,24,p,1\r\n24,s,24,s,1\r\n24,t,24,t,1\r\n24,u,24,u,1\r\n24,v,24,v,1\r\n24,z,24,z,1\r\n25,a,26,a,1\r\n25,e,26,e,1\r\n25,i,26,i,1\r\n25,o,26,o,1\r\n25,u,26,u,1\r\n26,b,27,b,1\r\n26,d,27,d,1\r\n26,f,27,f,1\r\n26,g,27,g,1\r\n26,h,27,h,1\r\n26,k,27,k,1\r\n26,m,27,m,1\r\n26,n,27,n,1\r\n26,p,27,p,1\r\n26,s,27,s,1\r\n26,t,27,t,1\r\n26,v,27,v,1\r\n26,z,27,z,1\r\n27,-,28,-,1\r\n28,a,8,a,-1\r\n28,e,8,e,-1\r\n28,i,8,i,-1\r\n28,o,8,o,-1\r\n28,u,8,u,-1\r\n3,a,10,a,1\r\n3,b,4,b,1\r\n3,d,4,d,1\r\n3,e,10,e,1\r\n3,f,4,f,1\r\n3,g,4,g,1\r\n3,h,4,h,1\r\n3,i,10,i,1\r\n3,k,4,k,1\r\n3,m,4,m,1\r\n3,n,4,n,1\r\n3,o,10,o,1\r\n3,p,4,p,1\r\n3,s,4,s,1\r\n3,t,4,t,1\r\n3,u,10,u,1\r\n3,v,4,v,1\r\n3,z,4,z,1\r\n4,+,25,+,1\r\n4,-,21,-,1\r\n4,a,5,a,1\r\n4,e,5,e,1\r\n4,i,5,i,1\r\n4,o,5,o,1\r\n4,u,5,u,1\r\n5,b,6,b,1\r\n5,d,6,d,1\r\n5,f,6,f,1\r\n5,g,6,g,1\r\n5,h,6,h,1\r\n5,k,6,k,1\r\n5,m,6,m,1\r\n5,n,6,n,1\r\n5,p,6,p,1\r\n5,s,6,s,1\r\n5,t,6,t,1\r\n5,v,6,v,1\r\n5,z,6,z,1\r\n6,+,8,-a,-1\r\n6,-,7,-,1\r\n7,a,8,a,-1\r\n7,e,8,e,-1\r\n7,i,8,i,-1\r\n7,o,8,o,-1\r\n7,u,8,u,-1\r\n8,+,8,,-1\r\n8,-,8,,-1\r\n8,<,9,~,1\r\n8,a,8,,-1\r\n8,b,8,,-1\r\n8,d,8,,-1\r\n8,e,8,,-1\r\n8,f,8,,-1\r\n8,g,8,,-1\r\n8,h,8,,-1\r\n8,i,8,,-1\r\n8,k,8,,-1\r\n8,m,8,,-1\r\n8,n,8,,-1\r\n8,o,8,,-1\r\n8,p,8,,-1\r\n8,s,8,,-1\r\n8,t,8,,-1\r\n8,u,8,,-1\r\n8,v,8,,-1\r\n8,z,8,,-1\r\n9,%,1,,1\r\n9,+,9,+,1\r\n9,-,9,-,1\r\n9,a,9,a,1\r\n9,b,9,b,1\r\n9,d,9,d,1\r\n9,e,9,e,1\r\n9,f,9,f,1\r\n9,g,9,g,1\r\n9,h,9,h,1\r\n9,i,9,i,1\r\n9,k,9,k,1\r\n9,m,9,m,1\r\n9,n,9,n,1\r\n9,o,9,o,1\r\n9,p,9,p,1\r\n9,s,9,s,1\r\n9,t,9,t,1\r\n9,u,9,u,1\r\n9,v,9,v,1\r\n9,z,9,z,1\r\n');
+('Initial CVCV - Kinande', 'Data too complicated. Refer to the description.', 'The reduplicative patterns differ based on the structure of the input/base. It involves overcopying, different outputs for vowel vs consonant initial stems, foot minimality, and reference to multiple morhpological and prosodic constituents. I have refrained from using prosodic constituents (P-stems) in the FST and discussion because those prosodic constituents are derived from the morphological constituents\r\n\r\nThe general template for the input is: Pre-verbal prefixes + root + derivational suffixes or \"extensions\" + inflectional final suffix IFS. \r\n\r\n\r\nOnly the root and inflectional final suffix are obligatory. \r\nThe  root + extensions + IFS look like they are always a sequence of alternating  vowels and consonants that ends in a vowel: VC(VC)\\*V or (CV)\\*CV.\r\n\r\nI assume that what look like consonant clusters in the orthography are actually complex segments\r\n\r\nThe reduplication patterns ignore the prefixes\r\n\r\n1) Pattern 1: redup(prefixes\\* - CVC root - V I(FS )= prefixes\\* - CVC root - V IFS - CVC root - V IFS\r\n\r\nCVC root (hum, tum) + IFS (a or e)\r\n\r\n| Input     | Gloss | Output          | Gloss        |\r\n|-----------|-------|-----------------|--------------|\r\n| eri-hum-a | ?     | eri-hum-a\\~hum-a | \"to beat\"    |\r\n| eri-hum-e | ?     | eri-hum-e\\~hum-e | \"let\'s beat\" |\r\n| eri-tum-a | ?     | eri-tum-a\\~tum-a | \"to send\"    |\r\n| eri-tum-e | ?     | eri-tum-e\\~tum-e | \"let\'s send\" |\r\n\r\n2) Pattern 2: redup(prefixes\\* - CVC root - (VC)\\* extensions - V IFS)= prefixes\\* - CVC root - a - CVC root - (VC)\\* extensions - IFS\r\n\r\nCVC root (hum, tum) + VC extensions (ir, an) + IFS (a or e)\r\n\r\n| Input          | Gloss | Output               | Gloss                    |\r\n|----------------|-------|----------------------|--------------------------|\r\n| eri-hum-ir-a   | ?     | eri-hum-a\\~hum-ir-a   | \"to beat for\"            |\r\n| eri-hum-iran-a | ?     | eri-hum-a\\~hum-iran-a | \"to beat for each other\" |\r\n| eri-tum-ir-a   | ?     | eri-tum-a\\~tum-ir-a   | \"to send to\"             |\r\n| eri-tum-an-a   | ?     | eri-tum-a\\~tum-an-a   | \"to send each other\"     |\r\n| eri-tum-iran-a | ?     | eri-tum-a\\~tum-iran-a | \"to send to each other\"  |\r\n\r\n3) Pattern 3: redup(prefixes\\* - C root -  V IFS)= prefixes\\* - C root - V IFS - C root - V IFS - C root - V IFS\r\n\r\nC root (sw, tm ly, hw) + IFS (a)\r\n\r\n| Input    | Gloss | Output             | Gloss       |\r\n|----------|-------|--------------------|-------------|\r\n| eri-sw-a | ?     | eri-sw-a-sw-a\\~sw-a | \"to grind\"  |\r\n| eri-t-a  | ?     | eri-t-a-t-a\\~t-a    | \"to bury\"   |\r\n| eri-ly-a | ?     | eri-ly-a-ly-a\\~ly-a | \"to eat\"    |\r\n| eri-hw-a | ?     | eri-hw-a-hw-a\\~hw-a | \"to finish\" |\r\n\r\nC root (s) + VC extension (er) + IFS (e)\r\n\r\n| Input       | Gloss | Output              | Gloss      |\r\n|-------------|-------|---------------------|------------|\r\n| eri-sw-er-e | ?     | eri-sw-er-e\\~w-er-a | \"to grind\" |\r\n\r\n4) Pattern 4: redup(prefixes\\* - VC root -  V IFS)= prefixes\\* - VC root - VC root - VC root - V IFS \r\n\r\nVC root (es, oh, ot, um, ib) + IFS (a)\r\n\r\n| Input    | Gloss | Output          | Gloss      |\r\n|----------|-------|-----------------|------------|\r\n| ery-es-a | ?     | ery-es-es\\~es-a | \"to play\"  |\r\n| ery-oh-a | ?     | ery-oh-oh\\~oh-a | \"to pick\"  |\r\n| ery-ot-a | ?     | ery-ot-ot\\~ot-a | \"to light\" |\r\n| ery-um-a | ?     | ery-um-um\\~um-a | \"to dry\"   |\r\n| er-ib-a  | ?     | er-ib-ib\\~ib-a  | \"to steal\" |\r\n\r\n5) Pattern 5: redup(prefixes\\* - VC root - VC extension  - V IFS)= prefixes\\* - VC root - VC extension - V IFS - C root - VC extension - V IFS \r\n\r\nVC root (es, oh) + VC extensions (er) + IFS (a)\r\n\r\n| Input        | Gloss | Output                 | Gloss          |\r\n|--------------|-------|------------------------|----------------|\r\n| ery-es-er-a  | ?     | ery-e-s-er-a\\~s-er-a   | \"to play for\"  |\r\n| ery-oh-er-a  | ?     | ery-o-h-er-a\\~h-er-a   | \"to pick for\"  |\r\n| ery-ot-er-a  | ?     | ery-o-t-er-a+t-er-a    | \"to light for\" |\r\n| ery-amb-al-a | ?     | ery-a-mb-al-a\\~mb-al-a | \"to clothe\"    |\r\n| ery-us-al-a  | ?     | ery-u-s-al-a\\~s-al-a   | \"to fill\"      |', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-2 go over the prefixes\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\r\n%state q2-7 handle if the root is CVC. if the IFS is next to the root, it is copied; otherwise /a/ is outputed.\r\n\\node[state] (q3) [above =4cm of q0] {$q_3$};\r\n\\node[state] (q4) [right of = q3] {$q_4$};\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n%\\node[state] (q6) [right of=q5] {$q_6$};\r\n\\node[state] (q7) [right of=q5] {$q_7$};\r\n%q8-up go back to begining of root and output base+suffixes\r\n\\node[state] (q8) [right of=q2] {$q_8$};\r\n\\node[state] (q9) [right of=q8] {$q_9$};\r\n\\node[state,accepting] (q10) [right of=q9] {$q_{10}$};\r\n\r\n%11-16 handle case where root is VC and theres no D suffixes, it repeats VC twice  to get 3 copies \r\n\\node[state] (q11) [below =4cm of q0] {$q_{11}$};\r\n\\node[state] (q12) [right of=q11] {$q_{12}$};\r\n%\\node[state] (q13) [right of=q12] {$q_{13}$};\r\n\\node[state] (q14) [right of=q12] {$q_{14}$};\r\n\\node[state] (q15) [right of=q14] {$q_{15}$};\r\n\\node[state] (q16) [right of=q15] {$q_{16}$};\r\n\r\n\r\n%17-23 handle case where root is VC and has 1 Der VC suffix. it outputs V-C-suffix VC IFS\'s V, then goes back to root, skips first vowel, and outputs base. \r\n\\node[state] (q17) [below of=q11] {$q_{17}$};\r\n\\node[state] (q18) [right of=q17] {$q_{18}$};\r\n\\node[state] (q19) [right of=q18] {$q_{19}$};\r\n%\\node[state] (q20) [right of=q19] {$q_{20}$};\r\n\\node[state] (q21) [right of=q19] {$q_{21}$};\r\n\\node[state] (q22) [right of=q21] {$q_{22}$};\r\n\\node[state] (q23) [right of=q22] {$q_{23}$};\r\n\r\n%q24-27 handle case where root is C and there are no Der suffixes. teh output is pre-C-IFS-C-IFS - C-IFS\r\n\\node[state] (q24) [above right =4cm of q3] {$q_{24}$};\r\n\\node[state] (q25) [right of=q24] {$q_{25}$};\r\n\\node[state] (q26) [right of=q25] {$q_{26}$};\r\n\\node[state] (q27) [right of=q26] {$q_{27}$};\r\n%q28-32 handle case where root is C and there is 1  Der suffix. teh output is pre-C-VC der-V IFS +base\r\n\\node[state] (q28) [above of =q24] {$q_{28}$};\r\n\\node[state] (q29) [right of=q28] {$q_{29}$};\r\n\\node[state] (q30) [right of=q29] {$q_{30}$};\r\n\\node[state] (q31) [right of=q30] {$q_{31}$};\r\n\\node[state] (q32) [right of=q31] {$q_{32}$};\r\n\r\n\\path\r\n\r\n\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge[loop above] node[left] {(\\{-,$\\Sigma$\\},*,+1)} (q1)\r\n(q1) edge node {(+,*,+1)} (q2)\r\n(q2) edge node[right] {(C,C,+1)} (q3)\r\n(q3) edge node {(V,V,+1)} (q4)\r\n(q4) edge node {(C,C,+1)} (q5)\r\n%----(q5) edge node {(]_R,*,+1)} (q6)\r\n\r\n\r\n(q5) edge node {(=,*,+1)} (q7)\r\n(q7) edge node {(V,V,-1)} (q8)\r\n(q8) edge[loop below] node {(\\{$\\Sigma$,-,=\\},$\\epsilon$,-1)} (q8)\r\n(q8) edge node[below] {(+,$\\sim$,+1)} (q9)\r\n(q9) edge[loop below] node[right] {(\\{$\\Sigma,-,=$\\},*,+1)} (q9)\r\n(q9) edge node {(\\%,$\\epsilon$,+1)} (q10)\r\n\r\n%for case without DER suffixes\r\n(q5) edge node[left] {(-,=a,-1)} (q8)\r\n\r\n\r\n% for VC roots without DER\r\n(q2) edge node {(V,V,+1)} (q11)\r\n(q11) edge node {(C,C,+1)} (q12)\r\n%---(q12) edge node {(_R],*,+1)} (q13)\r\n(q12) edge node {(=,$\\epsilon$,-1)} (q14)\r\n(q14) edge[loop below] node {($\\Sigma$,$\\epsilon$,-1)} (q14)\r\n(q14) edge node {(+,$\\epsilon$,+1)} (q15)\r\n(q15) edge node {(V,V,+1)} (q16)\r\n(q16) edge node {(C,C,+1)} (q8)\r\n\r\n\r\n% for VC roots with DER\r\n(q12) edge node[left] {(-,*,+1)} (q17)\r\n(q17) edge node {(V,V,+1)} (q18)\r\n(q18) edge node {(C,C,+1)} (q19)\r\n%--(q19) edge node {(_D],*,+1)} (q20)\r\n(q19) edge node {(=,*,+1)} (q21)\r\n(q21) edge node {(V,V,-1)} (q22)\r\n(q22) edge[loop below] node {(\\{$\\Sigma$,-,=\\},$\\epsilon$,-1)} (q22)\r\n(q22) edge node[below] {(+,*,+1)} (q23)\r\n(q23) edge node[right] {(V,$\\epsilon$,+1)} (q9)\r\n\r\n%C root no DER suffixes\r\n(q3) edge node {(=,$\\epsilon$,+1)} (q24)\r\n--(q24) edge node {(_I[,$\\epsilon$,+1)} (q25)\r\n(q25) edge node {(V,V,-1)} (q26)\r\n(q26) edge[loop below] node {(\\{$\\Sigma$,=\\},$\\epsilon$,-1)} (q26)\r\n(q26) edge node[below] {(+,*,+1)} (q27)\r\n(q27) edge[loop above] node {(\\{$\\Sigma$,=\\},*,+1)} (q27)\r\n(q27) edge[bend left=45] node {(\\%,$\\epsilon$,-1)} (q8)\r\n\r\n% C root, der suffixes\r\n(q24) edge node {(-,*,+1)} (q28)\r\n(q28) edge node {(V,V,+1)} (q29)\r\n(q29) edge node {(C,C,+1)} (q31)\r\n%--(q30) edge node {(]_D,*,+1)} (q31)\r\n(q31) edge node {(=,*,+1)} (q32)\r\n(q32) edge[bend left=60] node {(V,V,-1)} (q8)\r\n\r\n\r\n;\r\n\\end{tikzpicture}\r\n', 1, '#Initial CVCV reduplication in Kinande\r\n#In Kinande, the first CVCV of the derivational stem is repeated\r\n#The reduplicant is different depending on the morphological and phonological makeup of the stem\r\n#If the stem consists of a CVC root + V inflectional suffix --> CVC-V~CVC-V\r\n#If the stem consists of a CVC root + VC derivational suffixes + V inflectional suffix --> CVC-a~CVC+VC-V\r\n#If the stem consists of a C root + V inflectional suffix --> C-V~C-V~C-V\r\n#If the stem consists of a C root + VC derivational suffix + V inflectional suffix --> C+VC-V~C+VC-V\r\n#If the stem consists of a VC root + V inflectional suffix --> VC~VC~VC-V\r\n#If the stem consists of a VC root + VC derivational suffixes + V inflectional suffix --> VC+VC-V~C+VC-V\r\n#Every input starts with zero or more prefixes, a \'<\' boundary to signify the start of the root, \'+\' to signify start of derivational suffixes, and \'-\' to signify start of the inflectional suffix, e.g CV-CV<CVC+VC-V\r\n#Explanating the variation is easier with the examples in the SQL file\r\n#e.g. pa<tak-a --> pata<tak-a~tak-a, pa<tak+as-i --> pa<tak-a~tak+as-i, pa<t-a --> pa<t-a~t-a~t-a, pa<t+as-a --> pa<t+as-a~t+as-a, p<at-a --> p<at~at~at-a, p<it-as-a --> p<it-as-a~t-as-a \r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet =  [\'p\',\'b\',\'m\',\'t\',\'d\',\'n\',\'k\',\'g\',\'s\',\'z\',\'f\',\'v\',\'h\', \'a\',\'e\',\'i\',\'o\',\'u\', \'<\',\'+\',\'-\']\r\nsubalphabets =3\r\nsegments =  [\'p\',\'b\',\'m\',\'t\',\'d\',\'n\',\'k\',\'g\',\'s\',\'z\',\'f\',\'v\',\'h\', \'a\',\'e\',\'i\',\'o\',\'u\']\r\nconsonants = [\'p\',\'b\',\'m\',\'t\',\'d\',\'n\',\'k\',\'g\',\'s\',\'z\',\'f\',\'v\',\'h\']\r\nvowels = [\'a\',\'e\',\'i\',\'o\',\'u\']\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output prefixes\',\'enter root\',\'output root C\',\'output root CV\',\'output root CVC\',\'output root CVC-\',\'return to root\', \'continue output\', \'end\',\'output root V\',\'output root VC\',\'return to root to repeat VC\',\'output root V again\',\'output root VC again\',\'output root VC+\',\'output root VC+V\',\'output root VC+VC\',\'output root VC+VC-\',\'return to root for last time\',\'output root again without first V\',\'output root C-\',\'output root C-V\',\'return to root again to repeat CV\',\'output root again for C-V\',\'output root C+\',\'output root C+V\',\'output root C+VC\',\'output root C+VC-\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'output prefixes\',\'\',1)\r\n(\'output prefixes\',\'-\') = (\'output prefixes\',\\ID,1)\r\n(\'output prefixes\',\\segments) = (\'output prefixes\',\\ID,1)\r\n(\'output prefixes\',\'<\') = (\'enter root\',\\ID,1)\r\n(\'enter root\',\\consonants) = (\'output root C\',\\ID,1)\r\n(\'output root C\',\\vowels) = (\'output root CV\',\\ID,1)\r\n(\'output root CV\',\\consonants) = (\'output root CVC\',\\ID,1)\r\n(\'output root CVC\',\'-\') = (\'output root CVC-\',\\ID,1)\r\n(\'output root CVC-\',\\vowels) = (\'return to root\',\\ID,-1)\r\n(\'return to root\',\\segments) = (\'return to root\',\'\',-1)\r\n(\'return to root\',\'-\') = (\'return to root\',\'\',-1)\r\n(\'return to root\',\'+\') = (\'return to root\',\'\',-1)\r\n(\'return to root\',\'<\') = (\'continue output\',\'~\',1)\r\n(\'continue output\',\\segments) = (\'continue output\',\\ID,1)\r\n(\'continue output\',\'-\') = (\'continue output\',\\ID,1)\r\n(\'continue output\',\'+\') = (\'continue output\',\\ID,1)\r\n(\'continue output\',\'%\') = (\'end\',\'\',1)\r\n(\'output root CVC\',\'+\') = (\'return to root\',\'-a\',-1)\r\n(\'enter root\',\\vowels) =  (\'output root V\',\\ID,1)\r\n(\'output root V\',\\consonants) = (\'output root VC\',\\ID,1)\r\n(\'output root VC\',\'-\') = (\'return to root to repeat VC\',\'\',-1)\r\n(\'return to root to repeat VC\',\\segments) = (\'return to root to repeat VC\',\'\',-1)\r\n(\'return to root to repeat VC\',\'<\') = (\'output root V again\',\'~\',1)\r\n(\'output root V again\',\\vowels) = (\'output root VC again\',\\ID,1)\r\n(\'output root VC again\',\\consonants) = (\'return to root\',\\ID,1)\r\n(\'output root VC\',\'+\') = (\'output root VC+\',\\ID,1)\r\n(\'output root VC+\',\\vowels) = (\'output root VC+V\',\\ID,1)\r\n(\'output root VC+V\',\\consonants) = (\'output root VC+VC\',\\ID,1)\r\n(\'output root VC+VC\',\'-\') = (\'output root VC+VC-\',\\ID,1)\r\n(\'output root VC+VC-\',\\vowels)= (\'return to root for last time\',\\ID,-1)\r\n(\'return to root for last time\',\\segments) = (\'return to root for last time\',\'\',-1)\r\n(\'return to root for last time\',\'-\') = (\'return to root for last time\',\'\',-1)\r\n(\'return to root for last time\',\'+\') = (\'return to root for last time\',\'\',-1)\r\n(\'return to root for last time\',\'<\') = (\'output root again without first V\',\\ID,1)\r\n(\'output root again without first V\',\\vowels) = (\'continue output\',\'\',1)\r\n(\'output root C\', \'-\') = (\'output root C-\',\'-\',1)\r\n(\'output root C-\', \\vowels) = (\'return to root again to repeat CV\',\\ID,-1)\r\n(\'return to root again to repeat CV\',\'-\') = (\'return to root again to repeat CV\',\'\',-1)\r\n(\'return to root again to repeat CV\',\\segments) = (\'return to root again to repeat CV\',\'\',-1)\r\n(\'return to root again to repeat CV\',\'<\') = (\'output root again for C-V\',\'~\',1)\r\n(\'output root again for C-V\', \\segments) = (\'output root again for C-V\',\\ID,1)\r\n(\'output root again for C-V\',\'-\') = (\'output root again for C-V\',\\ID,1)\r\n(\'output root again for C-V\',\'%\') = (\'return to root\',\'\',-1)\r\n(\'output root C\',\'+\') = (\'output root C+\',\\ID,1)\r\n(\'output root C+\',\\vowels) = (\'output root C+V\',\\ID,1)\r\n(\'output root C+V\',\\consonants) = (\'output root C+VC\',\\ID,1)\r\n(\'output root C+VC\',\'-\') = (\'output root C+VC-\',\\ID,1)\r\n(\'output root C+VC-\',\\vowels) = (\'return to root\',\\ID,-1)\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Initial CVCV reduplication in Kinande\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output prefixes\r\n3	enter root\r\n4	output root C\r\n5	output root CV\r\n6	output root CVC\r\n7	output root CVC-\r\n8	return to root\r\n9	continue output\r\n10	output root V\r\n11	output root VC\r\n12	return to root to repeat VC\r\n13	output root V again\r\n14	output root VC again\r\n15	output root VC+\r\n16	output root VC+V\r\n17	output root VC+VC\r\n18	output root VC+VC-\r\n19	return to root for last time\r\n20	output root again without first V\r\n21	output root C-\r\n22	output root C-V\r\n23	return to root again to repeat CV\r\n24	output root again for C-V\r\n25	output root C+\r\n26	output root C+V\r\n27	output root C+VC\r\n28	output root C+VC-\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n10,b,11,b,1\r\n10,d,11,d,1\r\n10,f,11,f,1\r\n10,g,11,g,1\r\n10,h,11,h,1\r\n10,k,11,k,1\r\n10,m,11,m,1\r\n10,n,11,n,1\r\n10,p,11,p,1\r\n10,s,11,s,1\r\n10,t,11,t,1\r\n10,v,11,v,1\r\n10,z,11,z,1\r\n11,+,15,+,1\r\n11,-,12,,-1\r\n12,<,13,~,1\r\n12,a,12,,-1\r\n12,b,12,,-1\r\n12,d,12,,-1\r\n12,e,12,,-1\r\n12,f,12,,-1\r\n12,g,12,,-1\r\n12,h,12,,-1\r\n12,i,12,,-1\r\n12,k,12,,-1\r\n12,m,12,,-1\r\n12,n,12,,-1\r\n12,o,12,,-1\r\n12,p,12,,-1\r\n12,s,12,,-1\r\n12,t,12,,-1\r\n12,u,12,,-1\r\n12,v,12,,-1\r\n12,z,12,,-1\r\n13,a,14,a,1\r\n13,e,14,e,1\r\n13,i,14,i,1\r\n13,o,14,o,1\r\n13,u,14,u,1\r\n14,b,8,b,1\r\n14,d,8,d,1\r\n14,f,8,f,1\r\n14,g,8,g,1\r\n14,h,8,h,1\r\n14,k,8,k,1\r\n14,m,8,m,1\r\n14,n,8,n,1\r\n14,p,8,p,1\r\n14,s,8,s,1\r\n14,t,8,t,1\r\n14,v,8,v,1\r\n14,z,8,z,1\r\n15,a,16,a,1\r\n15,e,16,e,1\r\n15,i,16,i,1\r\n15,o,16,o,1\r\n15,u,16,u,1\r\n16,b,17,b,1\r\n16,d,17,d,1\r\n16,f,17,f,1\r\n16,g,17,g,1\r\n16,h,17,h,1\r\n16,k,17,k,1\r\n16,m,17,m,1\r\n16,n,17,n,1\r\n16,p,17,p,1\r\n16,s,17,s,1\r\n16,t,17,t,1\r\n16,v,17,v,1\r\n16,z,17,z,1\r\n17,-,18,-,1\r\n18,a,19,a,-1\r\n18,e,19,e,-1\r\n18,i,19,i,-1\r\n18,o,19,o,-1\r\n18,u,19,u,-1\r\n19,+,19,,-1\r\n19,-,19,,-1\r\n19,<,20,<,1\r\n19,a,19,,-1\r\n19,b,19,,-1\r\n19,d,19,,-1\r\n19,e,19,,-1\r\n19,f,19,,-1\r\n19,g,19,,-1\r\n19,h,19,,-1\r\n19,i,19,,-1\r\n19,k,19,,-1\r\n19,m,19,,-1\r\n19,n,19,,-1\r\n19,o,19,,-1\r\n19,p,19,,-1\r\n19,s,19,,-1\r\n19,t,19,,-1\r\n19,u,19,,-1\r\n19,v,19,,-1\r\n19,z,19,,-1\r\n2,-,2,-,1\r\n2,<,3,<,1\r\n2,a,2,a,1\r\n2,b,2,b,1\r\n2,d,2,d,1\r\n2,e,2,e,1\r\n2,f,2,f,1\r\n2,g,2,g,1\r\n2,h,2,h,1\r\n2,i,2,i,1\r\n2,k,2,k,1\r\n2,m,2,m,1\r\n2,n,2,n,1\r\n2,o,2,o,1\r\n2,p,2,p,1\r\n2,s,2,s,1\r\n2,t,2,t,1\r\n2,u,2,u,1\r\n2,v,2,v,1\r\n2,z,2,z,1\r\n20,a,9,,1\r\n20,e,9,,1\r\n20,i,9,,1\r\n20,o,9,,1\r\n20,u,9,,1\r\n21,a,23,a,-1\r\n21,e,23,e,-1\r\n21,i,23,i,-1\r\n21,o,23,o,-1\r\n21,u,23,u,-1\r\n23,-,23,,-1\r\n23,<,24,~,1\r\n23,a,23,,-1\r\n23,b,23,,-1\r\n23,d,23,,-1\r\n23,e,23,,-1\r\n23,f,23,,-1\r\n23,g,23,,-1\r\n23,h,23,,-1\r\n23,i,23,,-1\r\n23,k,23,,-1\r\n23,m,23,,-1\r\n23,n,23,,-1\r\n23,o,23,,-1\r\n23,p,23,,-1\r\n23,s,23,,-1\r\n23,t,23,,-1\r\n23,u,23,,-1\r\n23,v,23,,-1\r\n23,z,23,,-1\r\n24,%,8,,-1\r\n24,-,24,-,1\r\n24,a,24,a,1\r\n24,b,24,b,1\r\n24,d,24,d,1\r\n24,e,24,e,1\r\n24,f,24,f,1\r\n24,g,24,g,1\r\n24,h,24,h,1\r\n24,i,24,i,1\r\n24,k,24,k,1\r\n24,m,24,m,1\r\n24,n,24,n,1\r\n24,o,24,o,1\r\n24,p,24,p,1\r\n24,s,24,s,1\r\n24,t,24,t,1\r\n24,u,24,u,1\r\n24,v,24,v,1\r\n24,z,24,z,1\r\n25,a,26,a,1\r\n25,e,26,e,1\r\n25,i,26,i,1\r\n25,o,26,o,1\r\n25,u,26,u,1\r\n26,b,27,b,1\r\n26,d,27,d,1\r\n26,f,27,f,1\r\n26,g,27,g,1\r\n26,h,27,h,1\r\n26,k,27,k,1\r\n26,m,27,m,1\r\n26,n,27,n,1\r\n26,p,27,p,1\r\n26,s,27,s,1\r\n26,t,27,t,1\r\n26,v,27,v,1\r\n26,z,27,z,1\r\n27,-,28,-,1\r\n28,a,8,a,-1\r\n28,e,8,e,-1\r\n28,i,8,i,-1\r\n28,o,8,o,-1\r\n28,u,8,u,-1\r\n3,a,10,a,1\r\n3,b,4,b,1\r\n3,d,4,d,1\r\n3,e,10,e,1\r\n3,f,4,f,1\r\n3,g,4,g,1\r\n3,h,4,h,1\r\n3,i,10,i,1\r\n3,k,4,k,1\r\n3,m,4,m,1\r\n3,n,4,n,1\r\n3,o,10,o,1\r\n3,p,4,p,1\r\n3,s,4,s,1\r\n3,t,4,t,1\r\n3,u,10,u,1\r\n3,v,4,v,1\r\n3,z,4,z,1\r\n4,+,25,+,1\r\n4,-,21,-,1\r\n4,a,5,a,1\r\n4,e,5,e,1\r\n4,i,5,i,1\r\n4,o,5,o,1\r\n4,u,5,u,1\r\n5,b,6,b,1\r\n5,d,6,d,1\r\n5,f,6,f,1\r\n5,g,6,g,1\r\n5,h,6,h,1\r\n5,k,6,k,1\r\n5,m,6,m,1\r\n5,n,6,n,1\r\n5,p,6,p,1\r\n5,s,6,s,1\r\n5,t,6,t,1\r\n5,v,6,v,1\r\n5,z,6,z,1\r\n6,+,8,-a,-1\r\n6,-,7,-,1\r\n7,a,8,a,-1\r\n7,e,8,e,-1\r\n7,i,8,i,-1\r\n7,o,8,o,-1\r\n7,u,8,u,-1\r\n8,+,8,,-1\r\n8,-,8,,-1\r\n8,<,9,~,1\r\n8,a,8,,-1\r\n8,b,8,,-1\r\n8,d,8,,-1\r\n8,e,8,,-1\r\n8,f,8,,-1\r\n8,g,8,,-1\r\n8,h,8,,-1\r\n8,i,8,,-1\r\n8,k,8,,-1\r\n8,m,8,,-1\r\n8,n,8,,-1\r\n8,o,8,,-1\r\n8,p,8,,-1\r\n8,s,8,,-1\r\n8,t,8,,-1\r\n8,u,8,,-1\r\n8,v,8,,-1\r\n8,z,8,,-1\r\n9,%,1,,1\r\n9,+,9,+,1\r\n9,-,9,-,1\r\n9,a,9,a,1\r\n9,b,9,b,1\r\n9,d,9,d,1\r\n9,e,9,e,1\r\n9,f,9,f,1\r\n9,g,9,g,1\r\n9,h,9,h,1\r\n9,i,9,i,1\r\n9,k,9,k,1\r\n9,m,9,m,1\r\n9,n,9,n,1\r\n9,o,9,o,1\r\n9,p,9,p,1\r\n9,s,9,s,1\r\n9,t,9,t,1\r\n9,u,9,u,1\r\n9,v,9,v,1\r\n9,z,9,z,1\r\n');
 INSERT INTO `2-way FST` (`2-way FST ID`, `example data`, `description`, `FST diagram`, `language specific`, `FST recipe`, `FST code`) VALUES
 ('Initial CVCV - Makassarese morpheme integrity of up until two syllables else extra coded added', 'Data is complicated. Refer to the description.', 'There are two subpatterns.\r\n\r\n1) Pattern 1: If the input is bisyllabic, then the whole input is copied and this is a normal case of total reduplication. It looks like vowel sequences are treated as hetero-syllabic, e.g. redup(X)=X-X if X is bisyllabic\r\n\r\n| Input | Gloss | Output      | Gloss        |\r\n|-------|-------|-------------|--------------|\r\n| batu  | ?     | batu-batu   | \"small stones\" |\r\n| golla | ?     | golla-golla | \"sweets\"     |\r\n| bulaŋ | ?     | bulaŋ-bulaŋ | \"monthly\"    |\r\n| tau   | ?     | tau-tau     | \"person\"     |\r\n\r\n2) Pattern 2: If the input larger than bisyllabic, then the whole the first ( C )V( C )V sequence is copied. A segment [ʔ] is then inserted between the reduplicant and base, e.g. redup(X)=X\'-[ʔ]-X where X\' is the first ( C )V( C )V  sequences\r\n\r\n| Input    | Gloss | Output          | Gloss           |\r\n|----------|-------|-----------------|-----------------|\r\n| manara   | ?     | mana-ʔ-manara   | \"sort of tower\" |\r\n| balao    | ?     | bala-ʔ-balao    | \"toy rat\"       |\r\n| baine    | ?     | bai-ʔ-baine     | many women      |\r\n| baramban | ?     | bara-ʔ-baramban | \"sort of chest\" |', 'FST: Syllable boundaries will not be used because vowel count can do the job\r\n\r\n\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-6 output the first (C)V(C)V sequence\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n%state q6 handles case where base isnt bisyllabic\r\n\\node[state] (q6) [below of=q5] {$q_6$};\r\n%state q7-9 outs the base\r\n\\node[state] (q7) [left of=q6] {$q_7$};\r\n\\node[state] (q8) [left of=q7] {$q_8$};\r\n\\node[state,accepting] (q9) [left of=q8] {$q_9$};\r\n\\node[state] (q10) [below of=q6] {$q_{10}$};\r\n% 10 handles cases where base is bisyllabic\r\n\\path\r\n\r\n\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge node {(C,C,+1)} (q2)\r\n(q2) edge node {(V,V,+1)} (q3)\r\n(q3) edge node {(C,C,+1)} (q4)\r\n(q3) edge[bend left] node {(V,V,+1)} (q5)\r\n(q4) edge node {(V,V,+1)} (q5)\r\n(q5) edge node[left] {(C,$\\epsilon$,+1)} (q6)\r\n(q6) edge node {(V,\\textipa{P},+1)} (q7)\r\n\r\n(q7) edge[loop above] node {($\\Sigma$,$\\epsilon$,-1)} (q7)\r\n(q7) edge node {(\\#,$\\sim$,+1)} (q8)\r\n(q8) edge[loop above] node {($\\Sigma$,$\\sim$,+1)} (q8)\r\n(q8) edge node {(\\%,$\\epsilon$,+1)} (q9)\r\n\r\n(q5) edge[bend left] node {(\\%,$\\epsilon$,-1)} (q10)\r\n(q10) edge node {(C,C,-1)} (q7)\r\n\r\n;\r\n\\end{tikzpicture}\r\n', 1, '#Initial CVCV reduplication in Makassarese with morpheme integrity\r\n#In Makassarese, if the input is either CVC*CV or CVC*CVC, then the input is reduplicated\r\n#If the input starts with  CVC*CVCV, then the first CVC*CV is repeated and ʔ is added: CVC*CVCV-->CVC*CVʔ~CVC*CVCV\r\n#The function is not defined for any input which is anything other than CVC*CV or, CVC*CVC, \r\n#or which starts with anything other than  CVC*CVCV\r\n#e.g. pata --> pata~pata, patak --> patak~patak, pataka --> pataʔ~pataka, pat --> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = user\r\n\r\nalphabet =  [\'p\',\'b\',\'m\',\'t\',\'d\',\'n\',\'k\',\'g\',\'s\',\'z\',\'f\',\'v\',\'h\',\'ʔ\', \'a\',\'e\',\'i\',\'o\',\'u\']\r\nsubalphabets =2\r\nconsonants = [\'p\',\'b\',\'m\',\'t\',\'d\',\'n\',\'k\',\'g\',\'s\',\'z\',\'f\',\'v\',\'h\',\'ʔ\']\r\nvowels = [\'a\',\'e\',\'i\',\'o\',\'u\']\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first C\',\'output first CV\',\'output first CVC\',\'output first CVCV\',\'skip the C in CVCVC\',\'check whats after CVCVC\',\'return\',\'output final C in CVCVC\',\'output base\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'output first C\',\'\',1)\r\n(\'output first C\',\\consonants) = (\'output first CV\',\\ID,1)\r\n(\'output first CV\',\\vowels) = (\'output first CVC\',\\ID,1)\r\n(\'output first CVC\',\\consonants) = (\'output first CVCV\',\\ID,1)\r\n(\'output first CVC\',\\consonants) = (\'output first CVCV\',\\ID,1)\r\n(\'output first CVCV\',\\vowels) = (\'skip the C in CVCVC\',\\ID,1)\r\n(\'skip the C in CVCVC\',\\consonants) = (\'check whats after CVCVC\',\'\',1)\r\n(\'check whats after CVCVC\',\\vowels) = (\'return\',\'ʔ\',-1)\r\n(\'return\',\\alphabet) = (\'return\',\'\',-1)\r\n(\'return\',\'#\') = (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\',\'%\') = (\'end\',\'\',1)\r\n(\'skip the C in CVCVC\',\'%\') = (\'return\',\'\',-1)\r\n(\'check whats after CVCVC\',\'%\') = (\'output final C in CVCVC\',\'\',-1)\r\n(\'output final C in CVCVC\',\\consonants) = (\'return\',\\ID,-1)\r\n\r\n\r\n', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Initial CVCV reduplication in Makassarese with morpheme integrity\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	output first CV\r\n4	output first CVC\r\n5	output first CVCV\r\n6	skip the C in CVCVC\r\n7	check whats after CVCVC\r\n8	return\r\n9	output final C in CVCVC\r\n10	output base\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n10,%,1,,1\r\n10,a,10,a,1\r\n10,b,10,b,1\r\n10,d,10,d,1\r\n10,e,10,e,1\r\n10,f,10,f,1\r\n10,g,10,g,1\r\n10,h,10,h,1\r\n10,i,10,i,1\r\n10,k,10,k,1\r\n10,m,10,m,1\r\n10,n,10,n,1\r\n10,o,10,o,1\r\n10,p,10,p,1\r\n10,s,10,s,1\r\n10,t,10,t,1\r\n10,u,10,u,1\r\n10,v,10,v,1\r\n10,z,10,z,1\r\n10,ʔ,10,ʔ,1\r\n2,b,3,b,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,k,3,k,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,z,3,z,1\r\n2,ʔ,3,ʔ,1\r\n3,a,4,a,1\r\n3,e,4,e,1\r\n3,i,4,i,1\r\n3,o,4,o,1\r\n3,u,4,u,1\r\n4,b,5,b,1\r\n4,d,5,d,1\r\n4,f,5,f,1\r\n4,g,5,g,1\r\n4,h,5,h,1\r\n4,k,5,k,1\r\n4,m,5,m,1\r\n4,n,5,n,1\r\n4,p,5,p,1\r\n4,s,5,s,1\r\n4,t,5,t,1\r\n4,v,5,v,1\r\n4,z,5,z,1\r\n4,ʔ,5,ʔ,1\r\n5,a,6,a,1\r\n5,e,6,e,1\r\n5,i,6,i,1\r\n5,o,6,o,1\r\n5,u,6,u,1\r\n6,%,8,,-1\r\n6,b,7,,1\r\n6,d,7,,1\r\n6,f,7,,1\r\n6,g,7,,1\r\n6,h,7,,1\r\n6,k,7,,1\r\n6,m,7,,1\r\n6,n,7,,1\r\n6,p,7,,1\r\n6,s,7,,1\r\n6,t,7,,1\r\n6,v,7,,1\r\n6,z,7,,1\r\n6,ʔ,7,,1\r\n7,%,9,,-1\r\n7,a,8,ʔ,-1\r\n7,e,8,ʔ,-1\r\n7,i,8,ʔ,-1\r\n7,o,8,ʔ,-1\r\n7,u,8,ʔ,-1\r\n8,#,10,~,1\r\n8,a,8,,-1\r\n8,b,8,,-1\r\n8,d,8,,-1\r\n8,e,8,,-1\r\n8,f,8,,-1\r\n8,g,8,,-1\r\n8,h,8,,-1\r\n8,i,8,,-1\r\n8,k,8,,-1\r\n8,m,8,,-1\r\n8,n,8,,-1\r\n8,o,8,,-1\r\n8,p,8,,-1\r\n8,s,8,,-1\r\n8,t,8,,-1\r\n8,u,8,,-1\r\n8,v,8,,-1\r\n8,z,8,,-1\r\n8,ʔ,8,,-1\r\n9,b,8,b,-1\r\n9,d,8,d,-1\r\n9,f,8,f,-1\r\n9,g,8,g,-1\r\n9,h,8,h,-1\r\n9,k,8,k,-1\r\n9,m,8,m,-1\r\n9,n,8,n,-1\r\n9,p,8,p,-1\r\n9,s,8,s,-1\r\n9,t,8,t,-1\r\n9,v,8,v,-1\r\n9,z,8,z,-1\r\n9,ʔ,8,ʔ,-1\r\n'),
 ('Initial CVCV - medial codas are okay', '| Input     | Output          |\r\n|-----------|-----------------|\r\n| CVCV-X    | CVCV-CVCV-X     |\r\n| CVCCV-X   | CVCCV-CVCCV-X   |', 'Two allomorphs\r\nInput=#B-X$ where X is any string of symbols and B is CVCV or CVCC\\*V\r\nOutput=#B\\~B-X%\r\nThe word-initial CVCC\\*V string is repeated. Thus medial codas in the reduplicant are okay. I assume that inputs start with CVCC\\*V and there is no modification done on the reduplicant. ', '\\begin{tikzpicture}[->,>=stealth\',shorten >=1pt,auto,node distance=2.8cm,\r\nsemithick]\r\n\\tikzstyle{every state}=[fill=white,draw=black,text=black]\r\n\r\n\\node[initial,state] (q0)	{$q_0$};\r\n%state q1-3 outputs the first CVC once\r\n\\node[state] (q1) [right of=q0] {$q_1$};\r\n\\node[state] (q2) [right of=q1] {$q_2$};\r\n\\node[state] (q3) [right of=q2] {$q_3$};\r\n\\node[state] (q4) [right of=q3] {$q_4$};\r\n%states q3-q5 return to the beginning of input, output the base CVCX, and end\r\n\\node[state] (q5) [right of=q4] {$q_5$};\r\n\\node[state] (q6) [below of=q1] {$q_6$};\r\n\\node[state,accepting] (q7) [right of=q6] {$q_7$};\r\n\\node[state] (q8) [above of=q4] {$q_8$};\r\n\r\n\\path\r\n(q0) edge node {(\\#,$\\epsilon$,+1)} (q1)\r\n(q1) edge  node {(C,C,+1)} (q2)\r\n(q2) edge node {(V,V,+1)} (q3)\r\n(q3) edge node {(C,C,+1)} (q4)\r\n(q4) edge[loop above] node {(C,C,+1)} (q8)\r\n(q8) edge node {(V,V,-1)} (q5)\r\n(q4) edge node {(V,V,-1)} (q5)\r\n(q5) edge [loop right] node {($\\Sigma$,$\\epsilon$,-1)} (q5)\r\n(q5) edge node {(\\#,$\\sim$,+1)} (q6)\r\n(q6) edge [loop below] node[] {($\\Sigma$,$\\Sigma$,+1)} (q6)\r\n(q6) edge node[below] {(\\%,$\\epsilon$,+1)} (q7)\r\n\r\n;\r\n\\end{tikzpicture}', 0, '#Initial CVCV reduplication with retention of first syllable\'s coda\r\n#If the word starts with CVCV, then the CVCV is repeated\r\n#If the word starts with CVCCV, then the CVCCV is repeated\r\n#function is not defined for any input which doesnt start with CVCV or CVCCV\r\n#e.g. pataka --> pata~pataka, paftaka --> pafta~paftaka, ata --> undefined, spata--> undefined\r\n#alphabet type = char\r\n\r\nwhat type of alphabet will you use = keyboard ipa\r\n\r\nfunctions  = 0\r\n\r\n#states type = string\r\nstates = [\'start\',\'output first C\',\'output first CV\',\'output first CVC\',\'output first CVCC or CVCV\',\'output first CVCCV\',\'return\',\'output base\',\'end\']\r\ninitial states = [ \'start\' ] \r\ninitial value = \'\'\r\nfinal states = [ \'end\' ] \r\n\r\n(\'start\',\'#\') = (\'output first C\',\'\',1)\r\n(\'output first C\',\\consonants) = (\'output first CV\',\\ID,1)\r\n(\'output first CV\',\\vowels) = (\'output first CVC\',\\ID,1)\r\n(\'output first CVC\',\\consonants) = (\'output first CVCC or CVCV\',\\ID,1)\r\n(\'output first CVCC or CVCV\',\\consonants) = (\'output first CVCCV\',\\ID,1)\r\n(\'output first CVCC or CVCV\',\\vowels) = (\'return\',\\ID,-1)\r\n(\'output first CVCCV\',\\vowels) = (\'return\',\\ID,-1)\r\n(\'return\',\\alphabet) = (\'return\',\'\',-1)\r\n(\'return\',\'#\') = (\'output base\',\'~\',1)\r\n(\'output base\',\\alphabet) = (\'output base\',\\ID,1)\r\n(\'output base\',\'%\') = (\'end\',\'\',1)', '\"\"\"This is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n	Initial CVCV reduplication with retention of first syllable\'s coda\r\nThe states in our FST recipe were written as strings.\r\nThese get mapped to the following natural numbers:\r\n0	start\r\n1	end\r\n2	output first C\r\n3	output first CV\r\n4	output first CVC\r\n5	output first CVCC or CVCV\r\n6	output first CVCCV\r\n7	return\r\n8	output base\r\nThe initial states are:\r\n0	start\r\nThe final states are:\r\n1	end\r\n\r\n\"\"\"\r\n\r\n0,#,2,,1\r\n2,b,3,b,1\r\n2,c,3,c,1\r\n2,d,3,d,1\r\n2,f,3,f,1\r\n2,g,3,g,1\r\n2,h,3,h,1\r\n2,j,3,j,1\r\n2,k,3,k,1\r\n2,l,3,l,1\r\n2,m,3,m,1\r\n2,n,3,n,1\r\n2,p,3,p,1\r\n2,q,3,q,1\r\n2,r,3,r,1\r\n2,s,3,s,1\r\n2,t,3,t,1\r\n2,v,3,v,1\r\n2,w,3,w,1\r\n2,x,3,x,1\r\n2,z,3,z,1\r\n3,`a,4,`a,1\r\n3,`a:,4,`a:,1\r\n3,`e,4,`e,1\r\n3,`e:,4,`e:,1\r\n3,`i,4,`i,1\r\n3,`i:,4,`i:,1\r\n3,`o,4,`o,1\r\n3,`o:,4,`o:,1\r\n3,`u,4,`u,1\r\n3,`u:,4,`u:,1\r\n3,`y,4,`y,1\r\n3,`y:,4,`y:,1\r\n3,a,4,a,1\r\n3,a:,4,a:,1\r\n3,e,4,e,1\r\n3,e:,4,e:,1\r\n3,i,4,i,1\r\n3,i:,4,i:,1\r\n3,o,4,o,1\r\n3,o:,4,o:,1\r\n3,u,4,u,1\r\n3,u:,4,u:,1\r\n3,y,4,y,1\r\n3,y:,4,y:,1\r\n4,b,5,b,1\r\n4,c,5,c,1\r\n4,d,5,d,1\r\n4,f,5,f,1\r\n4,g,5,g,1\r\n4,h,5,h,1\r\n4,j,5,j,1\r\n4,k,5,k,1\r\n4,l,5,l,1\r\n4,m,5,m,1\r\n4,n,5,n,1\r\n4,p,5,p,1\r\n4,q,5,q,1\r\n4,r,5,r,1\r\n4,s,5,s,1\r\n4,t,5,t,1\r\n4,v,5,v,1\r\n4,w,5,w,1\r\n4,x,5,x,1\r\n4,z,5,z,1\r\n5,`a,7,`a,-1\r\n5,`a:,7,`a:,-1\r\n5,`e,7,`e,-1\r\n5,`e:,7,`e:,-1\r\n5,`i,7,`i,-1\r\n5,`i:,7,`i:,-1\r\n5,`o,7,`o,-1\r\n5,`o:,7,`o:,-1\r\n5,`u,7,`u,-1\r\n5,`u:,7,`u:,-1\r\n5,`y,7,`y,-1\r\n5,`y:,7,`y:,-1\r\n5,a,7,a,-1\r\n5,a:,7,a:,-1\r\n5,b,6,b,1\r\n5,c,6,c,1\r\n5,d,6,d,1\r\n5,e,7,e,-1\r\n5,e:,7,e:,-1\r\n5,f,6,f,1\r\n5,g,6,g,1\r\n5,h,6,h,1\r\n5,i,7,i,-1\r\n5,i:,7,i:,-1\r\n5,j,6,j,1\r\n5,k,6,k,1\r\n5,l,6,l,1\r\n5,m,6,m,1\r\n5,n,6,n,1\r\n5,o,7,o,-1\r\n5,o:,7,o:,-1\r\n5,p,6,p,1\r\n5,q,6,q,1\r\n5,r,6,r,1\r\n5,s,6,s,1\r\n5,t,6,t,1\r\n5,u,7,u,-1\r\n5,u:,7,u:,-1\r\n5,v,6,v,1\r\n5,w,6,w,1\r\n5,x,6,x,1\r\n5,y,7,y,-1\r\n5,y:,7,y:,-1\r\n5,z,6,z,1\r\n6,`a,7,`a,-1\r\n6,`a:,7,`a:,-1\r\n6,`e,7,`e,-1\r\n6,`e:,7,`e:,-1\r\n6,`i,7,`i,-1\r\n6,`i:,7,`i:,-1\r\n6,`o,7,`o,-1\r\n6,`o:,7,`o:,-1\r\n6,`u,7,`u,-1\r\n6,`u:,7,`u:,-1\r\n6,`y,7,`y,-1\r\n6,`y:,7,`y:,-1\r\n6,a,7,a,-1\r\n6,a:,7,a:,-1\r\n6,e,7,e,-1\r\n6,e:,7,e:,-1\r\n6,i,7,i,-1\r\n6,i:,7,i:,-1\r\n6,o,7,o,-1\r\n6,o:,7,o:,-1\r\n6,u,7,u,-1\r\n6,u:,7,u:,-1\r\n6,y,7,y,-1\r\n6,y:,7,y:,-1\r\n7,#,8,~,1\r\n7,+,7,,-1\r\n7,.,7,,-1\r\n7,`a,7,,-1\r\n7,`a:,7,,-1\r\n7,`e,7,,-1\r\n7,`e:,7,,-1\r\n7,`i,7,,-1\r\n7,`i:,7,,-1\r\n7,`o,7,,-1\r\n7,`o:,7,,-1\r\n7,`u,7,,-1\r\n7,`u:,7,,-1\r\n7,`y,7,,-1\r\n7,`y:,7,,-1\r\n7,a,7,,-1\r\n7,a:,7,,-1\r\n7,b,7,,-1\r\n7,c,7,,-1\r\n7,d,7,,-1\r\n7,e,7,,-1\r\n7,e:,7,,-1\r\n7,f,7,,-1\r\n7,g,7,,-1\r\n7,h,7,,-1\r\n7,i,7,,-1\r\n7,i:,7,,-1\r\n7,j,7,,-1\r\n7,k,7,,-1\r\n7,l,7,,-1\r\n7,m,7,,-1\r\n7,n,7,,-1\r\n7,o,7,,-1\r\n7,o:,7,,-1\r\n7,p,7,,-1\r\n7,q,7,,-1\r\n7,r,7,,-1\r\n7,s,7,,-1\r\n7,t,7,,-1\r\n7,u,7,,-1\r\n7,u:,7,,-1\r\n7,v,7,,-1\r\n7,w,7,,-1\r\n7,x,7,,-1\r\n7,y,7,,-1\r\n7,y:,7,,-1\r\n7,z,7,,-1\r\n8,%,1,,1\r\n8,+,8,+,1\r\n8,.,8,.,1\r\n8,`a,8,`a,1\r\n8,`a:,8,`a:,1\r\n8,`e,8,`e,1\r\n8,`e:,8,`e:,1\r\n8,`i,8,`i,1\r\n8,`i:,8,`i:,1\r\n8,`o,8,`o,1\r\n8,`o:,8,`o:,1\r\n8,`u,8,`u,1\r\n8,`u:,8,`u:,1\r\n8,`y,8,`y,1\r\n8,`y:,8,`y:,1\r\n8,a,8,a,1\r\n8,a:,8,a:,1\r\n8,b,8,b,1\r\n8,c,8,c,1\r\n8,d,8,d,1\r\n8,e,8,e,1\r\n8,e:,8,e:,1\r\n8,f,8,f,1\r\n8,g,8,g,1\r\n8,h,8,h,1\r\n8,i,8,i,1\r\n8,i:,8,i:,1\r\n8,j,8,j,1\r\n8,k,8,k,1\r\n8,l,8,l,1\r\n8,m,8,m,1\r\n8,n,8,n,1\r\n8,o,8,o,1\r\n8,o:,8,o:,1\r\n8,p,8,p,1\r\n8,q,8,q,1\r\n8,r,8,r,1\r\n8,s,8,s,1\r\n8,t,8,t,1\r\n8,u,8,u,1\r\n8,u:,8,u:,1\r\n8,v,8,v,1\r\n8,w,8,w,1\r\n8,x,8,x,1\r\n8,y,8,y,1\r\n8,y:,8,y:,1\r\n8,z,8,z,1\r\n'),
@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Benchmarks for the 2-way FST interpreter, run over the FST recipes stored in RedTyp.sql.
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import re
+import sys
+import io
+import json
+import argparse
+import time
+import tracemalloc
+
+import redtyp_db
+import two_way_sst
+import two_way_codegen
+import two_way_sweeping
+from two_way_interpreter import Reader, RecipeParser, RecipeError, RunError, interpreter_version
+
+def benchmark_parser(recipes,rounds=20):
+	"""Parses every recipe rounds times and returns how long it took, along with the recipes that couldn't be parsed
+	recipes is a list of (name, recipe text)"""
+	failed=[]
+	for name,text in recipes:
+		try:
+			RecipeParser().parse(text)
+		except RecipeError as error:
+			failed.append((name,error))
+	start=time.perf_counter()
+	for i in range(rounds):
+		for name,text in recipes:
+			try:
+				RecipeParser().parse(text)
+			except RecipeError:
+				pass
+	return time.perf_counter()-start,failed
+
+def same_output(output,expected):
+	"""The example data writes the boundary between the reduplicant and the base as - while most recipes output ~,
+	and sometimes puts spaces between segments, so outputs are compared ignoring both"""
+	return re.sub(r'\s','',output).replace('~','-')==re.sub(r'\s','',expected).replace('~','-')
+
+def benchmark_fst(catalog,fst_id,rounds=100):
+	"""Compiles one 2-way FST of the catalog and runs it on its examples, see Catalog.examples
+	Returns a dict with the result of every example, whether it passed, the compile time, the average number of steps per input,
+	and the number of inputs per second over rounds runs of all the examples
+	The best of 3 timings is kept, since the slower ones are mostly the computer doing something else"""
+	row=catalog.fst(fst_id)
+	examples=catalog.examples(fst_id)
+	result={'examples':len(examples)}
+	best=None
+	for repeat in range(3):
+		start=time.perf_counter()
+		try:
+			reader=Reader.from_recipe(row['FST recipe'])
+		except RecipeError as error:
+			result['recipe_error']=str(error)
+			return result
+		seconds=time.perf_counter()-start
+		if best is None or seconds<best:
+			best=seconds
+	result['compile_seconds']=best
+
+	machine=reader.machine
+	results=[]
+	passed=0
+	for source,input_string,expected in examples:
+		output=reader.transduce(input_string)
+		if isinstance(output,RunError):
+			ok=False
+			error=output.reason
+		else:
+			ok=same_output(output,expected)
+			error=None
+		passed=passed+ok
+		results.append({'source':source,'input':input_string,'expected':expected,'output':str(output),'error':error,'passed':ok})
+	result['passed']=passed
+	result['results']=results
+
+	if len(examples)>0:
+		inputs=[example[1] for example in examples]
+		machine.step_count=0
+		for input_string in inputs:
+			reader.transduce(input_string)
+		result['steps_per_input']=machine.step_count/float(len(inputs))
+		best=None
+		for repeat in range(3):
+			start=time.perf_counter()
+			for i in range(rounds):
+				for input_string in inputs:
+					reader.transduce(input_string)
+			seconds=time.perf_counter()-start
+			if best is None or seconds<best:
+				best=seconds
+		result['words_per_second']=rounds*len(inputs)/best
+	return result
+
+def benchmark_examples(catalog,rounds=100):
+	"""Runs benchmark_fst on every 2-way FST of the catalog, and returns all the results as a dict that can be written as json"""
+	fst_ids=[row['2-way FST ID'] for row in catalog.query('SELECT "2-way FST ID" FROM "2-way FST" ORDER BY "2-way FST ID"')]
+	report={'interpreter':interpreter_version(),'rounds':rounds,'fsts':{}}
+	for fst_id in fst_ids:
+		report['fsts'][fst_id]=benchmark_fst(catalog,fst_id,rounds)
+	fsts=list(report['fsts'].values())
+	report['summary']={
+		'fsts':len(fsts),
+		'recipe_errors':len([fst for fst in fsts if 'recipe_error' in fst]),
+		'examples':sum([fst['examples'] for fst in fsts]),
+		'passed':sum([fst.get('passed',0) for fst in fsts]),
+		'compile_seconds':sum([fst.get('compile_seconds',0) for fst in fsts]),
+	}
+	return report
+
+def best_time(function,repeats=3):
+	"""Returns the best of repeats timings of function()"""
+	best=None
+	for repeat in range(repeats):
+		start=time.perf_counter()
+		function()
+		seconds=time.perf_counter()-start
+		if best is None or seconds<best:
+			best=seconds
+	return best
+
+def benchmark_sst(catalog,fst_id,rounds=100):
+	"""Compiles one 2-way FST of the catalog into a streaming string transducer, see two_way_sst.py, and runs both on its examples
+	Returns a dict with the inputs where they disagree, the words per second of each, the number of states and registers the SST built, and whether its updates are copyless"""
+	row=catalog.fst(fst_id)
+	inputs=[example[1] for example in catalog.examples(fst_id)]
+	result={'examples':len(inputs)}
+	try:
+		reader=Reader.from_recipe(row['FST recipe'])
+	except RecipeError as error:
+		result['recipe_error']=str(error)
+		return result
+	sst=two_way_sst.StreamingTransducer(reader.machine)
+	result['disagreements']=[input_string for input_string,expected,output in two_way_sst.compare_runs(reader,sst,inputs)]
+	result['sst_states']=len(sst.behaviours)
+	result['registers']=sst.registers
+	result['copyless']=sst.copyless
+	if len(inputs)>0:
+		def run(transduce):
+			for i in range(rounds):
+				for input_string in inputs:
+					transduce(input_string)
+		result['fst_words_per_second']=rounds*len(inputs)/best_time(lambda: run(reader.transduce))
+		result['sst_words_per_second']=rounds*len(inputs)/best_time(lambda: run(sst.transduce))
+	return result
+
+def benchmark_codegen(catalog,fst_id,rounds=100):
+	"""Compiles one 2-way FST of the catalog, generates Python code for it, see two_way_codegen.py, and runs both on its examples
+	Returns a dict with the inputs where their outputs or errors differ, the words per second of each, and the number of lines of generated code"""
+	row=catalog.fst(fst_id)
+	inputs=[example[1] for example in catalog.examples(fst_id)]
+	result={'examples':len(inputs)}
+	try:
+		reader=Reader.from_recipe(row['FST recipe'])
+	except RecipeError as error:
+		result['recipe_error']=str(error)
+		return result
+	machine=reader.machine
+	generated=two_way_codegen.GeneratedMachine.from_machine(machine)
+	result['lines']=len(generated.generated_source.splitlines())
+	result['disagreements']=[]
+	for input_string in inputs:
+		output=machine.transduce(input_string)
+		generated_output=generated.transduce(input_string)
+		if output!=generated_output or getattr(output,'reason',None)!=getattr(generated_output,'reason',None):
+			result['disagreements'].append(input_string)
+	if len(inputs)>0:
+		def run(transduce):
+			for i in range(rounds):
+				for input_string in inputs:
+					transduce(input_string)
+		result['fst_words_per_second']=rounds*len(inputs)/best_time(lambda: run(machine.transduce))
+		result['generated_words_per_second']=rounds*len(inputs)/best_time(lambda: run(generated.transduce))
+	return result
+
+def benchmark_sweeping(catalog,fst_id,rounds=100):
+	"""Compiles one 2-way FST of the catalog, finds how many times its reading head can turn around, see two_way_sweeping.py,
+	and if that's bounded runs it both in passes and step by step on its examples
+	Returns a dict with the kind of 2-way FST and its bound of reversals, and if it's bounded the inputs where the outputs or errors differ and the words per second of each"""
+	row=catalog.fst(fst_id)
+	inputs=[example[1] for example in catalog.examples(fst_id)]
+	result={'examples':len(inputs)}
+	try:
+		reader=Reader.from_recipe(row['FST recipe'])
+	except RecipeError as error:
+		result['recipe_error']=str(error)
+		return result
+	machine=reader.machine
+	result['kind'],result['reversals']=two_way_sweeping.classify(machine)
+	sweeping=two_way_sweeping.SweepingMachine.from_machine(machine)
+	if sweeping is None:
+		return result
+	result['disagreements']=[]
+	for input_string in inputs:
+		output=machine.transduce(input_string)
+		sweeping_output=sweeping.transduce(input_string)
+		if output!=sweeping_output or getattr(output,'reason',None)!=getattr(sweeping_output,'reason',None):
+			result['disagreements'].append(input_string)
+	if len(inputs)>0:
+		def run(transduce):
+			for i in range(rounds):
+				for input_string in inputs:
+					transduce(input_string)
+		result['fst_words_per_second']=rounds*len(inputs)/best_time(lambda: run(machine.transduce))
+		result['sweeping_words_per_second']=rounds*len(inputs)/best_time(lambda: run(sweeping.transduce))
+	return result
+
+def benchmark_memory(catalog):
+	"""Compiles every 2-way FST of the catalog and measures how much memory each one takes before and after Reader.compact, see memory_report,
+	and how much the whole process allocated for all of them, with tracemalloc
+	Returns a dict with the reports of the 2-way FSTs by ID, the ones whose outputs or errors changed after compacting, and the bytes allocated in total"""
+	tracemalloc.start()
+	start=tracemalloc.get_traced_memory()[0]
+	readers={}
+	result={'fsts':{},'disagreements':[]}
+	for fst_id in catalog.fst_ids():
+		try:
+			readers[fst_id]=Reader.from_recipe(catalog.fst(fst_id)['FST recipe'])
+		except RecipeError:
+			continue
+		result['fsts'][fst_id]={'before':readers[fst_id].memory_report()}
+	result['loaded_bytes']=tracemalloc.get_traced_memory()[0]-start
+	for fst_id,reader in readers.items():
+		inputs=[example[1] for example in catalog.examples(fst_id)]
+		outputs=[reader.transduce(input_string) for input_string in inputs]
+		reader.compact()
+		for input_string,output in zip(inputs,outputs):
+			compact_output=reader.transduce(input_string)
+			if output!=compact_output or getattr(output,'reason',None)!=getattr(compact_output,'reason',None):
+				result['disagreements'].append((fst_id,input_string))
+		result['fsts'][fst_id]['after']=reader.memory_report()
+	result['compact_bytes']=tracemalloc.get_traced_memory()[0]-start
+	tracemalloc.stop()
+	return result
+
+def compare_reports(old,new,tolerance=0.2):
+	"""Compares two reports made by benchmark_examples and returns a list of lines describing what got worse:
+	examples whose output changed, examples that stopped passing, and 2-way FSTs which compile or run more than tolerance slower"""
+	lines=[]
+	for fst_id,new_fst in sorted(new['fsts'].items()):
+		old_fst=old['fsts'].get(fst_id)
+		if old_fst is None:
+			continue
+		if 'recipe_error' in new_fst and 'recipe_error' not in old_fst:
+			lines.append("%s: the recipe can't be compiled anymore" % fst_id)
+			continue
+		old_results=dict([((result['source'],result['input'],result['expected']),result) for result in old_fst.get('results',[])])
+		for result in new_fst.get('results',[]):
+			old_result=old_results.get((result['source'],result['input'],result['expected']))
+			if old_result is None:
+				continue
+			if old_result['output']!=result['output']:
+				lines.append("%s: the output of %s changed from %s to %s" % (fst_id,result['input'],old_result['output'],result['output']))
+			elif old_result['passed'] and not result['passed']:
+				lines.append("%s: %s doesn't pass anymore" % (fst_id,result['input']))
+		if 'words_per_second' in old_fst and 'words_per_second' in new_fst:
+			if new_fst['words_per_second']<old_fst['words_per_second']*(1-tolerance):
+				lines.append("%s: %.0f words per second, down from %.0f" % (fst_id,new_fst['words_per_second'],old_fst['words_per_second']))
+		if 'compile_seconds' in old_fst and 'compile_seconds' in new_fst:
+			if new_fst['compile_seconds']>old_fst['compile_seconds']*(1+tolerance) and new_fst['compile_seconds']-old_fst['compile_seconds']>0.001:
+				lines.append("%s: compiles in %.4f seconds, up from %.4f" % (fst_id,new_fst['compile_seconds'],old_fst['compile_seconds']))
+	return lines
+
+def main_parse(args):
+	tables=redtyp_db.read_dump(args.database)
+	recipes=[(row['2-way FST ID'],row['FST recipe']) for row in tables['2-way FST']]
+	lineCount=sum([len(text.splitlines()) for name,text in recipes])
+	seconds,failed=benchmark_parser(recipes,args.rounds)
+
+	print("parsed %d recipes (%d lines) %d times in %.3f seconds" % (len(recipes),lineCount,args.rounds,seconds))
+	print("%.1f recipes per second, %.1f lines per second" % (len(recipes)*args.rounds/seconds,lineCount*args.rounds/seconds))
+	for name,error in failed:
+		print("the recipe %s can't be parsed, its first error is %s" % (name,str(error).splitlines()[0]))
+
+def main_examples(args):
+	catalog=redtyp_db.Catalog(args.database)
+	report=benchmark_examples(catalog,args.rounds)
+	f=io.open(args.output,'w',encoding='utf-8')
+	f.write(json.dumps(report,ensure_ascii=False,indent=1,sort_keys=True))
+	f.close()
+
+	for fst_id,fst in sorted(report['fsts'].items()):
+		if 'recipe_error' in fst:
+			print("%s\tcan't be compiled" % fst_id)
+		elif fst['examples']>0:
+			print("%s\t%d/%d passed\t%.2f steps per input\t%.0f words per second" % (fst_id,fst['passed'],fst['examples'],fst['steps_per_input'],fst['words_per_second']))
+		else:
+			print("%s\tno examples" % fst_id)
+	summary=report['summary']
+	print("%d of %d examples passed over %d 2-way FSTs, the results are in %s" % (summary['passed'],summary['examples'],summary['fsts'],args.output))
+
+	if args.compare is not None:
+		f=io.open(args.compare,'r',encoding='utf-8')
+		old=json.load(f)
+		f.close()
+		lines=compare_reports(old,report,args.tolerance)
+		for line in lines:
+			print(line)
+		if len(lines)>0:
+			sys.exit(1)
+		print("nothing got worse since %s" % args.compare)
+
+def main_sst(args):
+	catalog=redtyp_db.Catalog(args.database)
+	disagreements=0
+	for fst_id in catalog.fst_ids():
+		fst=benchmark_sst(catalog,fst_id,args.rounds)
+		if 'recipe_error' in fst:
+			print("%s\tcan't be compiled" % fst_id)
+			continue
+		disagreements=disagreements+len(fst['disagreements'])
+		line="%s\t%d SST states\t%d registers\t%s" % (fst_id,fst['sst_states'],fst['registers'],'copyless' if fst['copyless'] else 'copying')
+		if fst['examples']>0:
+			line=line+"\t%.0f words per second as a 2-way FST, %.0f as an SST" % (fst['fst_words_per_second'],fst['sst_words_per_second'])
+		print(line)
+		for input_string in fst['disagreements']:
+			print("%s: the SST disagrees with the 2-way FST on %s" % (fst_id,input_string))
+	if disagreements>0:
+		sys.exit(1)
+
+def main_codegen(args):
+	catalog=redtyp_db.Catalog(args.database)
+	disagreements=0
+	total={'words':0,'fst_seconds':0.0,'generated_seconds':0.0}
+	for fst_id in catalog.fst_ids():
+		fst=benchmark_codegen(catalog,fst_id,args.rounds)
+		if 'recipe_error' in fst:
+			print("%s\tcan't be compiled" % fst_id)
+			continue
+		disagreements=disagreements+len(fst['disagreements'])
+		line="%s\t%d lines of generated code" % (fst_id,fst['lines'])
+		if fst['examples']>0:
+			line=line+"\t%.0f words per second as a 2-way FST, %.0f with the generated code" % (fst['fst_words_per_second'],fst['generated_words_per_second'])
+			words=args.rounds*fst['examples']
+			total['words']=total['words']+words
+			total['fst_seconds']=total['fst_seconds']+words/fst['fst_words_per_second']
+			total['generated_seconds']=total['generated_seconds']+words/fst['generated_words_per_second']
+		print(line)
+		for input_string in fst['disagreements']:
+			print("%s: the generated code disagrees with the 2-way FST on %s" % (fst_id,input_string))
+	if total['words']>0:
+		print("over all the examples: %.0f words per second as 2-way FSTs, %.0f with the generated code" % (total['words']/total['fst_seconds'],total['words']/total['generated_seconds']))
+	if disagreements>0:
+		sys.exit(1)
+
+def main_sweeping(args):
+	catalog=redtyp_db.Catalog(args.database)
+	disagreements=0
+	kinds={}
+	for fst_id in catalog.fst_ids():
+		fst=benchmark_sweeping(catalog,fst_id,args.rounds)
+		if 'recipe_error' in fst:
+			print("%s\tcan't be compiled" % fst_id)
+			continue
+		kinds[fst['kind']]=kinds.get(fst['kind'],0)+1
+		if fst['kind']=='general':
+			print("%s\tgeneral, the reading head can turn around any number of times" % fst_id)
+			continue
+		line="%s\t%s, at most %d reversals" % (fst_id,fst['kind'],fst['reversals'])
+		if fst['examples']>0:
+			line=line+"\t%.0f words per second step by step, %.0f in passes" % (fst['fst_words_per_second'],fst['sweeping_words_per_second'])
+		print(line)
+		disagreements=disagreements+len(fst['disagreements'])
+		for input_string in fst['disagreements']:
+			print("%s: the passes disagree with the 2-way FST on %s" % (fst_id,input_string))
+	print(', '.join(["%d %s" % (count,kind) for kind,count in sorted(kinds.items())]))
+	if disagreements>0:
+		sys.exit(1)
+
+def main_memory(args):
+	catalog=redtyp_db.Catalog(args.database)
+	result=benchmark_memory(catalog)
+	total={'before':0,'after':0}
+	for fst_id,fst in result['fsts'].items():
+		line="%s\t%d bytes, %d after compacting" % (fst_id,fst['before']['total'],fst['after']['total'])
+		parts=[(size,part) for part,size in fst['after'].items() if part not in ['total','shared']]
+		line=line+" (%s)" % ', '.join(["%s %d" % (part,size) for size,part in sorted(parts,reverse=True)])
+		print(line)
+		total['before']=total['before']+fst['before']['total']
+		total['after']=total['after']+fst['after']['total']
+	print("%d 2-way FSTs: %d bytes, %d after compacting, %.0f bytes each" % (len(result['fsts']),total['before'],total['after'],total['after']/max(len(result['fsts']),1)))
+	print("allocated by the process: %d bytes once loaded, %d after compacting, with the shared alphabets and tokenizers" % (result['loaded_bytes'],result['compact_bytes']))
+	for fst_id,input_string in result['disagreements']:
+		print("%s: the compacted 2-way FST disagrees on %s" % (fst_id,input_string))
+	if len(result['disagreements'])>0:
+		sys.exit(1)
+
+def main():
+	parser=argparse.ArgumentParser(description="Benchmarks the 2-way FST interpreter on the FST recipes in the RedTyp database")
+	parser.add_argument('--database',default='RedTyp.sql',help="the SQL dump of the RedTyp database (default: RedTyp.sql)")
+	commands=parser.add_subparsers(dest='command')
+	commands.required=True
+
+	parse=commands.add_parser('parse',help="measure how fast the FST recipes are parsed")
+	parse.add_argument('--rounds',type=int,default=20,help="how many times every recipe is parsed (default: 20)")
+	parse.set_defaults(main=main_parse)
+
+	examples=commands.add_parser('examples',help="run every 2-way FST on the example data of the database and measure it")
+	examples.add_argument('--output',default='benchmark.json',help="the json file the results are written on (default: benchmark.json)")
+	examples.add_argument('--rounds',type=int,default=100,help="how many times the examples are run to measure the speed (default: 100)")
+	examples.add_argument('--compare',default=None,metavar='OLD_JSON',help="report the outputs that changed and the 2-way FSTs that got slower since these results")
+	examples.add_argument('--tolerance',type=float,default=0.2,help="how much slower a 2-way FST can get before it's reported (default: 0.2)")
+	examples.set_defaults(main=main_examples)
+
+	sst=commands.add_parser('sst',help="check that the streaming string transducer of every 2-way FST gives the same outputs on the example data, and compare their speed")
+	sst.add_argument('--rounds',type=int,default=100,help="how many times the examples are run to measure the speed (default: 100)")
+	sst.set_defaults(main=main_sst)
+
+	codegen=commands.add_parser('codegen',help="check that the Python code generated for every 2-way FST gives the same outputs and errors on the example data, and compare their speed")
+	codegen.add_argument('--rounds',type=int,default=100,help="how many times the examples are run to measure the speed (default: 100)")
+	codegen.set_defaults(main=main_codegen)
+
+	sweeping=commands.add_parser('sweeping',help="find the 2-way FSTs whose reading head turns around a bounded number of times, check that running them in passes gives the same outputs and errors on the example data, and compare their speed")
+	sweeping.add_argument('--rounds',type=int,default=100,help="how many times the examples are run to measure the speed (default: 100)")
+	sweeping.set_defaults(main=main_sweeping)
+
+	memory=commands.add_parser('memory',help="measure how much memory every 2-way FST of the database takes, before and after compacting, and check that compacting doesn't change the outputs on the example data")
+	memory.set_defaults(main=main_memory)
+
+	args=parser.parse_args()
+	args.main(args)
+
+if __name__ == "__main__":
+	main()
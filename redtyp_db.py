@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Reads the RedTyp database from the SQL dump RedTyp.sql, without needing a database server.
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import re
+import io
+import sys
+import hashlib
+import sqlite3
+import argparse
+
+from two_way_interpreter import Reader, RecipeError
+
+"""The dump is made by phpMyAdmin, every row of a table is inside an INSERT statement of the form
+INSERT INTO `table` (`column`, `column`) VALUES
+('a string', 1),
+('another string', 0);"""
+insertRegex=re.compile(r"INSERT INTO `([^`]+)` \(([^)]*)\) VALUES")
+columnRegex=re.compile(r"`([^`]+)`")
+sqlEscapes={'n':'\n','r':'\r','t':'\t','0':'\0','Z':'\x1a','b':'\b'}
+
+def read_sql_string(dump,i):
+	"""Given the index i of the opening quote of a string in the dump, returns the string and the index right after its closing quote
+	Inside the string, a quote is written as \\' or as '' and the other special characters are escaped with a backslash"""
+	pieces=[]
+	i=i+1
+	start=i
+	while True:
+		c=dump[i]
+		if c=='\\':
+			pieces.append(dump[start:i])
+			pieces.append(sqlEscapes.get(dump[i+1],dump[i+1]))
+			i=i+2
+			start=i
+		elif c=="'":
+			pieces.append(dump[start:i])
+			if dump[i+1]=="'":
+				pieces.append("'")
+				i=i+2
+				start=i
+			else:
+				return ''.join(pieces),i+1
+		else:
+			i=i+1
+
+def read_sql_rows(dump,i):
+	"""Given the index i right after the VALUES of an INSERT statement, returns the list of rows it inserts and the index right after the ;
+	Each row is a list of strings, integers or None for NULL"""
+	rows=[]
+	while True:
+		while dump[i] in ' \r\n\t,':
+			i=i+1
+		if dump[i]==';':
+			return rows,i+1
+		if dump[i]!='(':
+			raise ValueError("the SQL dump has a row that doesnt start with ( at character %d" % i)
+		i=i+1
+		row=[]
+		while True:
+			while dump[i]==' ':
+				i=i+1
+			if dump[i]=="'":
+				value,i=read_sql_string(dump,i)
+			else:
+				end=i
+				while dump[end] not in ',)':
+					end=end+1
+				value=dump[i:end].strip()
+				i=end
+				if value=='NULL':
+					value=None
+				else:
+					value=int(value)
+			row.append(value)
+			while dump[i]==' ':
+				i=i+1
+			if dump[i]==')':
+				i=i+1
+				break
+			i=i+1#skip the comma
+		rows.append(row)
+
+def read_dump(dump_file='RedTyp.sql'):
+	"""Returns the tables of the SQL dump as a dict {table name: list of rows}, where each row is a dict {column name: value}
+	The tables are '2-way FST', 'matches' and 'morphemes' """
+	f=io.open(dump_file,'r',encoding='utf-8')
+	dump=f.read()
+	f.close()
+	tables={}
+	for insert in insertRegex.finditer(dump):
+		columns=columnRegex.findall(insert.group(2))
+		rows,end=read_sql_rows(dump,insert.end())
+		table=tables.setdefault(insert.group(1),[])
+		for row in rows:
+			table.append(dict(zip(columns,row)))
+	return tables
+
+def example_pairs(example_data):
+	"""Returns the list of (input, output) pairs in the markdown table of an 'example data' column, e.g.
+	| Input | Gloss | Output    | Gloss  |
+	|-------|-------|-----------|--------|
+	| pata  | ...   | pa-pata   | ...    |
+	Every Input column is paired with the first Output column after it, and the other columns like Gloss or Intermediate are ignored
+	Empty cells, and rows that repeat the header or the |---| line, are skipped. Markdown writes ~ as \\~ so that's undone"""
+	if example_data is None:
+		return []
+	rows=[]
+	for line in example_data.splitlines():
+		line=line.strip()
+		if len(line)>0 and line[0]=='|':
+			rows.append([cell.strip().replace('\\~','~') for cell in line.strip('|').split('|')])
+	if len(rows)==0:
+		return []
+	header=[cell.lower() for cell in rows[0]]
+	columns=[]
+	for i in range(len(header)):
+		if header[i].startswith('input'):
+			for j in range(i+1,len(header)):
+				if header[j].startswith('output'):
+					columns.append((i,j))
+					break
+	pairs=[]
+	for row in rows[1:]:
+		if [cell.lower() for cell in row]==header or len(''.join(row).strip('-: '))==0:
+			continue
+		for i,j in columns:
+			if j<len(row) and len(row[i])>0 and len(row[j])>0:
+				pairs.append((row[i],row[j]))
+	return pairs
+
+"""The catalog keeps the tables of the dump in SQLite, so the database can be searched without a database server
+The columns used to look things up are compared like MySQL does: ignoring case and trailing whitespace,
+so their values are stored without trailing whitespace and with COLLATE NOCASE"""
+catalogTables=['2-way FST','morphemes','matches']
+catalogKeys=['2-way FST ID','morpheme ID','language','function','default form name']
+catalogIndexes=[('2-way FST',['2-way FST ID']),('morphemes',['morpheme ID']),('morphemes',['language']),('morphemes',['function']),('morphemes',['default form name']),('matches',['morpheme ID']),('matches',['2-way FST ID'])]
+
+def dump_version(dump_file):
+	"""Returns a hash of the SQL dump, the catalog is rebuilt whenever it changes"""
+	f=io.open(dump_file,'rb')
+	version=hashlib.sha256(f.read()).hexdigest()
+	f.close()
+	return version
+
+def build_catalog(connection,tables,version):
+	"""Fills an empty SQLite database with the tables read by read_dump, and indexes the columns used to look things up"""
+	for table in catalogTables:
+		columns=list(tables[table][0].keys())
+		definitions=[]
+		for column in columns:
+			if column in catalogKeys:
+				definitions.append('"%s" TEXT COLLATE NOCASE' % column)
+			else:
+				definitions.append('"%s"' % column)
+		connection.execute('CREATE TABLE "%s" (%s)' % (table,', '.join(definitions)))
+		rows=[]
+		for row in tables[table]:
+			rows.append([row[column].rstrip() if column in catalogKeys else row[column] for column in columns])
+		connection.executemany('INSERT INTO "%s" VALUES (%s)' % (table,', '.join(['?']*len(columns))),rows)
+	for table,columns in catalogIndexes:
+		name='%s by %s' % (table,', '.join(columns))
+		connection.execute('CREATE INDEX "%s" ON "%s" (%s)' % (name,table,', '.join(['"%s"' % column for column in columns])))
+	connection.execute('CREATE TABLE "catalog version" ("dump version" TEXT)')
+	connection.execute('INSERT INTO "catalog version" VALUES (?)',(version,))
+	connection.commit()
+
+class Catalog:
+	"""The RedTyp database as a local SQLite catalog built from the SQL dump
+	The morphemes and the 2-way FSTs that model them can be looked up by morpheme ID, language, function or default form name,
+	and machine gives back a ready to run Reader for a 2-way FST, which is only compiled the first time it's asked for
+	If catalog_file is given, the catalog is kept in that file and only rebuilt when the dump changes, otherwise it's kept in memory
+	max_steps, cache_size and compiled_cache_dir are passed on to the Readers, see Reader"""
+	
+	def __init__(self,dump_file='RedTyp.sql',catalog_file=None,max_steps=None,cache_size=None,compiled_cache_dir=None):
+		self.max_steps=max_steps
+		self.cache_size=cache_size
+		self.compiled_cache_dir=compiled_cache_dir
+		self.readers={}
+		version=dump_version(dump_file)
+		if catalog_file is None:
+			catalog_file=':memory:'
+		self.connection=sqlite3.connect(catalog_file)
+		self.connection.row_factory=sqlite3.Row
+		try:
+			built=self.connection.execute('SELECT "dump version" FROM "catalog version"').fetchone()[0]==version
+		except sqlite3.Error:
+			built=False
+		if not built:
+			for table in catalogTables+['catalog version']:
+				self.connection.execute('DROP TABLE IF EXISTS "%s"' % table)
+			build_catalog(self.connection,read_dump(dump_file),version)
+	
+	def close(self):
+		self.connection.close()
+	
+	def query(self,sql,parameters=()):
+		return [dict(row) for row in self.connection.execute(sql,parameters)]
+	
+	def morpheme_filter(self,morpheme_id=None,language=None,function=None,default_form_name=None):
+		"""Returns the WHERE conditions and parameters that pick out the morphemes with the given values, None means any value"""
+		conditions=[]
+		parameters=[]
+		for column,value in [('morpheme ID',morpheme_id),('language',language),('function',function),('default form name',default_form_name)]:
+			if value is not None:
+				conditions.append('morphemes."%s" = ?' % column)
+				parameters.append(value.rstrip())
+		if len(conditions)==0:
+			conditions.append('1')
+		return ' AND '.join(conditions),parameters
+	
+	def morphemes(self,morpheme_id=None,language=None,function=None,default_form_name=None):
+		"""Returns the rows of the morphemes table as dicts, e.g. morphemes(language='Agta')"""
+		conditions,parameters=self.morpheme_filter(morpheme_id,language,function,default_form_name)
+		return self.query('SELECT * FROM morphemes WHERE %s ORDER BY morphemes."morpheme ID"' % conditions,parameters)
+	
+	def fst_ids(self,morpheme_id=None,language=None,function=None,default_form_name=None):
+		"""Returns the IDs of the 2-way FSTs that model the morphemes with the given values"""
+		conditions,parameters=self.morpheme_filter(morpheme_id,language,function,default_form_name)
+		rows=self.query('SELECT DISTINCT matches."2-way FST ID" AS id FROM morphemes JOIN matches ON matches."morpheme ID" = morphemes."morpheme ID" WHERE %s ORDER BY id' % conditions,parameters)
+		return [row['id'] for row in rows]
+	
+	def fst(self,fst_id):
+		"""Returns the row of the 2-way FST table with this ID as a dict, or None if there isn't one"""
+		rows=self.query('SELECT * FROM "2-way FST" WHERE "2-way FST ID" = ?',(fst_id.rstrip(),))
+		if len(rows)==0:
+			return None
+		return rows[0]
+	
+	def examples(self,fst_id):
+		"""Returns the examples that a 2-way FST should get right as a list of (source, input, output),
+		taken from its own 'example data' and from the 'example data' of every morpheme it's matched to
+		The source is '2-way FST' or the morpheme ID"""
+		row=self.fst(fst_id)
+		if row is None:
+			raise KeyError(fst_id)
+		examples=[('2-way FST',input_string,output_string) for input_string,output_string in example_pairs(row['example data'])]
+		for morpheme in self.query('SELECT morphemes."morpheme ID", morphemes."example data" FROM morphemes JOIN matches ON matches."morpheme ID" = morphemes."morpheme ID" WHERE matches."2-way FST ID" = ? ORDER BY morphemes."morpheme ID"',(row['2-way FST ID'],)):
+			for input_string,output_string in example_pairs(morpheme['example data']):
+				examples.append((morpheme['morpheme ID'],input_string,output_string))
+		return examples
+	
+	def machine(self,fst_id):
+		"""Returns a Reader for the 2-way FST with this ID, it's compiled the first time and then kept
+		Raises a KeyError if there's no such 2-way FST and a RecipeError if its recipe has mistakes"""
+		row=self.fst(fst_id)
+		if row is None:
+			raise KeyError(fst_id)
+		fst_id=row['2-way FST ID']
+		if fst_id not in self.readers:
+			self.readers[fst_id]=Reader.from_database_row(row,self.max_steps,self.cache_size,self.compiled_cache_dir)
+		return self.readers[fst_id]
+	
+	def machines(self,morpheme_id=None,language=None,function=None,default_form_name=None):
+		"""Returns a list of (2-way FST ID, Reader) for the 2-way FSTs that model the morphemes with the given values,
+		e.g. machines(language='Agta',function='diminutive',default_form_name='Initial C')"""
+		return [(fst_id,self.machine(fst_id)) for fst_id in self.fst_ids(morpheme_id,language,function,default_form_name)]
+
+def main():
+	parser=argparse.ArgumentParser(description="Looks up morphemes and their 2-way FSTs in the RedTyp database, and runs the 2-way FST that's found on a file of input strings")
+	parser.add_argument('input_strings',nargs='?',default=None,help="the file of input strings, one per line, or - for stdin. Without it the matching morphemes and 2-way FSTs are listed")
+	parser.add_argument('output_strings',nargs='?',default='-',help="the file the outputs are written on, or - for stdout (default: -)")
+	parser.add_argument('--morpheme',default=None,help="the morpheme ID, e.g. Agta-DIM-InitialC")
+	parser.add_argument('--language',default=None)
+	parser.add_argument('--function',default=None)
+	parser.add_argument('--form',default=None,help="the default form name, e.g. \"Initial C\"")
+	parser.add_argument('--fst',default=None,help="the 2-way FST ID, instead of looking it up from the morpheme")
+	parser.add_argument('--database',default='RedTyp.sql',help="the SQL dump of the RedTyp database (default: RedTyp.sql)")
+	parser.add_argument('--catalog',default=None,metavar='FILE',help="keep the catalog in this SQLite file instead of rebuilding it every time")
+	parser.add_argument('--max-steps',type=int,default=None,help="stop any run that takes more than this many steps")
+	args=parser.parse_args()
+	
+	catalog=Catalog(args.database,args.catalog,args.max_steps)
+	if args.fst is not None:
+		fst_ids=[args.fst]
+	else:
+		fst_ids=catalog.fst_ids(args.morpheme,args.language,args.function,args.form)
+	
+	if args.input_strings is None:
+		if args.fst is None:
+			for morpheme in catalog.morphemes(args.morpheme,args.language,args.function,args.form):
+				print("%s\t%s\t%s\t%s" % (morpheme['morpheme ID'],morpheme['language'],morpheme['function'],morpheme['default form name']))
+		for fst_id in fst_ids:
+			print("2-way FST:\t%s" % fst_id)
+		return
+	
+	if len(fst_ids)!=1:
+		sys.stderr.write("error, %d 2-way FSTs match, pick one of them with --fst:\n%s\n" % (len(fst_ids),'\n'.join(fst_ids)))
+		sys.exit(1)
+	try:
+		reader=catalog.machine(fst_ids[0])
+	except KeyError:
+		sys.stderr.write("error, there's no 2-way FST %s\n" % fst_ids[0])
+		sys.exit(1)
+	except RecipeError as error:
+		sys.stderr.write("error, the FST recipe of %s has mistakes:\n%s\n" % (fst_ids[0],error))
+		sys.exit(1)
+	reader.output_strings_file(args.input_strings,args.output_strings)
+
+if __name__ == "__main__":
+	main()
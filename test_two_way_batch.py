@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Tests for the batch engine of 2-way FSTs, run with python3 -m unittest
+   They're skipped if numpy isn't installed
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import unittest
+
+import two_way_batch
+from two_way_interpreter import Reader, RunError
+from test_two_way_interpreter import user_recipe
+
+"""Copies p and a, goes back to the start of the word on i, has no transition on t, and falls off the left edge on a word that starts with i"""
+EDGES=user_recipe("""('q','#') = ('q','',1)
+('q','p') = ('q','p',1)
+('q','a') = ('q','a',1)
+('q','i') = ('back','I',-1)
+('back',\\alphabet) = ('back','',-1)
+('back','#') = ('back','<',-1)
+('q','%') = ('end','',1)""",alphabet="['p','t','a','i','x']",states="['q','back','end']")
+
+"""Goes back and forth between the last symbol and the % forever"""
+LOOP=user_recipe("""('q','#') = ('q','',1)
+('q','a') = ('q','a',1)
+('q','p') = ('t','p',1)
+('t','%') = ('q','',-1)""",states="['q','t','end']")
+
+@unittest.skipUnless(two_way_batch.numpy is not None,"the batch engine needs numpy")
+class BatchEngineTest(unittest.TestCase):
+	"""BatchEngine.transduce_batch gives the outputs and errors of CompiledMachine.run"""
+
+	def assertSameResults(self,machine,inputs,max_steps=None):
+		results=two_way_batch.BatchEngine(machine,max_steps).transduce_batch(inputs)
+		self.assertEqual(len(results),len(inputs))
+		for input_string,result in zip(inputs,results):
+			expected=machine.run(machine.initialState,machine.initialValue,machine.prepare_input(input_string),0,max_steps)
+			self.assertEqual(type(result),type(expected))
+			self.assertEqual(result,expected)
+			if isinstance(expected,RunError):
+				self.assertEqual(result.reason,expected.reason)
+				self.assertEqual(result.partial_output,expected.partial_output)
+		return results
+
+	def test_outputs(self):
+		machine=Reader.from_recipe(EDGES).machine
+		self.assertEqual(self.assertSameResults(machine,['pa','','apap']),['pa','','apap'])
+
+	def test_errors(self):
+		machine=Reader.from_recipe(EDGES).machine
+		results=self.assertSameResults(machine,['pai','pta','paz','pax'])
+		self.assertEqual([result.reason for result in results],['left edge','no transition','bad symbol','no transition'])
+		self.assertEqual(results[0].partial_output,'paI<')
+
+	def test_loops(self):
+		machine=Reader.from_recipe(LOOP).machine
+		results=self.assertSameResults(machine,['ap','aap','a'])
+		self.assertEqual([result.reason for result in results[:2]],['non-terminating','non-terminating'])
+		self.assertEqual(results[2].reason,'no transition')
+		results=self.assertSameResults(machine,['aaaa','aap'],max_steps=3)
+		self.assertEqual([result.reason for result in results],['step budget','step budget'])
+		self.assertEqual(results[0].partial_output,'aa')
+
+	def test_duplicates(self):
+		machine=Reader.from_recipe(EDGES).machine
+		results=self.assertSameResults(machine,['pa','pta','pa','p a','pta'])
+		self.assertIs(results[0],results[2])
+		self.assertIs(results[1],results[4])
+
+	def test_cache(self):
+		machine=Reader.from_recipe(EDGES).machine
+		machine.set_cache(10)
+		machine.cache.put((tuple(machine.prepare_input('pa')),None),'cached')
+		engine=two_way_batch.BatchEngine(machine)
+		self.assertEqual(engine.transduce_batch(['pa','ap','p a']),['cached','ap','cached'])
+		self.assertEqual(machine.cache.stats()['hits'],2)
+		self.assertEqual(machine.cache.get((tuple(machine.prepare_input('ap')),None)),'ap')
+		self.assertEqual(engine.transduce_batch(['ap','pta']),['ap',machine.run(machine.initialState,machine.initialValue,machine.prepare_input('pta'),0)])
+		self.assertEqual(machine.cache.stats()['hits'],4)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Tests for the binary format of 2-way FSTs, run with python3 -m unittest
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import os
+import struct
+import tempfile
+import unittest
+
+import two_way_binary
+from two_way_binary import BinaryFormatError, write_machine, load_machine
+from two_way_interpreter import Reader
+from test_two_way_interpreter import user_recipe
+
+"""Writes the vowels with the function ID and marks them, then goes back to the start of the word and writes it again"""
+FUNCTIONS=user_recipe("""('q','#') = ('first','',1)
+('first',\\vowels) = ('first',\\ID,1)
+('first','p') = ('first','p',1)
+('first','t') = ('first','t',1)
+('first','%') = ('back','~',-1)
+('back',\\alphabet) = ('back','',-1)
+('back','#') = ('second','',1)
+('second',\\vowels) = ('second','V',1)
+('second','p') = ('second','p',1)
+('second','%') = ('end','',1)""",states="['q','first','back','second','end']")
+
+"""Two transitions for a vowel, of which only the second one can reach the end"""
+ALTERNATIVES=user_recipe("""('q','#') = ('q','',1)
+('q',\\vowels) = ('q','V',1)
+('q',\\vowels) = ('q2','W',1)
+('q','p') = ('q','p',1)
+('q2','%') = ('end','',1)""",states="['q','q2','end']")
+
+INPUTS=['','pa','papi','ipa','pat','tapa','pax','p a']
+
+class BinaryFileTest(unittest.TestCase):
+
+	def setUp(self):
+		self.folder=tempfile.TemporaryDirectory()
+		self.binary_file=os.path.join(self.folder.name,'machine.bin')
+
+	def tearDown(self):
+		self.folder.cleanup()
+
+	def write_bytes(self,data):
+		f=open(self.binary_file,'wb')
+		f.write(data)
+		f.close()
+
+	def read_bytes(self):
+		f=open(self.binary_file,'rb')
+		data=f.read()
+		f.close()
+		return data
+
+class RoundTripTest(BinaryFileTest):
+	"""A machine loaded back from its binary file gives the same outputs as the machine it was written from"""
+
+	def test_functions(self):
+		reader=Reader.from_recipe(FUNCTIONS)
+		self.assertTrue(any([type(output)!=str for output in reader.machine.outputs]))
+		write_machine(reader,self.binary_file)
+		loaded=Reader.from_binary(self.binary_file)
+		self.assertEqual([loaded.transduce(input_string) for input_string in INPUTS],[reader.transduce(input_string) for input_string in INPUTS])
+		self.assertEqual(loaded.transduce('papi'),'papi~pVpV')
+		self.assertEqual(loaded.pruning_stats,reader.pruning_stats)
+		self.assertEqual((loaded.initialStateList,loaded.finalStateList),(reader.initialStateList,reader.finalStateList))
+
+	def test_alternatives(self):
+		reader=Reader.from_recipe(ALTERNATIVES,nondeterministic=True)
+		self.assertGreater(len(reader.machine.alternatives),0)
+		write_machine(reader,self.binary_file)
+		machine,info=load_machine(self.binary_file)
+		self.assertEqual(machine.alternatives,reader.machine.alternatives)
+		loaded=Reader.from_binary(self.binary_file,nondeterministic=True)
+		self.assertEqual([loaded.transduce(input_string) for input_string in INPUTS],[reader.transduce(input_string) for input_string in INPUTS])
+		self.assertEqual(loaded.transduce('pa'),'pW')
+
+class BadFileTest(BinaryFileTest):
+	"""Files that aren't binary 2-way FSTs of this version raise a BinaryFormatError"""
+
+	def test_empty(self):
+		self.write_bytes(b'')
+		with self.assertRaisesRegex(BinaryFormatError,'empty'):
+			load_machine(self.binary_file)
+
+	def test_bad_magic(self):
+		write_machine(Reader.from_recipe(FUNCTIONS),self.binary_file)
+		self.write_bytes(b'NOT2FST!'+self.read_bytes()[8:])
+		with self.assertRaisesRegex(BinaryFormatError,"isn't a binary 2-way FST"):
+			load_machine(self.binary_file)
+
+	def test_version(self):
+		write_machine(Reader.from_recipe(FUNCTIONS),self.binary_file)
+		data=self.read_bytes()
+		self.write_bytes(data[:8]+struct.pack('<I',two_way_binary.VERSION+1)+data[12:])
+		with self.assertRaisesRegex(BinaryFormatError,'version %d' % (two_way_binary.VERSION+1)):
+			load_machine(self.binary_file)
+
+	def test_truncated_table(self):
+		write_machine(Reader.from_recipe(FUNCTIONS),self.binary_file)
+		data=self.read_bytes()
+		fields=two_way_binary.HEADER.unpack_from(data,0)
+		table=two_way_binary.SECTIONS.index('table')
+		offset=fields[14+2*table]
+		self.assertGreater(fields[15+2*table],8)
+		self.write_bytes(data[:offset+8])
+		with self.assertRaisesRegex(BinaryFormatError,'cut short'):
+			load_machine(self.binary_file)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Tests for the 2-way FST interpreter, run with python3 -m unittest
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import unittest
+
+from two_way_interpreter import Reader, RecipeError, SymbolTokenizer, TransductionCache
+
+def user_recipe(transitions,alphabet="['p','t','a','i']",subalphabets="vowels = ['a','i']",states="['q','end']"):
+	"""An FST recipe with a user alphabet, made of the given lines of transitions"""
+	return """#test
+what type of alphabet will you use = user
+
+alphabet = %s
+subalphabets = 1
+%s
+
+functions = 0
+
+states = %s
+initial states = ['q']
+initial value = ''
+final states = ['end']
+
+%s
+""" % (alphabet,subalphabets,states,transitions)
+
+class GeneralAfterSpecificTest(unittest.TestCase):
+	"""A transition on a subalphabet that overlaps an earlier one is nondeterministic only for the symbols they share,
+	it still applies to the other symbols"""
+
+	def test_general_after_specific(self):
+		reader=Reader.from_recipe(user_recipe("""('q','#') = ('q','',1)
+('q',\\vowels) = ('q','V',1)
+('q',\\alphabet) = ('q','X',1)
+('q','%') = ('end','',1)"""))
+		self.assertEqual(reader.transduce('pat'),'XVX')
+		self.assertEqual(reader.transduce('ipa'),'VXV')
+
+class RecipeErrorTest(unittest.TestCase):
+	"""Every mistake of a recipe is reported with its line and column, counting from 1"""
+
+	def errors(self,recipe_text):
+		with self.assertRaises(RecipeError) as context:
+			Reader.from_recipe(recipe_text)
+		return context.exception
+
+	def test_subalphabet(self):
+		error=self.errors(user_recipe("""('q','#') = ('q','',1)
+('q',\\vowel) = ('q','V',1)
+('q','%') = ('end','',1)"""))
+		self.assertEqual(error.errors,[(16,6,"the subalphabet vowel doesn't exist")])
+		self.assertEqual(str(error),"line 16, column 6: the subalphabet vowel doesn't exist")
+
+	def test_unclosed_string(self):
+		error=self.errors(user_recipe("""('q','#') = ('q','',1)
+('q','a') = ('q','V,1)"""))
+		self.assertEqual(error.errors[0],(16,18,"this string is never closed with '"))
+
+	def test_several_mistakes(self):
+		error=self.errors(user_recipe("""('q','#') = ('q','',1
+('q','b') = ('q','V',1)
+('q','a') = ('nowhere','V',1)
+('q','%') = ('end','',1)"""))
+		self.assertEqual(error.errors,[(15,22,"expected ) but the line ended"),
+			(16,6,"the input symbol b isn't in the alphabet and isn't a boundary symbol"),
+			(17,14,"the state nowhere isn't in the state list")])
+
+	def test_text(self):
+		error=self.errors("I can't implement the 2-way FST because it requires non-determinism")
+		self.assertEqual(error.errors,[(1,1,"this is text, not an FST recipe: it has no declarations or transitions")])
+
+"""Copies p and a, and on t goes back to the a before it, which sends it forward to the t again"""
+BOUNCE=user_recipe("""('q','#') = ('q','',1)
+('q','p') = ('q','p',1)
+('q','a') = ('q','a',1)
+('q','t') = ('back','T',-1)
+('back','a') = ('q','',1)
+('q','%') = ('end','',1)""",states="['q','back','end']")
+
+class CompiledMachineRunTest(unittest.TestCase):
+	"""CompiledMachine.run stops a run that loops, and a run that goes over max_steps, with the output it wrote so far"""
+
+	def run_machine(self,input_string,max_steps=None):
+		machine=Reader.from_recipe(BOUNCE).machine
+		return machine.run(machine.initialState,machine.initialValue,machine.prepare_input(input_string),0,max_steps)
+
+	def test_loop(self):
+		output=self.run_machine('pat')
+		self.assertEqual(output.reason,'non-terminating')
+		self.assertEqual(output.partial_output,'paTT')
+		self.assertEqual(output.message,"the machine doesn't halt on this input, it came back to state back at position 2 after 6 steps")
+
+	def test_step_budget(self):
+		output=self.run_machine('pata',4)
+		self.assertEqual(output.reason,'step budget')
+		self.assertEqual(output.partial_output,'paT')
+		self.assertEqual(output.message,"the machine didn't halt within the budget of 4 steps")
+		self.assertEqual(self.run_machine('pa',3).partial_output,'pa')
+		self.assertEqual(self.run_machine('pa',3).reason,'step budget')
+		self.assertEqual(self.run_machine('pa',4),'pa')
+
+class SymbolTokenizerTest(unittest.TestCase):
+	"""Strings are split into the longest symbols of the alphabet, and a character that starts no symbol is kept as its own symbol"""
+
+	def setUp(self):
+		self.tokenizer=SymbolTokenizer(['a','a:','t','ts','tsh','kw','i'])
+
+	def test_longest_match(self):
+		self.assertEqual(self.tokenizer.tokenize('tsha:ta'),(['tsh','a:','t','a'],[]))
+		self.assertEqual(self.tokenizer.tokenize('tsa'),(['ts','a'],[]))
+		self.assertEqual(self.tokenizer.tokenize('kwi'),(['kw','i'],[]))
+
+	def test_fallback(self):
+		"""k only starts the symbol kw, and x starts no symbol"""
+		self.assertEqual(self.tokenizer.tokenize('kai'),(['k','a','i'],[0]))
+		self.assertEqual(self.tokenizer.tokenize('tsx:'),(['ts','x',':'],[2,3]))
+		self.assertEqual(self.tokenizer.tokenize(''),([],[]))
+
+class TransductionCacheTest(unittest.TestCase):
+	"""When the cache is full, the output that was used least recently is evicted"""
+
+	def test_eviction_order(self):
+		cache=TransductionCache(2)
+		cache.put('pata','pa~pata')
+		cache.put('taka','ta~taka')
+		self.assertEqual(cache.get('pata'),'pa~pata')
+		cache.put('apa','a~apa')
+		self.assertIsNone(cache.get('taka'))
+		self.assertEqual(cache.get('pata'),'pa~pata')
+		self.assertEqual(cache.get('apa'),'a~apa')
+		cache.put('ki','ki~ki')
+		self.assertEqual(list(cache.entries),['apa','ki'])
+		self.assertEqual(cache.stats(),{'size':2,'maxsize':2,'hits':3,'misses':1})
+
+	def test_update(self):
+		"""Putting an output again replaces it without growing the cache"""
+		cache=TransductionCache(2)
+		cache.put('pata','pa~pata')
+		cache.put('taka','ta~taka')
+		cache.put('pata','pata')
+		self.assertEqual(cache.get('pata'),'pata')
+		self.assertEqual(len(cache.entries),2)
+
+DEAD_STATE=user_recipe("""('q','#') = ('q','',1)
+('q','a') = ('q2','a',1)
+('q2','t') = ('dead','D',1)
+('q2','%') = ('end','',1)
+('dead','t') = ('dead','D',1)
+('lost','a') = ('q','a',1)""",states="['q','q2','dead','end','lost']")
+
+class PruningTest(unittest.TestCase):
+	"""The states that can't be reached are left out of the compiled machine, and the ones that can't reach a final state too with prune_dead,
+	but the transitions are still listed as they were written"""
+
+	def test_unreachable_state(self):
+		reader=Reader.from_recipe(DEAD_STATE)
+		self.assertEqual(reader.pruning_stats['states'],(5,4))
+		self.assertNotIn('lost',reader.machine.state_ids)
+		output=reader.transduce('at')
+		self.assertEqual(output.partial_output,'aD')
+		self.assertEqual(output.message,"couldn't find output state for the input state+input symbol pair (dead,%)")
+
+	def test_dead_state(self):
+		reader=Reader.from_recipe(DEAD_STATE,prune_dead=True)
+		self.assertEqual(reader.pruning_stats['states'],(5,3))
+		self.assertEqual(reader.pruning_stats['transitions'],(6,3))
+		self.assertEqual(reader.transduce('a'),'a')
+		output=reader.transduce('at')
+		self.assertEqual(output.partial_output,'a')
+		self.assertEqual(output.message,"couldn't find output state for the input state+input symbol pair (q2,t)")
+
+	def test_listing(self):
+		listings=[Reader.from_recipe(DEAD_STATE,prune_dead=prune_dead).transitions_text() for prune_dead in (False,True)]
+		transitions=[[line for line in listing.split('\r\n') if line.count(',')==4] for listing in listings]
+		self.assertEqual(len(transitions[0]),6)
+		self.assertEqual(transitions[0],transitions[1])
+		reader=Reader.from_transition_list(listings[0],prune_dead=True)
+		self.assertEqual(reader.pruning_stats['states'],(5,3))
+		#the states of a list of transitions are numbered again when it's read, so only the number of transitions is compared
+		self.assertEqual(len([line for line in reader.transitions_text().split('\r\n') if line.count(',')==4]),6)
+
+class NondeterministicFailureTest(unittest.TestCase):
+	"""A run that comes back to a configuration another run already visited is dropped, it doesn't hide the error of a run that failed"""
+
+	def test_merged_run(self):
+		reader=Reader.from_recipe(user_recipe("""('q','#') = ('s','',1)
+('q','#') = ('t','',1)
+('s','p') = ('s','',1)
+('t','a') = ('q','',-1)
+('s','%') = ('end','',1)""",states="['q','s','t','end']"),nondeterministic=True)
+		output=reader.transduce('a')
+		self.assertEqual(output.reason,'no transition')
+		self.assertEqual(output.message,"couldn't find output state for the input state+input symbol pair (s,a)")
+
+	def test_loop(self):
+		reader=Reader.from_recipe(user_recipe("""('q','#') = ('q','',1)
+('q','a') = ('t','',1)
+('t','%') = ('q','',-1)""",states="['q','t','end']"),nondeterministic=True)
+		self.assertEqual(reader.transduce('a').reason,'non-terminating')
+
+if __name__ == "__main__":
+	unittest.main()
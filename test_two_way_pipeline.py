@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Tests for pipelines of 2-way FSTs, run with python3 -m unittest
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import unittest
+
+from two_way_interpreter import Reader, RunError
+from two_way_pipeline import Pipeline
+from test_two_way_interpreter import user_recipe
+
+"""The first FST lengthens a and writes t as ts, the second one reads the symbols a: and ts that the first one outputs"""
+LENGTHEN=user_recipe("""('q','#') = ('q','',1)
+('q','a') = ('q','a:',1)
+('q','t') = ('q','ts',1)
+('q','p') = ('q','p',1)
+('q','%') = ('end','',1)""",alphabet="['p','t','a']",subalphabets="vowels = ['a']")
+
+MARK=user_recipe("""('q','#') = ('q','',1)
+('q','a:') = ('q','L',1)
+('q','ts') = ('q','C',1)
+('q','p') = ('q','p',1)
+('q','%') = ('end','',1)""",alphabet="['p','t','s','a','a:','ts']",subalphabets="vowels = ['a','a:']")
+
+class MulticharacterSymbolTest(unittest.TestCase):
+	"""The outputs of the first FST are split into the symbols of the second one, with or without fusing them"""
+
+	def test_fused(self):
+		pipeline=Pipeline([Reader.from_recipe(LENGTHEN),Reader.from_recipe(MARK)])
+		self.assertEqual(len(pipeline.stages),1)
+		self.assertEqual(pipeline.transduce('pata'),'pLCL')
+
+	def test_not_fused(self):
+		pipeline=Pipeline([Reader.from_recipe(LENGTHEN),Reader.from_recipe(MARK)],False)
+		self.assertEqual(len(pipeline.stages),2)
+		self.assertEqual(pipeline.transduce('pata'),'pLCL')
+
+	def test_error(self):
+		for fuse_machines in (True,False):
+			output=Pipeline([Reader.from_recipe(MARK),Reader.from_recipe(LENGTHEN)],fuse_machines).transduce('pa:ts')
+			self.assertIsInstance(output,RunError)
+			self.assertEqual(output.partial_output,'p')
+			self.assertTrue(output.message.startswith('in FST 2 of the pipeline'))
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Tests for the server of 2-way FSTs, run with python3 -m unittest
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import os
+import json
+import asyncio
+import tempfile
+import unittest
+
+from two_way_interpreter import Reader
+from two_way_server import TransductionServer
+from test_two_way_interpreter import user_recipe
+
+COPY=user_recipe("""('q','#') = ('q','',1)
+('q','p') = ('q','p',1)
+('q','a') = ('q','a',1)
+('q','%') = ('end','',1)""")
+
+class RequestTest(unittest.TestCase):
+	"""Requests are read by TransductionServer.parse and answered by TransductionServer.answer"""
+
+	def setUp(self):
+		self.server=TransductionServer({'Copy ':Reader.from_recipe(COPY)})
+
+	def answer(self,request):
+		return json.loads(self.server.answer(json.dumps(request)))
+
+	def test_bad_json(self):
+		with self.assertRaises(ValueError):
+			self.server.parse('{"machine": "copy", "words": [')
+		self.assertTrue(json.loads(self.server.answer('{"id": 3, "words": ['))['error'].startswith("the request isn't json"))
+		with self.assertRaises(ValueError):
+			self.server.parse('["copy"]')
+
+	def test_unknown_machine(self):
+		with self.assertRaises(ValueError):
+			self.server.parse('{"machine": "paste", "word": "pa"}')
+		self.assertEqual(self.answer({'id':'x','machine':'paste','word':'pa'}),{'id':'x','error':"there's no machine paste"})
+
+	def test_words(self):
+		request,reader,words=self.server.parse('{"machine": "COPY", "word": "pa"}')
+		self.assertEqual(words,['pa'])
+		request,reader,words=self.server.parse('{"machine": "copy", "words": ["pa", "ap"]}')
+		self.assertEqual(words,['pa','ap'])
+		self.assertIs(reader,self.server.readers['copy'][1])
+		for request in ['{"machine": "copy"}','{"machine": "copy", "words": "pa"}','{"machine": "copy", "words": ["pa", 1]}']:
+			with self.assertRaises(ValueError):
+				self.server.parse(request)
+		self.assertEqual(self.answer({'machine':'copy','word':'pa'}),{'results':[{'input':'pa','output':'pa'}]})
+		self.assertEqual(self.answer({'machines':True}),{'machines':['Copy ']})
+
+	def test_id(self):
+		for request_id in [1,'one',[1,2],None]:
+			self.assertEqual(self.answer({'id':request_id,'machine':'copy','words':[]}),{'id':request_id,'results':[]})
+		self.assertNotIn('id',self.answer({'machine':'copy','words':[]}))
+
+	def test_run_error(self):
+		result=self.answer({'machine':'copy','words':['pta']})['results'][0]
+		self.assertEqual(result,{'input':'pta','output':'p','error':'no transition',
+			'message':"couldn't find output state for the input state+input symbol pair (q,t)"})
+
+class SocketTest(unittest.TestCase):
+	"""The server only replaces a socket file, never another kind of file"""
+
+	def test_not_a_socket(self):
+		server=TransductionServer({'copy':Reader.from_recipe(COPY)})
+		with tempfile.TemporaryDirectory() as folder:
+			path=os.path.join(folder,'server.txt')
+			f=open(path,'w')
+			f.write('keep me')
+			f.close()
+			with self.assertRaises(ValueError):
+				asyncio.run(server.serve_socket(path))
+			f=open(path,'r')
+			self.assertEqual(f.read(),'keep me')
+			f.close()
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Tests for the streaming string transducers of 2-way FSTs, run with python3 -m unittest
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import unittest
+
+from two_way_interpreter import Reader, RunError
+from two_way_sst import StreamingTransducer, compare_runs
+from test_two_way_interpreter import user_recipe
+
+"""Total reduplication with a marked vowel: the second copy is written after going back to the start of the word"""
+TOTAL=user_recipe("""('q','#') = ('first','',1)
+('first',\\vowels) = ('first',\\ID,1)
+('first','p') = ('first','p',1)
+('first','%') = ('back','~',-1)
+('back',\\alphabet) = ('back','',-1)
+('back','#') = ('second','',1)
+('second',\\vowels) = ('second','V',1)
+('second','p') = ('second','p',1)
+('second','%') = ('end','',1)""",states="['q','first','back','second','end']")
+
+class CopylessTest(unittest.TestCase):
+	"""The SST gives the outputs and errors of the 2-way FST, and never uses a register twice in an update"""
+
+	def test_total_reduplication(self):
+		reader=Reader.from_recipe(TOTAL)
+		sst=StreamingTransducer(reader.machine)
+		self.assertEqual(sst.transduce('papi'),'papi~pVpV')
+		inputs=['','a','pa','papi','ipapa','pat','tapa','pax']
+		self.assertEqual(compare_runs(reader,sst,inputs),[])
+		self.assertTrue(sst.copyless)
+		for behaviour_id,a in list(sst.transitions):
+			behaviour,updates,messages=sst.transitions[(behaviour_id,a)]
+			used=[piece for first,pieces in updates for piece in (first,)+pieces if piece.__class__ is int and piece>=0]
+			self.assertEqual(len(used),len(set(used)))
+
+	def test_failure(self):
+		reader=Reader.from_recipe(TOTAL)
+		output=StreamingTransducer(reader.machine).transduce('pat')
+		self.assertIsInstance(output,RunError)
+		self.assertEqual(output.reason,'no transition')
+		self.assertEqual(output.partial_output,'pa')
+		self.assertEqual(output.message,reader.transduce('pat').message)
+
+	def test_loop(self):
+		reader=Reader.from_recipe(user_recipe("""('q','#') = ('q','',1)
+('q','a') = ('t','',1)
+('t','%') = ('q','',-1)""",states="['q','t','end']"))
+		output=StreamingTransducer(reader.machine).transduce('a')
+		self.assertEqual(output.reason,'non-terminating')
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+"""
+   A batch engine for the 2-way FSTs of two_way_interpreter.py which runs many input strings in lockstep with numpy
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import sys
+import argparse
+
+try:
+	import numpy
+except ImportError:
+	numpy=None
+
+from two_way_interpreter import Reader, RecipeError, RunError, join_output, chunked, read_input_strings, write_output_strings
+
+class BatchEngine:
+	"""Runs the compiled machine of a Reader on a batch of input strings at the same time
+	The inputs are tokenized and padded into a matrix of symbol classes, and every input that is still running
+	moves one step forward at each iteration, with a single index into the transition table for the whole batch.
+	The outputs of the steps are kept as ids and only turned into strings at the end, so the loop itself never touches a string
+	The outputs and errors are the same as the ones of the 2-way FST, see CompiledMachine.run"""
+
+	def __init__(self,machine,max_steps=None):
+		"""machine is the CompiledMachine of a Reader"""
+		if numpy is None:
+			raise ImportError("the batch engine needs numpy, which isn't installed")
+		self.machine=machine
+		self.max_steps=max_steps
+		self.classCount=machine.classCount
+		"""The symbols which aren't in any class get the extra class classCount, where every transition is missing"""
+		table=numpy.frombuffer(machine.table,dtype=numpy.int64).reshape(len(machine.states),self.classCount)
+		self.table=numpy.hstack([table,numpy.full((len(machine.states),1),-1,dtype=numpy.int64)]).ravel()
+
+	def encode(self,inputs):
+		"""Turns a list of inputs, already split into symbols and flanked by # and %, into a matrix of symbol classes padded with the missing class, along with
+		the list of the symbols of the batch, the matrix of the ids of the symbols in that list, and the length of every input"""
+		machine=self.machine
+		flat=[]
+		for input_string in inputs:
+			flat.extend(input_string)
+		symbols=list(dict.fromkeys(flat))
+		symbol_ids=dict([(symbol,i) for i,symbol in enumerate(symbols)])
+		lengths=numpy.array([len(input_string) for input_string in inputs],dtype=numpy.int64)
+		starts=numpy.cumsum(lengths)-lengths
+		rows=numpy.repeat(numpy.arange(len(inputs)),lengths)
+		columns=numpy.arange(len(flat))-numpy.repeat(starts,lengths)
+		symbol_matrix=numpy.zeros((len(inputs),int(lengths.max())),dtype=numpy.int64)
+		symbol_matrix[rows,columns]=list(map(symbol_ids.__getitem__,flat))
+		symbol_classes=numpy.array([machine.class_ids.get(symbol,self.classCount) for symbol in symbols],dtype=numpy.int64)
+		return symbol_classes[symbol_matrix],symbols,symbol_matrix,lengths
+
+	def transduce_batch(self,inputs):
+		"""Runs the machine on a list of inputs and returns the list of their outputs, or of their RunErrors
+		Inputs that tokenize the same way are only run once, and if the prefilter of the machine is on,
+		inputs outside of its domain aren't run at all, see CompiledMachine.set_prefilter
+		If the cache of the machine is on, the inputs are looked up there before they go into the batch,
+		and the outputs of the batch are stored there, like CompiledMachine.transduce does"""
+		machine=self.machine
+		if len(inputs)==0:
+			return []
+		if machine.initialState not in machine.state_ids:
+			return [RunError(machine.initialValue,'bad state',"the input state %s isn't in the state list" % machine.initialState) for input_string in inputs]
+
+		unique={}
+		which=[]
+		for input_string in inputs:
+			entire_input=machine.prepare_input(input_string)
+			if machine.prefilter:
+				error=machine.reject(entire_input)
+				if error is not None:
+					which.append(error)
+					continue
+			key=tuple(entire_input)
+			if key not in unique:
+				if machine.cache is not None:
+					output=machine.cache.get((key,self.max_steps))
+					if output is not None:
+						which.append(output)
+						continue
+				unique[key]=len(unique)
+			which.append(unique[key])
+		if len(unique)==0:
+			return which
+		outputs=self.run(list(unique.keys()))
+		if machine.cache is not None:
+			for key,i in unique.items():
+				machine.cache.put((key,self.max_steps),outputs[i])
+		return [outputs[i] if i.__class__ is int else i for i in which]
+
+	def run(self,inputs):
+		"""Runs the machine on a list of inputs in lockstep, see CompiledMachine.run for the errors and how loops are caught
+		The inputs are already split into symbols and flanked by # and %, see CompiledMachine.prepare_input
+		Each input drops out of the batch as soon as it reaches the end, fails, or is caught in a loop"""
+		machine=self.machine
+		table=self.table
+		width=self.classCount+1
+		classes,symbols,symbol_matrix,lengths=self.encode(inputs)
+		batch=len(inputs)
+
+		q=numpy.full(batch,machine.state_ids[machine.initialState],dtype=numpy.int64)
+		head=numpy.zeros(batch,dtype=numpy.int64)
+		steps=numpy.zeros(batch,dtype=numpy.int64)
+		saved_q=numpy.full(batch,-1,dtype=numpy.int64)
+		saved_head=numpy.full(batch,-1,dtype=numpy.int64)
+		checkpoint=numpy.ones(batch,dtype=numpy.int64)
+		step_bound=len(machine.states)*lengths
+		if self.max_steps is not None:
+			step_bound=numpy.minimum(step_bound,self.max_steps)
+		"""reasons holds why each run stopped: -1 while running or if it reached the end, 0 for moving past the left edge,
+		1 for a missing transition, 2 for coming back to a saved configuration, 3 for the step budget, 4 for the bound on the steps"""
+		reasons=numpy.full(batch,-1,dtype=numpy.int64)
+		fragment_words=[]
+		fragment_codes=[]
+
+		active=numpy.arange(batch)
+		while len(active)>0:
+			position=head[active]
+			record=table[q[active]*width+classes[active,position]]
+			stuck=record<0
+			if stuck.any():
+				reasons[active[stuck]]=1
+				active=active[~stuck]
+				position=position[~stuck]
+				record=record[~stuck]
+				if len(active)==0:
+					break
+			"""An output is kept as a code (output id, symbol id), since the outputs of functions depend on the symbol read"""
+			fragment_words.append(active)
+			fragment_codes.append((record>>32)*len(symbols)+symbol_matrix[active,position])
+			new_q=(record>>2)&0x3fffffff
+			new_head=position+(record&3)-1
+			q[active]=new_q
+			head[active]=new_head
+			steps[active]=steps[active]+1
+			now=steps[active]
+
+			done=new_head==lengths[active]
+			left=(new_head<0)&~done
+			looping=(new_q==saved_q[active])&(new_head==saved_head[active])&~done
+			save=(now==checkpoint[active])&~looping
+			saving=active[save]
+			saved_q[saving]=new_q[save]
+			saved_head[saving]=new_head[save]
+			checkpoint[saving]=checkpoint[saving]*2
+			over=(now>=step_bound[active])&~done&~looping
+			reasons[active[looping]]=2
+			over_words=active[over]
+			if self.max_steps is not None:
+				reasons[over_words]=numpy.where(step_bound[over_words]==self.max_steps,3,4)
+			else:
+				reasons[over_words]=4
+			"""Moving past the left edge is only found at the next step in CompiledMachine.run, so loops and step bounds are checked first"""
+			left=left&~looping&~over
+			reasons[active[left]]=0
+			active=active[~(done|left|looping|over)]
+		machine.step_count=machine.step_count+int(steps.sum())
+
+		"""The outputs of each input are put back together in the order of its steps"""
+		if len(fragment_words)>0:
+			words=numpy.concatenate(fragment_words)
+			codes=numpy.concatenate(fragment_codes)
+		else:
+			words=numpy.zeros(0,dtype=numpy.int64)
+			codes=numpy.zeros(0,dtype=numpy.int64)
+		order=numpy.argsort(words,kind='stable')
+		unique_codes,inverse=numpy.unique(codes[order],return_inverse=True)
+		fragments=[]
+		for code in unique_codes.tolist():
+			output=machine.outputs[code//len(symbols)]
+			if output.__class__ is not str:
+				output=output[symbols[code%len(symbols)]]
+			fragments.append(output)
+		fragments=[fragments[i] for i in inverse.tolist()]
+		ends=numpy.cumsum(numpy.bincount(words,minlength=batch)).tolist()
+
+		results=[]
+		start=0
+		reasons=reasons.tolist()
+		for i in range(batch):
+			output_so_far=join_output(machine.initialValue,fragments[start:ends[i]])
+			start=ends[i]
+			results.append(self.result(output_so_far,reasons[i],inputs[i],int(q[i]),int(head[i]),int(steps[i]),int(step_bound[i])))
+		return results
+
+	def result(self,output_so_far,reason,entire_input,q,head,steps,step_bound):
+		"""Makes the output of a single input at the end of its run, with the same messages as CompiledMachine.run"""
+		machine=self.machine
+		if reason==0:
+			return RunError(output_so_far,'left edge',"the reading head moved past the left edge of the input in state %s" % machine.states[q])
+		if reason==1:
+			inputA=entire_input[head]
+			if inputA not in machine.alphabet:
+				return RunError(output_so_far,'bad symbol',"the input symbol %s isn't in the alphabet" % inputA)
+			return RunError(output_so_far,'no transition',"couldn't find output state for the input state+input symbol pair ("+machine.states[q]+","+inputA+")")
+		if reason==2:
+			return RunError(output_so_far,'non-terminating',"the machine doesn't halt on this input, it came back to state %s at position %d after %d steps" % (machine.states[q],head,steps))
+		if reason==3:
+			return RunError(output_so_far,'step budget',"the machine didn't halt within the budget of %d steps" % step_bound)
+		if reason==4:
+			return RunError(output_so_far,'non-terminating',"the machine doesn't halt on this input, it ran for more than %d steps" % step_bound)
+		if not machine.final[q]:
+			return RunError(output_so_far,'not final',"we read till the end but didnt end in a final state, but in state %s" % machine.states[q])
+		if type(output_so_far)==list:
+			output_so_far=list(filter(lambda x: x!='',output_so_far))
+		return output_so_far
+
+def transduce_lines_batch(machine,lines,batch_size=1000,max_steps=None):
+	"""Same as Reader.transduce_lines, but the input strings are run batch_size at a time by a BatchEngine"""
+	engine=BatchEngine(machine,max_steps)
+	for batch in chunked(lines,batch_size):
+		for pair in zip(batch,engine.transduce_batch(batch)):
+			yield pair
+
+def main():
+	parser=argparse.ArgumentParser(description="Runs the 2-way FST in an FST recipe on a file of input strings, many input strings at a time with numpy")
+	parser.add_argument('FST_recipe',help="the FST recipe")
+	parser.add_argument('input_strings',help="the file of input strings, one per line, or - for stdin")
+	parser.add_argument('output_strings',nargs='?',default='-',help="the file the outputs are written on, or - for stdout (default: -)")
+	parser.add_argument('--batch-size',type=int,default=1000,help="number of input strings run together and written at a time (default: 1000)")
+	parser.add_argument('--max-steps',type=int,default=None,help="stop any run that takes more than this many steps")
+	args=parser.parse_args()
+
+	if numpy is None:
+		sys.stderr.write("error, the batch engine needs numpy, which isn't installed\n")
+		sys.exit(1)
+	f=open(args.FST_recipe,'r',encoding='utf-8')
+	recipe_text=f.read()
+	f.close()
+	try:
+		reader=Reader.from_recipe(recipe_text,args.max_steps)
+	except RecipeError as error:
+		sys.stderr.write("error, the FST recipe %s has mistakes:\n%s\n" % (args.FST_recipe,error))
+		sys.exit(1)
+	pairs=transduce_lines_batch(reader.machine,read_input_strings(args.input_strings),args.batch_size,args.max_steps)
+	write_output_strings(args.output_strings,pairs,args.batch_size)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+"""
+   A binary file format for compiled 2-way FSTs, which is loaded by mapping the file into memory instead of parsing it
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import sys
+import mmap
+import struct
+import argparse
+from array import array
+
+from two_way_interpreter import Reader, RecipeError, TransitionListError, CompiledMachine, SymbolTokenizer, shared_alphabet
+
+"""The file starts with a header, then has the sections below one after the other, each one starting at a multiple of 8 bytes
+Every number is little-endian. Strings are never stored in the sections, only their ids in the string pool
+
+	strings			the string pool: stringCount+1 u32 offsets into the UTF-8 bytes of the strings, followed by the bytes
+	states			u32 string id of each state, in the order of the state ids of the table
+	initial states	u32 string ids of the initial states of the 2-way FST
+	final states	u32 string ids of the final states of the 2-way FST
+	state list		u32 string ids of the state list of the 2-way FST, which numbers the states in its list of transitions, see Reader.output_transitions
+	class starts	classCount+1 u32 offsets into the class symbols
+	class symbols	u32 string ids of the input symbols of each class, one class after the other
+	alphabet		u32 string ids of the alphabet, with the edge symbols # and %
+	input alphabet	u32 string ids of the symbols that input strings are split into
+	outputs			3 u32 for each output of the output pool: (0, string id, 0) for a string,
+					or (1, start, count) for an output that depends on the input symbol, whose (symbol, output) pairs are in the output pairs
+	output pairs	u32 string id pairs (input symbol, output string)
+	table			the transition table, one i64 per (state, class) cell, packed like in CompiledMachine
+	alternatives	i64 pairs (cell, record) for the other transitions of the cells of a nondeterministic machine, see CompiledMachine
+
+The table is the only big section. It's used straight from the mapped file, so processes which load the same file share one copy of it"""
+
+MAGIC=b'RTYP2FST'
+VERSION=2
+SECTIONS=['strings','states','initial states','final states','state list','class starts','class symbols','alphabet','input alphabet','outputs','output pairs','table','alternatives']
+"""magic, version, stateCount, classCount, outputCount, stringCount, string ids of the name and of the initial value,
+the pruning stats (states, symbols and transitions before and after), then the offset and the length in bytes of each section"""
+HEADER=struct.Struct('<8sIIIIIII6I'+'QQ'*len(SECTIONS))
+HEADER_SIZE=HEADER.size+(-HEADER.size%8)
+
+class BinaryFormatError(Exception):
+	"""Raised when a file isn't a binary 2-way FST of a version this interpreter can read"""
+
+def align(data):
+	return data+b'\0'*(-len(data)%8)
+
+def u32(values):
+	values=array('I',values)
+	if sys.byteorder!='little':
+		values.byteswap()
+	return values.tobytes()
+
+def function_outputs(machine):
+	"""Returns for each output of the machine that depends on the input symbol the list of (symbol, output string) for the symbols it's used with
+	A symbol the output isn't defined for is left out, so looking it up fails like it does in the compiled machine"""
+	used={}
+	for c,symbols in enumerate(machine.class_symbols):
+		for q in range(len(machine.states)):
+			record=machine.table[q*machine.classCount+c]
+			if record>=0 and machine.outputs[record>>32].__class__ is not str:
+				used.setdefault(record>>32,set()).update(symbols)
+	pairs={}
+	for output_id,symbols in used.items():
+		pairs[output_id]=[]
+		for symbol in sorted(symbols):
+			try:
+				pairs[output_id].append((symbol,machine.outputs[output_id][symbol]))
+			except KeyError:
+				pass
+	return pairs
+
+def write_machine(reader,binary_file):
+	"""Writes the compiled machine of a Reader on binary_file, along with what's needed to write its transitions back as text, see Reader.output_transitions"""
+	machine=reader.machine
+	if type(machine.initialValue)!=str:
+		raise ValueError("only machines whose initial value is a string can be written in the binary format")
+	string_ids={}
+	strings=[]
+	def sid(string):
+		if string not in string_ids:
+			string_ids[string]=len(strings)
+			strings.append(string)
+		return string_ids[string]
+
+	sections={}
+	sections['states']=u32([sid(state) for state in machine.states])
+	sections['initial states']=u32([sid(state) for state in reader.initialStateList])
+	sections['final states']=u32([sid(state) for state in reader.finalStateList])
+	sections['state list']=u32([sid(state) for state in reader.stateList])
+	starts=[0]
+	symbol_ids=[]
+	for symbols in machine.class_symbols:
+		symbol_ids.extend([sid(symbol) for symbol in symbols])
+		starts.append(len(symbol_ids))
+	sections['class starts']=u32(starts)
+	sections['class symbols']=u32(symbol_ids)
+	sections['alphabet']=u32([sid(symbol) for symbol in sorted(machine.alphabet)])
+	sections['input alphabet']=u32([sid(symbol) for symbol in sorted(set(input_alphabet(machine)))])
+	pairs=function_outputs(machine)
+	records=[]
+	pair_ids=[]
+	for output_id,output in enumerate(machine.outputs):
+		if output.__class__ is str:
+			records.extend([0,sid(output),0])
+		else:
+			records.extend([1,len(pair_ids)//2,len(pairs.get(output_id,[]))])
+			for symbol,output_string in pairs.get(output_id,[]):
+				pair_ids.extend([sid(symbol),sid(output_string)])
+	sections['outputs']=u32(records)
+	sections['output pairs']=u32(pair_ids)
+	table=array('q',machine.table)
+	if sys.byteorder!='little':
+		table.byteswap()
+	sections['table']=table.tobytes()
+	alternatives=array('q',[number for cell in sorted(machine.alternatives) for record in machine.alternatives[cell] for number in (cell,record)])
+	if sys.byteorder!='little':
+		alternatives.byteswap()
+	sections['alternatives']=alternatives.tobytes()
+	name_id=sid(reader.name)
+	value_id=sid(machine.initialValue)
+
+	encoded=[string.encode('utf-8') for string in strings]
+	offsets=[0]
+	for data in encoded:
+		offsets.append(offsets[-1]+len(data))
+	sections['strings']=u32(offsets)+b''.join(encoded)
+
+	body=b''
+	directory=[]
+	for section in SECTIONS:
+		directory.extend([HEADER_SIZE+len(body),len(sections[section])])
+		body=align(body+sections[section])
+	stats=[count for what in ['states','symbols','transitions'] for count in reader.pruning_stats[what]]
+	header=HEADER.pack(MAGIC,VERSION,len(machine.states),machine.classCount,len(machine.outputs),len(strings),name_id,value_id,*(stats+directory))
+	f=open(binary_file,'wb')
+	f.write(align(header)+body)
+	f.close()
+
+def input_alphabet(machine):
+	"""The symbols of the tokenizer of a machine, which input strings are split into"""
+	symbols=[]
+	stack=[machine.tokenizer.trie]
+	while stack:
+		node=stack.pop()
+		for char,child in node.items():
+			if char=='':
+				symbols.append(child)
+			else:
+				stack.append(child)
+	return symbols
+
+def load_machine(binary_file):
+	"""Loads a binary file written by write_machine
+	Returns (machine, info) where machine is a CompiledMachine whose table is a read-only view of the mapped file,
+	and info is a dict with the name, the initial states, the final states, the state list and the pruning stats of the 2-way FST
+	Raises a BinaryFormatError if the file isn't a binary 2-way FST of this version"""
+	f=open(binary_file,'rb')
+	try:
+		data=mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)
+	except ValueError:
+		raise BinaryFormatError("%s is empty" % binary_file)
+	finally:
+		f.close()
+	if len(data)<HEADER.size or data[:len(MAGIC)]!=MAGIC:
+		raise BinaryFormatError("%s isn't a binary 2-way FST" % binary_file)
+	fields=HEADER.unpack_from(data,0)
+	magic,version,stateCount,classCount,outputCount,stringCount,name_id,value_id=fields[:8]
+	if version!=VERSION:
+		raise BinaryFormatError("%s is a binary 2-way FST of version %d, this interpreter reads version %d" % (binary_file,version,VERSION))
+	stats=fields[8:14]
+	directory=fields[14:]
+	view=memoryview(data)
+	def section(name,typecode='I',length=None):
+		"""The numbers of a section, or of its first length bytes"""
+		i=SECTIONS.index(name)
+		offset=directory[2*i]
+		if length is None:
+			length=directory[2*i+1]
+		if offset+length>len(data) or length%array(typecode).itemsize!=0:
+			raise BinaryFormatError("%s is cut short" % binary_file)
+		if sys.byteorder=='little':
+			return view[offset:offset+length].cast(typecode)
+		values=array(typecode,view[offset:offset+length].tobytes())
+		values.byteswap()
+		return values
+
+	"""The strings section has the offsets first, as many as there are strings plus one, then the bytes of the strings"""
+	strings_start=directory[2*SECTIONS.index('strings')]
+	offsets=section('strings','I',4*(stringCount+1))
+	bytes_start=strings_start+4*(stringCount+1)
+	strings=[sys.intern(str(view[bytes_start+offsets[k]:bytes_start+offsets[k+1]],'utf-8')) for k in range(stringCount)]
+
+	machine=CompiledMachine.__new__(CompiledMachine)
+	machine.states=[strings[k] for k in section('states')]
+	machine.state_ids=dict([(state,q) for q,state in enumerate(machine.states)])
+	starts=section('class starts')
+	symbol_ids=section('class symbols')
+	machine.class_symbols=[[strings[k] for k in symbol_ids[starts[c]:starts[c+1]]] for c in range(classCount)]
+	machine.class_ids={}
+	for c,symbols in enumerate(machine.class_symbols):
+		for symbol in symbols:
+			machine.class_ids[symbol]=c
+	machine.classCount=classCount
+	records=section('outputs')
+	pair_ids=section('output pairs')
+	machine.outputs=[]
+	for k in range(outputCount):
+		kind,a,b=records[3*k:3*k+3]
+		if kind==0:
+			machine.outputs.append(strings[a])
+		else:
+			machine.outputs.append(dict([(strings[pair_ids[2*j]],strings[pair_ids[2*j+1]]) for j in range(a,a+b)]))
+	machine.table=section('table','q')
+	if len(machine.table)!=stateCount*classCount:
+		raise BinaryFormatError("%s is cut short" % binary_file)
+	machine.alphabet=shared_alphabet([strings[k] for k in section('alphabet')])
+	machine.tokenizer=SymbolTokenizer.shared([strings[k] for k in section('input alphabet')])
+	initialStateList=[strings[k] for k in section('initial states')]
+	finalStateList=[strings[k] for k in section('final states')]
+	machine.final=bytearray(stateCount)
+	for state in finalStateList:
+		if state in machine.state_ids:
+			machine.final[machine.state_ids[state]]=1
+	machine.initialState=initialStateList[0]
+	machine.initialStates=initialStateList
+	machine.alternatives={}
+	alternatives=section('alternatives','q')
+	for k in range(0,len(alternatives),2):
+		machine.alternatives[alternatives[k]]=machine.alternatives.get(alternatives[k],())+(alternatives[k+1],)
+	machine.initialValue=strings[value_id]
+	machine.conflicts=[]
+	machine.cache=None
+	machine.domain_automaton=None
+	machine.prefilter=False
+	machine.profile=None
+	machine.step_count=0
+	info={'name':strings[name_id],'initialStateList':initialStateList,'finalStateList':finalStateList,'stateList':[strings[k] for k in section('state list')],
+		'pruning_stats':{'states':stats[0:2],'symbols':stats[2:4],'transitions':stats[4:6]}}
+	return machine,info
+
+def main():
+	parser=argparse.ArgumentParser(description="Converts 2-way FSTs between FST recipes or lists of transitions and the binary format")
+	subparsers=parser.add_subparsers(dest='command',required=True)
+	pack=subparsers.add_parser('pack',help="write the 2-way FST of an FST recipe ('w') or of a list of transitions ('r') in the binary format")
+	pack.add_argument('FST_file',help="the FST recipe, or the list of transitions in the 'r' setting")
+	pack.add_argument('setting',choices=['w','r'])
+	pack.add_argument('binary_file',help="the binary file to write")
+	pack.add_argument('--nondeterministic',action='store_true',help="keep every transition of a nondeterministic 2-way FST, see two_way_nondeterministic.py")
+	unpack=subparsers.add_parser('unpack',help="write the transitions of a binary 2-way FST as a list of transitions, like output_transitions.txt")
+	unpack.add_argument('binary_file',help="the binary file to read")
+	unpack.add_argument('transitions_file',nargs='?',default='output_transitions.txt',help="the list of transitions to write (default: output_transitions.txt)")
+	unpack.add_argument('--nondeterministic',action='store_true',help="write every transition of a nondeterministic 2-way FST")
+	args=parser.parse_args()
+
+	if args.command=='pack':
+		f=open(args.FST_file,'r',encoding='utf-8')
+		FST_text=f.read()
+		f.close()
+		try:
+			if args.setting=='w':
+				reader=Reader.from_recipe(FST_text,nondeterministic=args.nondeterministic)
+			else:
+				reader=Reader.from_transition_list(FST_text,nondeterministic=args.nondeterministic)
+		except RecipeError as error:
+			sys.stderr.write("error, the FST recipe %s has mistakes:\n%s\n" % (args.FST_file,error))
+			sys.exit(1)
+		except TransitionListError as error:
+			sys.stderr.write("error, the list of transitions %s has mistakes:\n%s\n" % (args.FST_file,error))
+			sys.exit(1)
+		write_machine(reader,args.binary_file)
+	else:
+		try:
+			reader=Reader.from_binary(args.binary_file,nondeterministic=args.nondeterministic)
+		except BinaryFormatError as error:
+			sys.stderr.write("error, %s\n" % error)
+			sys.exit(1)
+		reader.output_transitions(args.transitions_file)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Generates a Python module specialized to one compiled 2-way FST, which runs it without going through the transition table
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import io
+import os
+import hashlib
+import importlib.util
+
+from two_way_interpreter import CompiledMachine, interpreter_version
+
+def codegen_version():
+	"""A hash of the source code of this generator and of the interpreter, so generated modules are never reused across versions of either"""
+	global codegen_source_hash
+	if codegen_source_hash is None:
+		with io.open(os.path.abspath(__file__),'rb') as f:
+			codegen_source_hash=hashlib.sha256(f.read()+interpreter_version().encode('utf-8')).hexdigest()
+	return codegen_source_hash
+codegen_source_hash=None
+
+def machine_key(machine):
+	"""A hash of everything the generated code depends on: the states, classes, outputs and transitions of the machine, and the version of the generator"""
+	key=hashlib.sha256()
+	key.update(codegen_version().encode('utf-8'))
+	for output in machine.outputs:
+		key.update(repr(output if output.__class__ is str else sorted(function_pairs(machine,output))).encode('utf-8'))
+	key.update(repr((machine.states,machine.class_symbols,list(machine.table),list(machine.final),machine.initialState)).encode('utf-8'))
+	return key.hexdigest()
+
+def function_pairs(machine,output):
+	"""The (symbol, output string) pairs of an output that depends on the input symbol, for every symbol of the machine it's defined for"""
+	pairs=[]
+	for symbol in sorted(machine.class_ids):
+		try:
+			pairs.append((symbol,output[symbol]))
+		except KeyError:
+			pass
+	return pairs
+
+def class_test(classes):
+	"""The test of a class id against a list of classes, a set written as a literal so that python makes it a constant"""
+	if len(classes)==1:
+		return '==%d' % classes[0]
+	return ' in {%s}' % ','.join([str(c) for c in sorted(classes)])
+
+class CodeWriter:
+	"""Collects the lines of the generated module with their indentation"""
+
+	def __init__(self):
+		self.lines=[]
+
+	def line(self,depth,text):
+		self.lines.append('\t'*depth+text)
+
+	def text(self):
+		return '\n'.join(self.lines)+'\n'
+
+def generate_source(machine,key=None):
+	"""Returns the source of a module with a function run(entire_input,bound) specialized to a deterministic compiled machine
+	run follows the same steps as CompiledMachine.run from the initial state and returns (output, steps) if the run reaches the end of the input in a final state,
+	(q, i, output list, steps) if it stops in the state number q at the position i without reaching the end in a final state,
+	or None if it takes bound steps before stopping or if it stays in the same configuration forever.
+	The bound is only checked when the run goes back to an earlier block, so a run can take a few more steps than bound, see GeneratedMachine.run
+
+	There's a block of code for each state, which checks the class of the symbol read against the classes the state has transitions for,
+	with the output strings written in the code as constants. The blocks are in the order of a depth-first search from the initial state,
+	so most transitions go on to the block right after them without going back to the top of the loop.
+	A state that loops on itself over some classes, moving the same way and outputting nothing, the same string, or the symbol it reads,
+	skips over all those symbols at once instead of taking one step at a time"""
+	if key is None:
+		key=machine_key(machine)
+	code=CodeWriter()
+	code.line(0,'# -*- coding: utf-8 -*-')
+	code.line(0,'# Generated by two_way_codegen.py, edits are overwritten')
+	code.line(0,'# key: %s' % key)
+	code.line(0,'')
+	code.line(0,'CLASS_IDS=%r' % dict(sorted(machine.class_ids.items())))
+	if machine.initialState not in machine.state_ids:
+		code.line(0,'')
+		code.line(0,'def run(entire_input,bound):')
+		code.line(1,'return None')
+		return code.text()
+
+	classCount=machine.classCount
+	edge_classes={}
+	for symbol,direction in [('#',-1),('%',1)]:
+		if symbol in machine.class_ids:
+			edge_classes[direction]=machine.class_ids[symbol]
+	def state_comment(q):
+		return '\t# '+machine.states[q].replace('\n',' ')
+
+	"""Each output is 'empty', a constant string, 'copy' if it outputs the symbol read, or a dict from symbols to strings"""
+	functions={}
+	def output_kind(output_id,classes):
+		output=machine.outputs[output_id]
+		if output.__class__ is str:
+			return ('empty',) if output=='' else ('constant',output)
+		symbols=[symbol for c in classes for symbol in machine.class_symbols[c]]
+		try:
+			if all([output[symbol]==symbol for symbol in symbols]):
+				return ('copy',)
+		except KeyError:
+			pass
+		if output_id not in functions:
+			functions[output_id]='F%d' % output_id
+			code.line(0,'%s=%r' % (functions[output_id],dict(function_pairs(machine,output))))
+		return ('function',functions[output_id])
+
+	rows=[]
+	for q in range(len(machine.states)):
+		groups={}
+		for c in range(classCount):
+			record=machine.table[q*classCount+c]
+			if record>=0:
+				groups.setdefault(record,[]).append(c)
+		rows.append(groups)
+	order=[]
+	placed=set()
+	stack=[machine.state_ids[machine.initialState]]
+	while len(stack)>0:
+		q=stack.pop()
+		if q in placed:
+			continue
+		placed.add(q)
+		order.append(q)
+		successors=[]
+		for record,classes in sorted(rows[q].items(),key=lambda item:item[1]):
+			p=(record>>2)&0x3fffffff
+			if p not in placed and p not in successors:
+				successors.append(p)
+		successors.reverse()
+		stack.extend(successors)
+	position=dict([(q,k) for k,q in enumerate(order)])
+
+	"""The blocks are written first, since the output constants of functions have to come before the run function
+	A state without transitions has no block, the run falls through every block after it and stops at the end of the loop"""
+	blocks=CodeWriter()
+	for q in order:
+		groups=rows[q]
+		if len(groups)==0:
+			continue
+		blocks.line(2,'if q==%d:%s' % (q,state_comment(q)))
+
+		"""The loops of the state on itself that can be skipped over at once: same direction, no edge symbol, and compatible outputs"""
+		scan=None
+		for direction in [1,-1]:
+			loops=[(record,classes) for record,classes in groups.items() if (record>>2)&0x3fffffff==q and (record&3)-1==direction and edge_classes.get(direction) not in classes]
+			if len(loops)==0:
+				continue
+			kinds=set([output_kind(record>>32,classes) for record,classes in loops])
+			if len(kinds)==1 and list(kinds)[0][0]!='function':
+				scan=(direction,list(kinds)[0],sorted([c for record,classes in loops for c in classes]),[record for record,classes in loops])
+				break
+		groups=dict(groups)
+		if scan is not None:
+			direction,kind,classes,records=scan
+			blocks.line(3,'j=i')
+			blocks.line(3,'while ids[j]%s:' % class_test(classes))
+			blocks.line(4,'j=j%+d' % direction)
+			if direction==1:
+				distance='j-i'
+				if kind[0]=='copy':
+					blocks.line(3,"append(''.join(entire_input[i:j]))")
+			else:
+				distance='i-j'
+				if kind[0]=='copy':
+					blocks.line(3,"append(''.join(entire_input[i:j:-1]))")
+			if kind[0]=='constant':
+				blocks.line(3,'append(%r*(%s))' % (kind[1],distance))
+			blocks.line(3,'steps=steps+%s' % distance)
+			blocks.line(3,'i=j')
+			for record in records:
+				del groups[record]
+
+		if len(groups)==0:
+			blocks.line(3,'return %d,i,output,steps' % q)
+			continue
+		blocks.line(3,'a=ids[i]')
+		test='if'
+		for record,classes in sorted(groups.items(),key=lambda item:item[1]):
+			p=(record>>2)&0x3fffffff
+			direction=(record&3)-1
+			blocks.line(3,'%s a%s:' % (test,class_test(classes)))
+			test='elif'
+			if p==q and direction==0:
+				#the machine stays in the same configuration forever
+				blocks.line(4,'return None')
+				continue
+			kind=output_kind(record>>32,classes)
+			if kind[0]=='constant':
+				blocks.line(4,'append(%r)' % kind[1])
+			elif kind[0]=='copy':
+				blocks.line(4,'append(entire_input[i])')
+			elif kind[0]=='function':
+				blocks.line(4,'append(%s[entire_input[i]])' % kind[1])
+			if direction!=0:
+				blocks.line(4,'i=i%+d' % direction)
+			blocks.line(4,'steps=steps+1')
+			if direction==1 and edge_classes.get(1) in classes:
+				blocks.line(4,'if i==n:')
+				if machine.final[p]:
+					blocks.line(5,"return ''.join(output),steps")
+				else:
+					blocks.line(5,'return %d,i,output,steps' % p)
+			if direction==-1 and edge_classes.get(-1) in classes:
+				blocks.line(4,'if i<0:')
+				blocks.line(5,'return %d,i,output,steps' % p)
+			if p!=q:
+				blocks.line(4,'q=%d%s' % (p,state_comment(p)))
+			if position[p]<=position[q]:
+				blocks.line(4,'continue')
+		blocks.line(3,'else:')
+		blocks.line(4,'return %d,i,output,steps' % q)
+
+	code.line(0,'')
+	code.line(0,'def run(entire_input,bound,get=CLASS_IDS.get):')
+	code.line(1,'"""Runs the 2-way FST on an input split into symbols and flanked by # and %, see two_way_codegen.generate_source"""')
+	code.line(1,'ids=[get(symbol,-1) for symbol in entire_input]')
+	code.line(1,'n=len(entire_input)')
+	code.line(1,'output=[]')
+	code.line(1,'append=output.append')
+	code.line(1,'i=0')
+	code.line(1,'q=%d' % order[0])
+	code.line(1,'steps=0')
+	code.line(1,'while steps<bound:')
+	code.lines.extend(blocks.lines)
+	code.line(2,'return q,i,output,steps')
+	code.line(1,'return None')
+	return code.text()
+
+def load_source(source,module_file='<generated>'):
+	"""Compiles the source of a generated module and returns its run function"""
+	namespace={}
+	exec(compile(source,module_file,'exec'),namespace)
+	return namespace['run']
+
+def load_module(machine,module_file):
+	"""Returns (run function, source) of the generated module of a machine stored in module_file
+	The module is only generated and written again if the file is missing or was generated for a different machine or generator version,
+	otherwise it's imported as it is, so python keeps its compiled bytecode too"""
+	key=machine_key(machine)
+	source=None
+	if os.path.exists(module_file):
+		with io.open(module_file,'r',encoding='utf-8') as f:
+			source=f.read()
+		if '# key: %s\n' % key not in source[:500]:
+			source=None
+	if source is None:
+		source=generate_source(machine,key)
+		temp_file='%s.%d.tmp' % (module_file,os.getpid())
+		with io.open(temp_file,'w',encoding='utf-8') as f:
+			f.write(source)
+		os.replace(temp_file,module_file)
+	spec=importlib.util.spec_from_file_location('redtyp_generated_%s' % key[:16],module_file)
+	module=importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(module)
+	return module.run,source
+
+class GeneratedMachine(CompiledMachine):
+	"""A compiled machine whose runs from the initial state go through the code generated for it, see generate_source
+	Runs that fail are run again by CompiledMachine.run, which makes their error, so the outputs and errors are always the same as the ones of the compiled machine"""
+
+	__slots__=('generated_run','generated_source')
+
+	@classmethod
+	def from_machine(cls,machine,module_file=None):
+		"""Generates the code of a compiled machine and returns the generated machine, which shares the table and outputs of the compiled machine
+		If module_file is given, the generated module is kept in that file and reused while the machine doesn't change, see load_module"""
+		generated_machine=machine.converted(cls)
+		if module_file is None:
+			generated_machine.generated_source=generate_source(machine)
+			generated_machine.generated_run=load_source(generated_machine.generated_source)
+		else:
+			generated_machine.generated_run,generated_machine.generated_source=load_module(machine,module_file)
+		return generated_machine
+
+	def compiled_machine(self):
+		"""Returns the compiled machine without the generated code"""
+		return self.converted(CompiledMachine)
+
+	def __getstate__(self):
+		"""The generated function can't be pickled, so only its source is kept, and it's compiled again when it's unpickled"""
+		state=CompiledMachine.__getstate__(self)
+		del state['generated_run']
+		return state
+
+	def __setstate__(self,state):
+		CompiledMachine.__setstate__(self,state)
+		self.generated_run=load_source(self.generated_source)
+
+	def run(self,stateQ,output_so_far,entire_input,index_header,max_steps=None):
+		"""Runs the generated code when the run starts at the beginning of an input from the initial state, and CompiledMachine.run otherwise
+		CompiledMachine.run is also used when the generated code went over the bound of steps, which it only notices once in a while,
+		so that the error is the same"""
+		if index_header==0 and stateQ==self.initialState and output_so_far.__class__ is str and entire_input[0]=='#' and entire_input[-1]=='%':
+			input_length=len(entire_input)
+			bound=len(self.states)*input_length
+			if max_steps is not None and max_steps<bound:
+				bound=max_steps
+			result=self.generated_run(entire_input,bound)
+			if result is not None and len(result)==2:
+				output,steps=result
+				if steps<=bound:
+					self.step_count=self.step_count+steps
+					return output_so_far+output
+			elif result is not None:
+				"""A run that stops before the end of the input has to stop within the bound, one that stops at the end can stop at the bound, like in CompiledMachine.run"""
+				q,i,outputs,steps=result
+				if steps<bound or (i==input_length and steps<=bound):
+					self.step_count=self.step_count+steps
+					return self.stop_error(q,i,output_so_far+''.join(outputs),entire_input)
+		return CompiledMachine.run(self,stateQ,output_so_far,entire_input,index_header,max_steps)
@@ -13,6 +13,18 @@ import re
 import sys
 import io
 import codecs
+import argparse
+import collections
+import multiprocessing
+import hashlib
+import pickle
+import os
+import time
+import json
+import csv
+import weakref
+import types
+from array import array
 
 def simplifyLines (lines):
 	"""Removes lines which start with a comment symbol %, or which are just whitespace/empty lines"""
@@ -22,23 +34,7 @@ def simplifyLines (lines):
 		if len(temp)>0 and temp[0]!='#':
 			newlines.append(temp)
 	return newlines
-	
-def breakLineofForm_Alphabet_type_eq_IntStrChar(line):
-	"""A lot of inputs are of the form "variable = value" where value ranges from a string to an integer
-	We just need to see whats on the right of the equation symbol
-	This will extract that"""
-	return line.split('=')[1].strip()
 
-def getListofItems(line):
-	"""A lot of inputs are of the form "variable = [ 'a', 'b', 'c'] where the value is a list of strings. 
-	We need that list. This extracts that list.
-	I assume the list values do not include [] or '' or "" """
-	rightpart=line.split(']')[0].split('[')[1].split(',')
-	refinedRightPart=[]
-	for mid in rightpart:
-		refinedRightPart.append(mid.strip()[1:-1])
-	return refinedRightPart
-	
 def getListofItems_nospace(line):
 	"""A lot of inputs are of the form "variable = [ 1, 2, 3] where the value is a list of integers or really anything without quotation marks. 
 	We need that list. 
@@ -49,472 +45,1817 @@ def getListofItems_nospace(line):
 		refinedRightPart.append(mid.strip())
 	return refinedRightPart
 
-def subalphabetCreator1by1(line):
-	"""Returns a tuple (string,list of strings)
-	An example is ('consonants', ['p', 't']) """
-	right=getListofItems(line)
-	left=line.split('=')[0].strip()
-	return (left,right)
+"""The alphabets that a recipe can use without listing them: "default ipa", "keyboard ipa" and "simple ipa"
+Each one is a tuple (alphabet, list of subalphabets), where each subalphabet is a tuple (name, list of symbols)
+They are tuples so that every machine that uses them can share them"""
 
-def subalphabetCreatorIter(lines):
-	"""Returns a list of subalphabets which are exemplified above"""
-	subalphabets=[]
-	for line in lines:
-		subalphabet=subalphabetCreator1by1(line)
-		#print subalphabet
-		subalphabets.append(subalphabet)
-	return subalphabets
-
-def functionCreator1by1(line):
-	"""Returns a tuple of the form (string, dict) where string is the name of the function
-	and where the dict is of the form { string:string}.
-	An example input is diphthongReduce = { ('A','a'), ('E','e') }
-	An example output is ('dipthongReduce', {'A':'a','E':'e'}) 
-	"""
-	line=line.strip().split('=')
-	leftpart=line[0].strip()
-	rightpart=line[1].split('}')[0].split('{')[1].strip()
-
-	"""This will get a list of form [('A,'a'),('B','b')], this list is a list of strings"""
-	tuples=re.findall('\(.*?\)',rightpart)
-	refinedtuples=[]
-	for tuple in tuples: 
-		"""This will convert the list into a list of tuples of strings"""
-		refinedtuple=re.findall('\'.*?\'',tuple)
-		refinedtuple=(refinedtuple[0][1:-1],refinedtuple[1][1:-1])
-		refinedtuples.append(refinedtuple) 
-	#return refinedtuples
-	return (leftpart,dict(refinedtuples))
-
-
-def functionCreatorIter(lines,alphabetList):
-	""" Returns a big dictionary of dictionaries to model the functions
-	for example { 'ID':{'a':'a','A':'A'}, 'dipthongReduce':{'A':'A'}}
-	We include the ID function here"""
-	functions=[]
+defaultIPA_consonants=tuple(['p', 'b', 'ɸ', 'β', 'm', 'ʙ', 'p͡f', 'f', 'v', 'ɱ', 'ʋ', 't̪', 'd̪', 'θ', 'ð', 't', 'd', 't͡s', 'd͡z', 't͡ɬ', 's', 'z', 't̪ˤ', 'd̪ˤ', 'θˤ', 'ðˤ', 'tˤ', 'dˤ', 'sˤ', 'zˤ', 'n', 'l', 'ɬ', 'ɮ', 'ɾ', 'ɺ', 'r', 'ʧ', 'ʤ', 'ʃ', 'ʒ', 'ɹ', 'ʈ', 'ɖ', 'ʂ', 'ʐ', 'ɳ', 'ɭ', 'ɽ', 'ɻ', 'k̘', 'g̘', 'ɡ̘', 'x̘', 'j', 'k', 'g', 'ɡ', 'ŋ', 'k͡x', 'x', 'ɣ', 'ʟ', 'k̙', 'g̙', 'ɡ̙', 'x̙', 'ɣ̙', 'q', 'ɢ', 'χ', 'ʁ', 'ɴ', 'ʀ', 'ħ', 'ʕ', 'ʔ', 'h', 'ɦ', 'w', 'ʍ', 'k͡p', 'ɡ͡b', 'ɥ', 't͡ɕ', 'd͡ʑ', 'ɕ', 'ʑ', 'c', 'ɟ', 'ç', 'ʝ', 'ɲ', 'ʎ', 'pː', 'bː', 'ɸː', 'βː', 'mː', 'ʙː', 'p͡fː', 'fː', 'vː', 'ɱː', 'ʋː', 't̪ː', 'd̪ː', 'θː', 'ðː', 'tː', 'dː', 't͡sː', 'd͡zː', 't͡ɬː', 'sː', 'zː', 't̪ˤː', 'd̪ˤː', 'θˤː', 'ðˤː', 'tˤː', 'dˤː', 'sˤː', 'zːˤ', 'nː', 'lː', 'ɬː', 'ɮː', 'ɾː', 'ɺː', 'rː', 'ʧː', 'ʤː', 'ʃː', 'ʒː', 'ɹː', 'ʈː', 'ɖː', 'ʂː', 'ʐː', 'ɳː', 'ɭː', 'ɽː', 'ɻː', 'k̘ː', 'g̘ː', 'ɡ̘ː', 'x̘ː', 'jː', 'kː', 'gː', 'ɡː', 'ŋː', 'k͡xː', 'xː', 'ɣː', 'ʟː', 'k̙ː', 'g̙ː', 'ɡ̙ː', 'x̙ː', 'ɣ̙ː', 'qː', 'ɢː', 'χː', 'ʁː', 'ɴː', 'ʀː', 'ħː', 'ʕː', 'ʔː', 'hː', 'ɦː', 'wː', 'ʍː', 'k͡pː', 'ɡ͡bː', 'ɥː', 't͡ɕː', 'd͡ʑː', 'ɕː', 'ʑː', 'cː', 'ɟː', 'çː', 'ʝː', 'ɲː', 'ʎː'])
+defaultIPA_vowels=tuple(['i', 'y', 'ɨ', 'ʉ', 'ɯ', 'u', 'ɪ', 'ʏ', 'ʊ', 'e', 'ø', 'ɘ', 'ɵ', 'ɤ', 'o', 'ɛ', 'œ', 'ɚ', 'ə', 'ɞ', 'ʌ', 'ɔ', 'æ', 'ɶ', 'a', 'ɑ', 'ɒ', 'ĩ', 'ỹ', 'ɨ̃', 'ʉ̃', 'ɯ̃', 'ũ', 'ɪ̃', 'ʏ̃', 'ʊ̃', 'ẽ', 'ø̃', 'ɘ̃', 'ɵ̃', 'ɤ̃', 'õ', 'ɛ̃', 'œ̃', 'ə̃', 'ɞ̃', 'ʌ̃', 'ɔ̃', 'æ̃', 'ɶ̃', 'ã', 'ɑ̃', 'ɒ̃', 'iː', 'yː', 'ɨː', 'ʉː', 'ɯː', 'uː', 'ɪː', 'ʏː', 'ʊː', 'eː', 'øː', 'ɘː', 'ɵː', 'ɤː', 'oː', 'ɛː', 'œː', 'ɚː', 'əː', 'ɞː', 'ʌː', 'ɔː', 'æː', 'ɶː', 'aː', 'ɑː', 'ɒː', 'ĩː', 'ỹː', 'ɨ̃ː', 'ʉ̃ː', 'ɯ̃ː', 'ũː', 'ɪ̃ː', 'ʏ̃ː', 'ʊ̃ː', 'ẽː', 'ø̃ː', 'ɘ̃ː', 'ɵ̃ː', 'ɤ̃ː', 'õː', 'ɛ̃ː', 'œ̃ː', 'ə̃ː', 'ɞ̃ː', 'ʌ̃ː', 'ɔ̃ː', 'æ̃ː', 'ɶ̃ː', 'ãː', 'ɑ̃ː', 'ɒ̃ː', 'ˈi', 'ˈy', 'ˈɨ', 'ˈʉ', 'ˈɯ', 'ˈu', 'ˈɪ', 'ˈʏ', 'ˈʊ', 'ˈe', 'ˈø', 'ˈɘ', 'ˈɵ', 'ˈɤ', 'ˈo', 'ˈɛ', 'ˈœ', 'ˈɚ', 'ˈə', 'ˈɞ', 'ˈʌ', 'ˈɔ', 'ˈæ', 'ˈɶ', 'ˈa', 'ˈɑ', 'ˈɒ', 'ˈĩ', 'ˈỹ', 'ˈɨ̃', 'ˈʉ̃', 'ˈɯ̃', 'ˈũ', 'ˈɪ̃', 'ˈʏ̃', 'ˈʊ̃', 'ˈẽ', 'ˈø̃', 'ˈɘ̃', 'ˈɵ̃', 'ˈɤ̃', 'ˈõ', 'ˈɛ̃', 'ˈœ̃', 'ˈə̃', 'ˈɞ̃', 'ˈʌ̃', 'ˈɔ̃', 'ˈæ̃', 'ˈɶ̃', 'ˈã', 'ˈɑ̃', 'ˈɒ̃', 'ˈiː', 'ˈyː', 'ˈɨː', 'ˈʉː', 'ˈɯː', 'ˈuː', 'ˈɪː', 'ˈʏː', 'ˈʊː', 'ˈeː', 'ˈøː', 'ˈɘː', 'ˈɵː', 'ˈɤː', 'ˈoː', 'ˈɛː', 'ˈœː', 'ˈɚː', 'ˈəː', 'ˈɞː', 'ˈʌː', 'ˈɔː', 'ˈæː', 'ˈɶː', 'ˈaː', 'ˈɑː', 'ˈɒː', 'ˈĩː', 'ˈỹː', 'ˈɨ̃ː', 'ˈʉ̃ː', 'ˈɯ̃ː', 'ˈũː', 'ˈɪ̃ː', 'ˈʏ̃ː', 'ˈʊ̃ː', 'ˈẽː', 'ˈø̃ː', 'ˈɘ̃ː', 'ˈɵ̃ː', 'ˈɤ̃ː', 'ˈõː', 'ˈɛ̃ː', 'ˈœ̃ː', 'ˈə̃ː', 'ˈɞ̃ː', 'ˈʌ̃ː', 'ˈɔ̃ː', 'ˈæ̃ː', 'ˈɶ̃ː', 'ˈãː', 'ˈɑ̃ː', 'ˈɒ̃ː', 'ˌi', 'ˌy', 'ˌɨ', 'ˌʉ', 'ˌɯ', 'ˌu', 'ˌɪ', 'ˌʏ', 'ˌʊ', 'ˌe', 'ˌø', 'ˌɘ', 'ˌɵ', 'ˌɤ', 'ˌo', 'ˌɛ', 'ˌœ', 'ˌɚ', 'ˌə', 'ˌɞ', 'ˌʌ', 'ˌɔ', 'ˌæ', 'ˌɶ', 'ˌa', 'ˌɑ', 'ˌɒ', 'ˌĩ', 'ˌỹ', 'ˌɨ̃', 'ˌʉ̃', 'ˌɯ̃', 'ˌũ', 'ˌɪ̃', 'ˌʏ̃', 'ˌʊ̃', 'ˌẽ', 'ˌø̃', 'ˌɘ̃', 'ˌɵ̃', 'ˌɤ̃', 'ˌõ', 'ˌɛ̃', 'ˌœ̃', 'ˌə̃', 'ˌɞ̃', 'ˌʌ̃', 'ˌɔ̃', 'ˌæ̃', 'ˌɶ̃', 'ˌã', 'ˌɑ̃', 'ˌɒ̃', 'ˌiː', 'ˌyː', 'ˌɨː', 'ˌʉː', 'ˌɯː', 'ˌuː', 'ˌɪː', 'ˌʏː', 'ˌʊː', 'ˌeː', 'ˌøː', 'ˌɘː', 'ˌɵː', 'ˌɤː', 'ˌoː', 'ˌɛː', 'ˌœː', 'ˌɚː', 'ˌəː', 'ˌɞː', 'ˌʌː', 'ˌɔː', 'ˌæː', 'ˌɶː', 'ˌaː', 'ˌɑː', 'ˌɒː', 'ˌĩː', 'ˌỹː', 'ˌɨ̃ː', 'ˌʉ̃ː', 'ˌɯ̃ː', 'ˌũː', 'ˌɪ̃ː', 'ˌʏ̃ː', 'ˌʊ̃ː', 'ˌẽː', 'ˌø̃ː', 'ˌɘ̃ː', 'ˌɵ̃ː', 'ˌɤ̃ː', 'ˌõː', 'ˌɛ̃ː', 'ˌœ̃ː', 'ˌə̃ː', 'ˌɞ̃ː', 'ˌʌ̃ː', 'ˌɔ̃ː', 'ˌæ̃ː', 'ˌɶ̃ː', 'ˌãː', 'ˌɑ̃ː', 'ˌɒ̃ː'])
+defaultIPA_short_vowels=tuple(['i', 'y', 'ɨ', 'ʉ', 'ɯ', 'u', 'ɪ', 'ʏ', 'ʊ', 'e', 'ø', 'ɘ', 'ɵ', 'ɤ', 'o', 'ɛ', 'œ', 'ɚ', 'ə', 'ɞ', 'ʌ', 'ɔ', 'æ', 'ɶ', 'a', 'ɑ', 'ɒ', 'ĩ', 'ỹ', 'ɨ̃', 'ʉ̃', 'ɯ̃', 'ũ', 'ɪ̃', 'ʏ̃', 'ʊ̃', 'ẽ', 'ø̃', 'ɘ̃', 'ɵ̃', 'ɤ̃', 'õ', 'ɛ̃', 'œ̃', 'ə̃', 'ɞ̃', 'ʌ̃', 'ɔ̃', 'æ̃', 'ɶ̃', 'ã', 'ɑ̃', 'ɒ̃', 'ˈi', 'ˈy', 'ˈɨ', 'ˈʉ', 'ˈɯ', 'ˈu', 'ˈɪ', 'ˈʏ', 'ˈʊ', 'ˈe', 'ˈø', 'ˈɘ', 'ˈɵ', 'ˈɤ', 'ˈo', 'ˈɛ', 'ˈœ', 'ˈɚ', 'ˈə', 'ˈɞ', 'ˈʌ', 'ˈɔ', 'ˈæ', 'ˈɶ', 'ˈa', 'ˈɑ', 'ˈɒ', 'ˈĩ', 'ˈỹ', 'ˈɨ̃', 'ˈʉ̃', 'ˈɯ̃', 'ˈũ', 'ˈɪ̃', 'ˈʏ̃', 'ˈʊ̃', 'ˈẽ', 'ˈø̃', 'ˈɘ̃', 'ˈɵ̃', 'ˈɤ̃', 'ˈõ', 'ˈɛ̃', 'ˈœ̃', 'ˈə̃', 'ˈɞ̃', 'ˈʌ̃', 'ˈɔ̃', 'ˈæ̃', 'ˈɶ̃', 'ˈã', 'ˈɑ̃', 'ˈɒ̃', 'ˌi', 'ˌy', 'ˌɨ', 'ˌʉ', 'ˌɯ', 'ˌu', 'ˌɪ', 'ˌʏ', 'ˌʊ', 'ˌe', 'ˌø', 'ˌɘ', 'ˌɵ', 'ˌɤ', 'ˌo', 'ˌɛ', 'ˌœ', 'ˌɚ', 'ˌə', 'ˌɞ', 'ˌʌ', 'ˌɔ', 'ˌæ', 'ˌɶ', 'ˌa', 'ˌɑ', 'ˌɒ', 'ˌĩ', 'ˌỹ', 'ˌɨ̃', 'ˌʉ̃', 'ˌɯ̃', 'ˌũ', 'ˌɪ̃', 'ˌʏ̃', 'ˌʊ̃', 'ˌẽ', 'ˌø̃', 'ˌɘ̃', 'ˌɵ̃', 'ˌɤ̃', 'ˌõ', 'ˌɛ̃', 'ˌœ̃', 'ˌə̃', 'ˌɞ̃', 'ˌʌ̃', 'ˌɔ̃', 'ˌæ̃', 'ˌɶ̃', 'ˌã', 'ˌɑ̃', 'ˌɒ̃'])
+defaultIPA_long_vowels=tuple(['iː', 'yː', 'ɨː', 'ʉː', 'ɯː', 'uː', 'ɪː', 'ʏː', 'ʊː', 'eː', 'øː', 'ɘː', 'ɵː', 'ɤː', 'oː', 'ɛː', 'œː', 'ɚː', 'əː', 'ɞː', 'ʌː', 'ɔː', 'æː', 'ɶː', 'aː', 'ɑː', 'ɒː', 'ĩː', 'ỹː', 'ɨ̃ː', 'ʉ̃ː', 'ɯ̃ː', 'ũː', 'ɪ̃ː', 'ʏ̃ː', 'ʊ̃ː', 'ẽː', 'ø̃ː', 'ɘ̃ː', 'ɵ̃ː', 'ɤ̃ː', 'õː', 'ɛ̃ː', 'œ̃ː', 'ə̃ː', 'ɞ̃ː', 'ʌ̃ː', 'ɔ̃ː', 'æ̃ː', 'ɶ̃ː', 'ãː', 'ɑ̃ː', 'ɒ̃ː', 'ˈiː', 'ˈyː', 'ˈɨː', 'ˈʉː', 'ˈɯː', 'ˈuː', 'ˈɪː', 'ˈʏː', 'ˈʊː', 'ˈeː', 'ˈøː', 'ˈɘː', 'ˈɵː', 'ˈɤː', 'ˈoː', 'ˈɛː', 'ˈœː', 'ˈɚː', 'ˈəː', 'ˈɞː', 'ˈʌː', 'ˈɔː', 'ˈæː', 'ˈɶː', 'ˈaː', 'ˈɑː', 'ˈɒː', 'ˈĩː', 'ˈỹː', 'ˈɨ̃ː', 'ˈʉ̃ː', 'ˈɯ̃ː', 'ˈũː', 'ˈɪ̃ː', 'ˈʏ̃ː', 'ˈʊ̃ː', 'ˈẽː', 'ˈø̃ː', 'ˈɘ̃ː', 'ˈɵ̃ː', 'ˈɤ̃ː', 'ˈõː', 'ˈɛ̃ː', 'ˈœ̃ː', 'ˈə̃ː', 'ˈɞ̃ː', 'ˈʌ̃ː', 'ˈɔ̃ː', 'ˈæ̃ː', 'ˈɶ̃ː', 'ˈãː', 'ˈɑ̃ː', 'ˈɒ̃ː', 'ˌiː', 'ˌyː', 'ˌɨː', 'ˌʉː', 'ˌɯː', 'ˌuː', 'ˌɪː', 'ˌʏː', 'ˌʊː', 'ˌeː', 'ˌøː', 'ˌɘː', 'ˌɵː', 'ˌɤː', 'ˌoː', 'ˌɛː', 'ˌœː', 'ˌɚː', 'ˌəː', 'ˌɞː', 'ˌʌː', 'ˌɔː', 'ˌæː', 'ˌɶː', 'ˌaː', 'ˌɑː', 'ˌɒː', 'ˌĩː', 'ˌỹː', 'ˌɨ̃ː', 'ˌʉ̃ː', 'ˌɯ̃ː', 'ˌũː', 'ˌɪ̃ː', 'ˌʏ̃ː', 'ˌʊ̃ː', 'ˌẽː', 'ˌø̃ː', 'ˌɘ̃ː', 'ˌɵ̃ː', 'ˌɤ̃ː', 'ˌõː', 'ˌɛ̃ː', 'ˌœ̃ː', 'ˌə̃ː', 'ˌɞ̃ː', 'ˌʌ̃ː', 'ˌɔ̃ː', 'ˌæ̃ː', 'ˌɶ̃ː', 'ˌãː', 'ˌɑ̃ː', 'ˌɒ̃ː'])
+defaultIPA_boundaries=tuple(['-','+','.'])
+keyboardIPA_consonants=tuple(['p','t','k','b','d','g','m','n','f','v','s','z','x','h','r','l','w','j','c','q'])
+keyboardIPA_vowels=tuple(['a','e','i','o','u','y', '`a','`e','`i','`o','`u','`y', '`a:','`e:','`i:','`o:','`u:','`y:', 'a:','e:','i:','o:','u:','y:'])
+keyboardIPA_long_vowels=tuple(['`a:','`e:','`i:','`o:','`u:','`y:', 'a:','e:','i:','o:','u:','y:'])
+keyboardIPA_short_vowels=tuple(['a','e','i','o','u','y', '`a','`e','`i','`o','`u','`y'])
+keyboardIPA_stressed_vowels=tuple(['`a','`e','`i','`o','`u','`y', '`a:','`e:','`i:','`o:','`u:','`y:'])
+keyboardIPA_unstressed_vowels=tuple(['a','e','i','o','u','y',  'a:','e:','i:','o:','u:','y:'])
+keyboardIPA_boundaries=tuple(['-','+','.'])
+simpleIPA_consonants=tuple(['b','ʙ','c','ç','ɕ','d','ð','ʤ','d͡z','d͡ʑ','ɖ','f','g','ɢ','ɣ','ɡ','ɡ͡b','h','ħ','ɦ','ɥ','j','ɟ','ʝ','k','k͡p','k͡x','l','ʟ','ɭ','ɬ','ɮ','m','ɱ','n','ɴ','ɲ','ɳ','ŋ','p','ɸ','p͡f','q','r','ʀ','ɽ','ɹ','ʁ','ɺ','ɻ','ɾ','s','ʂ','ʃ','t','ʈ','ʧ','t͡ɕ','t͡ɬ','t͡s','v','ʋ','w','ʍ','x','ʎ','z','ʐ','ʑ','ʒ','ʔ','ʕ','β','θ','χ'])
+simpleIPA_vowels=tuple(['i','y','ɨ','ʉ','ɯ','u','ɪ','ʏ','ʊ','e','ø','ɘ','ɵ','ɤ','o','ɛ','œ','ɚ','ə','ɞ','ʌ','ɔ','æ','ɶ','a','ɑ','ɒ'])
+defaultIPA_segments=defaultIPA_consonants+defaultIPA_vowels
+defaultIPA_alphabet=defaultIPA_segments+defaultIPA_boundaries
+keyboardIPA_segments=keyboardIPA_consonants+keyboardIPA_vowels
+keyboardIPA_alphabet=keyboardIPA_consonants+keyboardIPA_vowels+keyboardIPA_boundaries
+simpleIPA_alphabet=simpleIPA_consonants+simpleIPA_vowels
+
+builtinAlphabets={
+	"default ipa":(defaultIPA_alphabet,(("consonants",defaultIPA_consonants),("vowels",defaultIPA_vowels),("alphabet",defaultIPA_alphabet),("long_vowels",defaultIPA_long_vowels),("short_vowels",defaultIPA_short_vowels), ("boundaries",defaultIPA_boundaries),("segments",defaultIPA_segments))),
+	"keyboard ipa":(keyboardIPA_alphabet,(("consonants",keyboardIPA_consonants),("vowels",keyboardIPA_vowels),("alphabet",keyboardIPA_alphabet),("short_vowels",keyboardIPA_short_vowels),("long_vowels",keyboardIPA_long_vowels),("stressed_vowels",keyboardIPA_stressed_vowels),("unstressed_vowels",keyboardIPA_unstressed_vowels), ("boundaries",keyboardIPA_boundaries),("segments",keyboardIPA_segments))),
+	"simple ipa":(simpleIPA_alphabet,(("consonants",simpleIPA_consonants),("vowels",simpleIPA_vowels),("alphabet",simpleIPA_alphabet))),
+}
+
+def join_output(output_so_far,outputs):
+	"""Adds the list of output strings collected during a run to the output so far
+	The output so far is either a string, or a list of symbols if you're working on a list of symbols"""
+	if type(output_so_far)==list:
+		return output_so_far+outputs
+	return output_so_far+''.join(outputs)
+
+def read_input_strings(input_string_file):
+	"""Lazily yields the stripped lines of a utf-8 file of input strings, or of stdin if the file name is '-'
+	utf8 texts can start with the byte order mark, the utf-8-sig encoding removes it"""
+	if input_string_file=='-':
+		f_input=io.TextIOWrapper(sys.stdin.buffer,encoding='utf-8-sig')
+	else:
+		f_input=io.open(input_string_file,'r',encoding='utf-8-sig')
+	try:
+		for line in f_input:
+			yield line.strip()
+	finally:
+		if input_string_file=='-':
+			f_input.detach()
+		else:
+			f_input.close()
+
+def write_output_strings(output_string_file,pairs,chunk_size=1000):
+	"""Writes the pairs (input string, output string) as lines "input --> output" on a utf-8 file, or on stdout if the file name is '-'
+	The lines are joined and written chunk_size lines at a time instead of one write per line"""
+	if output_string_file=='-':
+		sys.stdout.flush()
+		f_output=io.TextIOWrapper(sys.stdout.buffer,encoding='utf-8',newline='')
+	else:
+		f_output=io.open(output_string_file,'w',encoding='utf-8',newline='')
+	try:
+		chunk=[]
+		for line,output in pairs:
+			chunk.append(line+"\t-->\t"+output+"\r\n")
+			if len(chunk)>=chunk_size:
+				f_output.write(''.join(chunk))
+				chunk=[]
+		f_output.write(''.join(chunk))
+	finally:
+		if output_string_file=='-':
+			f_output.flush()
+			f_output.detach()
+		else:
+			f_output.close()
+
+
+def chunked(lines,chunk_size):
+	"""Lazily groups an iterable of lines into lists of chunk_size lines"""
+	chunk=[]
 	for line in lines:
-		function=functionCreator1by1(line)
-		#print function
-		functions.append(function)
-	
-	ID=[]
-	for symbol in alphabetList:
-		ID.append((symbol,symbol))
-	ID=dict(ID)
-	functions.append(("ID",ID))
-	return dict(functions)
-
-def transitionCreator1by1(line):
-	"""Given a line of the form "(stateQ,inputA)=(stateP,outputB,direction')"
-	This function will parse it into a 5-tuple
-	I assume the states are flanked by '' and that they do not contain paranthesses or commas or ''
-	The input/output are either strings like 'A' which do not include (), or commas or '' OR they are of the form \\string such as \\alphabet
-	
-	I do not debug for wrong states/symbols here but in the delta function"""
-	
-	transitionEntry=line.strip()
+		chunk.append(line)
+		if len(chunk)>=chunk_size:
+			yield chunk
+			chunk=[]
+	if chunk:
+		yield chunk
+
+"""The compiled machine of a worker process in a parallel batch, it's set once when the worker starts"""
+batch_worker_machine=None
+batch_worker_max_steps=None
+
+def init_batch_worker(machine,max_steps):
+	global batch_worker_machine,batch_worker_max_steps
+	batch_worker_machine=machine
+	batch_worker_max_steps=max_steps
+
+def transduce_chunk(chunk):
+	"""Transduces a chunk of input strings inside a worker process"""
+	return [batch_worker_machine.transduce(line,batch_worker_max_steps) for line in chunk]
+
+
+"""The modules whose classes can end up pickled in the compiled cache: the machines of this interpreter and the machines that subclass them"""
+pickled_modules=['two_way_interpreter.py','two_way_nondeterministic.py','two_way_codegen.py','two_way_sweeping.py']
+
+def interpreter_version():
+	"""Returns a hash of the source code of this interpreter and of the other modules in pickled_modules,
+	so compiled machines are never reused across different versions of any of them"""
+	global interpreter_source_hash
+	if interpreter_source_hash is None:
+		source_hash=hashlib.sha256()
+		folder=os.path.dirname(os.path.abspath(__file__))
+		for module_file in pickled_modules:
+			path=os.path.join(folder,module_file)
+			if os.path.exists(path):
+				with io.open(path,'rb') as f:
+					source_hash.update(f.read())
+		interpreter_source_hash=source_hash.hexdigest()
+	return interpreter_source_hash
+interpreter_source_hash=None
+
+def compiled_cache_key(FST_text,setting):
+	"""The name of the compiled cache file is a hash of the FST file, of the setting 'w' or 'r' and of the interpreter version"""
+	key=hashlib.sha256()
+	key.update(interpreter_version().encode('utf-8'))
+	key.update(setting.encode('utf-8'))
+	key.update(FST_text.encode('utf-8'))
+	return key.hexdigest()
+
+def load_compiled(cache_dir,cache_key):
+	"""Returns the compiled state stored under the key, or None if there isn't one or if it can't be read
+	The file is unpickled, which can run code, so the cache folder has to be one that only trusted users can write to"""
+	path=os.path.join(cache_dir,cache_key+'.pickle')
 	try:
-		
-		#print ( "below is entry")
-		#print (transitionEntry)
-		leftpart=transitionEntry.split('=')[0].strip()
-		rightpart=transitionEntry.split('=')[1].strip()
+		with io.open(path,'rb') as f:
+			return pickle.load(f)
+	except Exception:
+		return None
 
-		refinedLeftPart=leftpart.split(')')[0].split('(')[1].strip().split(',')
-		stateQ=refinedLeftPart[0].strip()[1:-1]
-		inputA=refinedLeftPart[1].strip()
-		if inputA[0]=="'":
-			inputA=inputA[1:-1]
-		elif inputA[0]=='\\':
-			inputA=inputA.strip()
+def save_compiled(cache_dir,cache_key,state):
+	"""Stores the compiled state under the key. The file is written under a temporary name and then renamed,
+	so that jobs running at the same time never read a half-written file"""
+	if not os.path.isdir(cache_dir):
+		os.makedirs(cache_dir)
+	path=os.path.join(cache_dir,cache_key+'.pickle')
+	temp_path='%s.%d.tmp' % (path,os.getpid())
+	with io.open(temp_path,'wb') as f:
+		pickle.dump(state,f,pickle.HIGHEST_PROTOCOL)
+	os.replace(temp_path,path)
 
-		#print "stateQ and inputA"
-		#print stateQ
-		#print inputA
 
+class RecipeError(Exception):
+	"""Raised when an FST recipe can't be read
+	self.errors is the list of every error found in the recipe, each one a tuple (line number, column number, message) counting from 1"""
+	
+	def __init__(self,errors):
+		self.errors=errors
+		Exception.__init__(self,"\n".join(["line %d, column %d: %s" % error for error in errors]))
 
-		refinedRightPart=rightpart.split(')')[0].split('(')[1].strip().split(',')
-		stateP=refinedRightPart[0].strip()[1:-1]
-		outputB=refinedRightPart[1].strip()
+class TransitionListError(Exception):
+	"""Raised when a list of transitions, like the one in output_transitions.txt, can't be read, see Reader.read_transition_list"""
+	pass
+
+class RecipeSyntaxError(Exception):
+	"""Raised by the parser for an error at some column of the line it's reading, it's turned into an entry of RecipeError"""
+	
+	def __init__(self,column,message):
+		self.column=column
+		self.message=message
+		Exception.__init__(self,message)
+
+"""The tokens of an FST recipe are strings 'a', references to subalphabets or functions \\consonants, 
+numbers -1, punctuation ( ) [ ] { } , = - and bare words like the words in 'initial states' or 'keyboard ipa'"""
+recipeTokenRegex=re.compile(r"""(?P<space>\s+)
+	|(?P<string>'[^']*')
+	|(?P<reference>\\[^\s'()\[\]{},=\\-]+)
+	|(?P<number>[+-]?[0-9]+(?![^\s()\[\]{},=]))
+	|(?P<punctuation>[()\[\]{},=-])
+	|(?P<word>[^\s'()\[\]{},=\\]+)
+	|(?P<error>.)""",re.VERBOSE)
+
+class RecipeLine:
+	"""The tokens of one line of an FST recipe, which the parser reads from left to right
+	Each token is a tuple (kind, text, column), and the last one is always ('end', '', column after the line)"""
+	
+	def __init__(self,line):
+		self.line=line
+		self.position=0
+		self.tokens=[(match.lastgroup,match.group(),match.start()+1) for match in recipeTokenRegex.finditer(line) if match.lastgroup!='space']
+		for kind,text,column in self.tokens:
+			if kind=='error':
+				if text=="'":
+					raise RecipeSyntaxError(column,"this string is never closed with '")
+				raise RecipeSyntaxError(column,"unexpected character %s" % text)
+		self.tokens.append(('end','',len(line.rstrip())+1))
+	
+	def peek(self):
+		"""Returns the current token, or None at the end of the line"""
+		token=self.tokens[self.position]
+		if token[0]=='end':
+			return None
+		return token
+	
+	def at(self,kind,text=None):
+		token=self.tokens[self.position]
+		return token[0]==kind and (text is None or token[1]==text)
+	
+	def error_here(self,message):
+		"""Returns an error at the current token, or at the end of the line if there are no tokens left"""
+		token=self.tokens[self.position]
+		if token[0]=='end':
+			return RecipeSyntaxError(token[2],message+" but the line ended")
+		return RecipeSyntaxError(token[2],message+" but found "+token[1])
+	
+	def take(self,kind,text=None,what=None):
+		token=self.tokens[self.position]
+		if token[0]!=kind or (text is not None and token[1]!=text):
+			raise self.error_here("expected "+(what or text or kind))
+		self.position=self.position+1
+		return token
+	
+	def finish(self):
+		if self.tokens[self.position][0]!='end':
+			raise self.error_here("expected the end of the line")
+	
+	def key(self):
+		"""Reads the words on the left of a declaration "variable = value" and the =, and returns the words joined by single spaces"""
+		words=[]
+		while self.at('word'):
+			words.append(self.take('word')[1])
+		if len(words)==0:
+			raise self.error_here("expected a declaration like \"states = [...]\" or a transition")
+		self.take('punctuation','=')
+		return ' '.join(words)
+	
+	def string(self):
+		return self.take('string',what='a string in single quotes')[1][1:-1]
+	
+	def number(self):
+		return int(self.take('number',what='a number')[1])
+	
+	def words(self):
+		words=[]
+		while self.at('word'):
+			words.append(self.take('word')[1])
+		if len(words)==0:
+			raise self.error_here("expected a name")
+		return ' '.join(words)
+	
+	def string_list(self):
+		"""Reads a list of the form [ 'a', 'b', 'c' ]"""
+		self.take('punctuation','[')
+		items=[]
+		if not self.at('punctuation',']'):
+			items.append(self.string())
+			while self.at('punctuation',','):
+				self.take('punctuation',',')
+				items.append(self.string())
+		self.take('punctuation',']')
+		return items
+	
+	def pair_set(self):
+		"""Reads a set of pairs of the form { ('A','a'), ('E','e') } and returns it as a list of tuples of strings
+		Some recipes write a pair like ('A':'a'), so that's fine too"""
+		self.take('punctuation','{')
+		pairs=[]
+		while self.at('punctuation','('):
+			self.take('punctuation','(')
+			left=self.string()
+			if self.at('word',':'):
+				self.take('word',':')
+			else:
+				self.take('punctuation',',')
+			right=self.string()
+			self.take('punctuation',')')
+			pairs.append((left,right))
+			if not self.at('punctuation',','):
+				break
+			self.take('punctuation',',')
+		self.take('punctuation','}')
+		return pairs
+	
+	def source_since(self,start):
+		"""Returns the text of the line from the token at position start up to the last token that was read"""
+		first=self.tokens[start]
+		last=self.tokens[self.position-1]
+		return self.line[first[2]-1:last[2]-1+len(last[1])]
+
+class Recipe:
+	"""What an FST recipe says: its name, alphabet, subalphabets, functions, states and transitions
+	subalphabets is a list of tuples (name, list of symbols) and functions is a dict of dicts {name:{input symbol:output string}} which includes ID
+	transitions is the list of 5-tuples (q,a,p,b,d) as written in the recipe,
+	and symbolicTransitions is the list of 5-tuples (q,A,p,B,d) where A is the set of input symbols and B is the output template,
+	see CompiledMachine"""
+	pass
+
+class RecipeParser:
+	"""Reads an FST recipe, see instructions_on_recipe_creation.md, in a single pass over its lines
+	The subalphabets, functions and states are put in dicts by name as soon as they're read, so the transitions are checked with a lookup
+	Every error is collected with its line and column, and if there were any, a RecipeError with all of them is raised at the end"""
+	
+	"""The declarations come in this order, the ones starting with * can be repeated
+	The alphabet, subalphabets and subalphabet definitions only come with the alphabet type "user" """
+	sections=['what type of alphabet will you use','alphabet','subalphabets','*subalphabet','functions','*function','states','initial states','initial value','final states','*transition']
+	
+	def parse(self,text):
+		self.errors=[]
+		self.recipe=Recipe()
+		recipe=self.recipe
+		lines=text.splitlines()
+		if len(lines)>0 and lines[0][:1]==u'﻿':
+			lines[0]=lines[0][1:]#utf8 texts start with the byte encoding symbol, remove it
+		"""This gets the first line of the FST recipe assuming its the name of the FST"""
+		recipe.name=lines[0][1:].strip() if len(lines)>0 else ''
+		recipe.alphabetType=None
+		recipe.alphabetList=[]
+		recipe.subalphabets=[]
+		recipe.functions={}
+		recipe.stateList=[]
+		recipe.initialStateList=[]
+		recipe.initialValue=''
+		recipe.finalStateList=[]
+		recipe.transitions=[]
+		recipe.symbolicTransitions=[]
+		self.alphabetSet=set()
+		self.stateSet=set()
+		self.subalphabetIndex={}
+		self.userFunctions=[]
+		self.subalphabetCount=None
+		self.functionCount=None
+		self.stage=0
+		lineNumber=0
+		
+		"""Some 2-way FSTs of the database only have a note in place of their recipe, which would otherwise fail on its first apostrophe"""
+		content=[(lineNumber,line) for lineNumber,line in enumerate(lines,1) if len(line.strip())>0 and line.strip()[0]!='#']
+		if len(content)>0 and not any(['=' in line for lineNumber,line in content]):
+			raise RecipeError([(content[0][0],1,"this is text, not an FST recipe: it has no declarations or transitions")])
+		
+		for lineNumber,line in enumerate(lines,1):
+			stripped=line.strip()
+			if len(stripped)==0 or stripped[0]=='#':
+				continue
+			try:
+				self.parseLine(RecipeLine(line),lineNumber)
+			except RecipeSyntaxError as error:
+				self.errors.append((lineNumber,error.column,error.message))
+		
+		lastLine=max(lineNumber,1)
+		self.skipTo(self.sections.index('*transition'),lastLine,1,"at the end of the recipe")
+		self.checkCount(self.subalphabetCount,len(recipe.subalphabets)-(1 if recipe.alphabetType=='user' else 0),'subalphabets')
+		self.checkCount(self.functionCount,len(self.userFunctions),'functions')
+		if len(self.errors)>0:
+			raise RecipeError(sorted(self.errors,key=lambda error:error[0]))
+		return recipe
+	
+	def checkCount(self,count,found,what):
+		if count is not None and count[0]!=found:
+			self.errors.append((count[1],count[2],"the recipe says there are %d %s but %d are listed" % (count[0],what,found)))
+	
+	def skipTo(self,stage,lineNumber,column,where):
+		"""Moves on to the section at index stage, and reports every declaration that was skipped on the way"""
+		for skipped in self.sections[self.stage:stage]:
+			if skipped[0]=='*' or (skipped in ['alphabet','subalphabets'] and self.recipe.alphabetType!='user'):
+				continue
+			self.errors.append((lineNumber,column,"expected \"%s = ...\" %s" % (skipped,where)))
+		self.stage=max(self.stage,stage)
+	
+	def parseLine(self,line,lineNumber):
+		if line.at('punctuation','('):
+			self.skipTo(self.sections.index('*transition'),lineNumber,line.peek()[2],"before the transitions")
+			self.parseTransition(line)
+			line.finish()
+			return
+		
+		column=line.peek()[2]
+		key=line.key()
+		section=self.sections[self.stage] if self.stage<len(self.sections) else None
+		if key in self.sections and self.sections.index(key)>=self.stage:
+			self.skipTo(self.sections.index(key),lineNumber,column,"before \"%s = ...\"" % key)
+			self.stage=self.sections.index(key)+1
+			self.parseDeclaration(key,line,lineNumber,column)
+		elif section=='*subalphabet':
+			items=line.string_list()
+			self.recipe.subalphabets.insert(len(self.recipe.subalphabets)-1,(key,items))
+			line.finish()
+			self.checkInAlphabet(items,column,"the subalphabet %s" % key)
+		elif section=='*function':
+			pairs=line.pair_set()
+			self.userFunctions.append((key,dict(pairs)))
+			line.finish()
+			self.checkInAlphabet([pair[0] for pair in pairs],column,"the function %s" % key)
+		elif key in self.sections:
+			raise RecipeSyntaxError(column,"\"%s = ...\" is out of place or repeated" % key)
+		else:
+			raise RecipeSyntaxError(column,"unknown declaration \"%s = ...\"" % key)
+		line.finish()
+	
+	def checkInAlphabet(self,symbols,column,where):
+		alphabet=self.alphabetSet
+		bad=[symbol for symbol in symbols if symbol not in alphabet]
+		if len(bad)>0:
+			raise RecipeSyntaxError(column,"%s has symbols that aren't in the alphabet: %s" % (where,', '.join(bad)))
+	
+	def parseDeclaration(self,key,line,lineNumber,column):
+		recipe=self.recipe
+		if key=='what type of alphabet will you use':
+			"""This checks if the user is using one of the default alphabets/subalphabets or if he's defining his own"""
+			recipe.alphabetType=line.words()
+			if recipe.alphabetType in builtinAlphabets:
+				alphabet,subalphabets=builtinAlphabets[recipe.alphabetType]
+				recipe.alphabetList=list(alphabet)
+				recipe.subalphabets=[(name,list(items)) for name,items in subalphabets]
+				self.stage=self.sections.index('functions')
+			elif recipe.alphabetType=='user':
+				recipe.subalphabets=[('alphabet',[])]
+			else:
+				raise RecipeSyntaxError(column,"the type of alphabet must be one of: user, %s" % ', '.join(sorted(builtinAlphabets)))
+			self.alphabetSet=set(recipe.alphabetList)
+		elif key=='alphabet':
+			recipe.alphabetList=line.string_list()
+			recipe.subalphabets[-1]=('alphabet',recipe.alphabetList)
+			self.alphabetSet=set(recipe.alphabetList)
+		elif key=='subalphabets':
+			self.subalphabetCount=(line.number(),lineNumber,column)
+		elif key=='functions':
+			self.functionCount=(line.number(),lineNumber,column)
+		elif key=='states':
+			recipe.stateList=line.string_list()
+			self.stateSet=set(recipe.stateList)
+		elif key=='initial states':
+			recipe.initialStateList=line.string_list()
+			self.checkStates(recipe.initialStateList,column,'initial')
+		elif key=='initial value':
+			recipe.initialValue=line.string()
+		elif key=='final states':
+			recipe.finalStateList=line.string_list()
+			self.checkStates(recipe.finalStateList,column,'final')
+		self.startTransitionsIfReady(key)
+	
+	def checkStates(self,states,column,which):
+		if len(states)==0:
+			raise RecipeSyntaxError(column,"there must be at least one %s state" % which)
+		bad=[state for state in states if state not in self.stateSet]
+		if len(bad)>0:
+			raise RecipeSyntaxError(column,"these %s states aren't in the state list: %s" % (which,', '.join(bad)))
+	
+	def startTransitionsIfReady(self,key):
+		"""Once the functions are all read, they're put in a dict by name together with the identity function ID"""
+		if key=='states':
+			functions=dict(self.userFunctions)
+			functions["ID"]=dict([(symbol,symbol) for symbol in self.recipe.alphabetList])
+			self.recipe.functions=functions
+			self.subalphabetIndex={}
+			for name,items in self.recipe.subalphabets:
+				self.subalphabetIndex.setdefault(name,items)
+	
+	def parseTransition(self,line):
+		"""Reads a transition of the form (input state, input symbol) = (output state, output string, direction)
+		and checks it against the states, subalphabets and functions"""
+		recipe=self.recipe
+		line.take('punctuation','(')
+		stateQ=self.state(line)
+		line.take('punctuation',',')
+		start=line.position
+		inputSet=self.inputSymbols(line)
+		inputA=line.source_since(start)
+		if inputA[0]=="'":
+			inputA=inputA[1:-1]
+		line.take('punctuation',')')
+		line.take('punctuation','=')
+		line.take('punctuation','(')
+		stateP=self.state(line)
+		line.take('punctuation',',')
+		start=line.position
+		outputTemplate=self.outputTemplate(line,inputSet)
+		outputB=line.source_since(start)
 		if outputB[0]=="'":
 			outputB=outputB[1:-1]
-		elif outputB[0]=='\\':
-			outputB=outputB.strip()
-		elif outputB[0]=='[':
-			outputB=outputB.strip()
-		direction=int(refinedRightPart[2].strip())
-		#print "stateP outputB direction"
-		#print stateP
-		#print outputB
-		#print direction
-		return (stateQ,inputA,stateP,outputB,direction)
-	except :
-		print ( 'I got an error while trying to look up this transition\nDid you mistype it?',transitionEntry )
-		sys.exit()	
-
-def transitionCreatorIter(lines):
-	transitions=[]
-	for line in lines:
-		transition=transitionCreator1by1(line)
-		#print transition
-		transitions.append(transition)
-	return transitions
+		line.take('punctuation',',')
+		column=line.tokens[line.position][2]
+		direction=line.number()
+		if direction not in [0,-1,1]:
+			raise RecipeSyntaxError(column,"the direction %d isn't one of -1, 0, 1" % direction)
+		line.take('punctuation',')')
+		recipe.transitions.append((stateQ,inputA,stateP,outputB,direction))
+		recipe.symbolicTransitions.append((stateQ,inputSet,stateP,outputTemplate,direction))
+	
+	def state(self,line):
+		token=line.peek()
+		state=line.string()
+		if state not in self.stateSet:
+			raise RecipeSyntaxError(token[2],"the state %s isn't in the state list" % state)
+		return state
+	
+	def subalphabet(self,line):
+		token=line.take('reference',what='a subalphabet like \\consonants')
+		name=token[1][1:]
+		if name not in self.subalphabetIndex:
+			raise RecipeSyntaxError(token[2],"the subalphabet %s doesn't exist" % name)
+		return self.subalphabetIndex[name]
+	
+	def inputSymbols(self,line):
+		"""Reads the input symbol of a transition and returns the set of symbols it stands for
+		It's either a symbol 'a', a subalphabet \\consonants, or a set difference {\\alphabet - \\vowels - 't'}"""
+		if line.at('string'):
+			token=line.peek()
+			symbol=line.string()
+			if symbol not in self.alphabetSet and symbol not in ['#','%']:
+				raise RecipeSyntaxError(token[2],"the input symbol %s isn't in the alphabet and isn't a boundary symbol" % symbol)
+			return frozenset([symbol])
+		if line.at('reference'):
+			return frozenset(self.subalphabet(line))
+		if not line.at('punctuation','{'):
+			raise line.error_here("expected an input symbol, a subalphabet or a set difference")
+		line.take('punctuation','{')
+		symbols=set(self.subalphabet(line))
+		while line.at('punctuation','-'):
+			line.take('punctuation','-')
+			if line.at('string'):
+				token=line.peek()
+				symbol=line.string()
+				if symbol not in symbols:
+					raise RecipeSyntaxError(token[2],"the symbol %s can't be removed because it isn't in the set" % symbol)
+				symbols.remove(symbol)
+			else:
+				symbols.difference_update(self.subalphabet(line))
+		line.take('punctuation','}')
+		return frozenset(symbols)
+	
+	def outputTemplate(self,line,inputSet):
+		"""Reads the output string of a transition and returns its template: a tuple of parts (is_function, string)
+		where the string is either a piece of the output or the name of a function to apply to the input symbol
+		The output is either a string 'a~', a function \\ID, or a list of both ['m' \\ID]
+		The functions are only applied when the machine needs them, but every input symbol has to be in the domain of the function"""
+		if line.at('punctuation','['):
+			line.take('punctuation','[')
+			template=[]
+			while not line.at('punctuation',']'):
+				if line.at('string'):
+					template.append((False,line.string()))
+				else:
+					template.append((True,self.function(line,inputSet)))
+			line.take('punctuation',']')
+			return tuple(template)
+		if line.at('reference'):
+			return ((True,self.function(line,inputSet)),)
+		output=line.string()
+		if len(output)==0:
+			return ()
+		return ((False,output),)
+	
+	def function(self,line,inputSet):
+		token=line.take('reference',what="a string in single quotes or a function like \\ID")
+		name=token[1][1:]
+		if name not in self.recipe.functions:
+			raise RecipeSyntaxError(token[2],"the function %s doesn't exist" % name)
+		undefined=sorted(inputSet.difference(self.recipe.functions[name]))
+		if len(undefined)>0:
+			raise RecipeSyntaxError(token[2],"the function %s isn't defined for the input symbols: %s" % (name,', '.join(undefined)))
+		return name
 
+class RunError(str):
+	"""The result of a run on which the 2-way FST isn't defined
+	It is the output so far followed by the error message, just like the strings that are written to output_strings.txt,
+	but it also keeps the reason of the error, so that batch jobs can tell failed runs apart without parsing the message
+	The reasons are: 'bad state', 'bad symbol', 'no transition', 'left edge', 'not final', 'non-terminating' and 'step budget'"""
+	
+	def __new__(cls,output_so_far,reason,message):
+		#a run on a list of symbols has a list as its output so far, which is written with whitespace like its input
+		text=output_so_far if type(output_so_far)==str else ' '.join(output_so_far)
+		result=str.__new__(cls,text+" --- there was an error because "+message)
+		result.reason=reason
+		result.partial_output=output_so_far
+		result.message=message
+		return result
+	
+	def __reduce__(self):
+		#so that results can be sent back from the worker processes of a parallel batch
+		return (RunError,(self.partial_output,self.reason,self.message))
 
 
+shared_alphabets=weakref.WeakValueDictionary()
+shared_tokenizers=weakref.WeakValueDictionary()
+
+def shared_alphabet(symbols):
+	"""Returns the alphabet of the symbols as a frozenset of interned strings, which is the same frozenset for every machine with the same alphabet,
+	so that the machines over a built-in alphabet like "default ipa" share one copy of it instead of each having their own
+	An alphabet is forgotten once no machine uses it"""
+	alphabet=frozenset([sys.intern(symbol) for symbol in symbols])
+	return shared_alphabets.setdefault(alphabet,alphabet)
+
+class SymbolTokenizer:
+	"""Splits a raw string into the (possibly multicharacter) symbols of an alphabet, e.g. 'pa:ta' into ['p','a:','t','a']
+	The alphabet is stored as a trie of characters and the string is split by taking the longest symbol that matches at each position
+	The tokenizations of the strings are memoized because corpora repeat the same words a lot
+	Machines with the same input alphabet share their tokenizer, see shared"""
+	
+	@classmethod
+	def shared(cls,symbolList):
+		"""Returns the tokenizer of an alphabet, which is the same one for every machine with the same alphabet, along with its memo"""
+		symbols=shared_alphabet(symbolList)
+		tokenizer=shared_tokenizers.get(symbols)
+		if tokenizer is None:
+			tokenizer=cls(symbols)
+			shared_tokenizers[symbols]=tokenizer
+		return tokenizer
+	
+	def __reduce__(self):
+		#a tokenizer that is pickled along with a machine is shared again when it's unpickled, and its memo is left behind
+		return (SymbolTokenizer.shared,(sorted(self.symbols),))
 	
+	def __init__(self,symbolList,memo_size=100000):
+		self.symbols=shared_alphabet(symbolList)
+		self.trie={}
+		for symbol in self.symbols:
+			if len(symbol)==0:
+				continue
+			node=self.trie
+			for char in symbol:
+				node=node.setdefault(char,{})
+			node['']=symbol #the empty string can't be a character, so it marks the end of a symbol
+		self.memo={}
+		self.memo_size=memo_size
+	
+	def tokenize(self,string):
+		"""Returns a tuple (list of symbols, list of untokenizable positions)
+		A character which doesn't start any symbol of the alphabet is kept as its own 1-character symbol
+		and its position is reported, so the run of the machine can report it as a bad input symbol"""
+		if string in self.memo:
+			return self.memo[string]
+		tokens=[]
+		bad_positions=[]
+		trie=self.trie
+		i=0
+		length=len(string)
+		while i<length:
+			node=trie
+			match=None
+			j=i
+			while j<length and string[j] in node:
+				node=node[string[j]]
+				j=j+1
+				if '' in node:
+					match=j
+			if match is None:
+				bad_positions.append(i)
+				tokens.append(string[i])
+				i=i+1
+			else:
+				tokens.append(string[i:match])
+				i=match
+		result=(tokens,bad_positions)
+		if len(self.memo)>=self.memo_size:
+			self.memo.clear()
+		self.memo[string]=result
+		return result
+
 
+class TransductionCache:
+	"""A size-bounded cache of the outputs of a machine, keyed by the tokenized input
+	Natural language corpora repeat the same words a lot, so most runs can be skipped
+	When the cache is full, the least recently used output is evicted"""
 	
-class Reader:
-	def __init__(self,FST_file,input_strings,setting):
-		"""Take as input two file names: FST file and input_strings, and a string "setting"
-		if the setting is set to "w", then our job is to convert an FST written with the FST recipe into a list of transitions
-		the FST_recipe_file is read to construct a 2-way FST 
-		If the setting is set to "r", then our job is to read the FST written as a list of transitions into a working FST
-		The transitions of the 2-way FST are written on the output_transitions file
-		The 2-way FST will run on each string entry in input_strings and write their output on the output_strings file
-		"""
-		if setting=='w':
-			f=codecs.open(FST_file,'r','utf-8')#io.open(FST_recipe_file,'r',encoding='utf-8')
-			lines=f.readlines()
-			if lines[0][0]==u'\ufeff':
-				lines[0]=lines[0][1:]#utf8 texts start with the byte encoding symbol, remove it
-			
-			"""This gets the first line of the FST recipe assuming its the name of the FST"""
-			self.name=lines[0][1:].strip()
-			self.lines=simplifyLines(lines)
-			#print ("ok time to process strings")
-			self.processLines()
-			#print ("ok i processed the basic lines\n")
-			self.transitionSubPartsCreator()
-			
-			#print ("ok i made the transitions, now ill print  them to the output")
-			
-			self.output_transitions()
-			self.output_strings_file(input_strings)
+	def __init__(self,maxsize):
+		self.maxsize=maxsize
+		self.entries=collections.OrderedDict()
+		self.hits=0
+		self.misses=0
+	
+	def get(self,key):
+		"""Returns the cached output for the key, or None if it isn't cached"""
+		try:
+			output=self.entries[key]
+		except KeyError:
+			self.misses=self.misses+1
+			return None
+		self.entries.move_to_end(key)
+		self.hits=self.hits+1
+		return output
+	
+	def put(self,key,output):
+		self.entries[key]=output
+		if len(self.entries)>self.maxsize:
+			self.entries.popitem(last=False)
+	
+	def clear(self):
+		self.entries.clear()
+		self.hits=0
+		self.misses=0
+	
+	def stats(self):
+		return {'size':len(self.entries),'maxsize':self.maxsize,'hits':self.hits,'misses':self.misses}
 
-		elif setting=='r':
-			f=codecs.open(FST_file,'r','utf-8') 
-			#print('gonna read')
-			lines=f.readlines()
-			self.name="N/A"
-			
-			self.lines=simplifyLines(lines)
-			self.read_transition_list(lines)
-			self.output_transitions()#for the sake of double-checking
-			self.output_strings_file(input_strings)
-		else:
-			print("Wrong setting provided. Must be either 'w' or 'r'")
-			
-			
-	def processLines(self):
-		currentLineIndex=0
-		
 
+class FunctionOutput(dict):
+	"""The output of a transition whose output template applies functions to the input symbol, like \\ID or ['m' \\voice]
+	It maps each input symbol to its output string, and each output string is only made the first time the machine needs it"""
+	
+	def __init__(self,template,functions):
+		self.template=template
+		self.functions=functions
+	
+	def __missing__(self,symbol):
+		output=''.join([self.functions[part][symbol] if is_function else part for is_function,part in self.template])
+		self[symbol]=output
+		return output
+
+def deep_size(obj,seen):
+	"""The number of bytes taken by an object and by everything it refers to, leaving out the objects whose id is in seen, and adding the ids of the ones counted
+	Classes, functions and modules are left out, since they belong to the program and not to the object"""
+	size=0
+	stack=[obj]
+	while len(stack)>0:
+		obj=stack.pop()
+		if id(obj) in seen or isinstance(obj,(type,types.FunctionType,types.BuiltinFunctionType,types.MethodType,types.ModuleType)):
+			continue
+		seen.add(id(obj))
+		size=size+sys.getsizeof(obj)
+		if isinstance(obj,dict):
+			stack.extend(obj.keys())
+			stack.extend(obj.values())
+		elif isinstance(obj,(list,tuple,set,frozenset,collections.deque)):
+			stack.extend(obj)
+		if hasattr(obj,'__dict__'):
+			stack.append(obj.__dict__)
+		if isinstance(obj,CompiledMachine):
+			stack.extend(obj.attributes().values())
+	return size
+
+class CompiledMachine:
+	"""A compiled version of the transitions of a 2-way FST that is used to actually run the machine
+	
+	The input symbols are not kept one by one. They are split into classes of symbols which behave the same way in every state,
+	e.g. all the consonants if the recipe only ever reads \\consonants, so the table has one column per class instead of one per symbol
+	The states and classes are mapped to small integers, and each (state,class) cell of the transition table
+	is one packed integer in a flat array: (output id << 32) | (output state << 2) | (direction + 1)
+	Empty cells are -1
+	The outputs are stored once in an output pool and referred to by their id. An output is either a string,
+	or a FunctionOutput if its template applies a function like \\ID to the input symbol
+	The transitions that conflict with the ones in the table are kept as alternatives, which only a nondeterministic run uses, see two_way_nondeterministic.py
+	
+	The machine only has the attributes in __slots__, so that a process can keep hundreds of machines. The states and symbols are interned,
+	and machines over the same alphabet share it and their tokenizer, see shared_alphabet. memory_report tells how much memory a machine takes"""
+	
+	__slots__=('states','state_ids','outputs','conflicts','class_ids','class_symbols','classCount','table','alternatives','alphabet','tokenizer',
+		'final','initialState','initialStates','initialValue','cache','domain_automaton','prefilter','profile','step_count')
+	nondeterministic=False
+	
+	def __init__(self,stateList,alphabetList,inputAlphabetList,initialStateList,finalStateList,initialValue,symbolicTransitions,functions):
+		"""symbolicTransitions is a list of 5-tuples (q,A,p,B,d) where A is a set of input symbols and B is an output template, see RecipeParser.outputTemplate"""
+		self.states=[]
+		self.state_ids={}
+		for state in list(stateList)+[trans[0] for trans in symbolicTransitions]+[trans[2] for trans in symbolicTransitions]:
+			if state not in self.state_ids:
+				state=sys.intern(state)
+				self.state_ids[state]=len(self.states)
+				self.states.append(state)
 		
-		"""This checks if the user is using my default alphabet/subalphabet or if hes defining his own
-		If he typed "user", then he will define his own alphabet
-		If he typed "default ipa", then he will use the alphabet I already have for consonants vs vowels
-		He likewise cannot use functions
-		If he typed "simple ipa", then he will use the smaller alphabet I already have for consonants vs vowels 
-		which are  mostly characters found on the keyboard plus the IPA symbols for length and stress
+		"""First the symbols are grouped by which input sets of the transitions they belong to.
+		This only looks at the few distinct input sets, like \\consonants or {\\alphabet - 't'}, not at every transition"""
+		input_set_ids={}
+		for trans in symbolicTransitions:
+			input_set_ids.setdefault(trans[1],len(input_set_ids))
+		signatures={}
+		for input_set,i in input_set_ids.items():
+			for symbol in input_set:
+				signatures.setdefault(symbol,[]).append(i)
+		group_ids={}
+		group_symbols=[]
+		groups_of_input_set=[[] for i in input_set_ids]
+		for symbol in sorted(signatures):
+			symbol=sys.intern(symbol)
+			signature=tuple(signatures[symbol])
+			if signature not in group_ids:
+				group_ids[signature]=len(group_symbols)
+				group_symbols.append([])
+				for i in signature:
+					groups_of_input_set[i].append(group_ids[signature])
+			group_symbols[group_ids[signature]].append(symbol)
 		
-		"""
-		self.line_user_alphabet=self.lines[currentLineIndex]
-		self.default_alphabet_wanted=breakLineofForm_Alphabet_type_eq_IntStrChar(self.line_user_alphabet)
-		currentLineIndex=currentLineIndex+1
+		"""Then each group gets its row of transitions, one per state
+		If a state already has a transition for a group, the transition is nondeterministic for that group and is left out of the table there,
+		but it still fills the groups that the state has no transition for yet, e.g. a transition on \\alphabet after one on \\vowels.
+		What's left out is kept in the alternative rows of the groups instead"""
+		self.outputs=[]
+		output_ids={}
+		rows=[{} for group in group_symbols]
+		alternative_rows=[{} for group in group_symbols]
+		self.conflicts=[]
+		for trans in symbolicTransitions:
+			template=trans[3]
+			if template not in output_ids:
+				output_ids[template]=len(self.outputs)
+				if any([is_function for is_function,part in template]):
+					self.outputs.append(FunctionOutput(template,functions))
+				else:
+					self.outputs.append(sys.intern(''.join([part for is_function,part in template])))
+			q=self.state_ids[trans[0]]
+			record=(output_ids[template]<<32)|(self.state_ids[trans[2]]<<2)|(trans[4]+1)
+			conflict=False
+			for group in groups_of_input_set[input_set_ids[trans[1]]]:
+				if q in rows[group]:
+					if not conflict:
+						self.conflicts.append(trans)
+						conflict=True
+					if rows[group][q]!=record and record not in alternative_rows[group].get(q,[]):
+						alternative_rows[group].setdefault(q,[]).append(record)
+				else:
+					rows[group][q]=record
 		
-		if self.default_alphabet_wanted=="default ipa":
-			self.subalphabetCount=6
-			consonants=['p', 'b', 'ɸ', 'β', 'm', 'ʙ', 'p͡f', 'f', 'v', 'ɱ', 'ʋ', 't̪', 'd̪', 'θ', 'ð', 't', 'd', 't͡s', 'd͡z', 't͡ɬ', 's', 'z', 't̪ˤ', 'd̪ˤ', 'θˤ', 'ðˤ', 'tˤ', 'dˤ', 'sˤ', 'zˤ', 'n', 'l', 'ɬ', 'ɮ', 'ɾ', 'ɺ', 'r', 'ʧ', 'ʤ', 'ʃ', 'ʒ', 'ɹ', 'ʈ', 'ɖ', 'ʂ', 'ʐ', 'ɳ', 'ɭ', 'ɽ', 'ɻ', 'k̘', 'g̘', 'ɡ̘', 'x̘', 'j', 'k', 'g', 'ɡ', 'ŋ', 'k͡x', 'x', 'ɣ', 'ʟ', 'k̙', 'g̙', 'ɡ̙', 'x̙', 'ɣ̙', 'q', 'ɢ', 'χ', 'ʁ', 'ɴ', 'ʀ', 'ħ', 'ʕ', 'ʔ', 'h', 'ɦ', 'w', 'ʍ', 'k͡p', 'ɡ͡b', 'ɥ', 't͡ɕ', 'd͡ʑ', 'ɕ', 'ʑ', 'c', 'ɟ', 'ç', 'ʝ', 'ɲ', 'ʎ', 'pː', 'bː', 'ɸː', 'βː', 'mː', 'ʙː', 'p͡fː', 'fː', 'vː', 'ɱː', 'ʋː', 't̪ː', 'd̪ː', 'θː', 'ðː', 'tː', 'dː', 't͡sː', 'd͡zː', 't͡ɬː', 'sː', 'zː', 't̪ˤː', 'd̪ˤː', 'θˤː', 'ðˤː', 'tˤː', 'dˤː', 'sˤː', 'zːˤ', 'nː', 'lː', 'ɬː', 'ɮː', 'ɾː', 'ɺː', 'rː', 'ʧː', 'ʤː', 'ʃː', 'ʒː', 'ɹː', 'ʈː', 'ɖː', 'ʂː', 'ʐː', 'ɳː', 'ɭː', 'ɽː', 'ɻː', 'k̘ː', 'g̘ː', 'ɡ̘ː', 'x̘ː', 'jː', 'kː', 'gː', 'ɡː', 'ŋː', 'k͡xː', 'xː', 'ɣː', 'ʟː', 'k̙ː', 'g̙ː', 'ɡ̙ː', 'x̙ː', 'ɣ̙ː', 'qː', 'ɢː', 'χː', 'ʁː', 'ɴː', 'ʀː', 'ħː', 'ʕː', 'ʔː', 'hː', 'ɦː', 'wː', 'ʍː', 'k͡pː', 'ɡ͡bː', 'ɥː', 't͡ɕː', 'd͡ʑː', 'ɕː', 'ʑː', 'cː', 'ɟː', 'çː', 'ʝː', 'ɲː', 'ʎː']
-			vowels=['i', 'y', 'ɨ', 'ʉ', 'ɯ', 'u', 'ɪ', 'ʏ', 'ʊ', 'e', 'ø', 'ɘ', 'ɵ', 'ɤ', 'o', 'ɛ', 'œ', 'ɚ', 'ə', 'ɞ', 'ʌ', 'ɔ', 'æ', 'ɶ', 'a', 'ɑ', 'ɒ', 'ĩ', 'ỹ', 'ɨ̃', 'ʉ̃', 'ɯ̃', 'ũ', 'ɪ̃', 'ʏ̃', 'ʊ̃', 'ẽ', 'ø̃', 'ɘ̃', 'ɵ̃', 'ɤ̃', 'õ', 'ɛ̃', 'œ̃', 'ə̃', 'ɞ̃', 'ʌ̃', 'ɔ̃', 'æ̃', 'ɶ̃', 'ã', 'ɑ̃', 'ɒ̃', 'iː', 'yː', 'ɨː', 'ʉː', 'ɯː', 'uː', 'ɪː', 'ʏː', 'ʊː', 'eː', 'øː', 'ɘː', 'ɵː', 'ɤː', 'oː', 'ɛː', 'œː', 'ɚː', 'əː', 'ɞː', 'ʌː', 'ɔː', 'æː', 'ɶː', 'aː', 'ɑː', 'ɒː', 'ĩː', 'ỹː', 'ɨ̃ː', 'ʉ̃ː', 'ɯ̃ː', 'ũː', 'ɪ̃ː', 'ʏ̃ː', 'ʊ̃ː', 'ẽː', 'ø̃ː', 'ɘ̃ː', 'ɵ̃ː', 'ɤ̃ː', 'õː', 'ɛ̃ː', 'œ̃ː', 'ə̃ː', 'ɞ̃ː', 'ʌ̃ː', 'ɔ̃ː', 'æ̃ː', 'ɶ̃ː', 'ãː', 'ɑ̃ː', 'ɒ̃ː', 'ˈi', 'ˈy', 'ˈɨ', 'ˈʉ', 'ˈɯ', 'ˈu', 'ˈɪ', 'ˈʏ', 'ˈʊ', 'ˈe', 'ˈø', 'ˈɘ', 'ˈɵ', 'ˈɤ', 'ˈo', 'ˈɛ', 'ˈœ', 'ˈɚ', 'ˈə', 'ˈɞ', 'ˈʌ', 'ˈɔ', 'ˈæ', 'ˈɶ', 'ˈa', 'ˈɑ', 'ˈɒ', 'ˈĩ', 'ˈỹ', 'ˈɨ̃', 'ˈʉ̃', 'ˈɯ̃', 'ˈũ', 'ˈɪ̃', 'ˈʏ̃', 'ˈʊ̃', 'ˈẽ', 'ˈø̃', 'ˈɘ̃', 'ˈɵ̃', 'ˈɤ̃', 'ˈõ', 'ˈɛ̃', 'ˈœ̃', 'ˈə̃', 'ˈɞ̃', 'ˈʌ̃', 'ˈɔ̃', 'ˈæ̃', 'ˈɶ̃', 'ˈã', 'ˈɑ̃', 'ˈɒ̃', 'ˈiː', 'ˈyː', 'ˈɨː', 'ˈʉː', 'ˈɯː', 'ˈuː', 'ˈɪː', 'ˈʏː', 'ˈʊː', 'ˈeː', 'ˈøː', 'ˈɘː', 'ˈɵː', 'ˈɤː', 'ˈoː', 'ˈɛː', 'ˈœː', 'ˈɚː', 'ˈəː', 'ˈɞː', 'ˈʌː', 'ˈɔː', 'ˈæː', 'ˈɶː', 'ˈaː', 'ˈɑː', 'ˈɒː', 'ˈĩː', 'ˈỹː', 'ˈɨ̃ː', 'ˈʉ̃ː', 'ˈɯ̃ː', 'ˈũː', 'ˈɪ̃ː', 'ˈʏ̃ː', 'ˈʊ̃ː', 'ˈẽː', 'ˈø̃ː', 'ˈɘ̃ː', 'ˈɵ̃ː', 'ˈɤ̃ː', 'ˈõː', 'ˈɛ̃ː', 'ˈœ̃ː', 'ˈə̃ː', 'ˈɞ̃ː', 'ˈʌ̃ː', 'ˈɔ̃ː', 'ˈæ̃ː', 'ˈɶ̃ː', 'ˈãː', 'ˈɑ̃ː', 'ˈɒ̃ː', 'ˌi', 'ˌy', 'ˌɨ', 'ˌʉ', 'ˌɯ', 'ˌu', 'ˌɪ', 'ˌʏ', 'ˌʊ', 'ˌe', 'ˌø', 'ˌɘ', 'ˌɵ', 'ˌɤ', 'ˌo', 'ˌɛ', 'ˌœ', 'ˌɚ', 'ˌə', 'ˌɞ', 'ˌʌ', 'ˌɔ', 'ˌæ', 'ˌɶ', 'ˌa', 'ˌɑ', 'ˌɒ', 'ˌĩ', 'ˌỹ', 'ˌɨ̃', 'ˌʉ̃', 'ˌɯ̃', 'ˌũ', 'ˌɪ̃', 'ˌʏ̃', 'ˌʊ̃', 'ˌẽ', 'ˌø̃', 'ˌɘ̃', 'ˌɵ̃', 'ˌɤ̃', 'ˌõ', 'ˌɛ̃', 'ˌœ̃', 'ˌə̃', 'ˌɞ̃', 'ˌʌ̃', 'ˌɔ̃', 'ˌæ̃', 'ˌɶ̃', 'ˌã', 'ˌɑ̃', 'ˌɒ̃', 'ˌiː', 'ˌyː', 'ˌɨː', 'ˌʉː', 'ˌɯː', 'ˌuː', 'ˌɪː', 'ˌʏː', 'ˌʊː', 'ˌeː', 'ˌøː', 'ˌɘː', 'ˌɵː', 'ˌɤː', 'ˌoː', 'ˌɛː', 'ˌœː', 'ˌɚː', 'ˌəː', 'ˌɞː', 'ˌʌː', 'ˌɔː', 'ˌæː', 'ˌɶː', 'ˌaː', 'ˌɑː', 'ˌɒː', 'ˌĩː', 'ˌỹː', 'ˌɨ̃ː', 'ˌʉ̃ː', 'ˌɯ̃ː', 'ˌũː', 'ˌɪ̃ː', 'ˌʏ̃ː', 'ˌʊ̃ː', 'ˌẽː', 'ˌø̃ː', 'ˌɘ̃ː', 'ˌɵ̃ː', 'ˌɤ̃ː', 'ˌõː', 'ˌɛ̃ː', 'ˌœ̃ː', 'ˌə̃ː', 'ˌɞ̃ː', 'ˌʌ̃ː', 'ˌɔ̃ː', 'ˌæ̃ː', 'ˌɶ̃ː', 'ˌãː', 'ˌɑ̃ː', 'ˌɒ̃ː']
-			short_vowels=['i', 'y', 'ɨ', 'ʉ', 'ɯ', 'u', 'ɪ', 'ʏ', 'ʊ', 'e', 'ø', 'ɘ', 'ɵ', 'ɤ', 'o', 'ɛ', 'œ', 'ɚ', 'ə', 'ɞ', 'ʌ', 'ɔ', 'æ', 'ɶ', 'a', 'ɑ', 'ɒ', 'ĩ', 'ỹ', 'ɨ̃', 'ʉ̃', 'ɯ̃', 'ũ', 'ɪ̃', 'ʏ̃', 'ʊ̃', 'ẽ', 'ø̃', 'ɘ̃', 'ɵ̃', 'ɤ̃', 'õ', 'ɛ̃', 'œ̃', 'ə̃', 'ɞ̃', 'ʌ̃', 'ɔ̃', 'æ̃', 'ɶ̃', 'ã', 'ɑ̃', 'ɒ̃', 'ˈi', 'ˈy', 'ˈɨ', 'ˈʉ', 'ˈɯ', 'ˈu', 'ˈɪ', 'ˈʏ', 'ˈʊ', 'ˈe', 'ˈø', 'ˈɘ', 'ˈɵ', 'ˈɤ', 'ˈo', 'ˈɛ', 'ˈœ', 'ˈɚ', 'ˈə', 'ˈɞ', 'ˈʌ', 'ˈɔ', 'ˈæ', 'ˈɶ', 'ˈa', 'ˈɑ', 'ˈɒ', 'ˈĩ', 'ˈỹ', 'ˈɨ̃', 'ˈʉ̃', 'ˈɯ̃', 'ˈũ', 'ˈɪ̃', 'ˈʏ̃', 'ˈʊ̃', 'ˈẽ', 'ˈø̃', 'ˈɘ̃', 'ˈɵ̃', 'ˈɤ̃', 'ˈõ', 'ˈɛ̃', 'ˈœ̃', 'ˈə̃', 'ˈɞ̃', 'ˈʌ̃', 'ˈɔ̃', 'ˈæ̃', 'ˈɶ̃', 'ˈã', 'ˈɑ̃', 'ˈɒ̃', 'ˌi', 'ˌy', 'ˌɨ', 'ˌʉ', 'ˌɯ', 'ˌu', 'ˌɪ', 'ˌʏ', 'ˌʊ', 'ˌe', 'ˌø', 'ˌɘ', 'ˌɵ', 'ˌɤ', 'ˌo', 'ˌɛ', 'ˌœ', 'ˌɚ', 'ˌə', 'ˌɞ', 'ˌʌ', 'ˌɔ', 'ˌæ', 'ˌɶ', 'ˌa', 'ˌɑ', 'ˌɒ', 'ˌĩ', 'ˌỹ', 'ˌɨ̃', 'ˌʉ̃', 'ˌɯ̃', 'ˌũ', 'ˌɪ̃', 'ˌʏ̃', 'ˌʊ̃', 'ˌẽ', 'ˌø̃', 'ˌɘ̃', 'ˌɵ̃', 'ˌɤ̃', 'ˌõ', 'ˌɛ̃', 'ˌœ̃', 'ˌə̃', 'ˌɞ̃', 'ˌʌ̃', 'ˌɔ̃', 'ˌæ̃', 'ˌɶ̃', 'ˌã', 'ˌɑ̃', 'ˌɒ̃']
-			long_vowels=['iː', 'yː', 'ɨː', 'ʉː', 'ɯː', 'uː', 'ɪː', 'ʏː', 'ʊː', 'eː', 'øː', 'ɘː', 'ɵː', 'ɤː', 'oː', 'ɛː', 'œː', 'ɚː', 'əː', 'ɞː', 'ʌː', 'ɔː', 'æː', 'ɶː', 'aː', 'ɑː', 'ɒː', 'ĩː', 'ỹː', 'ɨ̃ː', 'ʉ̃ː', 'ɯ̃ː', 'ũː', 'ɪ̃ː', 'ʏ̃ː', 'ʊ̃ː', 'ẽː', 'ø̃ː', 'ɘ̃ː', 'ɵ̃ː', 'ɤ̃ː', 'õː', 'ɛ̃ː', 'œ̃ː', 'ə̃ː', 'ɞ̃ː', 'ʌ̃ː', 'ɔ̃ː', 'æ̃ː', 'ɶ̃ː', 'ãː', 'ɑ̃ː', 'ɒ̃ː', 'ˈiː', 'ˈyː', 'ˈɨː', 'ˈʉː', 'ˈɯː', 'ˈuː', 'ˈɪː', 'ˈʏː', 'ˈʊː', 'ˈeː', 'ˈøː', 'ˈɘː', 'ˈɵː', 'ˈɤː', 'ˈoː', 'ˈɛː', 'ˈœː', 'ˈɚː', 'ˈəː', 'ˈɞː', 'ˈʌː', 'ˈɔː', 'ˈæː', 'ˈɶː', 'ˈaː', 'ˈɑː', 'ˈɒː', 'ˈĩː', 'ˈỹː', 'ˈɨ̃ː', 'ˈʉ̃ː', 'ˈɯ̃ː', 'ˈũː', 'ˈɪ̃ː', 'ˈʏ̃ː', 'ˈʊ̃ː', 'ˈẽː', 'ˈø̃ː', 'ˈɘ̃ː', 'ˈɵ̃ː', 'ˈɤ̃ː', 'ˈõː', 'ˈɛ̃ː', 'ˈœ̃ː', 'ˈə̃ː', 'ˈɞ̃ː', 'ˈʌ̃ː', 'ˈɔ̃ː', 'ˈæ̃ː', 'ˈɶ̃ː', 'ˈãː', 'ˈɑ̃ː', 'ˈɒ̃ː', 'ˌiː', 'ˌyː', 'ˌɨː', 'ˌʉː', 'ˌɯː', 'ˌuː', 'ˌɪː', 'ˌʏː', 'ˌʊː', 'ˌeː', 'ˌøː', 'ˌɘː', 'ˌɵː', 'ˌɤː', 'ˌoː', 'ˌɛː', 'ˌœː', 'ˌɚː', 'ˌəː', 'ˌɞː', 'ˌʌː', 'ˌɔː', 'ˌæː', 'ˌɶː', 'ˌaː', 'ˌɑː', 'ˌɒː', 'ˌĩː', 'ˌỹː', 'ˌɨ̃ː', 'ˌʉ̃ː', 'ˌɯ̃ː', 'ˌũː', 'ˌɪ̃ː', 'ˌʏ̃ː', 'ˌʊ̃ː', 'ˌẽː', 'ˌø̃ː', 'ˌɘ̃ː', 'ˌɵ̃ː', 'ˌɤ̃ː', 'ˌõː', 'ˌɛ̃ː', 'ˌœ̃ː', 'ˌə̃ː', 'ˌɞ̃ː', 'ˌʌ̃ː', 'ˌɔ̃ː', 'ˌæ̃ː', 'ˌɶ̃ː', 'ˌãː', 'ˌɑ̃ː', 'ˌɒ̃ː']
-			boundaries = ['-','+','.']
-			segments=consonants+vowels
-			self.alphabetList=segments+boundaries 
-			self.subalphabets=[("consonants",consonants),("vowels",vowels),("alphabet",self.alphabetList),("long_vowels",long_vowels),("short_vowels",short_vowels), ("boundaries",boundaries),("segments",segments)]
-			#print ("below alphabet list")
-			#print ('\t',self.alphabetList)
-			#print ("below subalphabetCount")
-			#print ('\t',self.subalphabetCount)
-		if self.default_alphabet_wanted=="keyboard ipa":
-			self.subalphabetCount=8
-			consonants = ['p','t','k','b','d','g','m','n','f','v','s','z','x','h','r','l','w','j','c','q']
-			vowels = ['a','e','i','o','u','y', '`a','`e','`i','`o','`u','`y', '`a:','`e:','`i:','`o:','`u:','`y:', 'a:','e:','i:','o:','u:','y:']  
-			long_vowels = ['`a:','`e:','`i:','`o:','`u:','`y:', 'a:','e:','i:','o:','u:','y:']
-			short_vowels = ['a','e','i','o','u','y', '`a','`e','`i','`o','`u','`y']
-			stressed_vowels = ['`a','`e','`i','`o','`u','`y', '`a:','`e:','`i:','`o:','`u:','`y:']
-			unstressed_vowels =['a','e','i','o','u','y',  'a:','e:','i:','o:','u:','y:']
-			boundaries = ['-','+','.']
-			segments = consonants + vowels 
-			self.alphabetList=consonants + vowels + boundaries
-			self.subalphabets=[("consonants",consonants),("vowels",vowels),("alphabet",self.alphabetList),("short_vowels",short_vowels),("long_vowels",long_vowels),("stressed_vowels",stressed_vowels),("unstressed_vowels",unstressed_vowels), ("boundaries",boundaries),("segments",segments)]
-			#print ("below alphabet list`")
-			#print ('\t',self.alphabetList)
-			#print ("below subalphabetCount")
-			#print ('\t',self.subalphabetCount)
-
-		
-		elif self.default_alphabet_wanted=="simple ipa":
-			self.subalphabetCount=2
-			consonants=['b','ʙ','c','ç','ɕ','d','ð','ʤ','d͡z','d͡ʑ','ɖ','f','g','ɢ','ɣ','ɡ','ɡ͡b','h','ħ','ɦ','ɥ','j','ɟ','ʝ','k','k͡p','k͡x','l','ʟ','ɭ','ɬ','ɮ','m','ɱ','n','ɴ','ɲ','ɳ','ŋ','p','ɸ','p͡f','q','r','ʀ','ɽ','ɹ','ʁ','ɺ','ɻ','ɾ','s','ʂ','ʃ','t','ʈ','ʧ','t͡ɕ','t͡ɬ','t͡s','v','ʋ','w','ʍ','x','ʎ','z','ʐ','ʑ','ʒ','ʔ','ʕ','β','θ','χ']
-			vowels=['i','y','ɨ','ʉ','ɯ','u','ɪ','ʏ','ʊ','e','ø','ɘ','ɵ','ɤ','o','ɛ','œ','ɚ','ə','ɞ','ʌ','ɔ','æ','ɶ','a','ɑ','ɒ']
-			self.alphabetList=consonants+vowels
-			self.subalphabets=[("consonants",consonants),("vowels",vowels),("alphabet",self.alphabetList)]
-			
-			#print ("below alphabet list`")
-			#print ('\t',self.alphabetList)
-			#print ("below subalphabetCount")
-			#print ('\t',self.subalphabetCount)
-
-						
-		elif self.default_alphabet_wanted=="user":
-			self.line_alphabetList=self.lines[currentLineIndex]
-			self.alphabetList=getListofItems(self.line_alphabetList)
-			currentLineIndex=currentLineIndex+1
-			#print "line_alphabetList"
-			#print ("below alphabet list`")
-			#print ('\t',self.alphabetList)
-
-			
+		"""Groups of symbols that behave the same way in every state are merged into one class"""
+		class_of_row={}
+		self.class_ids={}
+		self.class_symbols=[]
+		class_rows=[]
+		class_alternative_rows=[]
+		for group,row in enumerate(rows):
+			key=(frozenset(row.items()),frozenset([(q,tuple(records)) for q,records in alternative_rows[group].items()]))
+			if key not in class_of_row:
+				class_of_row[key]=len(self.class_symbols)
+				self.class_symbols.append([])
+				class_rows.append(row)
+				class_alternative_rows.append(alternative_rows[group])
+			c=class_of_row[key]
+			for symbol in group_symbols[group]:
+				self.class_ids[symbol]=c
+			self.class_symbols[c].extend(group_symbols[group])
 		
-			self.line_subalphabetCount=self.lines[currentLineIndex]
-			self.subalphabetCount=int(breakLineofForm_Alphabet_type_eq_IntStrChar(self.line_subalphabetCount))
-			currentLineIndex=currentLineIndex+1
-			#print ("below subalphabetCount")
-			#print ('\t',self.subalphabetCount)
-
-			
-			
-			self.lines_subalphabets=self.lines[currentLineIndex:(currentLineIndex+self.subalphabetCount)]
-			self.subalphabets=subalphabetCreatorIter(self.lines_subalphabets+[self.line_alphabetList])
-			
-			currentLineIndex=currentLineIndex+self.subalphabetCount
-			
-		#print ("below subalphabets + alphabet")
-		for sub in self.subalphabets:
-			#print ('\t',sub)
-			for item in sub[1]:
-				if item not in self.alphabetList:
-					print ("error, the subalphabet "+sub[0]+" has a bad item "+item+" thats not in the alphabet")
-					sys.exit()
-					
-					
-			
+		self.classCount=len(self.class_symbols)
+		self.table=array('q',[-1])*(len(self.states)*self.classCount)
+		for c,row in enumerate(class_rows):
+			for q,record in row.items():
+				self.table[q*self.classCount+c]=record
+		"""The alternatives map a cell to the tuple of the records of its other transitions, and to nothing for almost every cell"""
+		self.alternatives={}
+		for c,row in enumerate(class_alternative_rows):
+			for q,records in row.items():
+				self.alternatives[q*self.classCount+c]=tuple(records)
 		
-			
+		"""Only the symbols that are read by some transition have a class,
+		the rest of the alphabet is kept as a set so that we can tell apart the two kinds of errors when running"""
+		self.alphabet=shared_alphabet(list(alphabetList)+['#','%'])
+		self.tokenizer=SymbolTokenizer.shared(inputAlphabetList)
 		
+		self.final=bytearray(len(self.states))
+		for state in finalStateList:
+			if state in self.state_ids:
+				self.final[self.state_ids[state]]=1
+		self.initialState=initialStateList[0]
+		self.initialStates=list(initialStateList)#only a nondeterministic run starts in all of them
+		self.initialValue=initialValue
+		self.cache=None
+		self.domain_automaton=None
+		self.prefilter=False
+		self.profile=None
+		self.step_count=0#the total number of steps of every run so far
+	
+	@classmethod
+	def slot_names(cls):
+		"""The names of the attributes of the machines of this class, with the ones that subclasses add"""
+		names=[]
+		for klass in reversed(cls.__mro__):
+			names.extend(klass.__dict__.get('__slots__',()))
+		return names
+	
+	def attributes(self):
+		"""Returns a dict of the attributes the machine has"""
+		return dict([(name,getattr(self,name)) for name in self.slot_names() if hasattr(self,name)])
+	
+	def converted(self,cls):
+		"""Returns a machine of the class cls, e.g. a subclass, with the same attributes as this one, which are shared and not copied
+		The attributes that the machines of cls don't have are left out"""
+		machine=cls.__new__(cls)
+		names=set(cls.slot_names())
+		for name,value in self.attributes().items():
+			if name in names:
+				setattr(machine,name,value)
+		return machine
+	
+	def __getstate__(self):
+		"""A table loaded from a binary file is a view of the mapped file, which can't be pickled, so it's copied into an array"""
+		state=self.attributes()
+		if type(state['table'])!=array:
+			state['table']=array('q',state['table'])
+		return state
+	
+	def __setstate__(self,state):
+		for name,value in state.items():
+			setattr(self,name,value)
+		self.alphabet=shared_alphabet(self.alphabet)
+	
+	def memory_report(self,seen=None):
+		"""Returns how many bytes the machine takes, as a dict from the parts of the machine to their size, along with their 'total'
+		The alphabet and the tokenizer are shared with the other machines that have the same alphabet, so they're under 'shared' and not in the total,
+		and so is a table loaded from a binary file, since it's read from the mapped file. Objects are only counted once,
+		and not at all if their id is in seen, which can be given to leave out what other machines already have"""
+		if seen is None:
+			seen=set()
+		seen.add(id(self))
+		parts={'table':['table','alternatives'],'states':['states','state_ids','final','initialState','initialStates','initialValue','conflicts','classCount','step_count'],
+			'classes':['class_ids','class_symbols'],'outputs':['outputs'],'cache':['cache'],'prefilter':['domain_automaton','prefilter'],'profile':['profile']}
+		shared_parts={'alphabet':['alphabet'],'tokenizer':['tokenizer']}
+		if type(self.table)!=array:
+			parts['table'].remove('table')
+			shared_parts['mapped table']=['table']
+		attributes=self.attributes()
+		report={}
+		shared={}
+		for what,names in list(shared_parts.items())+list(parts.items()):
+			size=0
+			for name in names:
+				if name in attributes:
+					size=size+deep_size(attributes.pop(name),seen)
+			if what in shared_parts:
+				shared[what]=size
+			else:
+				report[what]=size
+		#the attributes of subclasses, like the generated code of two_way_codegen.py
+		for name,value in attributes.items():
+			report[name]=deep_size(value,seen)
+		report['total']=sys.getsizeof(self)+sum(report.values())
+		report['shared']=shared
+		return report
+	
+	def expand(self):
+		"""Returns the delta functions of the machine as three dicts deltaState, deltaOutput, deltaDirection
+		keyed by (state,symbol) pairs, with one entry per symbol instead of one per class"""
+		deltaState={}
+		deltaOutput={}
+		deltaDirection={}
+		for c,symbols in enumerate(self.class_symbols):
+			for q in range(len(self.states)):
+				record=self.table[q*self.classCount+c]
+				if record<0:
+					continue
+				p=self.states[(record>>2)&0x3fffffff]
+				output=self.outputs[record>>32]
+				direction=(record&3)-1
+				for symbol in symbols:
+					qa=(self.states[q],symbol)
+					deltaState[qa]=p
+					deltaOutput[qa]=output if type(output)==str else output[symbol]
+					deltaDirection[qa]=direction
+		return (deltaState,deltaOutput,deltaDirection)
+	
+	def expand_alternatives(self):
+		"""Returns the alternatives of the machine as a list of (state, symbol, output state, output string, direction), one per symbol like expand"""
+		transitions=[]
+		for cell,records in self.alternatives.items():
+			for record in records:
+				transitions.extend(self.expand_record(cell,record))
+		return transitions
+	
+	def expand_record(self,cell,record):
+		"""Returns the transition of a record in a cell as a list of (state, symbol, output state, output string, direction), one per symbol of the class of the cell"""
+		q,c=divmod(cell,self.classCount)
+		output=self.outputs[record>>32]
+		return [(self.states[q],symbol,self.states[(record>>2)&0x3fffffff],output if type(output)==str else output[symbol],(record&3)-1) for symbol in self.class_symbols[c]]
+	
+	def transition_counts(self):
+		"""Returns the number of states, of input symbols that some transition reads, and of transitions (one per state and input symbol) of the table"""
+		symbols=0
+		transitions=0
+		for c,class_symbols in enumerate(self.class_symbols):
+			cells=len([q for q in range(len(self.states)) if self.table[q*self.classCount+c]>=0])
+			if cells>0:
+				symbols=symbols+len(class_symbols)
+				transitions=transitions+cells*len(class_symbols)
+		return (len(self.states),symbols,transitions)
+	
+	def pruned(self,initialStateList,dead=False):
+		"""Returns a copy of the machine without the states that can't be reached from the states in initialStateList,
+		and if dead is True, without the states from which no final state can be reached either, along with the transitions into them.
+		No run ever goes through the first ones, so the outputs and errors stay the same. A run that goes into the second ones can only fail,
+		but it now fails as soon as it would go into them, with a shorter partial output and another message, which is why they're only pruned when asked for.
+		The states that are left keep their order and are numbered densely, so the table only has rows for them. The initial states are always kept
+		Also returns the list of the transitions that were left out and the list of the alternatives that were left out,
+		as (state, symbol, output state, output string, direction) like expand_alternatives"""
+		classCount=self.classCount
+		stateCount=len(self.states)
+		following=[set() for q in range(stateCount)]
+		for cell,record in enumerate(self.table):
+			if record>=0:
+				following[cell//classCount].add((record>>2)&0x3fffffff)
+		for cell,records in self.alternatives.items():
+			following[cell//classCount].update([(record>>2)&0x3fffffff for record in records])
 		
-		self.line_functionCount=self.lines[currentLineIndex]
-		self.functionCount=int(breakLineofForm_Alphabet_type_eq_IntStrChar(self.line_functionCount))
-		currentLineIndex=currentLineIndex+1
-		#print ("functionCount")
-		#print ('\t',self.functionCount)
-
-		self.lines_functions=self.lines[currentLineIndex:(currentLineIndex+self.functionCount)]
-		self.functions=functionCreatorIter(self.lines_functions,self.alphabetList)
-		currentLineIndex=currentLineIndex+self.functionCount
-		#print ("below functions + ID function")
-		for fun in self.functions.items():
-			#print ('\t',fun)
-			for input_segment in fun[1].keys():
-				if input_segment not in self.alphabetList:
-					print ("error, the function",fun," has a bad item",input_segment,"thats not in the alphabet")
-					sys.exit()
+		def closure(states,edges):
+			seen=set(states)
+			stack=list(seen)
+			while stack:
+				for q in edges[stack.pop()]:
+					if q not in seen:
+						seen.add(q)
+						stack.append(q)
+			return seen
+		
+		starts=[self.state_ids[state] for state in initialStateList if state in self.state_ids]
+		kept=closure(starts,following)
+		if dead:
+			preceding=[set() for q in range(stateCount)]
+			for q,targets in enumerate(following):
+				for p in targets:
+					preceding[p].add(q)
+			kept=kept&closure([q for q in range(stateCount) if self.final[q]],preceding)
+			kept.update(starts)
+		order=[q for q in range(stateCount) if q in kept]
+		new_ids=[-1]*stateCount
+		for n,q in enumerate(order):
+			new_ids[q]=n
+		
+		def renumbered(record):
+			p=new_ids[(record>>2)&0x3fffffff]
+			if p<0:
+				return -1
+			return ((record>>32)<<32)|(p<<2)|(record&3)
+		
+		removed=[]
+		removed_alternatives=[]
+		table=array('q',[-1])*(len(order)*classCount)
+		alternatives={}
+		for cell,record in enumerate(self.table):
+			if record<0:
+				continue
+			q,c=divmod(cell,classCount)
+			new_record=renumbered(record) if new_ids[q]>=0 else -1
+			if new_record<0:
+				removed.extend(self.expand_record(cell,record))
+			else:
+				table[new_ids[q]*classCount+c]=new_record
+		for cell,records in self.alternatives.items():
+			q,c=divmod(cell,classCount)
+			kept_records=[]
+			for record in records:
+				new_record=renumbered(record) if new_ids[q]>=0 else -1
+				if new_record<0:
+					removed_alternatives.extend(self.expand_record(cell,record))
+				else:
+					kept_records.append(new_record)
+			if len(kept_records)>0:
+				alternatives[new_ids[q]*classCount+c]=tuple(kept_records)
 		
+		machine=self.converted(type(self))
+		machine.states=[self.states[q] for q in order]
+		machine.state_ids=dict([(state,n) for n,state in enumerate(machine.states)])
+		machine.table=table
+		machine.alternatives=alternatives
+		machine.final=bytearray([self.final[q] for q in order])
+		return machine,removed,removed_alternatives
+	
+	def set_cache(self,maxsize):
+		"""Turns on the cache of outputs with room for maxsize inputs, or turns it off if maxsize is None or 0
+		The cache belongs to this compiled machine, so compiling the machine again starts with an empty cache"""
+		if maxsize:
+			self.cache=TransductionCache(maxsize)
+		else:
+			self.cache=None
+	
+	def lookup(self,stateQ,inputA):
+		"""Returns the (output state, output string, direction) of a state+symbol pair, or None if there is no transition"""
+		if stateQ not in self.state_ids or inputA not in self.class_ids:
+			return None
+		record=self.table[self.state_ids[stateQ]*self.classCount+self.class_ids[inputA]]
+		if record<0:
+			return None
+		output=self.outputs[record>>32]
+		if type(output)!=str:
+			output=output[inputA]
+		return (self.states[(record>>2)&0x3fffffff],output,(record&3)-1)
+	
+	def prepare_input(self,input_string):
+		"""We determine whether the input is in the form of a list, a string of characters separated by whitespace, or just a string without whitespace
+		and return it as a list of symbols flanked by the edge symbols # and %"""
+		if ( type(input_string)==str) and " " in input_string:
+			input_string=input_string.split()
+		if type(input_string)==str:
+			#the string is split into the longest symbols of the alphabet, so multicharacter symbols like a: don't need whitespace
+			return ["#"]+self.tokenizer.tokenize(input_string.strip())[0]+["%"]
+		#if you want to output a list of symbols, not a string, then the initial value needs to be a list too
+		return ["#"]+list(input_string)+["%"]
 	
+	def transduce(self,input_string,max_steps=None):
+		"""Runs the machine on an input from its initial state and initial value
+		If the cache is on, the output is looked up there first
+		If the prefilter is on, inputs outside of the domain aren't run, see set_prefilter
+		If the profile is on, the run is measured, see RunProfile"""
+		if self.profile is not None:
+			return self.profile.transduce(input_string,max_steps)
+		return self.transduce_prepared(self.prepare_input(input_string),max_steps)
+	
+	def transduce_prepared(self,entire_input,max_steps=None):
+		"""Same as transduce, for an input already split into symbols and flanked by # and %"""
+		if self.prefilter:
+			error=self.reject(entire_input)
+			if error is not None:
+				return error
+		if self.cache is None:
+			return self.run(self.initialState,self.initialValue,entire_input,0,max_steps)
+		key=(tuple(entire_input),max_steps)
+		output=self.cache.get(key)
+		if output is None:
+			output=self.run(self.initialState,self.initialValue,entire_input,0,max_steps)
+			self.cache.put(key,output)
+		return output
+	
+	def transduce_fragments(self,entire_input,max_steps=None):
+		"""Same as transduce_prepared, but the output is the list of the output strings of the run, starting with the initial value,
+		instead of their concatenation, so that the next machine of a pipeline can split each of them into its symbols, see two_way_pipeline
+		The partial output of a RunError is such a list too, except when the prefilter rejects the input"""
+		if self.prefilter:
+			error=self.reject(entire_input)
+			if error is not None:
+				return error
+		if self.cache is None:
+			return self.run(self.initialState,[self.initialValue],entire_input,0,max_steps)
+		key=(tuple(entire_input),max_steps,list)
+		output=self.cache.get(key)
+		if output is None:
+			output=self.run(self.initialState,[self.initialValue],entire_input,0,max_steps)
+			self.cache.put(key,output)
+		return output
+	
+	def run(self,stateQ,output_so_far,entire_input,index_header,max_steps=None):
+		"""Runs the machine from the state stateQ with the reading head at index_header
+		The input symbols are mapped to their classes once, so each step of the run is a single index into the table
+		
+		A deterministic 2-way FST which is still running after |Q|*(length of input) steps has repeated a configuration
+		(state, position of the reading head) and so it will never halt. The run is stopped at that bound, or earlier if max_steps is given.
+		Repeated configurations are also caught early by comparing the current configuration with one saved at steps 1,2,4,8,...
+		so a machine that loops after a few steps is stopped after a few steps
+		The steps are added to self.step_count"""
+		outputs=[]
+		input_length=len(entire_input)
+		if index_header==input_length:
+			q=self.state_ids.get(stateQ,-1)
+		else:
+			if stateQ not in self.state_ids:
+				return RunError(join_output(output_so_far,outputs),'bad state',"the input state %s isn't in the state list" % stateQ)
+			q=self.state_ids[stateQ]
+			class_ids=self.class_ids
+			input_ids=[class_ids.get(inputA,-1) for inputA in entire_input]
+			table=self.table
+			classCount=self.classCount
+			pool=self.outputs
+			
+			step_bound=len(self.states)*input_length
+			if max_steps is not None and max_steps<step_bound:
+				step_bound=max_steps
+			steps=0
+			saved_q=-1
+			saved_index=-1
+			checkpoint=1
+			error=None
+			while index_header!=input_length:
+				if index_header<0:
+					error=RunError(join_output(output_so_far,outputs),'left edge',"the reading head moved past the left edge of the input in state %s" % self.states[q])
+					break
+				a=input_ids[index_header]
+				record=table[q*classCount+a] if a>=0 else -1
+				if record<0:
+					inputA=entire_input[index_header]
+					if inputA not in self.alphabet:
+						error=RunError(join_output(output_so_far,outputs),'bad symbol',"the input symbol %s isn't in the alphabet" % inputA)
+					else:
+						error=RunError(join_output(output_so_far,outputs),'no transition',"couldn't find output state for the input state+input symbol pair ("+self.states[q]+","+inputA+")")
+					break
+				output=pool[record>>32]
+				if output.__class__ is not str:
+					output=output[entire_input[index_header]]
+				outputs.append(output)
+				index_header=index_header+(record&3)-1
+				q=(record>>2)&0x3fffffff
+				
+				steps=steps+1
+				if q==saved_q and index_header==saved_index:
+					error=RunError(join_output(output_so_far,outputs),'non-terminating',"the machine doesn't halt on this input, it came back to state %s at position %d after %d steps" % (self.states[q],index_header,steps))
+					break
+				if steps==checkpoint:
+					saved_q=q
+					saved_index=index_header
+					checkpoint=checkpoint*2
+				if steps>=step_bound and index_header!=input_length:
+					if step_bound==max_steps:
+						error=RunError(join_output(output_so_far,outputs),'step budget',"the machine didn't halt within the budget of %d steps" % max_steps)
+					else:
+						error=RunError(join_output(output_so_far,outputs),'non-terminating',"the machine doesn't halt on this input, it ran for more than %d steps" % step_bound)
+					break
+			self.step_count=self.step_count+steps
+			if error is not None:
+				return error
 		
+		output_so_far=join_output(output_so_far,outputs)
+		if q<0 or not self.final[q]:
+			return RunError(output_so_far,'not final',"we read till the end but didnt end in a final state, but in state %s" % (self.states[q] if q>=0 else stateQ))
+		#in case youre working on a list of symbols and you dont want to see ' in your output list'
+		if type(output_so_far)==list:
+			output_so_far= list(filter(lambda x: x!= '', output_so_far))
+		return output_so_far
 
-		self.line_stateList=self.lines[currentLineIndex]
-		self.stateList=getListofItems(self.line_stateList)
-		currentLineIndex=currentLineIndex+1
-		#print ("stateList")
-		#print ('\t',self.stateList)
+	def stop_error(self,q,i,output_so_far,entire_input):
+		"""The error of a run which stopped in the state number q at the position i of entire_input, for the engines which don't run through run
+		It has the same reason and message as the error run would give: the run went past an edge, or there's no transition at i"""
+		if i==len(entire_input):
+			return RunError(output_so_far,'not final',"we read till the end but didnt end in a final state, but in state %s" % self.states[q])
+		if i<0:
+			return RunError(output_so_far,'left edge',"the reading head moved past the left edge of the input in state %s" % self.states[q])
+		inputA=entire_input[i]
+		if inputA not in self.alphabet:
+			return RunError(output_so_far,'bad symbol',"the input symbol %s isn't in the alphabet" % inputA)
+		return RunError(output_so_far,'no transition',"couldn't find output state for the input state+input symbol pair ("+self.states[q]+","+inputA+")")
 
+	def set_prefilter(self,on,max_states=10000):
+		"""Turns on or off the check of every input against the domain of the machine before it's run, see DomainAutomaton
+		Inputs outside of the domain then aren't run at all and their error has the reason 'not in domain'.
+		The automaton is built the first time the check is turned on, and stays off if it would have more than max_states states"""
+		if on and self.domain_automaton is None:
+			self.domain_automaton=build_domain_automaton(self,max_states)
+		self.prefilter=on and self.domain_automaton is not None
+		return self.prefilter
+	
+	def set_profile(self,on):
+		"""Turns on or off the measuring of every run, see RunProfile. Turning it on again starts a new profile
+		Returns the profile, or None if it's off"""
+		if on:
+			self.profile=RunProfile(self)
+		else:
+			self.profile=None
+		return self.profile
+	
+	def reject(self,entire_input):
+		"""Returns the error of an input that the prefilter rejects, or None if it's in the domain or if the prefilter is off"""
+		if not self.prefilter or self.domain_automaton.accepts(entire_input):
+			return None
+		return RunError(self.initialValue,'not in domain',"the input isn't in the domain of the 2-way FST, so it wasn't run")
 
-		self.line_initialStates=self.lines[currentLineIndex]
-		self.initialStateList=getListofItems(self.line_initialStates)
-		currentLineIndex=currentLineIndex+1
-		#print ("initialStates")
-		#print ('\t',self.initialStateList)
 
-		self.line_initialValue=self.lines[currentLineIndex]
-		self.initialValue=breakLineofForm_Alphabet_type_eq_IntStrChar(self.line_initialValue)[1:-1]
-		currentLineIndex=currentLineIndex+1
-		#print ("initialValue")
-		#print ('\t',self.initialValue)
-		
-		self.line_finalStates=self.lines[currentLineIndex]
-		self.finalStateList=getListofItems(self.line_finalStates)
-		currentLineIndex=currentLineIndex+1
-		#print ("finalStates")
-		#print ('\t',self.finalStateList)
+class DomainAutomaton:
+	"""A 1-way deterministic automaton which accepts exactly the inputs on which a compiled machine halts in a final state,
+	i.e. the domain of the 2-way FST. It reads each symbol once, so it can reject an input without running the 2-way FST on it
+	The table has a row per state and a column per class of the machine, plus a last column for symbols in no class
+	Each cell is the next state, or -1 if no input going through it is in the domain"""
+	
+	def __init__(self,class_ids,classCount,table,accepting):
+		self.class_ids=class_ids
+		self.width=classCount+1
+		self.table=table
+		self.accepting=accepting
+	
+	def accepts(self,entire_input):
+		"""entire_input is the list of symbols flanked by # and %, see CompiledMachine.prepare_input"""
+		class_ids=self.class_ids
+		table=self.table
+		width=self.width
+		missing=width-1
+		state=0
+		for symbol in entire_input:
+			state=table[state*width+class_ids.get(symbol,missing)]
+			if state<0:
+				return False
+		return self.accepting[state]==1
 
-		self.lines_transitions=self.lines[currentLineIndex:]
-		self.transitions=transitionCreatorIter(self.lines_transitions)
-		#print ("transitions")
-		#for trans in self.transitions:
-		#	print ('\t',trans)
-			
-	def transitionSubPartsCreator(self):
-		"""Given a list of edges or 5-tuples (q,a,p,b,d)
-		This function breaks the 5-tuples into 3 functions such that given q,a it will return p and b and d
-		I debug for erronous state or symbol entries here"""
-		self.deltaState={}
-		self.deltaOutput={}
-		self.deltaDirection={}
-		#print ("ok doing the deltas")
-		
-		for trans in self.transitions:
-			#print ("working on interpreting the delta function for the transition:",trans)
-			try:
-				
-				#print ('working on transition: ',trans)
-				
-				stateQ=trans[0]
-				inputA=trans[1]
-				stateP=trans[2]
-				outputB=trans[3]
-				direction=trans[4]
-				
-				
-				#print ('input state is: ',stateQ)
-				if stateQ not in self.stateList:
-					print ("error, the input state",stateQ,"isnt in state List for the transition:",trans)
-					sys.exit()
-				#print ('output state is: ',stateP)
-				if stateP not in self.stateList:
-					print ("error, the output state",stateP,"isnt in state List for the transition:",trans)
-					sys.exit()
-				#print ('direction is: ',direction)
-				if direction not in [0,-1,1]:
-					print ("error, the direction symbol",direction," isnt an okay direction  for the transition:",trans)
-					sys.exit()
-				
-				expandedInputA=[]
-				#print ('input symbol is:',inputA)
-				if inputA[0]=='\\':
-					alphCategory=inputA[1:]
-					alphabetExists=False
-					alphItems=[]
-					for alph in self.subalphabets:
-						if alphCategory==alph[0]:
-							alphabetExists=True
-							alphItems=alph[1]
-							break
-					if not alphabetExists:
-						print ("error, the subalphabet",alphCategory,"doesnt exist for the transition:",trans)
-						sys.exit()
-					expandedInputA=alphItems
-				
-				elif inputA[0]=='{':
-					"""Assume that if the input is a of form {}, then the person wants to do a set difference: alphabet - a
-					For now I assume the first element is always of form \\alphabet and the second is either a single symbol or a subalphabet
-					
-					We should potentially replace this with somehow making the two-way reader read the transitions by ordering the subalphabets"""
-					inside_parts=inputA[1:-1].split('-')
-						
-					alphCategory=inside_parts[0][1:].strip()#remember that the subalphabets are stored as just their names, like "consonants", not "\consonants"
-					alphabetExists=False
-					alphItems=[]
-					#print ("Im checking if the subalphabet",alphCategory,"exists")
-					for alph in self.subalphabets:
-						#print ("checking if it matches: ",alph[0])
-						if alphCategory==alph[0]:
-							alphabetExists=True
-							#print("it did!")
-							alphItems=set(alph[1])
-							break
-					if not alphabetExists:
-						print ("error, the subalphabet",alphCategory," doesnt exist for the transition:",trans)
-						sys.exit()
-					
-					for to_be_removed in inside_parts[1:]:
-						to_be_removed=to_be_removed.strip()
-						#print ("going to interpret the element",to_be_removed,"in order to remove it")
-						if to_be_removed[0]=='\\':
-							to_be_removed_category=to_be_removed[1:]#remember that the subalphabets are stored as just their names, like "consonants", not "\consonants"
-							to_be_removed_exists=False
-							to_be_removed_set=[]
-							#print ("Im checking if the subalphabet ",alphCategory," exists")
-							for alph in self.subalphabets:
-								#print ("checking if it matches: ",alph[0])
-								if to_be_removed_category==alph[0]:
-									to_be_removed_exists=True
-									#print("it did!")
-									to_be_removed_set=set(alph[1])
-									break
-							if not to_be_removed_exists:
-								print ("error, the subalphabet",alphCategory," doesnt exist for the transition:",trans)
-								sys.exit()
-							alphItems.difference_update(to_be_removed_set)
-						else:
-							string_to_remove=to_be_removed[1:-1]
-							#print ('going to remove the string',string_to_remove)
-							alphItems.remove(string_to_remove)
-					
-					expandedInputA=list(alphItems)
-		
-					
-				else:
-					#print ('input symbol was not of form \\')
-					if inputA not in self.alphabetList+['#','%']:
-						print ("error, the input symbol",inputA," isnt in alphabet and isnt a boundary symbol for the transition:",trans)
-						sys.exit()
-					#print ('input symbol was in alphabet or #,%')
-					expandedInputA.append(inputA)
-				#print ('expanded inputs are the strings:\n\t',) 
-				#for expanded_input in expandedInputA:
-				#	print(expanded_input,)
-					
-				inputoutputPairs=[]
-				#print ('output string is: (',outputB,')')
-				for i in expandedInputA:
-					#print ('working on getting output for the input symbol: ',i)
-					if len(outputB)==0:
-						#print ('output string was empty')
-						inputoutputPairs.append((i,''))
-					elif outputB[0]=='\\':
-						funCategory=outputB[1:]
-						inputoutputPairs.append((i,self.functions[funCategory][i]))
-					elif outputB[0]=='[':#this is for the cases of ['m' \ID]
-						inside_parts=outputB[1:-1].split()
-						potential_output=""
-						for inside_part in inside_parts:
-							inside_part=inside_part.strip()
-							if inside_part[0]=='\\':
-								funCategory=inside_part[1:]
-								potential_output=potential_output + self.functions[funCategory][i]
-							else: #if the insides of the [] isnt \\ then its a string
-								potential_output=potential_output+inside_part[1:-1]
-							
-						inputoutputPairs.append((i,potential_output))
-					else: #if the output string doesnt start with [ or \\ then its a string
-						#print ('output string was the symbol:', outputB)
-						inputoutputPairs.append((i,outputB))
-						
-				for i,o in inputoutputPairs:
-					qa=(stateQ,i)
-					#print ('input state + input symbol pair is: ',qa)
-					p=stateP
-					b=o
-					dir=direction
-					if qa in self.deltaState:
-						print ("error, nondeterminism for the transition:",trans)
-						break
-					else:
-						self.deltaState[qa]=p
-						self.deltaOutput[qa]=b
-						self.deltaDirection[qa]=dir
-			except :
-				print ("an error happened while intrepreting the transition:",trans)
-				sys.exit()
-		#print ("delta state:")
-		#for key in sorted(self.deltaState.keys()):
-		#	print (key," --> ", self.deltaState[key],", ",self.deltaOutput[key],", ",self.deltaDirection[key])
+def build_domain_automaton(machine,max_states=10000):
+	"""Builds the DomainAutomaton of a compiled machine, or returns None if it would have more than max_states states
+	
+	After reading a prefix w of the input, the 2-way FST can only come back into w by moving left from the next symbol,
+	and then it leaves w to the right in a state which only depends on the state it moved left in, or it never does (Shepherdson's construction)
+	A state of the automaton is this behaviour of w for every state the 2-way FST can move left in,
+	along with the state in which the actual run first leaves w to the right. -1 stands for a run that fails inside w
+	The input is in the domain if after reading all of it the actual run leaves it in a final state
+	Only the states that can be reached from the empty prefix are built"""
+	if machine.initialState not in machine.state_ids:
+		return None
+	table=machine.table
+	classCount=machine.classCount
+	left_states=sorted(set([(record>>2)&0x3fffffff for record in table if record>=0 and (record&3)==0]))
+	slots=dict([(q,i) for i,q in enumerate(left_states)])
+	main=len(left_states)
+	
+	def leave(behaviour,q,a):
+		"""The state in which the 2-way FST leaves a symbol of class a to the right when it starts on it in state q, or -1"""
+		seen=set()
+		while q not in seen:
+			seen.add(q)
+			record=table[q*classCount+a]
+			if record<0:
+				return -1
+			q=(record>>2)&0x3fffffff
+			direction=(record&3)-1
+			if direction==1:
+				return q
+			if direction==-1:
+				q=behaviour[slots[q]]
+				if q<0:
+					return -1
+		return -1
+	
+	initial=tuple([-1]*main+[machine.state_ids[machine.initialState]])
+	behaviours=[initial]
+	behaviour_ids={initial:0}
+	dfa=array('l')
+	i=0
+	while i<len(behaviours):
+		behaviour=behaviours[i]
+		for a in range(classCount):
+			q=leave(behaviour,behaviour[main],a)
+			if q<0:
+				dfa.append(-1)
+				continue
+			following=tuple([leave(behaviour,p,a) for p in left_states]+[q])
+			if following not in behaviour_ids:
+				if len(behaviours)>=max_states:
+					return None
+				behaviour_ids[following]=len(behaviours)
+				behaviours.append(following)
+			dfa.append(behaviour_ids[following])
+		dfa.append(-1)#symbols in no class can't be read by any transition
+		i=i+1
+	accepting=bytearray([machine.final[behaviour[main]] for behaviour in behaviours])
+	return DomainAutomaton(machine.class_ids,classCount,dfa,accepting)
+
+
+
+
+	
+
+	
+class RunProfile:
+	"""Measures the runs of a compiled machine while it's set as the machine's profile, see CompiledMachine.set_profile
+	For every input it keeps the number of symbols and of steps, how many times the reading head turned around (the run makes reversals+1 passes over the input),
+	the reason of the error if there was one, whether the output came from the cache, and the time spent splitting the input into symbols and running the machine
+	For every cell of the transition table it keeps how many times it was used
+	
+	The run itself isn't changed: the steps it took are replayed afterwards to count the cells and reversals,
+	so the machine costs nothing more than a check of its profile when the profile is off"""
+	
+	def __init__(self,machine):
+		self.machine=machine
+		self.hits=array('l',[0])*len(machine.table)
+		self.inputs=[]
+		self.seconds={'tokenize':0.0,'run':0.0,'output':0.0,'profiling':0.0}
+	
+	def transduce(self,input_string,max_steps=None):
+		machine=self.machine
+		start=time.perf_counter()
+		entire_input=machine.prepare_input(input_string)
+		tokenized=time.perf_counter()
+		step_count=machine.step_count
+		cache_hits=machine.cache.hits if machine.cache is not None else 0
+		output=machine.transduce_prepared(entire_input,max_steps)
+		ran=time.perf_counter()
+		steps=machine.step_count-step_count
+		reversals=self.replay(entire_input,steps)
+		self.inputs.append({
+			'input':input_string if type(input_string)==str else ' '.join(input_string),
+			'symbols':len(entire_input)-2,
+			'steps':steps,
+			'reversals':reversals,
+			'error':output.reason if isinstance(output,RunError) else None,
+			'cached':machine.cache is not None and machine.cache.hits>cache_hits,
+			'tokenize_seconds':tokenized-start,
+			'run_seconds':ran-tokenized,
+		})
+		self.seconds['tokenize']=self.seconds['tokenize']+tokenized-start
+		self.seconds['run']=self.seconds['run']+ran-tokenized
+		self.seconds['profiling']=self.seconds['profiling']+time.perf_counter()-ran
+		return output
+	
+	def replay(self,entire_input,steps):
+		"""Follows the first steps of the run on an input again, counting the cells used, and returns the number of reversals
+		Moves that stay in place don't change the direction the head is going in"""
+		machine=self.machine
+		table=machine.table
+		classCount=machine.classCount
+		class_ids=machine.class_ids
+		hits=self.hits
+		q=machine.state_ids.get(machine.initialState,0)
+		index_header=0
+		reversals=0
+		heading=1
+		for step in range(steps):
+			cell=q*classCount+class_ids[entire_input[index_header]]
+			hits[cell]=hits[cell]+1
+			record=table[cell]
+			direction=(record&3)-1
+			if direction!=0 and direction!=heading:
+				reversals=reversals+1
+				heading=direction
+			index_header=index_header+direction
+			q=(record>>2)&0x3fffffff
+		return reversals
+	
+	def add_output_time(self,seconds):
+		self.seconds['output']=self.seconds['output']+seconds
+	
+	def transitions(self):
+		"""Returns the cells of the transition table that were used, most used first, as dicts
+		with the state, the symbols of the class, the output state, the direction and the number of hits"""
+		machine=self.machine
+		cells=[]
+		for cell,hits in enumerate(self.hits):
+			if hits==0:
+				continue
+			q,c=divmod(cell,machine.classCount)
+			record=machine.table[cell]
+			cells.append({
+				'state':machine.states[q],
+				'symbols':' '.join(machine.class_symbols[c]),
+				'output state':machine.states[(record>>2)&0x3fffffff],
+				'direction':(record&3)-1,
+				'hits':hits,
+			})
+		cells.sort(key=lambda cell: -cell['hits'])
+		return cells
+	
+	def summary(self):
+		"""Returns the totals over every input, along with the average steps and reversals for each input length"""
+		by_length={}
+		for record in self.inputs:
+			by_length.setdefault(record['symbols'],[]).append(record)
+		lengths={}
+		for length,records in sorted(by_length.items()):
+			lengths[length]={
+				'inputs':len(records),
+				'steps_per_input':sum([record['steps'] for record in records])/float(len(records)),
+				'reversals_per_input':sum([record['reversals'] for record in records])/float(len(records)),
+			}
+		return {
+			'inputs':len(self.inputs),
+			'steps':sum([record['steps'] for record in self.inputs]),
+			'reversals':sum([record['reversals'] for record in self.inputs]),
+			'errors':len([record for record in self.inputs if record['error'] is not None]),
+			'seconds':dict(self.seconds),
+			'by_length':lengths,
+		}
+	
+	def write_json(self,profile_file):
+		"""Writes the summary, the transitions that were used and every input on a json file"""
+		f=io.open(profile_file,'w',encoding='utf-8')
+		f.write(json.dumps({'summary':self.summary(),'transitions':self.transitions(),'inputs':self.inputs},ensure_ascii=False,indent=1))
+		f.close()
+	
+	def write_csv(self,profile_file,what='inputs'):
+		"""Writes either every input ('inputs') or the transitions that were used ('transitions') on a csv file, one per row"""
+		if what=='inputs':
+			rows=self.inputs
+			columns=['input','symbols','steps','reversals','error','cached','tokenize_seconds','run_seconds']
+		else:
+			rows=self.transitions()
+			columns=['state','symbols','output state','direction','hits']
+		f=io.open(profile_file,'w',encoding='utf-8',newline='')
+		writer=csv.DictWriter(f,columns)
+		writer.writeheader()
+		writer.writerows(rows)
+		f.close()
+	
+	def write(self,profile_file):
+		"""Writes the profile on a json file, or on two csv files if the file name ends with .csv:
+		the inputs on that file and the transitions on the same name ending with _transitions.csv"""
+		if profile_file.lower().endswith('.csv'):
+			self.write_csv(profile_file,'inputs')
+			self.write_csv(profile_file[:-4]+'_transitions.csv','transitions')
+		else:
+			self.write_json(profile_file)
+
+class Reader:
+	def __init__(self,FST_file,input_strings,setting,max_steps=None,output_strings='output_strings.txt',workers=1,chunk_size=1000,cache_size=None,compiled_cache_dir=None,batch=False,prefilter=False,profile_file=None,transitions_file='output_transitions.txt',nondeterministic=False,determinize=False,generated=False,sweeping=False,prune_dead=False):
+		"""Take as input two file names: FST file and input_strings, and a string "setting"
+		if the setting is set to "w", then our job is to convert an FST written with the FST recipe into a list of transitions
+		the FST_recipe_file is read to construct a 2-way FST 
+		If the setting is set to "r", then our job is to read the FST written as a list of transitions into a working FST
+		If the setting is set to "b", the FST file is a compiled machine in the binary format of two_way_binary.py, which is loaded without being parsed
+		The transitions of the 2-way FST are written on transitions_file, or aren't written if it's None
+		The 2-way FST will run on each string entry in input_strings and write their output on the output_strings file
+		Either input_strings or output_strings can be '-' to use stdin or stdout
+		If workers is more than 1, the input strings are transduced in parallel in chunks of chunk_size strings
+		max_steps optionally limits how many steps a single run can take, runs that never halt are always stopped
+		cache_size optionally turns on a cache of the outputs of that many inputs, see set_cache
+		If compiled_cache_dir is given, the compiled machine is stored there, keyed by a hash of the FST file and of the interpreter,
+		and it is loaded from there instead of being compiled again as long as neither has changed. The files are loaded with pickle, so the folder has to be trusted
+		If batch is True, the input strings are run chunk_size at a time in lockstep with numpy, see two_way_batch.py
+		If prefilter is True, input strings outside of the domain of the 2-way FST are rejected without being run, see set_prefilter
+		If profile_file is given, the runs are measured and the profile is written on it, see set_profile
+		If nondeterministic is True, the 2-way FST can have several transitions for a state+symbol pair and several initial states, see two_way_nondeterministic.py,
+		and if determinize is True too, it's turned into a deterministic 2-way FST when that's cheap, see determinize
+		If generated is True, the 2-way FST is run by Python code generated for it, which is kept next to the FST file, see set_generated
+		If sweeping is True and the reading head of the 2-way FST only turns around a bounded number of times, it's run in passes over the input instead, see set_sweeping
+		The states that can't be reached are left out of the compiled machine, and if prune_dead is True, so are the states that can't reach a final state, see CompiledMachine.pruned
+		To use the 2-way FST from Python without reading or writing any files, see from_recipe, from_transition_list and from_database_row
+		"""
+		self.max_steps=max_steps
+		self.cache_size=cache_size
+		self.nondeterministic=nondeterministic
+		self.prune_dead=prune_dead
+		if setting not in ['w','r','b']:
+			raise ValueError("Wrong setting provided. Must be either 'w', 'r' or 'b'")
+		
+		if setting=='b':
+			self.load_binary(FST_file)
+		else:
+			f=codecs.open(FST_file,'r','utf-8')#io.open(FST_recipe_file,'r',encoding='utf-8')
+			FST_text=f.read()
+			f.close()
+			self.build(FST_text,setting,compiled_cache_dir)
+		if determinize:
+			self.determinize()
+		if generated:
+			self.set_generated(True,os.path.splitext(FST_file)[0]+'_generated.py')
+		if sweeping:
+			self.set_sweeping(True)
+		if prefilter:
+			self.set_prefilter(True)
+		if profile_file is not None:
+			self.set_profile(True)
+		
+		#print ("ok i made the transitions, now ill print  them to the output")
+		if transitions_file is not None:
+			self.output_transitions(transitions_file)#in the 'r' setting this is for the sake of double-checking
+		self.output_strings_file(input_strings,output_strings,chunk_size,workers,batch)
+		if profile_file is not None and self.machine.profile is not None:
+			self.machine.profile.write(profile_file)
+	
+	@classmethod
+	def from_recipe(cls,recipe_text,max_steps=None,cache_size=None,compiled_cache_dir=None,nondeterministic=False,prune_dead=False):
+		"""Builds the 2-way FST of an FST recipe given as a string, without reading or writing any files
+		The machine is then run with transduce or transduce_many, and its transitions can be written with output_transitions"""
+		reader=cls.__new__(cls)
+		reader.max_steps=max_steps
+		reader.cache_size=cache_size
+		reader.nondeterministic=nondeterministic
+		reader.prune_dead=prune_dead
+		reader.build(recipe_text,'w',compiled_cache_dir)
+		return reader
+	
+	@classmethod
+	def from_transition_list(cls,transitions,max_steps=None,cache_size=None,compiled_cache_dir=None,nondeterministic=False,prune_dead=False):
+		"""Builds the 2-way FST of a list of transitions like the one in output_transitions.txt, without reading or writing any files
+		transitions is the text of the list, or a list of its lines"""
+		if type(transitions)!=str:
+			transitions='\n'.join([line.rstrip('\r\n') for line in transitions])
+		reader=cls.__new__(cls)
+		reader.max_steps=max_steps
+		reader.cache_size=cache_size
+		reader.nondeterministic=nondeterministic
+		reader.prune_dead=prune_dead
+		reader.build(transitions,'r',compiled_cache_dir)
+		return reader
+	
+	@classmethod
+	def from_database_row(cls,row,max_steps=None,cache_size=None,compiled_cache_dir=None,nondeterministic=False,prune_dead=False):
+		"""Builds the 2-way FST of a row of the "2-way FST" table of RedTyp, given as a dict like the ones of redtyp_db.Catalog.fst
+		Raises a KeyError if the row has no FST recipe"""
+		return cls.from_recipe(row['FST recipe'],max_steps,cache_size,compiled_cache_dir,nondeterministic,prune_dead)
+	
+	@classmethod
+	def from_binary(cls,binary_file,max_steps=None,cache_size=None,nondeterministic=False):
+		"""Loads the 2-way FST of a binary file written by write_binary, see two_way_binary.py
+		The transition table isn't copied, it's read from the file mapped in memory"""
+		reader=cls.__new__(cls)
+		reader.max_steps=max_steps
+		reader.cache_size=cache_size
+		reader.nondeterministic=nondeterministic
+		reader.load_binary(binary_file)
+		return reader
+	
+	def load_binary(self,binary_file):
+		import two_way_binary
+		self.machine,info=two_way_binary.load_machine(binary_file)
+		self.name=info['name']
+		self.initialStateList=info['initialStateList']
+		self.finalStateList=info['finalStateList']
+		self.pruning_stats=info['pruning_stats']
+		self.pruned_transitions=[]
+		self.stateList=info['stateList']
+		if self.nondeterministic:
+			import two_way_nondeterministic
+			self.machine=two_way_nondeterministic.NondeterministicMachine.from_machine(self.machine)
+		self.machine.set_cache(self.cache_size)
+		self.expanded_deltas=None
+	
+	def write_binary(self,binary_file):
+		"""Writes the compiled machine on binary_file in the binary format of two_way_binary.py, which from_binary loads back"""
+		import two_way_binary
+		two_way_binary.write_machine(self,binary_file)
+	
+	def build(self,FST_text,setting,compiled_cache_dir=None):
+		"""Builds the machine from the text of an FST recipe ('w') or of a list of transitions ('r'),
+		or loads it from the compiled cache if it's there"""
+		compiled=None
+		if compiled_cache_dir is not None:
+			cache_key=compiled_cache_key(FST_text,setting+(' nondeterministic' if self.nondeterministic else '')+(' prune dead' if self.prune_dead else ''))
+			compiled=load_compiled(compiled_cache_dir,cache_key)
+		
+		if compiled is not None:
+			self.__dict__.update(compiled)
+			self.machine.set_cache(self.cache_size)
+			return
+		if setting=='w':
+			self.read_recipe(FST_text)
+		else:
+			self.name="N/A"
+			lines=FST_text.splitlines(True)
+			self.lines=simplifyLines(lines)
+			self.read_transition_list(lines)
+		self.compile()
+		
+		if compiled_cache_dir is not None:
+			save_compiled(compiled_cache_dir,cache_key,self.compiled_state())
+	
+	def compiled_state(self):
+		"""Returns everything that was built from the FST file, which is what gets stored in the compiled cache
+		The settings of this particular run, like max_steps, aren't included"""
+		state=dict(self.__dict__)
+		del state['max_steps']
+		del state['cache_size']
+		return state
 			
-	def output_transitions(self):
+	def read_recipe(self,recipe_text):
+		"""Reads an FST recipe with RecipeParser, which raises a RecipeError listing every mistake in the recipe
+		The recipe is made into the symbolic transitions (q,A,p,B,d), see CompiledMachine"""
+		recipe=RecipeParser().parse(recipe_text)
+		self.name=recipe.name
+		self.alphabetList=recipe.alphabetList
+		self.subalphabets=recipe.subalphabets
+		self.functions=recipe.functions
+		self.stateList=recipe.stateList
+		self.initialStateList=recipe.initialStateList
+		self.initialValue=recipe.initialValue
+		self.finalStateList=recipe.finalStateList
+		self.transitions=recipe.transitions
+		self.symbolicTransitions=recipe.symbolicTransitions
+	
+	def compile(self):
+		"""Compiles the symbolic transitions made by read_recipe or read_transition_list
+		into an integer-indexed transition table which is used to run the machine
+		In the 'r' setting, the alphabet list also has the output strings, so only the input alphabet is used to tokenize inputs
+		The states that can't be reached, and the ones that can't reach a final state if prune_dead is True, are then left out of the machine, see CompiledMachine.pruned.
+		The transitions as they're written are left as they are, and the ones left out of the machine are kept in pruned_transitions for output_transitions
+		A deterministic machine only ever starts in the first initial state, and transitions that conflict with the ones before them are reported as mistakes.
+		A nondeterministic machine starts in all of them and keeps every transition, see two_way_nondeterministic.py"""
+		if self.nondeterministic:
+			initialStateList=self.initialStateList
+		else:
+			initialStateList=self.initialStateList[:1]
+		"""The mistakes are reported with the transitions as they're written in the FST file"""
+		written=dict(zip(self.symbolicTransitions,self.transitions))
+		if hasattr(self,'input_alphabet'):
+			inputAlphabetList=self.input_alphabet
+		else:
+			inputAlphabetList=self.alphabetList
+		machine=CompiledMachine(self.stateList,self.alphabetList,inputAlphabetList,self.initialStateList,self.finalStateList,self.initialValue,self.symbolicTransitions,self.functions)
+		before=machine.transition_counts()
+		self.machine,removed,removed_alternatives=machine.pruned(initialStateList,self.prune_dead)
+		after=self.machine.transition_counts()
+		self.pruning_stats={'states':(before[0],after[0]),'symbols':(before[1],after[1]),'transitions':(before[2],after[2])}
+		if self.nondeterministic:
+			import two_way_nondeterministic
+			self.machine=two_way_nondeterministic.NondeterministicMachine.from_machine(self.machine)
+			self.pruned_transitions=removed+removed_alternatives
+		else:
+			self.pruned_transitions=removed
+			for trans in self.machine.conflicts:
+				print("error, nondeterminism for the transition:",written.get(trans,trans),file=sys.stderr)
+		self.machine.set_cache(self.cache_size)
+		self.expanded_deltas=None
+	
+	def delta_functions(self):
+		"""Returns the delta functions of the machine as the three dicts deltaState, deltaOutput, deltaDirection keyed by (state,symbol) pairs
+		The compiled machine doesn't keep these, so they are expanded the first time they're asked for"""
+		if self.expanded_deltas is None:
+			self.expanded_deltas=self.machine.expand()
+		return self.expanded_deltas
+	
+	@property
+	def deltaState(self):
+		return self.delta_functions()[0]
+	
+	@property
+	def deltaOutput(self):
+		return self.delta_functions()[1]
+	
+	@property
+	def deltaDirection(self):
+		return self.delta_functions()[2]
+	
+	def set_cache(self,maxsize):
+		"""Turns on a cache of the outputs of the machine with room for maxsize inputs, or turns it off if maxsize is None or 0
+		The cache is used by transduce and by both batch modes, each worker process of a parallel batch has its own copy"""
+		self.cache_size=maxsize
+		self.machine.set_cache(maxsize)
+	
+	def set_prefilter(self,on):
+		"""Turns on or off the check of every input against the domain of the 2-way FST before running it, see CompiledMachine.set_prefilter
+		Inputs outside of the domain get an error with the reason 'not in domain' and the initial value as their partial output
+		Returns whether the prefilter is on, it stays off if the automaton of the domain would be too big"""
+		if not self.machine.set_prefilter(on) and on:
+			if self.machine.nondeterministic:
+				print("only deterministic 2-way FSTs can be prefiltered, every input will be run",file=sys.stderr)
+			else:
+				print("the domain of the 2-way FST is too big to be prefiltered, every input will be run",file=sys.stderr)
+		return self.machine.prefilter
+	
+	def set_profile(self,on):
+		"""Turns on or off the measuring of the runs of the 2-way FST, see RunProfile, and returns the profile if it's on
+		Only the runs done by transduce in this process are measured, not the ones of worker processes or of the numpy batch engine,
+		and only deterministic 2-way FSTs can be measured"""
+		if self.machine.set_profile(on) is None and on:
+			print("only the runs of deterministic 2-way FSTs can be measured, there won't be a profile",file=sys.stderr)
+		return self.machine.profile
+	
+	def set_generated(self,on,module_file=None):
+		"""Turns on or off running the 2-way FST with Python code generated for it, see two_way_codegen.py
+		The outputs and errors are the same, only the runs are faster. If module_file is given, the generated code is written there
+		and imported again the next time, as long as the 2-way FST and the generator haven't changed
+		Returns whether the generated code is used, only deterministic 2-way FSTs get generated code"""
+		import two_way_codegen
+		if not on:
+			if isinstance(self.machine,two_way_codegen.GeneratedMachine):
+				self.machine=self.machine.compiled_machine()
+			return False
+		if self.machine.nondeterministic:
+			print("only deterministic 2-way FSTs get generated code, the 2-way FST is run as it is",file=sys.stderr)
+			return False
+		if not isinstance(self.machine,two_way_codegen.GeneratedMachine):
+			self.machine=two_way_codegen.GeneratedMachine.from_machine(self.compiled_machine(),module_file)
+		return True
+	
+	def set_sweeping(self,on):
+		"""Turns on or off running the 2-way FST in passes over the input, if its reading head only turns around a bounded number of times, see two_way_sweeping.py
+		The outputs and errors are the same. A 1-way 2-way FST makes one pass, and can also read its input as a stream, see SweepingMachine.stream
+		Returns the number of passes, or None if the 2-way FST is run step by step. This replaces the generated code of set_generated if it can be used"""
+		import two_way_sweeping
+		if not on:
+			if isinstance(self.machine,two_way_sweeping.SweepingMachine):
+				self.machine=self.machine.compiled_machine()
+			return None
+		if self.machine.nondeterministic:
+			print("only deterministic 2-way FSTs can be run in passes, the 2-way FST is run as it is",file=sys.stderr)
+			return None
+		if not isinstance(self.machine,two_way_sweeping.SweepingMachine):
+			machine=two_way_sweeping.SweepingMachine.from_machine(self.compiled_machine())
+			if machine is None:
+				print("the reading head of the 2-way FST can turn around any number of times, it's run step by step",file=sys.stderr)
+				return None
+			self.machine=machine
+		return self.machine.passes
+	
+	def compiled_machine(self):
+		"""Returns the compiled machine of the 2-way FST without the generated code of set_generated or the passes of set_sweeping"""
+		if hasattr(self.machine,'compiled_machine'):
+			return self.machine.compiled_machine()
+		return self.machine
+	
+	def compact(self):
+		"""Drops what was only needed to build the machine, like the lines of the FST file and the transitions of the recipe, so that a process can keep hundreds of 2-way FSTs
+		The 2-way FST still runs, and its transitions can still be written with output_transitions and write_binary, since they're read from the machine"""
+		for name in ['lines','lines_transitions','line_initialStates','line_finalStates','transitions','symbolicTransitions','subalphabets','functions',
+			'alphabetList','input_alphabet','output_alphabet','state_to_number']:
+			if name in self.__dict__:
+				del self.__dict__[name]
+		"""The lists of states are kept for output_transitions, with the strings of the machine"""
+		self.stateList=[sys.intern(state) for state in self.stateList]
+		self.initialStateList=[sys.intern(state) for state in self.initialStateList]
+		self.finalStateList=[sys.intern(state) for state in self.finalStateList]
+		self.expanded_deltas=None
+		self.machine.conflicts=[]
+
+	def memory_report(self):
+		"""Returns how many bytes the 2-way FST takes, see CompiledMachine.memory_report, with what the Reader keeps besides the machine under 'reader'"""
+		seen=set()
+		report=self.machine.memory_report(seen)
+		seen.add(id(self.__dict__))
+		report['reader']=sys.getsizeof(self)+sys.getsizeof(self.__dict__)+sum([deep_size(value,seen) for name,value in self.__dict__.items() if name!='machine'])
+		report['total']=report['total']+report['reader']
+		return report
+
+	def determinize(self,max_states=10000):
+		"""Turns a nondeterministic 2-way FST into a deterministic one with the same outputs, if the runs never split up, see two_way_nondeterministic.determinize
+		The states of the new machine are sets of states, and its transitions are the ones written by output_transitions
+		Returns whether the 2-way FST is deterministic now"""
+		if not self.machine.nondeterministic:
+			return True
+		import two_way_nondeterministic
+		machine=two_way_nondeterministic.determinize(self.machine,max_states)
+		if machine is None:
+			print("the 2-way FST can't be determinized cheaply, it's run as a nondeterministic 2-way FST",file=sys.stderr)
+			return False
+		self.machine=machine
+		self.machine.set_cache(self.cache_size)
+		self.stateList=list(machine.states)
+		self.initialStateList=[machine.initialState]
+		self.finalStateList=[state for q,state in enumerate(machine.states) if machine.final[q]]
+		self.pruned_transitions=[]
+		self.nondeterministic=False
+		self.expanded_deltas=None
+		return True
+	
+	def cache_stats(self):
+		"""Returns the size and the hit and miss counts of the cache, or None if the cache is off"""
+		if self.machine.cache is None:
+			return None
+		return self.machine.cache.stats()
+	
+	def output_transitions(self,transitions_file='output_transitions.txt'):
+		"""Writes the transitions of the 2-way FST on transitions_file, see transitions_text"""
+		f = codecs.open(transitions_file,'w','utf-8')#io.open('output_transitions.txt','w',encoding='utf-8')
+		f.write(self.transitions_text())
+		f.close()
+	
+	def transitions_text(self):
+		"""Returns the list of transitions of the 2-way FST as the text of output_transitions.txt, which can be read back with from_transition_list"""
+		f=io.StringIO(newline='')
 		"""Here we determine how the state strings will get mapped to numbers"""
 		self.state_to_number={}
 		n=0
@@ -532,9 +1873,12 @@ class Reader:
 				n=n+1
 		
 		"""Here we print out the state to number mapping"""
-		f = codecs.open('output_transitions.txt','w','utf-8')#io.open('output_transitions.txt','w',encoding='utf-8')
 		f.write(u"#\tThis is the list of transitions arcs for the 2-way FST that implements the following FST recipe:\r\n")
 		f.write(u"#\t\t"+self.name+"\r\n")
+		if any([before!=after for before,after in self.pruning_stats.values()]):
+			f.write(u"#\tThe states that no run can go through to a final state were left out of the compiled 2-way FST, but they're still listed here:\r\n")
+			for what in ['states','symbols','transitions']:
+				f.write(u"#\t\t%s: %d before, %d after\r\n" % ((what,)+self.pruning_stats[what]))
 		
 		f.write(u"#\tThe states in our FST recipe were written as strings.\r\n")
 		f.write(u"#\tThese get mapped to the following natural numbers:\r\n")
@@ -560,16 +1904,24 @@ class Reader:
 		
 		f.write(u"\r\n\r\n\r\n")
 		
-		"""Here we convert our tranisitions into a sorted tuples of input state,input symbol, output state, output string, direction"""
+		"""Here we convert our tranisitions into a sorted tuples of input state,input symbol, output state, output string, direction
+		The transitions of the compiled machine are expanded here to one per symbol, without keeping them around afterwards"""
+		deltaState,deltaOutput,deltaDirection=self.machine.expand()
 		lines_to_output=[]
-		for key in sorted(self.deltaState.keys()):
-			lines_to_output.append(str(self.state_to_number[key[0]])+","+key[1]+","+str(self.state_to_number[self.deltaState[key]])+","+self.deltaOutput[key]+","+str(self.deltaDirection[key]))
+		for key in sorted(deltaState.keys()):
+			lines_to_output.append(str(self.state_to_number[key[0]])+","+key[1]+","+str(self.state_to_number[deltaState[key]])+","+deltaOutput[key]+","+str(deltaDirection[key]))
 			#.encode('utf-8')
+		if self.machine.nondeterministic:
+			for stateQ,inputA,stateP,outputB,direction in self.machine.expand_alternatives():
+				lines_to_output.append(str(self.state_to_number[stateQ])+","+inputA+","+str(self.state_to_number[stateP])+","+outputB+","+str(direction))
+		"""The transitions that were left out of the compiled machine are listed too, so that the list is the one that was written"""
+		for stateQ,inputA,stateP,outputB,direction in self.pruned_transitions:
+			lines_to_output.append(str(self.state_to_number[stateQ])+","+inputA+","+str(self.state_to_number[stateP])+","+outputB+","+str(direction))
 		lines_to_output.sort()
 		for line in lines_to_output:
 			f.write(line)# (line.decode('utf-8'))#.encode('utf-8'))
 			f.write('\r\n')
-		f.close()
+		return f.getvalue()
 			
 	"""these functions will run the 2way FST on the input strings
 	not sure if they should be methods of a class  or just general methods
@@ -577,102 +1929,80 @@ class Reader:
 	meh ill make em be part of class"""			
 	def run(self,stateQ,output_so_far,entire_input,index_header):
 		"""Given an input state, the output string, the input string, and the location of the reading head,
-		this function runs the machine"""
-		#print("stateQ:%s outputsofar:%s entireinput:%s indexheader=%s"% (stateQ,output_so_far,entire_input,index_header ) )
-
-		if index_header==len(entire_input):
-			#print ("huh i made it here")
-			#print (stateQ,output_so_far)
-			if stateQ  not in self.finalStateList:
-				#print ("this did not end on the final state \"end\" ")
-				return (output_so_far+" --- there was an error because we read till the end but didnt end in a final state, but in state " % stateQ)
-			#in case youre working on a list of symbols and you dont want to see ' in your output list'
-			if type(output_so_far)==list:
-				output_so_far= list(filter(lambda x: x!= '', output_so_far))
-			return output_so_far
-		
-		else:
-			#print ("reached here2")
-			#print ("q:",stateQ)
-			#print ("outputsofar:",output_so_far)
-			#print ("entire_input:",entire_input)
-			#print ("index_header:",index_header)
-			inputA=entire_input[index_header]
-			#print("inputA:%s"%inputA)
-			#print ("scanning input symbol:",entire_input[index_header])
-			
-			if stateQ not in self.stateList:
-				return (output_so_far+" --- there was an error because the input state %s isn't in the state list" % stateQ)
-			if inputA not in self.alphabetList + ['#','%']:
-				return (output_so_far+" --- there was an error because the input symbol %s isn't in the alphabet" % inputA)
-			
-			try:
-				stateP=self.deltaState[(stateQ,inputA)]
-			except:
-				#print("k")
-				#print(stateQ)
-				#print(inputA)
-				#print(self.deltaState[(stateQ,inputA)])
-				#print ("I got an error while trying to look up the output state  for the input_state+input_symbol pair (",stateQ," , ",inputA,") in the input\nPerhaps a key error?" )
-				#sys.exit()
-				return (output_so_far+" --- there was an error because couldn't find output state for the input state+input symbol pair ("+stateQ+","+inputA+")")
-			try:
-				outputB=self.deltaOutput[(stateQ,inputA)]
-			except:
-				#print ( 'I got an error while trying to look up the output string  for the input_state+input_symbol pair (',stateQ," , ",inputA,') in the input\nPerhaps a key error?' )
-				return (output_so_far+" --- there was an error because couldn't find output string for the input state+input symbol pair ("+stateQ+","+inputA+")" )
-			
-			#print("type of output_so_far " + str(type(output_so_far))) 
-			if ( type(output_so_far)==str or type(output_so_far)==unicode):
-				output_so_far=output_so_far+outputB
-			elif type(output_so_far)==list:
-				output_so_far=output_so_far+[outputB]
-			direction=self.deltaDirection[(stateQ,inputA)]
-			index_header=direction+index_header
-			return self.run(stateP,output_so_far,entire_input,index_header)			
-		
+		this function runs the machine
+		The machine is run with a loop instead of one recursive call per move of the reading head,
+		so long inputs don't hit python's recursion limit.
+		The run itself is done over the compiled transition table, see CompiledMachine
+		If the machine doesn't halt, or if it takes more than self.max_steps steps, the run stops and the error is returned"""
+		return self.machine.run(stateQ,output_so_far,entire_input,index_header,self.max_steps)
 			
 	def transduce(self,input_string):
-		"""given an input, this function processes the 2-way FST on the input and prints out the output
-		If the 2-way FST's function is not defined on the input, then it crashes"""
-		
-		"""We first need to determine the initial state and initial value"""
-		#print("transducing time")
-		#print("so this is list of initial states:%s"%self.initialStateList)
-		#print("so this is #1 of initial states:%s"%self.initialStateList[0])
-		initialState=self.initialStateList[0]
-		initialValue=self.initialValue
-		
-		"""We determine whether the input is in the form of a list, a string of characters separated by whitespace, or just a string without whitespace"""
-		if ( type(input_string)==str) and " " in input_string:#type(input_string)==unicode or -- bugs
-		 	#print("yes space")
-		 	input_string=input_string.split()
-		if type(input_string)==str:#type(input_string)==unicode or  bugs
-		 	#print("no space")
-		 	input_string=input_string.strip()
-		 	input_string="#"+input_string+"%"
-		elif type(input_string)==list:
-			print ("ok..")
-			input_string=["#"]+input_string+["%"]
-			print (input_string)
-			#if you want to output a list of symbols, not a string, then uncomment the below
-			#if type(initialValue)==str:
-			#	initialValue=[initialValue]
-		#print("type: ",type(input_string))	
-		return self.run(initialState,initialValue,input_string,0)
-		
-	def output_strings_file(self,input_string_file):
-		"""Given a file with a list of input strings, this processes each input string and prints it out onto the output file"""
-		f_input=codecs.open(input_string_file,'r','utf-8')#io.open(input_string_file,'r',encoding='utf-8')
-		f_output=codecs.open('output_strings.txt','w','utf-8')#io.open('output_strings.txt','w',encoding='utf-8')
-		input_lines=f_input.readlines()
-		if input_lines[0][0]==u'\ufeff':
-			input_lines[0]=input_lines[0][1:]#utf8 texts start with the byte encoding symbol, remove it
-		for line in input_lines:
-			line=line.strip()
-			f_output.write (u''+line+"\t-->\t"+self.transduce(line)+"\r\n")
-		f_input.close()
-		f_output.close()
+		"""given an input, this function processes the 2-way FST on the input and returns the output
+		If the 2-way FST's function is not defined on the input, then the output so far is returned with the error, see RunError"""
+		return self.machine.transduce(input_string,self.max_steps)
+	
+	def transduce_many(self,input_strings):
+		"""Runs the 2-way FST on each string of an iterable of input strings and returns the list of their outputs, in the same order
+		An input the 2-way FST isn't defined on gets its RunError, see transduce"""
+		return [self.transduce(input_string) for input_string in input_strings]
+		
+	def tokenize(self,input_string):
+		"""Splits an input string without whitespace into symbols of the alphabet by longest match
+		Returns a tuple (list of symbols, list of positions in the string that couldn't be tokenized)"""
+		return self.machine.tokenizer.tokenize(input_string)
+	
+	def output_strings_file(self,input_string_file,output_string_file='output_strings.txt',chunk_size=1000,workers=1,batch=False):
+		"""Given a file with a list of input strings, this processes each input string and prints it out onto the output file
+		The input file is read lazily line by line and the output is written in chunks of chunk_size lines,
+		so memory stays flat however big the input file is
+		Either file name can be '-' to read from stdin or write to stdout
+		If workers is more than 1, the input strings are transduced by that many worker processes, see transduce_lines_parallel
+		If batch is True, each chunk of input strings is run at the same time with numpy, see two_way_batch.py,
+		unless the 2-way FST is nondeterministic, since the batch engine only follows one run per input"""
+		if batch and not self.machine.nondeterministic:
+			import two_way_batch
+			pairs=two_way_batch.transduce_lines_batch(self.machine,read_input_strings(input_string_file),chunk_size,self.max_steps)
+		elif workers>1:
+			pairs=self.transduce_lines_parallel(read_input_strings(input_string_file),workers,chunk_size)
+		else:
+			pairs=self.transduce_lines(read_input_strings(input_string_file))
+		profile=self.machine.profile
+		if profile is None:
+			write_output_strings(output_string_file,pairs,chunk_size)
+			return
+		"""The time spent reading and writing the files is what's left once the measured runs are taken out"""
+		measured=profile.seconds['tokenize']+profile.seconds['run']+profile.seconds['profiling']
+		start=time.perf_counter()
+		write_output_strings(output_string_file,pairs,chunk_size)
+		measured=profile.seconds['tokenize']+profile.seconds['run']+profile.seconds['profiling']-measured
+		profile.add_output_time(time.perf_counter()-start-measured)
+	
+	def transduce_lines(self,lines):
+		"""Given an iterable of input strings, this lazily yields the pairs (input string, output string)"""
+		for line in lines:
+			yield (line,self.transduce(line))
+	
+	def transduce_lines_parallel(self,lines,workers,chunk_size=1000):
+		"""Same as transduce_lines but the input strings are sent in chunks of chunk_size lines to a pool of worker processes
+		Each worker gets the compiled machine once when it starts.
+		The results are yielded in the order of the input, and at most 2 chunks per worker are in flight at any time
+		so memory stays bounded"""
+		pool=multiprocessing.Pool(workers,initializer=init_batch_worker,initargs=(self.machine,self.max_steps))
+		try:
+			pending=collections.deque()
+			for chunk in chunked(lines,chunk_size):
+				pending.append((chunk,pool.apply_async(transduce_chunk,(chunk,))))
+				if len(pending)>=2*workers:
+					chunk,result=pending.popleft()
+					for pair in zip(chunk,result.get()):
+						yield pair
+			while pending:
+				chunk,result=pending.popleft()
+				for pair in zip(chunk,result.get()):
+					yield pair
+		finally:
+			pool.terminate()
+			pool.join()
 		
 	def read_transition_list(self,transition_file):
 		"""This takes as input a list of lines such that:
@@ -681,6 +2011,7 @@ class Reader:
 			all other lines have the template: input state, input symbol, output state, output string, direction
 				e.g. : 2,a,3,aa,+1
 			Note, both the input and output have the same alphabet
+		A TransitionListError is raised if a line can't be read
 		"""
 		#print('eh')
 		self.input_alphabet=set([]) 
@@ -690,67 +2021,69 @@ class Reader:
 		self.initialValue=""
 		self.transitions=[]
 		
+		if len(self.lines)<2:
+			raise TransitionListError("the list of transitions must start with a line of initial states and a line of final states")
 		currentLineIndex=0
 		self.line_initialStates=self.lines[currentLineIndex]
 #		print("so this is line of initial states:%s"%self.line_initialStates)
-		self.initialStateList=getListofItems_nospace(self.line_initialStates)
+		self.initialStateList=self.state_numbers(self.line_initialStates,'initial')
 #		print("so this is list of initial states:%s"%self.initialStateList)
 #		print("so this is #1 of initial states:%s"%self.initialStateList[0])
 		currentLineIndex=currentLineIndex+1
 		#print('oy')
 		self.line_finalStates=self.lines[currentLineIndex]
-		self.finalStateList=getListofItems_nospace(self.line_finalStates)
+		self.finalStateList=self.state_numbers(self.line_finalStates,'final')
 		currentLineIndex=currentLineIndex+1
 
 		
 		self.lines_transitions=self.lines[currentLineIndex:]
 
 
-		self.deltaState={}
-		self.deltaOutput={}
-		self.deltaDirection={}
+		self.symbolicTransitions=[]
+		seen=set()
 		
 		for trans in self.lines_transitions:
+		#	print("pre-strip trans that im working on:%s"%trans)
+			trans=trans.strip()
+		#	print("post-strip trans that im working on:%s"%trans)
+			trans=trans.split(',')
+		#	print("post-split trans that im working on:%s"%trans)
+			if len(trans)<5:
+				raise TransitionListError("the transition %s doesn't have an input state, input symbol, output state, output string and direction" % ','.join(trans))
+			stateQ=trans[0]
+			inputA=trans[1]
+			stateP=trans[2]
+			outputB=trans[3]
 			try:
-			#	print("pre-strip trans that im working on:%s"%trans)
-				trans=trans.strip()
-			#	print("post-strip trans that im working on:%s"%trans)
-				trans=trans.split(',')
-			#	print("post-split trans that im working on:%s"%trans)
-				stateQ=trans[0]
-				inputA=trans[1]
-				stateP=trans[2]
-				outputB=trans[3]
 				direction=int(trans[4])
+			except ValueError:
+				raise TransitionListError("the direction symbol %s isnt a number for the transition: %s" % (trans[4],','.join(trans)))
+			
+			
+			if direction   not in [0,1,-1]:
+				raise TransitionListError("the direction symbol %d isnt an okay direction for the transition: %s" % (direction,','.join(trans)))
 				
-				
-				if direction   not in [0,1,-1]:
-					print ("error, the direction symbol",direction," isnt an okay direction  for the transition:",trans)
-					sys.exit()
-					
-				self.transitions.append(trans)
-				self.stateList.add(stateQ)
-				self.input_alphabet.add(inputA)
-				self.stateList.add(stateP)
-				self.output_alphabet.add(outputB)
-				
-				i=inputA
-				o=outputB
-				qa=(stateQ,i)
-				#print ('input state + input symbol pair is: ',qa)
-				p=stateP
-				b=o
-				dir=direction
-				if qa in self.deltaState:
-					print ("error, nondeterminism for the transition:",trans)
-					break
-				else:
-					self.deltaState[qa]=p
-					self.deltaOutput[qa]=b
-					self.deltaDirection[qa]=dir
-			except :
-				print ("an error happened while intrepreting the transition:",trans)
-				sys.exit()
+			self.transitions.append(trans)
+			self.stateList.add(stateQ)
+			self.input_alphabet.add(inputA)
+			self.stateList.add(stateP)
+			self.output_alphabet.add(outputB)
+			
+			qa=(stateQ,inputA)
+			#print ('input state + input symbol pair is: ',qa)
+			if qa in seen and not self.nondeterministic:
+				print("error, nondeterminism for the transition:",trans,file=sys.stderr)
+				break
+			seen.add(qa)
+			"""An output which copies the input symbol is read as the identity function \\ID,
+			so that symbols which are copied the same way can share a class in the compiled machine"""
+			if outputB==inputA:
+				outputTemplate=((True,'ID'),)
+			elif len(outputB)==0:
+				outputTemplate=()
+			else:
+				outputTemplate=((False,outputB),)
+			self.symbolicTransitions.append((stateQ,frozenset([inputA]),stateP,outputTemplate,direction))
 		
 		self.alphabetList.update(self.input_alphabet)
 		self.alphabetList.update(self.output_alphabet)
@@ -758,14 +2091,59 @@ class Reader:
 		self.input_alphabet=list(self.input_alphabet)
 		self.output_alphabet=list(self.output_alphabet)
 		self.stateList=list(self.stateList)
+		self.functions={"ID":dict([(symbol,symbol) for symbol in self.input_alphabet])}
+	
+	def state_numbers(self,line,which):
+		"""Reads a line of initial or final states of a list of transitions, of the form: initial states = [ 1,2,3]"""
+		if '[' not in line:
+			raise TransitionListError("the %s states must be written as %s states = [ 1,2,3], not as: %s" % (which,which,line))
+		return getListofItems_nospace(line)
 	
 #def __main__(self,FST_recipe_file,input_strings):
 def main():
-    #for arg in sys.argv[1:]:
-	#print ("arguments are:")
-	#print (sys.argv[1])
-	#print (sys.argv[2])
-	reader=Reader( sys.argv[1],sys.argv[2],sys.argv[3])	
+	parser=argparse.ArgumentParser(description="Runs the 2-way FST in an FST recipe ('w') or in a list of transitions ('r') on a file of input strings")
+	parser.add_argument('FST_file',help="the FST recipe, or the list of transitions in the 'r' setting, or the binary file in the 'b' setting")
+	parser.add_argument('input_strings',help="the file of input strings, one per line, or - for stdin")
+	parser.add_argument('setting',choices=['w','r','b'],help="'w' for an FST recipe, 'r' for a list of transitions, 'b' for a binary file, see two_way_binary.py")
+	parser.add_argument('output_strings',nargs='?',default='output_strings.txt',help="the file the outputs are written on, or - for stdout (default: output_strings.txt)")
+	parser.add_argument('--max-steps',type=int,default=None,help="stop any run that takes more than this many steps")
+	parser.add_argument('--workers',type=int,default=1,help="number of worker processes that transduce the input strings (default: 1)")
+	parser.add_argument('--chunk-size',type=int,default=1000,help="number of input strings read, sent to a worker and written at a time (default: 1000)")
+	parser.add_argument('--cache-size',type=int,default=None,help="cache the outputs of up to this many distinct inputs (default: no cache)")
+	parser.add_argument('--compiled-cache',default=None,metavar='DIR',help="store compiled machines in this folder and reuse them while the FST file is unchanged. The files in it are loaded with pickle, so only use a folder that you trust")
+	parser.add_argument('--batch',action='store_true',help="run each chunk of input strings at the same time with numpy instead of one by one")
+	parser.add_argument('--prefilter',action='store_true',help="reject the input strings outside of the domain of the 2-way FST without running it on them")
+	parser.add_argument('--no-transitions',action='store_true',help="don't write the transitions of the 2-way FST on output_transitions.txt")
+	parser.add_argument('--nondeterministic',action='store_true',help="allow several transitions for a state+symbol pair and several initial states, for 2-way FSTs that are functional")
+	parser.add_argument('--determinize',action='store_true',help="with --nondeterministic, turn the 2-way FST into a deterministic one first if that's cheap")
+	parser.add_argument('--profile',default=None,metavar='FILE',help="measure the runs and write the steps, reversals and times of every input and the number of times each transition was used on FILE, as json or as csv if FILE ends with .csv")
+	parser.add_argument('--generated',action='store_true',help="run the 2-way FST with Python code generated for it, which is kept next to FST_file as NAME_generated.py and reused while the 2-way FST is unchanged")
+	parser.add_argument('--sweeping',action='store_true',help="if the reading head of the 2-way FST only turns around a bounded number of times, run it in passes over the input (instead of --generated if both are given)")
+	parser.add_argument('--prune-dead',action='store_true',help="also leave the states that can't reach a final state out of the compiled 2-way FST, so that the runs that go into them fail right away, with a shorter partial output")
+	args=parser.parse_args()
+	if args.profile is not None and (args.batch or args.workers>1):
+		sys.stderr.write("error, --profile only measures runs done one by one, without --batch or --workers\n")
+		sys.exit(1)
+	if args.batch:
+		import two_way_batch
+		if two_way_batch.numpy is None:
+			sys.stderr.write("error, --batch needs numpy, which isn't installed\n")
+			sys.exit(1)
+	binary_errors=()
+	if args.setting=='b':
+		import two_way_binary
+		binary_errors=two_way_binary.BinaryFormatError
+	try:
+		reader=Reader(args.FST_file,args.input_strings,args.setting,args.max_steps,args.output_strings,args.workers,args.chunk_size,args.cache_size,args.compiled_cache,args.batch,args.prefilter,args.profile,None if args.no_transitions else 'output_transitions.txt',args.nondeterministic,args.determinize,args.generated,args.sweeping,args.prune_dead)
+	except RecipeError as error:
+		sys.stderr.write("error, the FST recipe %s has mistakes:\n%s\n" % (args.FST_file,error))
+		sys.exit(1)
+	except TransitionListError as error:
+		sys.stderr.write("error, the list of transitions %s has mistakes:\n%s\n" % (args.FST_file,error))
+		sys.exit(1)
+	except binary_errors as error:
+		sys.stderr.write("error, %s\n" % error)
+		sys.exit(1)
 
 if __name__ == "__main__":
     main()		
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Functional nondeterministic 2-way FSTs, which are run on sets of configurations at once
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+from two_way_interpreter import RunError, CompiledMachine, join_output
+
+class NondeterministicMachine(CompiledMachine):
+	"""A compiled machine whose (state, symbol) pairs can have several transitions, and which can start in several initial states
+	The other transitions of a cell are the alternatives of CompiledMachine
+	The machine has to be functional: every run that succeeds on an input gives the same output
+
+	All the runs are followed at the same time, one step at a time. A configuration is a state and a position of the reading head.
+	Two runs that reach the same configuration do the same thing from then on, and in a functional machine they've output the same string
+	if either can succeed, so only the first one to get there is kept. Runs that fail are dropped at once.
+	So each configuration is visited at most once, and a run costs at most |Q|*(length of input) steps, even if the machine loops"""
+
+	__slots__=()
+	nondeterministic=True
+
+	@classmethod
+	def from_machine(cls,machine):
+		"""Makes a nondeterministic machine out of a compiled machine, sharing its table, outputs and alternatives"""
+		return machine.converted(cls)
+
+	def set_prefilter(self,on,max_states=10000):
+		"""The automaton of the domain is only built for deterministic machines, so the prefilter stays off"""
+		self.prefilter=False
+		return False
+
+	def set_profile(self,on):
+		"""The profile replays deterministic runs, so it stays off"""
+		self.profile=None
+		return None
+
+	def run(self,stateQ,output_so_far,entire_input,index_header,max_steps=None):
+		"""Runs the machine from the state stateQ with the reading head at index_header, or from every initial state if stateQ is the initial state
+		Returns the output of the first run to reach the end of the input in a final state
+		If no run succeeds, the error is the one of the run that failed last, with its partial output. A run that comes to a configuration
+		which was already visited is dropped without an error, since the run that got there first goes on from it.
+		Only when every run was dropped that way, so that none of them failed, does the machine loop, and it then fails with 'non-terminating'
+		max_steps limits the number of steps of the runs. The configurations visited are added to self.step_count"""
+		if stateQ==self.initialState:
+			starts=self.initialStates
+		else:
+			starts=[stateQ]
+		for state in starts:
+			if state not in self.state_ids:
+				return RunError(join_output(output_so_far,[]),'bad state',"the input state %s isn't in the state list" % state)
+		input_length=len(entire_input)
+		if index_header==input_length:
+			for state in starts:
+				if self.final[self.state_ids[state]]:
+					return self.finish(output_so_far,None)
+			return RunError(join_output(output_so_far,[]),'not final',"we read till the end but didnt end in a final state, but in state %s" % starts[0])
+
+		class_ids=self.class_ids
+		input_ids=[class_ids.get(inputA,-1) for inputA in entire_input]
+		table=self.table
+		alternatives=self.alternatives
+		classCount=self.classCount
+		pool=self.outputs
+		final=self.final
+
+		"""A configuration is kept as (state, position, output), where the output is a linked list (output before, output of the last step)
+		so that the runs share what they output before they split"""
+		seen=set()
+		frontier=[]
+		for state in starts:
+			q=self.state_ids[state]
+			if q*input_length+index_header not in seen:
+				seen.add(q*input_length+index_header)
+				frontier.append((q,index_header,None))
+		steps=0
+		visited=0
+		failure=None
+		looped=None
+		while len(frontier)>0:
+			if max_steps is not None and steps>=max_steps:
+				failure=('step budget',"no run of the machine halted within the budget of %d steps" % max_steps,frontier[0][2])
+				break
+			next_frontier=[]
+			for q,i,output in frontier:
+				visited=visited+1
+				a=input_ids[i]
+				if a>=0:
+					cell=q*classCount+a
+					record=table[cell]
+					records=alternatives.get(cell,())
+					if record>=0:
+						records=(record,)+records
+				else:
+					records=()
+				if len(records)==0:
+					inputA=entire_input[i]
+					if inputA not in self.alphabet:
+						failure=('bad symbol',"the input symbol %s isn't in the alphabet" % inputA,output)
+					else:
+						failure=('no transition',"couldn't find output state for the input state+input symbol pair ("+self.states[q]+","+inputA+")",output)
+					continue
+				for record in records:
+					step_output=pool[record>>32]
+					if step_output.__class__ is not str:
+						step_output=step_output[entire_input[i]]
+					p=(record>>2)&0x3fffffff
+					j=i+(record&3)-1
+					new_output=(output,step_output) if step_output!='' else output
+					if j==input_length:
+						if final[p]:
+							self.step_count=self.step_count+visited
+							return self.finish(output_so_far,new_output)
+						failure=('not final',"we read till the end but didnt end in a final state, but in state %s" % self.states[p],new_output)
+					elif j<0:
+						failure=('left edge',"the reading head moved past the left edge of the input in state %s" % self.states[p],new_output)
+					elif p*input_length+j in seen:
+						if looped is None:
+							looped=('non-terminating',"the machine doesn't halt on this input, its runs came back to state %s at position %d after %d steps" % (self.states[p],j,steps+1),new_output)
+					else:
+						seen.add(p*input_length+j)
+						next_frontier.append((p,j,new_output))
+			frontier=next_frontier
+			steps=steps+1
+		self.step_count=self.step_count+visited
+		if failure is None:
+			failure=looped
+		reason,message,output=failure
+		return RunError(join_output(output_so_far,self.outputs_of(output)),reason,message)
+
+	def outputs_of(self,output):
+		"""The list of outputs of the steps of a run, from its linked list"""
+		outputs=[]
+		while output is not None:
+			output,step_output=output
+			outputs.append(step_output)
+		outputs.reverse()
+		return outputs
+
+	def finish(self,output_so_far,output):
+		output_so_far=join_output(output_so_far,self.outputs_of(output))
+		if type(output_so_far)==list:
+			output_so_far=list(filter(lambda x: x!='',output_so_far))
+		return output_so_far
+
+def determinize(machine,max_states=10000):
+	"""Turns a nondeterministic machine into a deterministic compiled machine with the same outputs, when that's cheap, or returns None
+	The states of the new machine are the sets of states the runs can be in (subset construction), starting with the set of the initial states.
+	This only works when the runs never split up: all the transitions of the states of a set on a symbol have to move the same way
+	with the same output, so that the runs stay at the same position with the same output. Runs that have no transition just stop.
+	A set is final if one of its states is. Returns None if the runs split up, or if there would be more than max_states sets"""
+	if any([state not in machine.state_ids for state in machine.initialStates]):
+		return None
+	names={}
+	used=set()
+	def name(subset):
+		"""A set of one state keeps the name of the state, the others are named like {q1, q2}"""
+		if subset not in names:
+			if len(subset)==1:
+				candidate=machine.states[next(iter(subset))]
+			else:
+				candidate="{%s}" % ', '.join(sorted([machine.states[q] for q in subset]))
+			while candidate in used:
+				candidate=candidate+"'"
+			used.add(candidate)
+			names[subset]=candidate
+		return names[subset]
+
+	functions={}
+	def template(output_id):
+		output=machine.outputs[output_id]
+		if output.__class__ is str:
+			return ((False,output),) if len(output)>0 else ()
+		if hasattr(output,'template'):
+			functions.update(output.functions)
+			return output.template
+		"""An output loaded from a binary file is a dict from the input symbols to the output strings, so it becomes a function"""
+		functions['output %d' % output_id]=output
+		return ((True,'output %d' % output_id),)
+
+	initial=frozenset([machine.state_ids[state] for state in machine.initialStates])
+	queue=[initial]
+	seen=set([initial])
+	symbolicTransitions=[]
+	finalStateList=[]
+	while len(queue)>0:
+		subset=queue.pop()
+		if any([machine.final[q] for q in subset]):
+			finalStateList.append(name(subset))
+		for c,symbols in enumerate(machine.class_symbols):
+			moves=set()
+			targets=set()
+			for q in subset:
+				cell=q*machine.classCount+c
+				records=machine.alternatives.get(cell,())
+				if machine.table[cell]>=0:
+					records=(machine.table[cell],)+records
+				for record in records:
+					moves.add((record>>32,record&3))
+					targets.add((record>>2)&0x3fffffff)
+			if len(moves)==0:
+				continue
+			if len(moves)>1:
+				return None
+			output_id,direction=moves.pop()
+			target=frozenset(targets)
+			if target not in seen:
+				if len(seen)>=max_states:
+					return None
+				seen.add(target)
+				queue.append(target)
+			symbolicTransitions.append((name(subset),frozenset(symbols),name(target),template(output_id),direction-1))
+
+	deterministic=CompiledMachine([name(subset) for subset in seen],list(machine.alphabet),[],[name(initial)],finalStateList,machine.initialValue,symbolicTransitions,functions)
+	deterministic.tokenizer=machine.tokenizer
+	return deterministic
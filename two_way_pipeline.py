@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Pipelines of 2-way FSTs, where the output of each 2-way FST is the input of the next one
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import sys
+import argparse
+import collections
+
+from two_way_interpreter import Reader, RecipeError, RunError, CompiledMachine, read_input_strings, write_output_strings
+
+def one_way(machine):
+	"""Checks whether a compiled machine only ever moves right, so it reads its input once from left to right"""
+	for record in machine.table:
+		if record>=0 and (record&3)!=2:
+			return False
+	return True
+
+def split_output(tokenizer,text):
+	"""Splits an output string of a machine into the input symbols of the next machine, the same way the tokenizer splits the whole output,
+	see SymbolTokenizer. Returns None if that could depend on what comes after text: when a symbol that starts in text could go on past its end,
+	or when text has whitespace, since the next machine then splits its input at the whitespace instead"""
+	if any([char.isspace() for char in text]):
+		return None
+	trie=tokenizer.trie
+	length=len(text)
+	symbols=[]
+	i=0
+	while i<length:
+		node=trie
+		j=i
+		end=i+1
+		while j<length and text[j] in node:
+			node=node[text[j]]
+			j=j+1
+			if '' in node:
+				end=j
+		if j==length and len(node)>('' in node):
+			return None
+		#a character that starts no symbol is a symbol by itself, which the next machine then rejects
+		symbols.append(text[i:end])
+		i=end
+	return symbols
+
+def fuse(first,second):
+	"""Composes two compiled machines into one compiled machine which outputs what second outputs on the output of first
+	This is only done when second is 1-way: its state after reading the output of first so far is then tracked along with the state of first,
+	and each transition of first outputs what second outputs on its output string (product construction)
+	Each output string of first has to split into the symbols of second on its own, see split_output,
+	so first can't output whitespace or parts of the symbols of second. Both have to be deterministic. Returns None if second can't be fused this way
+
+	The fused machine gives the same outputs as running both machines one after the other when neither fails.
+	Its errors are about the fused states, so see Pipeline for how the errors of each machine are kept"""
+	if first.nondeterministic or second.nondeterministic:
+		return None
+	if not one_way(second):
+		return None
+	if type(first.initialValue)!=str or type(second.initialValue)!=str:
+		return None
+	if first.initialState not in first.state_ids or second.initialState not in second.state_ids:
+		return None
+
+	def read(q,symbols):
+		"""Runs second from the state q on a list of its symbols, returns (state, output) or None if it fails"""
+		outputs=[]
+		for symbol in symbols:
+			a=second.class_ids.get(symbol,-1)
+			record=second.table[q*second.classCount+a] if a>=0 else -1
+			if record<0:
+				return None
+			output=second.outputs[record>>32]
+			if output.__class__ is not str:
+				output=output[symbol]
+			outputs.append(output)
+			q=(record>>2)&0x3fffffff
+		return q,''.join(outputs)
+
+	initial_symbols=split_output(second.tokenizer,first.initialValue)
+	if initial_symbols is None:
+		return None
+	start=read(second.state_ids[second.initialState],['#']+initial_symbols)
+	if start is None:
+		return None
+
+	names={}
+	used=set()
+	def name(pair):
+		"""The fused states are named after both states, e.g. (start, copy)"""
+		if pair not in names:
+			candidate="(%s, %s)" % (first.states[pair[0]],second.states[pair[1]])
+			while candidate in used:
+				candidate=candidate+"'"
+			used.add(candidate)
+			names[pair]=candidate
+		return names[pair]
+
+	initial=(first.state_ids[first.initialState],start[0])
+	symbolicTransitions=[]
+	finalStateList=[]
+	seen=set([initial])
+	queue=collections.deque([initial])
+	while queue:
+		pair=queue.popleft()
+		q,r=pair
+		if first.final[q] and second.final[r]:
+			finalStateList.append(name(pair))
+		for c,symbols in enumerate(first.class_symbols):
+			record=first.table[q*first.classCount+c]
+			if record<0:
+				continue
+			p=(record>>2)&0x3fffffff
+			direction=(record&3)-1
+			output=first.outputs[record>>32]
+			"""The symbols of the class that lead to the same state of second with the same output share a transition"""
+			targets={}
+			for symbol in symbols:
+				if output.__class__ is str:
+					text=output
+				else:
+					try:
+						text=output[symbol]
+					except KeyError:
+						continue
+				text_symbols=split_output(second.tokenizer,text)
+				if text_symbols is None:
+					return None
+				if symbol=='%' and direction==1:
+					#this is the last step of first, so second reads the end of its input too
+					text_symbols=text_symbols+['%']
+				result=read(r,text_symbols)
+				if result is None:
+					continue
+				targets.setdefault((result[0],result[1]),[]).append(symbol)
+			for (s,fused_output),fused_symbols in targets.items():
+				target=(p,s)
+				if target not in seen:
+					seen.add(target)
+					queue.append(target)
+				template=((False,fused_output),) if len(fused_output)>0 else ()
+				symbolicTransitions.append((name(pair),frozenset(fused_symbols),name(target),template,direction))
+
+	machine=CompiledMachine([name(pair) for pair in seen],list(first.alphabet),[],[name(initial)],finalStateList,second.initialValue+start[1],symbolicTransitions,{})
+	machine.tokenizer=first.tokenizer
+	return machine
+
+class Pipeline:
+	"""A list of Readers run one after the other on each input, the output of each one being the input of the next one
+	The outputs are passed straight from one machine to the next, without writing or reading any files
+	If fuse_machines is True, each machine that can be fused into the machine before it is, see fuse, so that the input is only run once for all of them
+
+	Each machine but the last one gives the list of its output strings instead of their concatenation, see CompiledMachine.transduce_fragments,
+	and each string is split into the symbols of the next machine on its own, see split_output, so the whole output isn't tokenized again.
+	The splits of each string are kept, and the whole output is only tokenized when one of its strings can't be split on its own
+
+	If a machine fails, the error of the pipeline is the error of that machine with its partial output,
+	and its message says which machine failed. When a fused machine fails, its machines are run again one after the other to find out which one it was,
+	so the errors are always the same as without fusing"""
+
+	def __init__(self,readers,fuse_machines=True):
+		self.readers=list(readers)
+		"""Each stage is (compiled machine, max_steps, index of its first reader, index after its last reader)"""
+		self.stages=[]
+		for i,reader in enumerate(self.readers):
+			if fuse_machines and len(self.stages)>0 and reader.max_steps is None:
+				machine,max_steps,start,end=self.stages[-1]
+				fused=fuse(machine,reader.machine)
+				if fused is not None:
+					fused.set_cache(self.readers[start].cache_size)
+					self.stages[-1]=(fused,max_steps,start,i+1)
+					continue
+			self.stages.append((reader.machine,reader.max_steps,i,i+1))
+		"""The symbols of each output string of a machine, for the machine after it, see split_output"""
+		self.splits=[{} for stage in self.stages]
+
+	@classmethod
+	def from_recipes(cls,recipe_texts,max_steps=None,cache_size=None,compiled_cache_dir=None,fuse_machines=True):
+		"""Builds a pipeline from a list of FST recipes given as strings, see Reader.from_recipe"""
+		return cls([Reader.from_recipe(recipe_text,max_steps,cache_size,compiled_cache_dir) for recipe_text in recipe_texts],fuse_machines)
+
+	def transduce(self,input_string):
+		"""Runs the pipeline on an input, returns the output of the last machine or the RunError of the first one that failed"""
+		fragments=None
+		last=len(self.stages)-1
+		for k,(machine,max_steps,start,end) in enumerate(self.stages):
+			if fragments is None:
+				entire_input=machine.prepare_input(input_string)
+			else:
+				input_string=''.join(fragments)
+				entire_input=self.split_fragments(k,fragments)
+				if entire_input is None:
+					entire_input=machine.prepare_input(input_string)
+			if k<last and type(machine.initialValue)==str:
+				stage_output=machine.transduce_fragments(entire_input,max_steps)
+			else:
+				stage_output=machine.transduce_prepared(entire_input,max_steps)
+			if isinstance(stage_output,RunError):
+				if end-start>1:
+					return self.transduce_readers(input_string,start,end)
+				if type(stage_output.partial_output)==list:
+					stage_output=RunError(''.join(stage_output.partial_output),stage_output.reason,stage_output.message)
+				return self.reader_error(start,stage_output)
+			if type(stage_output)==list:
+				fragments=stage_output
+			else:
+				fragments=None
+				input_string=stage_output
+		return input_string
+
+	def split_fragments(self,k,fragments):
+		"""The input of the k-th stage, made of the output strings of the stage before it split into its symbols,
+		or None if one of them can't be split on its own"""
+		tokenizer=self.stages[k][0].tokenizer
+		splits=self.splits[k]
+		entire_input=['#']
+		for fragment in fragments:
+			if fragment not in splits:
+				splits[fragment]=split_output(tokenizer,fragment)
+			symbols=splits[fragment]
+			if symbols is None:
+				return None
+			entire_input.extend(symbols)
+		entire_input.append('%')
+		return entire_input
+
+	def transduce_readers(self,input_string,start,end):
+		"""Runs the readers from start to end one after the other on an input, without fusing them"""
+		output=input_string
+		for i in range(start,end):
+			output=self.readers[i].transduce(output)
+			if isinstance(output,RunError):
+				return self.reader_error(i,output)
+		return output
+
+	def reader_error(self,i,error):
+		"""The error of the pipeline when its i-th reader fails"""
+		if len(self.readers)==1:
+			return error
+		return RunError(error.partial_output,error.reason,"in FST %d of the pipeline, %s" % (i+1,error.message))
+
+	def transduce_lines(self,lines):
+		"""Given an iterable of input strings, this lazily yields the pairs (input string, output string)"""
+		for line in lines:
+			yield (line,self.transduce(line))
+
+	def output_strings_file(self,input_string_file,output_string_file='output_strings.txt',chunk_size=1000):
+		"""Runs the pipeline on a file of input strings and writes the outputs like Reader.output_strings_file"""
+		write_output_strings(output_string_file,self.transduce_lines(read_input_strings(input_string_file)),chunk_size)
+
+def main():
+	parser=argparse.ArgumentParser(description="Runs a pipeline of 2-way FSTs on a file of input strings, each FST recipe running on the outputs of the one before it")
+	parser.add_argument('FST_recipes',nargs='+',help="the FST recipes, in the order they are run")
+	parser.add_argument('--input',default='-',help="the file of input strings, one per line, or - for stdin (default: -)")
+	parser.add_argument('--output',default='-',help="the file the outputs are written on, or - for stdout (default: -)")
+	parser.add_argument('--max-steps',type=int,default=None,help="stop any run of any FST that takes more than this many steps")
+	parser.add_argument('--chunk-size',type=int,default=1000,help="number of outputs written at a time (default: 1000)")
+	parser.add_argument('--no-fuse',action='store_true',help="always run the FSTs one after the other instead of fusing them when possible")
+	args=parser.parse_args()
+
+	recipe_texts=[]
+	for FST_recipe in args.FST_recipes:
+		f=open(FST_recipe,'r',encoding='utf-8')
+		recipe_texts.append(f.read())
+		f.close()
+	readers=[]
+	for FST_recipe,recipe_text in zip(args.FST_recipes,recipe_texts):
+		try:
+			readers.append(Reader.from_recipe(recipe_text,args.max_steps))
+		except RecipeError as error:
+			sys.stderr.write("error, the FST recipe %s has mistakes:\n%s\n" % (FST_recipe,error))
+			sys.exit(1)
+	pipeline=Pipeline(readers,not args.no_fuse)
+	pipeline.output_strings_file(args.input,args.output,args.chunk_size)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+"""
+   A server which keeps 2-way FSTs compiled and runs them on the words it's sent, over a Unix domain socket or stdin/stdout
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import os
+import sys
+import io
+import json
+import asyncio
+import argparse
+import signal
+import stat
+
+import redtyp_db
+from two_way_interpreter import Reader, RecipeError, RunError
+
+class TransductionServer:
+	"""Answers requests to run 2-way FSTs that are compiled once when the server starts
+	A request is one line of json, e.g. {"id": 1, "machine": "Total reduplication - General", "words": ["pata", "tak"]}
+	and it's answered with one line of json with the same id and a result for each word:
+	{"id": 1, "results": [{"input": "pata", "output": "pata~pata"}, ...]}
+	The result of a word the 2-way FST fails on also has the "error" reason and the "message", and its "output" is the partial output, see RunError
+	{"machines": true} is answered with the list of machine IDs. A request that can't be answered gets an "error" instead of "results"
+	"id" is optional and can be anything, it's only sent back. "word" can be given instead of "words" for a single word
+
+	Machine IDs are looked up ignoring case and trailing whitespace, like in the RedTyp database"""
+
+	def __init__(self,readers,chunk_size=100):
+		"""readers is a dict from machine IDs to Readers
+		Words are run chunk_size at a time, and between two chunks the server answers the other clients"""
+		self.readers=dict([(self.normalize(machine_id),(machine_id,reader)) for machine_id,reader in readers.items()])
+		self.chunk_size=chunk_size
+
+	def normalize(self,machine_id):
+		return machine_id.rstrip().lower()
+
+	def machine_ids(self):
+		return sorted([machine_id for machine_id,reader in self.readers.values()])
+
+	def parse(self,line):
+		"""Reads a request, returns (request, reader, words) where reader is None for a request for the list of machines
+		Raises a ValueError with what's wrong with the request"""
+		try:
+			request=json.loads(line)
+		except ValueError as error:
+			raise ValueError("the request isn't json: %s" % error)
+		if type(request)!=dict:
+			raise ValueError("the request has to be a json object")
+		if request.get('machines'):
+			return request,None,None
+		machine_id=request.get('machine')
+		if type(machine_id)!=str:
+			raise ValueError("the request has no machine")
+		if self.normalize(machine_id) not in self.readers:
+			raise ValueError("there's no machine %s" % machine_id)
+		if 'words' in request:
+			words=request['words']
+		elif 'word' in request:
+			words=[request['word']]
+		else:
+			raise ValueError("the request has no words")
+		if type(words)!=list or not all([type(word)==str for word in words]):
+			raise ValueError("the words have to be a list of strings")
+		return request,self.readers[self.normalize(machine_id)][1],words
+
+	def result(self,reader,word):
+		output=reader.transduce(word)
+		if isinstance(output,RunError):
+			return {'input':word,'output':output.partial_output,'error':output.reason,'message':output.message}
+		return {'input':word,'output':output}
+
+	def answer(self,line):
+		"""Answers a request all at once, returns the line of json of the answer"""
+		try:
+			request,reader,words=self.parse(line)
+		except ValueError as error:
+			return self.error_line(line,str(error))
+		if reader is None:
+			return self.answer_line(request,{'machines':self.machine_ids()})
+		return self.answer_line(request,{'results':[self.result(reader,word) for word in words]})
+
+	async def answer_async(self,line):
+		"""Same as answer, but the words are run a chunk at a time, letting the other clients in between"""
+		try:
+			request,reader,words=self.parse(line)
+		except ValueError as error:
+			return self.error_line(line,str(error))
+		if reader is None:
+			return self.answer_line(request,{'machines':self.machine_ids()})
+		results=[]
+		for start in range(0,len(words),self.chunk_size):
+			results.extend([self.result(reader,word) for word in words[start:start+self.chunk_size]])
+			if start+self.chunk_size<len(words):
+				await asyncio.sleep(0)
+		return self.answer_line(request,{'results':results})
+
+	def answer_line(self,request,answer):
+		if 'id' in request:
+			answer['id']=request['id']
+		return json.dumps(answer,ensure_ascii=False)
+
+	def error_line(self,line,message):
+		"""The answer to a bad request, with its id if the id can be read"""
+		answer={'error':message}
+		try:
+			request=json.loads(line)
+			if type(request)==dict and 'id' in request:
+				answer['id']=request['id']
+		except ValueError:
+			pass
+		return json.dumps(answer,ensure_ascii=False)
+
+	async def handle_client(self,stream_reader,stream_writer):
+		"""Answers the requests of one client of the socket, in order, until it closes the connection"""
+		try:
+			while True:
+				line=await stream_reader.readline()
+				if not line:
+					break
+				line=line.decode('utf-8').strip()
+				if len(line)==0:
+					continue
+				stream_writer.write((await self.answer_async(line)+'\n').encode('utf-8'))
+				await stream_writer.drain()
+		except (ConnectionError,UnicodeDecodeError):
+			pass
+		finally:
+			stream_writer.close()
+
+	async def serve_socket(self,path):
+		"""Listens on a Unix domain socket at path until the server gets SIGTERM or SIGINT, answering any number of clients at the same time
+		A socket file left at path by an earlier server is replaced, and the socket file is removed when it stops
+		Raises a ValueError if there's something else than a socket at path, which is left alone"""
+		if os.path.exists(path):
+			if not stat.S_ISSOCK(os.stat(path).st_mode):
+				raise ValueError("%s already exists and isn't a socket" % path)
+			os.remove(path)
+		server=await asyncio.start_unix_server(self.handle_client,path=path)
+		loop=asyncio.get_running_loop()
+		stopped=loop.create_future()
+		for signal_number in [signal.SIGTERM,signal.SIGINT]:
+			loop.add_signal_handler(signal_number,lambda: stopped.done() or stopped.set_result(None))
+		try:
+			async with server:
+				await stopped
+		finally:
+			if os.path.exists(path):
+				os.remove(path)
+
+	def serve_stdio(self):
+		"""Answers the requests read from stdin one line at a time on stdout, until stdin is closed"""
+		f_input=io.TextIOWrapper(sys.stdin.buffer,encoding='utf-8-sig')
+		f_output=io.TextIOWrapper(sys.stdout.buffer,encoding='utf-8',newline='\n')
+		try:
+			for line in f_input:
+				line=line.strip()
+				if len(line)==0:
+					continue
+				f_output.write(self.answer(line)+'\n')
+				f_output.flush()
+		finally:
+			f_input.detach()
+			f_output.detach()
+
+def load_readers(recipe_files,database=None,max_steps=None,cache_size=None,compiled_cache_dir=None):
+	"""Compiles the FST recipes of the files, each one under the name of its file without the extension or under NAME if it's given as NAME=FILE,
+	and every 2-way FST of the RedTyp database if database is the SQL dump, under its 2-way FST ID
+	Recipes with mistakes are reported on stderr and left out. The readers are compacted, see Reader.compact, since the server only runs them"""
+	readers={}
+	if database is not None:
+		catalog=redtyp_db.Catalog(database,None,max_steps,cache_size,compiled_cache_dir)
+		for fst_id in catalog.fst_ids():
+			try:
+				readers[fst_id]=catalog.machine(fst_id)
+			except RecipeError as error:
+				sys.stderr.write("the 2-way FST %s of the database has mistakes, it's left out:\n%s\n" % (fst_id,error))
+		catalog.close()
+	for recipe_file in recipe_files:
+		if '=' in recipe_file:
+			machine_id,recipe_file=recipe_file.split('=',1)
+		else:
+			machine_id=os.path.splitext(os.path.basename(recipe_file))[0]
+		f=io.open(recipe_file,'r',encoding='utf-8')
+		recipe_text=f.read()
+		f.close()
+		try:
+			readers[machine_id]=Reader.from_recipe(recipe_text,max_steps,cache_size,compiled_cache_dir)
+		except RecipeError as error:
+			sys.stderr.write("the FST recipe %s has mistakes, it's left out:\n%s\n" % (recipe_file,error))
+	for reader in readers.values():
+		reader.compact()
+	return readers
+
+def main():
+	parser=argparse.ArgumentParser(description="Keeps 2-way FSTs compiled and runs them on the words sent as lines of json, over a Unix domain socket or stdin/stdout")
+	parser.add_argument('FST_recipes',nargs='*',help="FST recipes to serve, named after their file, or NAME=FILE to give them a name")
+	parser.add_argument('--database',default=None,help="also serve every 2-way FST of this SQL dump of the RedTyp database, e.g. RedTyp.sql")
+	parser.add_argument('--socket',default=None,metavar='PATH',help="listen on a Unix domain socket at PATH instead of reading stdin and writing stdout")
+	parser.add_argument('--max-steps',type=int,default=None,help="stop any run that takes more than this many steps")
+	parser.add_argument('--cache-size',type=int,default=None,help="cache the outputs of up to this many distinct inputs for each machine (default: no cache)")
+	parser.add_argument('--compiled-cache',default=None,metavar='DIR',help="store compiled machines in this folder and reuse them while the FST recipes are unchanged. The files in it are loaded with pickle, so only use a folder that you trust")
+	args=parser.parse_args()
+
+	readers=load_readers(args.FST_recipes,args.database,args.max_steps,args.cache_size,args.compiled_cache)
+	if len(readers)==0:
+		sys.stderr.write("error, there are no FST recipes to serve\n")
+		sys.exit(1)
+	server=TransductionServer(readers)
+	if args.socket is None:
+		server.serve_stdio()
+		return
+	sys.stderr.write("serving %d machines on %s\n" % (len(readers),args.socket))
+	try:
+		asyncio.run(server.serve_socket(args.socket))
+	except ValueError as error:
+		sys.stderr.write("error, the server can't listen on the socket: %s\n" % error)
+		sys.exit(1)
+
+if __name__ == "__main__":
+	main()
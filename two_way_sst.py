@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Copyless streaming string transducers (SSTs) compiled from the deterministic 2-way FSTs of two_way_interpreter.py
+   They read inputs as streams. They aren't a faster engine: on the words of the database they're slower than the 2-way FST, see benchmark.py sst
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import sys
+import argparse
+import itertools
+
+from two_way_interpreter import Reader, RecipeError, RunError, join_output, read_input_strings, write_output_strings
+
+def flatten(register):
+	"""A register is a list of strings and registers whose concatenation is its content
+	An old register is put inside a new one as a single item instead of being copied. This returns the content as a single string"""
+	pieces=[]
+	stack=[register]
+	while len(stack)>0:
+		register=stack.pop()
+		if register.__class__ is str:
+			pieces.append(register)
+		else:
+			stack.extend(reversed(register))
+	return ''.join(pieces)
+
+class StreamingTransducer:
+	"""A 1-way copyless streaming string transducer which computes the same function as a deterministic 2-way FST
+	It reads the input once from left to right, so the input can come as a stream of symbols and is never rescanned
+
+	After reading a prefix w of the input, the 2-way FST can only come back into w by moving left from the next position.
+	What happens then only depends on the state it moves left in: it eventually leaves w to the right in some state,
+	or it fails inside w. This is the behaviour of w (Shepherdson's construction). The actual run is one more run, which starts at the
+	left edge and leaves w to the right after what it output so far
+
+	Since the 2-way FST is deterministic, two of these runs that get to the same configuration go on the same way from there:
+	runs merge but never split. So their outputs are kept as a forest: each register holds the output of a piece of run up to
+	the next point where runs merge, and then either goes on with the register of the piece after that point, or ends with the run,
+	which leaves w to the right in some state or fails. The state of the SST is this shape, a tuple with what comes after each register.
+	Registers 0 to main-1 are where the runs of the left states start, register main is where the actual run starts.
+	When the next symbol is read, the new runs are put together from single steps on that symbol and the old pieces of run.
+	Each old piece belongs to one new piece only, so every update is copyless: a register is used at most once, and the new
+	register that starts with it is extended in place
+
+	The states and register updates are only built for the (state, class of symbol) pairs that come up, then they're kept.
+	Runs that fail give the same RunError reasons as the 2-way FST. Runs never need a step budget since every symbol is read once,
+	and a loop of the 2-way FST shows up as a run that comes back to the same configuration on the same symbol"""
+
+	def __init__(self,machine):
+		"""machine is the CompiledMachine of a Reader"""
+		self.machine=machine
+		self.table=machine.table
+		self.classCount=machine.classCount
+		self.outputs=machine.outputs
+
+		"""Only the states which the 2-way FST moves left in start a run inside the prefix"""
+		left_states=set()
+		for record in machine.table:
+			if record>=0 and (record&3)==0:
+				left_states.add((record>>2)&0x3fffffff)
+		self.left_states=sorted(left_states)
+		self.slots=dict([(q,i) for i,q in enumerate(self.left_states)])
+		self.main=len(self.left_states)#the register of the actual run comes after the registers of the left states
+
+		"""What comes after a register is the register that goes on with the run, ('exit',state) if the run leaves the prefix to the right,
+		or ('fail',reason). Before reading anything, moving left falls off the left edge and the actual run is in the initial state"""
+		self.behaviours=[]
+		self.behaviour_ids={}
+		self.main_paths=[]
+		self.transitions={}
+		self.copyless=True
+		self.registers=self.main+1
+		initial=[('fail','left edge') for q in self.left_states]+[('exit',machine.state_ids.get(machine.initialState,0))]
+		self.initial_messages=dict([(slot,"the reading head moved past the left edge of the input in state %s" % machine.states[q]) for slot,q in enumerate(self.left_states)])
+		self.initial=self.behaviour_id(tuple(initial))
+
+	def escape(self,text):
+		return text.replace('%','%%')
+
+	def behaviour_id(self,behaviour):
+		"""Also keeps the registers which the actual run goes through and how it ends, for reading the output"""
+		if behaviour not in self.behaviour_ids:
+			self.behaviour_ids[behaviour]=len(self.behaviours)
+			self.behaviours.append(behaviour)
+			path=[self.main]
+			while behaviour[path[-1]].__class__ is int:
+				path.append(behaviour[path[-1]])
+			self.main_paths.append((tuple(path),behaviour[path[-1]]))
+			self.registers=max(self.registers,len(behaviour))
+		return self.behaviour_ids[behaviour]
+
+	def step(self,behaviour,node,a):
+		"""The pieces of the new runs on a symbol of class a are nodes: ('start',slot) where the run of a register of the new shape starts,
+		('symbol',q) when the 2-way FST is in state q on the symbol, and ('register',r) for the old piece of run in register r
+		Returns (output, next): output is None, an old register, or an output string or function, and next is the node that comes after,
+		or how the run ends: ('exit',state), ('fail',reason,message) with a %-template over the symbol and position,
+		or ('old fail',r) when it ends like the old piece in register r"""
+		kind,x=node
+		if kind=='start':
+			if x==self.main:
+				return None,('register',self.main)#the actual run goes on from where it left the prefix, after what it output so far
+			return None,('symbol',self.left_states[x])
+		if kind=='register':
+			following=behaviour[x]
+			if following.__class__ is int:
+				return x,('register',following)
+			if following[0]=='exit':
+				return x,('symbol',following[1])
+			return x,('old fail',x)
+		record=self.table[x*self.classCount+a] if a>=0 else -1
+		if record<0:
+			return None,('fail','no transition',"couldn't find output state for the input state+input symbol pair ("+self.escape(self.machine.states[x])+",%(symbol)s)")
+		output=self.outputs[record>>32]
+		if output=='':
+			output=None
+		q=(record>>2)&0x3fffffff
+		direction=(record&3)-1
+		if direction==1:
+			return output,('exit',q)
+		if direction==-1:
+			return output,('register',self.slots[q])
+		return output,('symbol',q)
+
+	def build(self,behaviour_id,a):
+		"""Builds the transition of the SST from a state on a symbol of class a
+		It's a tuple (new state id, updates, messages). There's an update (first, pieces) for each new register: first is the old register
+		that it starts with and is extended in place, or -1, and pieces are the old registers, output strings and output functions that come after.
+		messages has a (register, message) pair for each new register whose run fails: message is a %-template, or the old register whose message is kept"""
+		behaviour=self.behaviours[behaviour_id]
+		is_node=lambda following: following[0] in ('start','symbol','register')
+		starts=[('start',slot) for slot in range(self.main+1)]
+		steps={}
+		stack=list(starts)
+		while len(stack)>0:
+			node=stack.pop()
+			if node not in steps:
+				steps[node]=self.step(behaviour,node,a)
+				if is_node(steps[node][1]):
+					stack.append(steps[node][1])
+
+		"""A piece of run that comes back to a node it went through never ends, so the nodes of a cycle become a failure"""
+		cycle_nodes=set()
+		walked={}
+		for walk,node in enumerate(steps):
+			path=[]
+			while is_node(node) and node not in walked:
+				walked[node]=walk
+				path.append(node)
+				node=steps[node][1]
+			if is_node(node) and walked[node]==walk:
+				cycle_nodes.update(path[path.index(node):])
+		loops={}
+		for node in steps:
+			output,following=steps[node]
+			if following in cycle_nodes:
+				while following[0]!='symbol':
+					following=steps[following][1]
+				loops[node]=(output,('fail','non-terminating',self.escape("the machine doesn't halt on this input, it keeps coming back to state %s" % self.machine.states[following[1]])+" at position %(position)d"))
+		steps.update(loops)
+
+		"""A new register starts where a run starts or where runs merge, and goes on until the next one"""
+		incoming={}
+		stack=list(starts)
+		while len(stack)>0:
+			node=stack.pop()
+			following=steps[node][1]
+			if is_node(following):
+				incoming[following]=incoming.get(following,0)+1
+				if incoming[following]==1:
+					stack.append(following)
+		registers=dict([(node,slot) for slot,node in enumerate(starts)])
+		heads=list(starts)
+		shape=[]
+		updates=[]
+		messages=[]
+		for node in heads:
+			pieces=[]
+			while True:
+				output,following=steps[node]
+				if output is not None:
+					pieces.append(output)
+				if is_node(following) and incoming[following]==1:
+					node=following
+				else:
+					break
+			if is_node(following):
+				if following not in registers:
+					registers[following]=len(heads)
+					heads.append(following)
+				shape.append(registers[following])
+			elif following[0]=='exit':
+				shape.append(following)
+			elif following[0]=='fail':
+				shape.append(following[:2])
+				messages.append((len(updates),following[2]))
+			else:
+				shape.append(behaviour[following[1]])
+				messages.append((len(updates),following[1]))
+			if len(pieces)>0 and pieces[0].__class__ is int:
+				updates.append((pieces[0],tuple(pieces[1:])))
+			else:
+				updates.append((-1,tuple(pieces)))
+
+		used=[piece for first,pieces in updates for piece in (first,)+pieces if piece.__class__ is int and piece>=0]
+		if len(used)!=len(set(used)):
+			self.copyless=False
+		transition=(self.behaviour_id(tuple(shape)),tuple(updates),tuple(messages))
+		self.transitions[(behaviour_id,a)]=transition
+		return transition
+
+	def transduce(self,input_string):
+		"""Runs the SST on an input string, which is split into symbols like the 2-way FST does"""
+		return self.transduce_symbols(self.machine.prepare_input(input_string)[1:-1])
+
+	def output(self,registers,path):
+		"""The output of a run is the content of the registers it goes through"""
+		return join_output(self.machine.initialValue,[flatten([registers[register] for register in path])])
+
+	def transduce_symbols(self,symbols):
+		"""Runs the SST on an iterable of input symbols without the edge symbols # and %, reading each symbol once as it comes
+		Returns the output, or a RunError like the 2-way FST does"""
+		machine=self.machine
+		class_ids=machine.class_ids
+		transitions=self.transitions
+		main_paths=self.main_paths
+		if machine.initialState not in machine.state_ids:
+			return RunError(machine.initialValue,'bad state',"the input state %s isn't in the state list" % machine.initialState)
+		behaviour_id=self.initial
+		registers=[[] for slot in range(self.main+1)]
+		messages=self.initial_messages
+		position=0
+		for symbol in itertools.chain(['#'],symbols,['%']):
+			a=class_ids.get(symbol,-1)
+			if a<0 and symbol not in machine.alphabet:
+				return RunError(self.output(registers,main_paths[behaviour_id][0]),'bad symbol',"the input symbol %s isn't in the alphabet" % symbol)
+			transition=transitions.get((behaviour_id,a))
+			if transition is None:
+				transition=self.build(behaviour_id,a)
+			behaviour_id,updates,update_messages=transition
+
+			new_registers=[]
+			for first,pieces in updates:
+				register=registers[first] if first>=0 else []
+				for piece in pieces:
+					if piece.__class__ is int:
+						register.append(registers[piece])
+					elif piece.__class__ is str:
+						register.append(piece)
+					else:
+						register.append(piece[symbol])
+				new_registers.append(register)
+			registers=new_registers
+			new_messages={}
+			for register,message in update_messages:
+				if message.__class__ is int:
+					new_messages[register]=messages[message]
+				else:
+					new_messages[register]=message % {'symbol':symbol,'position':position}
+			messages=new_messages
+			position=position+1
+			if main_paths[behaviour_id][1][0]=='fail':
+				break#the actual run failed, the rest of the input doesn't matter
+
+		path,result=main_paths[behaviour_id]
+		output_so_far=self.output(registers,path)
+		if result[0]=='fail':
+			return RunError(output_so_far,result[1],messages[path[-1]])
+		if not machine.final[result[1]]:
+			return RunError(output_so_far,'not final',"we read till the end but didnt end in a final state, but in state %s" % machine.states[result[1]])
+		return output_so_far
+
+def compare_runs(reader,sst,input_strings):
+	"""Runs both the 2-way FST of a Reader and its SST on each input string, and returns a list of (input, 2-way FST output, SST output) where they disagree
+	Failed runs agree if they fail for the same reason with the same partial output. Runs that don't halt are stopped
+	at different points by the two machines, so only their reason is compared"""
+	disagreements=[]
+	for input_string in input_strings:
+		expected=reader.transduce(input_string)
+		output=sst.transduce(input_string)
+		if isinstance(expected,RunError) or isinstance(output,RunError):
+			if not (isinstance(expected,RunError) and isinstance(output,RunError)) or expected.reason!=output.reason:
+				disagreements.append((input_string,expected,output))
+			elif expected.reason not in ['non-terminating','step budget'] and expected.partial_output!=output.partial_output:
+				disagreements.append((input_string,expected,output))
+		elif expected!=output:
+			disagreements.append((input_string,expected,output))
+	return disagreements
+
+def main():
+	parser=argparse.ArgumentParser(description="Compiles the 2-way FST in an FST recipe into a streaming string transducer and runs it on a file of input strings")
+	parser.add_argument('FST_recipe',help="the FST recipe")
+	parser.add_argument('input_strings',help="the file of input strings, one per line, or - for stdin")
+	parser.add_argument('output_strings',nargs='?',default='-',help="the file the outputs are written on, or - for stdout (default: -)")
+	parser.add_argument('--chunk-size',type=int,default=1000,help="number of outputs written at a time (default: 1000)")
+	args=parser.parse_args()
+
+	f=open(args.FST_recipe,'r',encoding='utf-8')
+	recipe_text=f.read()
+	f.close()
+	try:
+		reader=Reader.from_recipe(recipe_text)
+	except RecipeError as error:
+		sys.stderr.write("error, the FST recipe %s has mistakes:\n%s\n" % (args.FST_recipe,error))
+		sys.exit(1)
+	sst=StreamingTransducer(reader.machine)
+	pairs=((line,sst.transduce(line)) for line in read_input_strings(args.input_strings))
+	write_output_strings(args.output_strings,pairs,args.chunk_size)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+
+"""
+   Finds the 2-way FSTs whose reading head only turns around a bounded number of times, and runs them in passes over the input
+   Copyright (C) 2018 Authors
+
+   This work is licensed under the Creative Commons Attribution-NonCommercial 4.0 International License.
+   To view a copy of this license, visit http://creativecommons.org/licenses/by-nc/4.0/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+   """
+
+
+import sys
+import io
+import argparse
+import itertools
+import collections
+
+from two_way_interpreter import Reader, RecipeError, RunError, CompiledMachine, read_input_strings, write_output_strings
+
+def sweep_plan(machine):
+	"""Finds how many times the reading head of a deterministic compiled machine can turn around, from the directions of its transitions
+	The head starts at the left edge going right. A transition turns it around if it moves the other way than the last move, transitions that stay don't count.
+	So what matters is the state together with the way the head last moved: there's an edge from (q, d) to (p, d') for every transition from q to p,
+	and it's a reversal if d' isn't d. If some cycle of these pairs has a reversal, the head can turn around any number of times.
+	Otherwise every pair gets the most reversals that can come before it, and the largest of these is the bound
+
+	Returns a dict from the pairs (state number, direction) that can be reached to their number of reversals, or None if it's not bounded
+	This only looks at the transitions, not at which inputs can actually reach them, so the bound can be more than what any input needs"""
+	if machine.initialState not in machine.state_ids:
+		return None
+	classCount=machine.classCount
+	edges={}
+	def targets(node):
+		if node not in edges:
+			q,d=node
+			found=set()
+			for c in range(classCount):
+				record=machine.table[q*classCount+c]
+				if record<0:
+					continue
+				direction=(record&3)-1
+				if direction==0:
+					found.add((((record>>2)&0x3fffffff,d),0))
+				else:
+					found.add((((record>>2)&0x3fffffff,direction),int(direction!=d)))
+			edges[node]=found
+		return edges[node]
+
+	"""A pair is looked at again whenever it gets more reversals. Without a cycle with a reversal no pair can get more than one per pair there is,
+	so a pair that gets more than that is on such a cycle"""
+	start=(machine.state_ids[machine.initialState],1)
+	plan={start:0}
+	limit=2*len(machine.states)
+	queue=collections.deque([start])
+	while queue:
+		node=queue.popleft()
+		for target,reversal in targets(node):
+			k=plan[node]+reversal
+			if k>plan.get(target,-1):
+				if k>limit:
+					return None
+				plan[target]=k
+				queue.append(target)
+	return plan
+
+def classify(machine):
+	"""Returns ('1-way', 0) if the compiled machine never moves left, ('bounded', r) if its head turns around at most r times, or ('general', None)
+	Nondeterministic machines are always 'general', see sweep_plan"""
+	if machine.nondeterministic:
+		return ('general',None)
+	plan=sweep_plan(machine)
+	if plan is None:
+		return ('general',None)
+	reversals=max(plan.values())
+	if reversals==0:
+		return ('1-way',0)
+	return ('bounded',reversals)
+
+def stream_tokens(tokenizer,characters):
+	"""Lazily splits an iterable of characters into the symbols of a SymbolTokenizer by longest match, like SymbolTokenizer.tokenize does with a string
+	Only the characters of the longest symbol that's being matched are kept, so a stream of any length is split in constant memory"""
+	trie=tokenizer.trie
+	characters=iter(characters)
+	pending=collections.deque()
+	ended=False
+	while True:
+		node=trie
+		match=0
+		j=0
+		while True:
+			if j==len(pending):
+				if ended:
+					break
+				char=next(characters,None)
+				if char is None:
+					ended=True
+					break
+				pending.append(char)
+			char=pending[j]
+			if char not in node:
+				break
+			node=node[char]
+			j=j+1
+			if '' in node:
+				match=j
+		if len(pending)==0:
+			return
+		if match==0:
+			#a character which doesn't start any symbol is its own symbol, and the run reports it as a bad input symbol
+			yield pending.popleft()
+		else:
+			yield ''.join([pending.popleft() for k in range(match)])
+
+class SweepingMachine(CompiledMachine):
+	"""A compiled machine whose reading head turns around a bounded number of times, which is run in passes over the input instead of one step at a time
+	The input is mapped to its classes once, and each pass is a loop over the positions in one direction, which ends when the head turns around.
+	The number of passes is known before running, see sweep_plan. Runs that loop, or go over their bound of steps, are run again by CompiledMachine.run,
+	so the outputs and errors are always the same as the ones of the compiled machine
+
+	A 1-way machine, which makes a single pass, can also read its input as a stream, see stream"""
+
+	__slots__=('moves','passes')
+
+	@classmethod
+	def from_machine(cls,machine):
+		"""Returns the sweeping machine of a deterministic compiled machine, which shares its table and outputs, or None if its head can turn around any number of times"""
+		if machine.nondeterministic:
+			return None
+		plan=sweep_plan(machine)
+		if plan is None:
+			return None
+		sweeping_machine=machine.converted(cls)
+		sweeping_machine.passes=max(plan.values())+1
+		"""The cells of the table are unpacked once into (output state, output, direction), where the output is None if it's empty"""
+		moves=[]
+		for record in machine.table:
+			if record<0:
+				moves.append(None)
+			else:
+				output=machine.outputs[record>>32]
+				if output.__class__ is str and len(output)==0:
+					output=None
+				moves.append(((record>>2)&0x3fffffff,output,(record&3)-1))
+		sweeping_machine.moves=moves
+		return sweeping_machine
+
+	def compiled_machine(self):
+		"""Returns the compiled machine without the passes"""
+		return self.converted(CompiledMachine)
+
+	def run(self,stateQ,output_so_far,entire_input,index_header,max_steps=None):
+		"""Runs the passes when the run starts at the beginning of the input from the initial state, and CompiledMachine.run otherwise
+		The steps of the passes are only counted at the end of each pass, so a run that went over the bound of steps is run again by CompiledMachine.run,
+		which stops it at the same step with the same error"""
+		if index_header==0 and stateQ==self.initialState and output_so_far.__class__ is str and stateQ in self.state_ids:
+			result=self.sweep(entire_input)
+			if result is not None:
+				q,i,outputs,steps=result
+				input_length=len(entire_input)
+				bound=len(self.states)*input_length
+				if max_steps is not None and max_steps<bound:
+					bound=max_steps
+				"""Like in CompiledMachine.run, a run that stops before the end of the input has to stop within the bound, one that gets to the end can get there at the bound"""
+				if steps<bound or (i==input_length and steps<=bound):
+					self.step_count=self.step_count+steps
+					if i==input_length and self.final[q]:
+						return output_so_far+''.join(outputs)
+					return self.stop_error(q,i,output_so_far+''.join(outputs),entire_input)
+		return CompiledMachine.run(self,stateQ,output_so_far,entire_input,index_header,max_steps)
+
+	def sweep(self,entire_input):
+		"""Runs the passes from the initial state, returns (state number, position, list of outputs, steps) where the run stopped,
+		which is at the end of the input if it got there, or None if it stays on a symbol forever"""
+		class_ids=self.class_ids
+		ids=[class_ids.get(inputA,-1) for inputA in entire_input]
+		moves=self.moves
+		classCount=self.classCount
+		input_length=len(ids)
+		outputs=[]
+		append=outputs.append
+		q=self.state_ids[self.initialState]
+		i=0
+		steps=0
+		for k in range(self.passes):
+			start=i
+			stays=0
+			if k%2==0:
+				"""A pass to the right, from start until the head turns left or moves past the last symbol"""
+				if start>=input_length:
+					return q,input_length,outputs,steps
+				for i in range(start,input_length):
+					a=ids[i]
+					move=moves[q*classCount+a] if a>=0 else None
+					if move is None:
+						return q,i,outputs,steps+i-start+stays
+					q,output,direction=move
+					if output is not None:
+						append(output if output.__class__ is str else output[entire_input[i]])
+					if direction!=1:
+						if direction==0:
+							q,direction,count=self.stay(q,a,entire_input[i],append)
+							stays=stays+count
+							if direction is None:
+								return None
+							if direction==0:
+								return q,i,outputs,steps+i-start+stays+1
+							if direction==1:
+								continue
+						steps=steps+i-start+1+stays
+						i=i-1
+						break
+				else:
+					return q,input_length,outputs,steps+input_length-start+stays
+			else:
+				"""A pass to the left, from start until the head turns right or moves past the first symbol"""
+				if start<0:
+					return q,-1,outputs,steps
+				for i in range(start,-1,-1):
+					a=ids[i]
+					move=moves[q*classCount+a] if a>=0 else None
+					if move is None:
+						return q,i,outputs,steps+start-i+stays
+					q,output,direction=move
+					if output is not None:
+						append(output if output.__class__ is str else output[entire_input[i]])
+					if direction!=-1:
+						if direction==0:
+							q,direction,count=self.stay(q,a,entire_input[i],append)
+							stays=stays+count
+							if direction is None:
+								return None
+							if direction==0:
+								return q,i,outputs,steps+start-i+stays+1
+							if direction==-1:
+								continue
+						steps=steps+start-i+1+stays
+						i=i+1
+						break
+				else:
+					return q,-1,outputs,steps+start+1+stays
+		#the plan is an upper bound, so this isn't reached
+		return None
+
+	def stay(self,q,a,symbol,append):
+		"""Follows the transitions that stay on a symbol of class a from the state q, after a first one that stayed there
+		Returns (state, direction of the first transition that moves, number of transitions followed), where the direction is 0 if the run stops there
+		and None if it comes back to a state, since then it stays there forever"""
+		moves=self.moves
+		count=0
+		seen=set([q])
+		while True:
+			move=moves[q*self.classCount+a]
+			if move is None:
+				return q,0,count
+			q,output,direction=move
+			count=count+1
+			if output is not None:
+				append(output if output.__class__ is str else output[symbol])
+			if direction!=0:
+				return q,direction,count
+			if q in seen:
+				return q,None,count
+			seen.add(q)
+
+	def stream(self,characters):
+		"""Runs a 1-way machine on an iterable of characters, which is split into symbols by longest match as it's read, see stream_tokens"""
+		return self.stream_symbols(stream_tokens(self.tokenizer,characters))
+
+	def stream_symbols(self,symbols):
+		"""Runs a 1-way machine on an iterable of input symbols without the edge symbols # and %, reading each symbol once as it comes
+		This yields the pieces of the output as soon as they're made, starting with the initial value, and keeps nothing else, so memory stays constant.
+		If the run fails, the last piece is its RunError with an empty partial output, since the partial output was already yielded:
+		the pieces joined together are the same as what transduce returns
+		Raises a ValueError if the machine isn't 1-way, or if its initial value isn't a string"""
+		if self.passes!=1:
+			raise ValueError("only 1-way 2-way FSTs can read a stream, this one turns around up to %d times" % (self.passes-1))
+		if self.initialValue.__class__ is not str:
+			raise ValueError("only 2-way FSTs whose initial value is a string can read a stream")
+		class_ids=self.class_ids
+		moves=self.moves
+		classCount=self.classCount
+		pieces=[]
+		append=pieces.append
+		if len(self.initialValue)>0:
+			yield self.initialValue
+		q=self.state_ids[self.initialState]
+		position=0
+		for symbol in itertools.chain(['#'],symbols,['%']):
+			a=class_ids.get(symbol,-1)
+			move=moves[q*classCount+a] if a>=0 else None
+			if move is None:
+				#stop_error only looks at the symbol the run stopped on
+				yield self.stop_error(q,0,'',[symbol])
+				return
+			q,output,direction=move
+			if output is not None:
+				yield output if output.__class__ is str else output[symbol]
+			if direction==0:
+				q,direction,count=self.stay(q,a,symbol,append)
+				for piece in pieces:
+					yield piece
+				del pieces[:]
+				if direction is None:
+					yield RunError('','non-terminating',"the machine doesn't halt on this input, it keeps coming back to state %s at position %d" % (self.states[q],position))
+					return
+				if direction==0:
+					yield self.stop_error(q,0,'',[symbol])
+					return
+			position=position+1
+		if not self.final[q]:
+			yield self.stop_error(q,1,'',['%'])
+
+def main():
+	parser=argparse.ArgumentParser(description="Tells how many times the reading head of the 2-way FST in an FST recipe turns around, and if it's bounded runs it in passes on a file of input strings")
+	parser.add_argument('FST_recipe',help="the FST recipe")
+	parser.add_argument('input_strings',help="the file of input strings, one per line, or - for stdin")
+	parser.add_argument('output_strings',nargs='?',default='-',help="the file the outputs are written on, or - for stdout (default: -)")
+	parser.add_argument('--chunk-size',type=int,default=1000,help="number of outputs written at a time (default: 1000)")
+	parser.add_argument('--stream',action='store_true',help="read the whole file of input strings as a single input, without its line breaks, and write its output as it's made; only for 1-way 2-way FSTs")
+	args=parser.parse_args()
+
+	f=open(args.FST_recipe,'r',encoding='utf-8')
+	recipe_text=f.read()
+	f.close()
+	try:
+		reader=Reader.from_recipe(recipe_text)
+	except RecipeError as error:
+		sys.stderr.write("error, the FST recipe %s has mistakes:\n%s\n" % (args.FST_recipe,error))
+		sys.exit(1)
+	kind,reversals=classify(reader.machine)
+	if kind=='1-way':
+		sys.stderr.write("the 2-way FST is 1-way, it reads its input in one pass from left to right\n")
+	elif kind=='bounded':
+		sys.stderr.write("the reading head of the 2-way FST turns around at most %d times, so it's run in at most %d passes\n" % (reversals,reversals+1))
+	else:
+		sys.stderr.write("the reading head of the 2-way FST can turn around any number of times, it's run step by step\n")
+	if args.stream and kind!='1-way':
+		sys.stderr.write("error, only 1-way 2-way FSTs can read a stream\n")
+		sys.exit(1)
+	if kind!='general':
+		reader.machine=SweepingMachine.from_machine(reader.machine)
+
+	if not args.stream:
+		pairs=((line,reader.transduce(line)) for line in read_input_strings(args.input_strings))
+		write_output_strings(args.output_strings,pairs,args.chunk_size)
+		return
+	if args.input_strings=='-':
+		f_input=io.TextIOWrapper(sys.stdin.buffer,encoding='utf-8-sig')
+	else:
+		f_input=io.open(args.input_strings,'r',encoding='utf-8-sig')
+	if args.output_strings=='-':
+		sys.stdout.flush()
+		f_output=io.TextIOWrapper(sys.stdout.buffer,encoding='utf-8',newline='')
+	else:
+		f_output=io.open(args.output_strings,'w',encoding='utf-8',newline='')
+	try:
+		characters=(char for block in iter(lambda: f_input.read(65536),'') for char in block if char not in '\r\n')
+		chunk=[]
+		for piece in reader.machine.stream(characters):
+			chunk.append(piece)
+			if len(chunk)>=65536:
+				f_output.write(''.join(chunk))
+				chunk=[]
+		chunk.append('\r\n')
+		f_output.write(''.join(chunk))
+	finally:
+		if args.input_strings=='-':
+			f_input.detach()
+		else:
+			f_input.close()
+		if args.output_strings=='-':
+			f_output.detach()
+		else:
+			f_output.close()
+
+if __name__ == "__main__":
+	main()